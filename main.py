@@ -3,73 +3,304 @@ import sys
 from datetime import datetime
 from pathlib import Path
 
-from src.infrastructure.sqlite_repo import SQLiteVideoRepository
-from src.infrastructure.yt_dlp_service import YTDLPService
-from src.presentation.cli import run_cli
-from src.usecases.download_video import DownloadVideo
+from src.presentation.cli import parse_args
 
 
-def setup_logging(level: str = "INFO") -> None:
+def setup_logging(level: str = "INFO", json_format: bool = False):
     """
     Configura o sistema de logging da aplicação.
-    Logs são salvos em arquivos separados por data (YYYY-MM-DD.log).
-    Não exibe logs no terminal.
+    Logs são salvos em arquivos separados por data (YYYY-MM-DD.log, ou
+    YYYY-MM-DD.jsonl no formato JSON). Não exibe logs no terminal.
+
+    Os loggers apenas enfileiram os registros (QueueHandler); a formatação
+    e a escrita no arquivo ficam em uma thread própria (QueueListener),
+    fora das threads de download.
 
     Args:
         level: Nível de log (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        json_format: Grava um objeto JSON por linha em vez de texto
+
+    Returns:
+        QueueListener: Listener a ser parado (stop) ao encerrar
     """
+    from src.infrastructure.logging_pipeline import (
+        JsonLinesFormatter,
+        start_queue_logging,
+    )
+
     # Cria diretório de logs se não existir
     log_dir = Path("logs")
     log_dir.mkdir(exist_ok=True)
 
     # Nome do arquivo com data atual
     today = datetime.now().strftime("%Y-%m-%d")
-    log_filename = log_dir / f"{today}.log"
+    suffix = "jsonl" if json_format else "log"
+    log_filename = log_dir / f"{today}.{suffix}"
 
     # Formato do log
-    log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    date_format = "%Y-%m-%d %H:%M:%S"
-
-    # Configuração básica (apenas arquivo, sem console)
-    logging.basicConfig(
-        level=getattr(logging, level.upper()),
-        format=log_format,
-        datefmt=date_format,
-        handlers=[
-            # Log apenas para arquivo
-            logging.FileHandler(log_filename, encoding="utf-8"),
-        ],
-    )
+    formatter: logging.Formatter
+    if json_format:
+        formatter = JsonLinesFormatter()
+    else:
+        formatter = logging.Formatter(
+            "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+        )
+
+    # Log apenas para arquivo, escrito pela thread do listener
+    file_handler = logging.FileHandler(log_filename, encoding="utf-8")
+    file_handler.setFormatter(formatter)
+    log_level = getattr(logging, level.upper())
+    listener = start_queue_logging([file_handler], level=log_level)
 
     # Silencia logs muito verbosos de bibliotecas externas
     logging.getLogger("yt_dlp").setLevel(logging.WARNING)
 
     logger = logging.getLogger(__name__)
     logger.info("Sistema de logging configurado")
+    return listener
 
 
-def main():
+def main(argv=None):
     """Função principal da aplicação."""
+    args = parse_args(argv)
+
     # Configura logging
-    setup_logging(level="INFO")
+    log_listener = setup_logging(level="INFO", json_format=args.log_format == "json")
 
     logger = logging.getLogger(__name__)
     logger.info("Iniciando aplicação de download de vídeos")
 
+    # Importações tardias: SQLite, yt-dlp e os casos de uso só são
+    # carregados depois de validar os argumentos, e apenas os necessários
+    from src.infrastructure.sqlite_pool import SQLiteConnectionPool
+    from src.infrastructure.sqlite_repo import SQLiteVideoRepository
+
+    pool = SQLiteConnectionPool()
+    downloader = None
+    metrics_server = None
+    postprocess = None
+    interrupted = False
     try:
+        metrics = None
+        if args.metrics_port is not None:
+            from src.infrastructure.prometheus import MetricsRegistry, MetricsServer
+            from src.infrastructure.sqlite_job_repo import SQLiteJobRepository
+
+            metrics = MetricsRegistry()
+            jobs = SQLiteJobRepository(pool=pool)
+            metrics.gauge_callback(
+                "ytdl_queue_jobs",
+                "Jobs na fila persistente, por estado",
+                jobs.count_by_status,
+                label="status",
+            )
+            metrics_server = MetricsServer(
+                metrics, port=args.metrics_port, release=pool.release
+            ).start()
+
+        # Instancia dependências
+        repo = SQLiteVideoRepository(pool=pool, metrics=metrics)
+
+        if args.history is not None:
+            from src.presentation.cli import run_history_cli
+
+            run_history_cli(repo, limit=args.history, json_output=args.json)
+            return
+
+        from src.infrastructure.sqlite_metrics_repo import (
+            SQLiteDownloadMetricsRepository,
+        )
+
+        metrics_repo = SQLiteDownloadMetricsRepository(pool=pool)
+
+        if args.stats is not None:
+            from src.presentation.cli import run_stats_cli
+            from src.usecases.summarize_metrics import SummarizeMetrics
+
+            run_stats_cli(
+                SummarizeMetrics(metrics_repo), hours=args.stats, json_output=args.json
+            )
+            return
+
+        from src.infrastructure.probe_cache import ProbeCache
+        from src.infrastructure.rate_limiter import BandwidthGovernor, HostRateLimiter
+        from src.infrastructure.sqlite_failure_repo import SQLiteFailureRepository
+        from src.infrastructure.sqlite_partial_repo import (
+            SQLitePartialDownloadRepository,
+        )
+        from src.infrastructure.path_allocator import PathAllocator
+        from src.infrastructure.yt_dlp_service import YTDLPService
+
         # Cria diretório de downloads se não existir
         downloads_dir = Path("downloads")
         downloads_dir.mkdir(exist_ok=True)
 
-        # Instancia dependências
-        downloader = YTDLPService()
-        repo = SQLiteVideoRepository()
-        usecase = DownloadVideo(downloader, repo)
+        # Blobs endereçados por conteúdo, no mesmo disco dos downloads para
+        # que as cópias possam ser hardlinks
+        content_store = None
+        if not args.no_dedup:
+            from src.infrastructure.content_store import ContentAddressedStore
+
+            content_store = ContentAddressedStore(root=str(downloads_dir / ".objects"))
+            # Sem a lista de hashes em uso, nenhum blob é removido
+            referenced = repo.content_hashes()
+            if referenced is not None:
+                content_store.prune(referenced)
+
+        downloader = YTDLPService(
+            reuse_session=True,
+            probe_cache=ProbeCache(pool=pool),
+            partial_repo=SQLitePartialDownloadRepository(pool=pool),
+            fragment_concurrency=4,
+            request_limiter=HostRateLimiter(args.host_rps) if args.host_rps else None,
+            bandwidth=BandwidthGovernor(args.limit_rate) if args.limit_rate else None,
+            metrics=metrics,
+            content_store=content_store,
+            path_allocator=PathAllocator(root=str(downloads_dir)),
+            defer_postprocess=args.postprocess,
+        )
+        failure_repo = SQLiteFailureRepository(pool=pool)
+        failure_repo.purge_expired()
+
+        if args.postprocess:
+            from src.infrastructure.ffmpeg_postprocessor import FFmpegPostProcessor
+            from src.usecases.postprocess_videos import PostprocessVideos
+
+            # Remux e extração de áudio em um processo por núcleo, retomando
+            # o que ficou pendente na execução anterior
+            postprocess = PostprocessVideos(
+                FFmpegPostProcessor(), repo, content_store=content_store
+            )
+            postprocess.resume()
+
+        if args.serve is not None:
+            from src.infrastructure.sqlite_job_repo import SQLiteJobRepository
+            from src.presentation.http_api import DownloadApiServer
+            from src.usecases.download_video import DownloadVideo
+            from src.usecases.process_download_queue import ProcessDownloadQueue
+
+            # Modo servidor: o caso de uso fica "quente" em memória e recebe
+            # URLs pela API; --jobs workers processam a fila persistente
+            queue = ProcessDownloadQueue(
+                DownloadVideo(
+                    downloader,
+                    repo,
+                    failure_repo=failure_repo,
+                    retry_failed=args.retry_failed,
+                    metrics_repo=metrics_repo,
+                    metrics=metrics,
+                    content_store=content_store,
+                    profile=args.profile,
+                    postprocess=postprocess,
+                ),
+                SQLiteJobRepository(pool=pool),
+            )
+            with DownloadApiServer(
+                queue,
+                repo,
+                port=args.serve,
+                workers=args.jobs,
+                release=pool.release,
+            ) as server:
+                host, port = server.address
+                print(f"🌐 API em http://{host}:{port} (Ctrl+C para encerrar)")
+                server.serve_forever()
+            return
+
+        if args.sync is not None:
+            from src.infrastructure.sqlite_job_repo import SQLiteJobRepository
+            from src.infrastructure.sqlite_subscription_repo import (
+                SQLiteSubscriptionRepository,
+            )
+            from src.presentation.cli import run_sync_cli
+            from src.usecases.download_video import DownloadVideo
+            from src.usecases.process_download_queue import ProcessDownloadQueue
+            from src.usecases.sync_channel import SyncChannel
+
+            # Sincronização incremental: enfileira só os uploads novos de
+            # cada canal e processa a fila persistente
+            subscriptions = SQLiteSubscriptionRepository(pool=pool)
+            queue = ProcessDownloadQueue(
+                DownloadVideo(
+                    downloader,
+                    repo,
+                    failure_repo=failure_repo,
+                    retry_failed=args.retry_failed,
+                    metrics_repo=metrics_repo,
+                    metrics=metrics,
+                    content_store=content_store,
+                    profile=args.profile,
+                    postprocess=postprocess,
+                ),
+                SQLiteJobRepository(pool=pool),
+            )
+            channels = args.sync or [sub.url for sub in subscriptions.get_all()]
+            exit_code = run_sync_cli(
+                SyncChannel(downloader, repo, subscriptions),
+                queue,
+                channels,
+                json_output=args.json,
+            )
+            sys.exit(exit_code)
+
+        if args.batch:
+            from src.infrastructure.sqlite_job_repo import SQLiteJobRepository
+            from src.presentation.cli import run_batch_cli
+            from src.usecases.download_video_batch import DownloadVideoBatch
+            from src.usecases.expand_playlist import ExpandPlaylist
+            from src.usecases.process_download_queue import ProcessDownloadQueue
+
+            # Modo não interativo: lê as URLs do arquivo (ou stdin) sob demanda
+            usecase = DownloadVideoBatch(
+                downloader,
+                repo,
+                max_workers=args.jobs,
+                per_host_limit=args.per_host,
+                failure_repo=failure_repo,
+                retry_failed=args.retry_failed,
+                metrics_repo=metrics_repo,
+                metrics=metrics,
+                content_store=content_store,
+                profile=args.profile,
+                postprocess=postprocess,
+            )
+            # As URLs passam pela fila persistente: depois de um Ctrl+C, a
+            # próxima execução retoma os jobs que ficaram pendentes
+            queue = ProcessDownloadQueue(usecase, SQLiteJobRepository(pool=pool))
+            # Playlists e canais viram os seus vídeos ainda não baixados
+            options = dict(
+                json_output=args.json,
+                expander=ExpandPlaylist(downloader, repo),
+                queue_usecase=queue,
+            )
+            if args.batch == "-":
+                exit_code = run_batch_cli(usecase, sys.stdin, **options)
+            else:
+                with open(args.batch, encoding="utf-8") as lines:
+                    exit_code = run_batch_cli(usecase, lines, **options)
+            sys.exit(exit_code)
+
+        from src.presentation.cli import run_cli
+        from src.usecases.download_video import DownloadVideo
+
+        usecase = DownloadVideo(
+            downloader,
+            repo,
+            failure_repo=failure_repo,
+            retry_failed=args.retry_failed,
+            metrics_repo=metrics_repo,
+            metrics=metrics,
+            content_store=content_store,
+            profile=args.profile,
+            postprocess=postprocess,
+        )
 
         # Executa CLI
         run_cli(usecase)
 
     except KeyboardInterrupt:
+        interrupted = True
         logger.info("Aplicação interrompida pelo usuário")
         print("\n\nAté logo!")
     except Exception as e:
@@ -77,7 +308,16 @@ def main():
         print(f"\n❌ Erro fatal: {e}")
         sys.exit(1)
     finally:
+        if postprocess is not None:
+            # Interrompido: o que não começou fica pendente para a próxima vez
+            postprocess.close(wait=not interrupted)
+        if metrics_server is not None:
+            metrics_server.close()
+        if downloader is not None:
+            downloader.close()
+        pool.close_all()
         logger.info("Aplicação finalizada")
+        log_listener.stop()
 
 
 if __name__ == "__main__":
@@ -1,5 +1,27 @@
+import time
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
+from enum import Enum
+from typing import Iterator, Optional
+
+from src.domain.failures import FailureCategory
+
+
+class FormatProfile(str, Enum):
+    """Perfis de seleção de formato: o que baixar de cada vídeo."""
+
+    AUDIO = "audio"
+    SD = "720p"
+    ARCHIVAL = "archival"
+
+
+class PostprocessStatus(str, Enum):
+    """Estados do pós-processamento de um vídeo baixado."""
+
+    PENDING = "pending"
+    DONE = "done"
+    FAILED = "failed"
 
 
 @dataclass
@@ -8,3 +30,121 @@ class Video:
     title: str
     file_path: str
     downloaded_at: datetime
+    content_hash: Optional[str] = None
+    format_profile: Optional[FormatProfile] = None
+    postprocess_status: Optional[PostprocessStatus] = None
+
+
+class JobStatus(str, Enum):
+    """Estados possíveis de um job na fila de downloads."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+@dataclass
+class Job:
+    url: str
+    status: JobStatus
+    attempts: int
+    created_at: datetime
+    updated_at: datetime
+    id: int
+    worker_id: Optional[str] = None
+    lease_expires_at: Optional[datetime] = None
+    last_error: Optional[str] = None
+    available_at: Optional[datetime] = None
+
+
+@dataclass
+class PartialDownload:
+    url: str
+    temp_path: str
+    bytes_done: int
+    updated_at: datetime
+    total_bytes: Optional[int] = None
+    format_id: Optional[str] = None
+    etag: Optional[str] = None
+
+
+@dataclass
+class FailedDownload:
+    url: str
+    reason: str
+    category: FailureCategory
+    failed_at: datetime
+    expires_at: datetime
+
+
+@dataclass
+class PlaylistEntry:
+    url: str
+    video_id: Optional[str] = None
+    title: Optional[str] = None
+    upload_date: Optional[str] = None
+
+
+@dataclass
+class Subscription:
+    url: str
+    last_video_id: Optional[str] = None
+    last_upload_date: Optional[str] = None
+    last_synced_at: Optional[datetime] = None
+
+
+class DownloadOutcome(str, Enum):
+    """Resultado de uma chamada de download, para as métricas."""
+
+    PENDING = "pending"
+    DOWNLOADED = "downloaded"
+    EXISTING = "existing"
+    SKIPPED = "skipped"
+    FAILED = "failed"
+
+
+# Fases medidas em DownloadStats (cada uma vira o campo <fase>_s)
+DOWNLOAD_PHASES = (
+    "validation",
+    "lookup",
+    "extraction",
+    "transfer",
+    "postprocess",
+    "save",
+)
+
+
+@dataclass
+class DownloadStats:
+    url: str
+    started_at: datetime
+    outcome: DownloadOutcome = DownloadOutcome.PENDING
+    validation_s: float = 0.0
+    lookup_s: float = 0.0
+    extraction_s: float = 0.0
+    transfer_s: float = 0.0
+    postprocess_s: float = 0.0
+    save_s: float = 0.0
+    total_s: float = 0.0
+    bytes_downloaded: int = 0
+    error: Optional[str] = None
+
+    @property
+    def speed(self) -> float:
+        """Velocidade média da transferência, em bytes/s."""
+        return self.bytes_downloaded / self.transfer_s if self.transfer_s else 0.0
+
+    def add(self, phase: str, seconds: float) -> None:
+        """Soma um intervalo ao tempo de uma fase."""
+        attr = f"{phase}_s"
+        setattr(self, attr, getattr(self, attr) + seconds)
+
+    @contextmanager
+    def phase(self, phase: str) -> Iterator[None]:
+        """Mede o tempo do bloco e o soma à fase informada."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(phase, time.perf_counter() - start)
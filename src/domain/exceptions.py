@@ -33,3 +33,23 @@ class VideoNotSavedException(DomainException):
 
     def __init__(self, reason: str = "Erro ao salvar no banco de dados"):
         super().__init__(reason)
+
+
+class JobQueueException(DomainException):
+    """Levantada quando a fila de downloads não pode ser acessada."""
+
+    def __init__(self, reason: str = "Erro ao acessar a fila de downloads"):
+        super().__init__(reason)
+
+
+class PostprocessFailedException(DomainException):
+    """Levantada quando o pós-processamento de um arquivo falha."""
+
+    def __init__(self, path: str, reason: str = "Erro desconhecido"):
+        self.path = path
+        self.reason = reason
+        super().__init__(f"Falha ao pós-processar {path}: {reason}")
+
+    def __reduce__(self):
+        # Levantada em processos do pool: precisa voltar intacta do pickle
+        return type(self), (self.path, self.reason)
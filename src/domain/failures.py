@@ -0,0 +1,122 @@
+"""
+Classificação de falhas de download.
+
+A mensagem de erro de um DownloadFailedException (o ``reason``) é
+reduzida a uma categoria. Categorias transitórias (limite de requisições,
+erros 5xx, timeouts, quedas de conexão) podem ser retentadas; as
+permanentes (vídeo privado, removido, bloqueado na região, URL não
+suportada) não mudam com uma nova tentativa.
+"""
+
+import re
+from datetime import timedelta
+from enum import Enum
+from typing import Dict, Optional
+
+
+class FailureCategory(str, Enum):
+    """Categorias de falha de download."""
+
+    RATE_LIMITED = "rate_limited"
+    SERVER_ERROR = "server_error"
+    TIMEOUT = "timeout"
+    NETWORK = "network"
+    PRIVATE = "private"
+    UNAVAILABLE = "unavailable"
+    GEO_BLOCKED = "geo_blocked"
+    UNSUPPORTED = "unsupported"
+    UNKNOWN = "unknown"
+
+    @property
+    def retryable(self) -> bool:
+        """Indica se uma nova tentativa pode ter sucesso."""
+        return self in _RETRYABLE
+
+
+_RETRYABLE = {
+    FailureCategory.RATE_LIMITED,
+    FailureCategory.SERVER_ERROR,
+    FailureCategory.TIMEOUT,
+    FailureCategory.NETWORK,
+    # Sem informação suficiente, é mais seguro tentar de novo
+    FailureCategory.UNKNOWN,
+}
+
+# Avaliados em ordem: a primeira categoria que casar é a escolhida
+_PATTERNS = [
+    (
+        FailureCategory.RATE_LIMITED,
+        re.compile(
+            r"\b429\b|too many requests|rate.?limit|confirm you.?re not a bot",
+            re.IGNORECASE,
+        ),
+    ),
+    (
+        FailureCategory.SERVER_ERROR,
+        re.compile(
+            r"HTTP Error 5\d\d\b|internal server error|bad gateway|"
+            r"service unavailable",
+            re.IGNORECASE,
+        ),
+    ),
+    (
+        FailureCategory.TIMEOUT,
+        re.compile(r"timed? ?out|timeout|tempo limite", re.IGNORECASE),
+    ),
+    (
+        FailureCategory.NETWORK,
+        re.compile(
+            r"connection (reset|refused|aborted)|network is unreachable|"
+            r"temporary failure in name resolution|incomplete ?read",
+            re.IGNORECASE,
+        ),
+    ),
+    (
+        FailureCategory.PRIVATE,
+        re.compile(r"private video|sign in|members.only|login required", re.IGNORECASE),
+    ),
+    (
+        FailureCategory.GEO_BLOCKED,
+        re.compile(r"in your country|geo.?restrict|geo.?block", re.IGNORECASE),
+    ),
+    (
+        FailureCategory.UNAVAILABLE,
+        re.compile(
+            r"video unavailable|has been removed|no longer available|"
+            r"account .*terminated|does not exist|\b404\b|\b410\b",
+            re.IGNORECASE,
+        ),
+    ),
+    (
+        FailureCategory.UNSUPPORTED,
+        re.compile(r"unsupported url|no video formats found", re.IGNORECASE),
+    ),
+]
+
+
+def classify_failure(reason: Optional[str]) -> FailureCategory:
+    """
+    Classifica a mensagem de erro de um download.
+
+    Args:
+        reason: Mensagem de erro (ex: DownloadFailedException.reason)
+
+    Returns:
+        FailureCategory correspondente, ou UNKNOWN se nada casar
+    """
+    if not reason:
+        return FailureCategory.UNKNOWN
+    for category, pattern in _PATTERNS:
+        if pattern.search(reason):
+            return category
+    return FailureCategory.UNKNOWN
+
+
+# Por quanto tempo uma falha é lembrada (cache negativo), por categoria.
+# Falhas transitórias não são lembradas: a fila já as retenta com backoff.
+DEFAULT_FAILURE_TTLS: Dict[FailureCategory, timedelta] = {
+    FailureCategory.PRIVATE: timedelta(days=1),
+    FailureCategory.GEO_BLOCKED: timedelta(days=1),
+    FailureCategory.UNAVAILABLE: timedelta(days=7),
+    FailureCategory.UNSUPPORTED: timedelta(days=30),
+}
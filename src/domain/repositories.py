@@ -1,7 +1,16 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Set
 
-from src.domain.entities import Video
+from src.domain.entities import (
+    DownloadStats,
+    FailedDownload,
+    Job,
+    PartialDownload,
+    PostprocessStatus,
+    Subscription,
+    Video,
+)
 
 
 class VideoRepository(ABC):
@@ -24,3 +33,252 @@ class VideoRepository(ABC):
     def get_all(self) -> List[Video]:
         """Retorna todos os vídeos salvos."""
         pass
+
+    @abstractmethod
+    def iter_videos(
+        self, after: Optional[datetime] = None, limit: Optional[int] = None
+    ) -> Iterator[Video]:
+        """
+        Percorre os vídeos do mais recente para o mais antigo, sob demanda.
+
+        Args:
+            after: Se informado, retorna apenas vídeos baixados antes desta data
+            limit: Quantidade máxima de vídeos retornados
+        """
+        pass
+
+    @abstractmethod
+    def save_many(self, videos: Iterable[Video]) -> int:
+        """
+        Salva vários vídeos em uma única transação.
+        URLs já existentes são ignoradas; variantes de URL de um vídeo já
+        salvo atualizam o registro dele. Retorna quantos foram gravados.
+        """
+        pass
+
+    @abstractmethod
+    def find_by_urls(self, urls: Iterable[str]) -> Dict[str, Video]:
+        """Busca vários vídeos de uma vez. Retorna um dicionário url -> Video."""
+        pass
+
+    @abstractmethod
+    def find_by_content_hash(self, content_hash: str) -> Optional[Video]:
+        """Busca um vídeo com o mesmo conteúdo (hash do arquivo)."""
+        pass
+
+    @abstractmethod
+    def content_hashes(self) -> Optional[Set[str]]:
+        """
+        Retorna os hashes de conteúdo de todos os vídeos salvos, ou None se
+        o repositório não puder ser lido.
+        """
+        pass
+
+    @abstractmethod
+    def find_by_postprocess_status(self, status: PostprocessStatus) -> List[Video]:
+        """Busca os vídeos cujo pós-processamento está no estado informado."""
+        pass
+
+    @abstractmethod
+    def update_postprocess(
+        self,
+        url: str,
+        status: PostprocessStatus,
+        file_path: Optional[str] = None,
+        content_hash: Optional[str] = None,
+    ) -> None:
+        """
+        Atualiza o estado do pós-processamento de um vídeo e, se
+        informados, o caminho e o hash do arquivo processado.
+        """
+        pass
+
+
+class JobRepository(ABC):
+    """
+    Interface para a fila persistente de jobs de download.
+    Cada job passa por pending -> running -> done/failed.
+    """
+
+    @abstractmethod
+    def enqueue_many(self, urls: Iterable[str]) -> int:
+        """Enfileira URLs ainda não conhecidas. Retorna quantas foram inseridas."""
+        pass
+
+    @abstractmethod
+    def enqueue(self, url: str) -> Job:
+        """
+        Enfileira uma URL e retorna o seu job. Se a URL já estiver na
+        fila, retorna o job existente, em qualquer estado.
+        """
+        pass
+
+    @abstractmethod
+    def find_by_urls(self, urls: Iterable[str]) -> Dict[str, Job]:
+        """Busca os jobs de várias URLs, indexados pela URL."""
+        pass
+
+    @abstractmethod
+    def reopen_many(self, job_ids: Iterable[int]) -> int:
+        """
+        Devolve à fila, com as tentativas zeradas, jobs concluídos ou que
+        falharam. Retorna quantos foram reabertos.
+        """
+        pass
+
+    @abstractmethod
+    def claim(self, worker_id: str, lease_seconds: float) -> Optional[Job]:
+        """
+        Reserva atomicamente o próximo job disponível para o worker.
+        Jobs em execução com lease expirado também podem ser reservados.
+        """
+        pass
+
+    @abstractmethod
+    def complete(self, job_id: int) -> None:
+        """Marca um job como concluído."""
+        pass
+
+    @abstractmethod
+    def fail(
+        self,
+        job_id: int,
+        reason: str,
+        retry: bool,
+        retry_at: Optional[datetime] = None,
+    ) -> None:
+        """
+        Registra a falha de um job, devolvendo-o à fila se retry=True.
+        Com retry_at, o job só volta a ser reservado a partir desse momento.
+        """
+        pass
+
+    @abstractmethod
+    def release(self, job_id: int) -> None:
+        """Devolve um job à fila sem contabilizar a tentativa como falha."""
+        pass
+
+    @abstractmethod
+    def requeue_running(self) -> int:
+        """Devolve à fila todos os jobs em execução (ex: após um crash)."""
+        pass
+
+    @abstractmethod
+    def get(self, job_id: int) -> Optional[Job]:
+        """Busca um job pelo id."""
+        pass
+
+    @abstractmethod
+    def count_by_status(self) -> Dict[str, int]:
+        """Retorna a quantidade de jobs em cada estado."""
+        pass
+
+    @abstractmethod
+    def next_available_at(self) -> Optional[datetime]:
+        """
+        Retorna quando o próximo job pendente pode ser reservado (o momento
+        atual, se algum já estiver disponível), ou None sem jobs pendentes.
+        """
+        pass
+
+
+class PartialDownloadRepository(ABC):
+    """
+    Interface para o estado de downloads interrompidos.
+    Permite retomar um download a partir do último byte recebido.
+    """
+
+    @abstractmethod
+    def save_progress(self, partial: PartialDownload) -> None:
+        """Grava (ou atualiza) o progresso de um download."""
+        pass
+
+    @abstractmethod
+    def find(self, url: str) -> Optional[PartialDownload]:
+        """Busca o progresso salvo de uma URL."""
+        pass
+
+    @abstractmethod
+    def delete(self, url: str) -> None:
+        """Remove o progresso de uma URL (ex: após concluir o download)."""
+        pass
+
+
+class FailureRepository(ABC):
+    """
+    Interface para o cache negativo de downloads que falharam.
+    Cada falha tem um prazo de validade (expires_at) definido pela categoria.
+    """
+
+    @abstractmethod
+    def record(self, failure: FailedDownload) -> None:
+        """Grava (ou substitui) a falha de uma URL."""
+        pass
+
+    @abstractmethod
+    def find(self, url: str) -> Optional[FailedDownload]:
+        """Busca a falha registrada para uma URL, mesmo que já expirada."""
+        pass
+
+    @abstractmethod
+    def find_many(self, urls: Iterable[str]) -> Dict[str, FailedDownload]:
+        """Busca as falhas registradas de várias URLs."""
+        pass
+
+    @abstractmethod
+    def delete(self, url: str) -> None:
+        """Remove a falha de uma URL (ex: após um download bem-sucedido)."""
+        pass
+
+    @abstractmethod
+    def delete_many(self, urls: Iterable[str]) -> None:
+        """Remove as falhas de várias URLs em uma única transação."""
+        pass
+
+    @abstractmethod
+    def purge_expired(self) -> int:
+        """Remove as falhas expiradas. Retorna quantas foram removidas."""
+        pass
+
+
+class SubscriptionRepository(ABC):
+    """
+    Interface para os canais sincronizados periodicamente.
+    Guarda, por canal, o vídeo mais novo já visto (high-water mark).
+    """
+
+    @abstractmethod
+    def save(self, subscription: Subscription) -> None:
+        """Grava (ou atualiza) a assinatura de um canal."""
+        pass
+
+    @abstractmethod
+    def find(self, url: str) -> Optional[Subscription]:
+        """Busca a assinatura de um canal por qualquer URL dele."""
+        pass
+
+    @abstractmethod
+    def get_all(self) -> List[Subscription]:
+        """Retorna todas as assinaturas."""
+        pass
+
+
+class DownloadMetricsRepository(ABC):
+    """Interface para as métricas de desempenho de cada download."""
+
+    @abstractmethod
+    def record(self, stats: DownloadStats) -> None:
+        """Grava as métricas de um download."""
+        pass
+
+    @abstractmethod
+    def record_many(self, stats: Iterable[DownloadStats]) -> None:
+        """Grava as métricas de vários downloads em uma transação."""
+        pass
+
+    @abstractmethod
+    def find_since(
+        self, since: datetime, until: Optional[datetime] = None
+    ) -> List[DownloadStats]:
+        """Retorna as métricas dos downloads iniciados no intervalo."""
+        pass
@@ -1,5 +1,10 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Tuple
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, TypeVar
+
+from src.domain.entities import DownloadStats, FormatProfile, PlaylistEntry
+
+T = TypeVar("T")
 
 
 class VideoDownloaderService(ABC):
@@ -10,12 +15,20 @@ class VideoDownloaderService(ABC):
     """
 
     @abstractmethod
-    def download(self, url: str) -> Tuple[str, str]:
+    def download(
+        self,
+        url: str,
+        stats: Optional[DownloadStats] = None,
+        profile: Optional[FormatProfile] = None,
+    ) -> Tuple[str, str]:
         """
         Faz o download de um vídeo a partir de uma URL.
 
         Args:
             url: URL do vídeo a ser baixado
+            stats: Métricas opcionais a preencher (tempos de extração,
+                transferência e pós-processamento, bytes recebidos)
+            profile: Perfil de formato; None usa a escolha padrão do serviço
 
         Returns:
             Tuple contendo (título do vídeo, caminho do arquivo)
@@ -24,3 +37,159 @@ class VideoDownloaderService(ABC):
             Exception: Caso ocorra erro no download
         """
         pass
+
+    def probe(self, url: str) -> Dict[str, Any]:
+        """
+        Obtém os metadados de um vídeo sem baixá-lo.
+
+        Args:
+            url: URL do vídeo
+
+        Returns:
+            Dicionário com os metadados (título, formatos, duração, ...)
+
+        Raises:
+            NotImplementedError: Se a implementação não suportar a operação
+        """
+        raise NotImplementedError
+
+    def iter_playlist(self, url: str) -> Iterator[PlaylistEntry]:
+        """
+        Enumera os vídeos de uma playlist ou canal, sob demanda.
+
+        A enumeração deve ser preguiçosa: novas páginas só são buscadas
+        quando o chamador consome as entradas anteriores, então parar a
+        iteração interrompe a paginação.
+
+        Args:
+            url: URL da playlist ou canal
+
+        Yields:
+            PlaylistEntry: Um vídeo da coleção, sem extração individual
+
+        Raises:
+            NotImplementedError: Se a implementação não suportar a operação
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """
+        Libera recursos mantidos pelo serviço (sessões, conexões).
+        Implementações sem estado não precisam sobrescrever.
+        """
+
+    def __enter__(self) -> "VideoDownloaderService":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+class AsyncVideoDownloaderService(ABC):
+    """
+    Abstração assíncrona (asyncio) para serviços de download de vídeo.
+    Permite integrar o downloader a aplicações baseadas em event loop
+    sem bloquear o loop durante o download.
+    """
+
+    @abstractmethod
+    async def download(self, url: str) -> Tuple[str, str]:
+        """
+        Faz o download de um vídeo a partir de uma URL.
+
+        Args:
+            url: URL do vídeo a ser baixado
+
+        Returns:
+            Tuple contendo (título do vídeo, caminho do arquivo)
+        """
+        pass
+
+    async def run_blocking(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Executa uma chamada bloqueante (ex: consultas ao repositório) fora
+        do event loop. Por padrão usa o executor padrão do loop.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, func, *args)
+
+    async def aclose(self) -> None:
+        """Libera recursos mantidos pelo serviço."""
+
+    async def __aenter__(self) -> "AsyncVideoDownloaderService":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+
+class MetricsRecorder(ABC):
+    """
+    Abstração para métricas operacionais (contadores, gauges e
+    histogramas) com rótulos. Os componentes instrumentados recebem um
+    MetricsRecorder opcional; sem ele, nenhuma medição é feita.
+    """
+
+    @abstractmethod
+    def inc(self, name: str, amount: float = 1.0, **labels: str) -> None:
+        """Soma amount a um contador ou gauge (valores negativos só em gauges)."""
+        pass
+
+    @abstractmethod
+    def set(self, name: str, value: float, **labels: str) -> None:
+        """Define o valor de um gauge."""
+        pass
+
+    @abstractmethod
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        """Registra uma observação em um histograma."""
+        pass
+
+
+class ContentStore(ABC):
+    """
+    Abstração para armazenamento endereçado por conteúdo.
+    Arquivos com o mesmo conteúdo (ex: o mesmo vídeo publicado em URLs
+    diferentes) passam a compartilhar um único blob em disco.
+    """
+
+    @abstractmethod
+    def store(self, path: str) -> Optional[str]:
+        """
+        Guarda o arquivo sob o hash do seu conteúdo. Se o conteúdo já
+        existir, o arquivo é substituído por um link para o blob existente.
+
+        Args:
+            path: Caminho do arquivo baixado
+
+        Returns:
+            Hash do conteúdo, ou None se o arquivo não puder ser lido
+        """
+        pass
+
+
+class PostProcessor(ABC):
+    """
+    Abstração para o pós-processamento de arquivos baixados (remux,
+    extração de áudio, etc.). Roda em processos separados dos downloads,
+    então as implementações precisam ser serializáveis (pickle).
+    """
+
+    @abstractmethod
+    def process(
+        self, path: str, profile: Optional[FormatProfile] = None
+    ) -> Optional[str]:
+        """
+        Pós-processa um arquivo baixado.
+
+        Args:
+            path: Caminho do arquivo baixado
+            profile: Perfil de formato usado no download
+
+        Returns:
+            Caminho do arquivo processado, ou None se nada foi alterado
+
+        Raises:
+            PostprocessFailedException: Se o processamento falhar
+        """
+        pass
@@ -0,0 +1,159 @@
+"""
+Canonicalização de URLs de vídeo.
+
+Variações de URL que apontam para o mesmo vídeo (youtu.be/X,
+youtube.com/watch?v=X&t=10s, m.youtube.com/..., /shorts/X, ...) são
+reduzidas a uma chave única no formato "extrator:id". A chave é usada
+para deduplicar downloads sem depender da URL exata digitada.
+
+URLs de coleções (playlists, canais) não têm chave de vídeo; elas são
+reconhecidas por is_collection_url() para serem expandidas em vídeos.
+"""
+
+import re
+from typing import Optional
+from urllib.parse import parse_qs, urlparse
+
+_YOUTUBE_ID = re.compile(r"^[A-Za-z0-9_-]{11}$")
+_YOUTUBE_HOSTS = {
+    "youtube.com",
+    "m.youtube.com",
+    "music.youtube.com",
+    "youtube-nocookie.com",
+}
+# Prefixos de caminho no formato /<prefixo>/<id>
+_YOUTUBE_PATH_PREFIXES = {"shorts", "embed", "live", "v", "e"}
+
+_VIMEO_HOSTS = {"vimeo.com", "player.vimeo.com"}
+_VIMEO_ID = re.compile(r"^\d+$")
+
+# Primeiro segmento do caminho de URLs de coleção
+_YOUTUBE_COLLECTION_PREFIXES = {"playlist", "channel", "c", "user"}
+_VIMEO_COLLECTION_PREFIXES = {"channels", "showcase", "album", "groups"}
+# Coleções que representam um canal (uploads do mais novo para o mais antigo)
+_YOUTUBE_CHANNEL_PREFIXES = {"channel", "c", "user"}
+_VIMEO_CHANNEL_PREFIXES = {"channels"}
+
+
+def _normalize_host(netloc: str) -> str:
+    """Remove porta, credenciais e o prefixo www. do host."""
+    host = netloc.rsplit("@", 1)[-1].split(":", 1)[0].lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+def _youtube_id(host: str, path: str, query: str) -> Optional[str]:
+    """Extrai o id de um vídeo do YouTube, se a URL for de um."""
+    segments = [segment for segment in path.split("/") if segment]
+
+    if host == "youtu.be":
+        candidate = segments[0] if segments else None
+    elif host in _YOUTUBE_HOSTS:
+        if segments == ["watch"]:
+            candidate = parse_qs(query).get("v", [None])[0]
+        elif len(segments) >= 2 and segments[0] in _YOUTUBE_PATH_PREFIXES:
+            candidate = segments[1]
+        else:
+            candidate = None
+    else:
+        return None
+
+    if candidate and _YOUTUBE_ID.match(candidate):
+        return candidate
+    return None
+
+
+def _vimeo_id(host: str, path: str) -> Optional[str]:
+    """Extrai o id de um vídeo do Vimeo, se a URL for de um."""
+    if host not in _VIMEO_HOSTS:
+        return None
+    segments = [segment for segment in path.split("/") if segment]
+    if segments and segments[0] == "video":
+        segments = segments[1:]
+    if segments and _VIMEO_ID.match(segments[0]):
+        return segments[0]
+    return None
+
+
+def canonical_video_key(url: str) -> Optional[str]:
+    """
+    Calcula a chave canônica (extrator:id) de uma URL de vídeo.
+
+    Args:
+        url: URL do vídeo
+
+    Returns:
+        Chave no formato "youtube:<id>" ou "vimeo:<id>", ou None se a URL
+        não for reconhecida (nesse caso a URL exata é usada como chave).
+    """
+    try:
+        parsed = urlparse(url.strip())
+    except (AttributeError, ValueError):
+        return None
+
+    host = _normalize_host(parsed.netloc)
+
+    video_id = _youtube_id(host, parsed.path, parsed.query)
+    if video_id:
+        return f"youtube:{video_id}"
+
+    video_id = _vimeo_id(host, parsed.path)
+    if video_id:
+        return f"vimeo:{video_id}"
+
+    return None
+
+
+def is_collection_url(url: str) -> bool:
+    """
+    Indica se a URL aponta para uma coleção de vídeos (playlist ou canal)
+    em vez de um único vídeo.
+
+    Uma URL de vídeo com parâmetro list= (watch?v=X&list=Y) continua sendo
+    tratada como vídeo.
+    """
+    if canonical_video_key(url) is not None:
+        return False
+    try:
+        parsed = urlparse(url.strip())
+    except (AttributeError, ValueError):
+        return False
+
+    host = _normalize_host(parsed.netloc)
+    segments = [segment for segment in parsed.path.split("/") if segment]
+    if not segments:
+        return False
+
+    if host in _YOUTUBE_HOSTS:
+        return segments[0] in _YOUTUBE_COLLECTION_PREFIXES or segments[0].startswith(
+            "@"
+        )
+    if host in _VIMEO_HOSTS:
+        return segments[0] in _VIMEO_COLLECTION_PREFIXES
+    return False
+
+
+def channel_key(url: str) -> Optional[str]:
+    """
+    Calcula a chave de um canal, ignorando abas e parâmetros da URL.
+
+    Returns:
+        Chave no formato "youtube:@nome", "youtube:channel:<id>",
+        "vimeo:channels:<nome>", ..., ou None se a URL não for de um canal
+        (playlists não são canais: sua ordem não é cronológica).
+    """
+    if not is_collection_url(url):
+        return None
+    parsed = urlparse(url.strip())
+    host = _normalize_host(parsed.netloc)
+    segments = [segment for segment in parsed.path.split("/") if segment]
+
+    if host in _YOUTUBE_HOSTS:
+        if segments[0].startswith("@"):
+            return f"youtube:{segments[0].lower()}"
+        if segments[0] in _YOUTUBE_CHANNEL_PREFIXES and len(segments) >= 2:
+            name = segments[1] if segments[0] == "channel" else segments[1].lower()
+            return f"youtube:{segments[0]}:{name}"
+        return None
+    if segments[0] in _VIMEO_CHANNEL_PREFIXES and len(segments) >= 2:
+        return f"vimeo:{segments[0]}:{segments[1].lower()}"
+    return None
@@ -0,0 +1,50 @@
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Tuple, TypeVar
+
+from src.domain.services import AsyncVideoDownloaderService, VideoDownloaderService
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+
+class ExecutorAsyncDownloader(AsyncVideoDownloaderService):
+    """
+    Adapta um VideoDownloaderService síncrono para a interface assíncrona.
+
+    O trabalho bloqueante (yt-dlp) roda em um ThreadPoolExecutor limitado a
+    ``max_workers`` threads. Downloads cancelados antes de começar são
+    removidos da fila do executor; um download já em andamento não pode
+    ser interrompido, mas o resultado é descartado.
+
+    Chamadas bloqueantes do caso de uso (run_blocking) usam o mesmo
+    executor, sem criar threads além de ``max_workers``.
+    """
+
+    def __init__(self, downloader: VideoDownloaderService, max_workers: int = 4):
+        self.downloader = downloader
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="async-download"
+        )
+
+    async def download(self, url: str) -> Tuple[str, str]:
+        """Executa o download no executor sem bloquear o event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.downloader.download, url)
+
+    async def run_blocking(self, func: Callable[..., T], *args: Any) -> T:
+        """Executa a chamada bloqueante no executor dos downloads."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    async def aclose(self) -> None:
+        """Encerra o executor e fecha o downloader síncrono."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None, lambda: self._executor.shutdown(wait=True, cancel_futures=True)
+        )
+        self.downloader.close()
+        logger.debug("Downloader assíncrono encerrado")
@@ -0,0 +1,305 @@
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from src.domain.services import ContentStore
+
+fcntl: Optional[ModuleType]
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# ioctl do Linux que clona os extents de um arquivo (btrfs, XFS, bcachefs)
+_FICLONE = 0x40049409
+
+# Hashes de arquivos concluídos ainda não consumidos por store(); arquivos
+# intermediários (ex: formatos separados de áudio e vídeo) nunca são
+# consumidos e saem daqui pela ordem de chegada
+_MAX_FINISHED = 64
+
+
+@dataclass
+class _PartialHash:
+    """Hash incremental de um arquivo em transferência."""
+
+    hasher: Any
+    offset: int = 0
+
+
+def _reflink(source: str, target: str) -> None:
+    """
+    Cria target como clone copy-on-write de source.
+
+    Raises:
+        OSError: Se o sistema ou o sistema de arquivos não suportar reflink
+    """
+    if fcntl is None:
+        raise OSError("reflink não suportado nesta plataforma")
+    with open(source, "rb") as src, open(target, "xb") as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+        except OSError:
+            dst.close()
+            os.unlink(target)
+            raise
+
+
+class ContentAddressedStore(ContentStore):
+    """
+    Armazena os downloads em blobs nomeados pelo hash do conteúdo
+    (``root/ab/abcdef...``); o arquivo em downloads/ vira um hardlink (ou,
+    se não for possível, um reflink) para o blob. Cópias idênticas baixadas
+    de URLs diferentes ocupam o espaço de uma só.
+
+    O hash é calculado durante o download: on_progress() deve ser
+    registrado como hook de progresso do yt-dlp e lê apenas os bytes
+    recebidos desde o evento anterior, ainda no cache de páginas do
+    sistema. store() só lê o arquivo inteiro quando não houver hash
+    incremental válido (ex: arquivo alterado pelo pós-processamento ou
+    baixado em outro processo).
+
+    Como hardlinks compartilham o mesmo inode, alterar um dos arquivos
+    altera todas as cópias. Blobs e arquivos precisam estar no mesmo
+    sistema de arquivos; caso contrário o arquivo é mantido como está e
+    apenas o hash é devolvido.
+    """
+
+    def __init__(
+        self,
+        root: str = "downloads/.objects",
+        algorithm: str = "sha256",
+        chunk_size: int = 1024 * 1024,
+    ):
+        self.root = root
+        self.algorithm = algorithm
+        self.chunk_size = chunk_size
+        self._lock = threading.Lock()
+        self._partial: Dict[str, _PartialHash] = {}
+        # (dispositivo, inode) -> (hash, tamanho, mtime_ns) no fim do
+        # download; o inode sobrevive a renomeações (ex: .incomplete -> final)
+        self._finished: "OrderedDict[Tuple[int, int], Tuple[str, int, int]]" = (
+            OrderedDict()
+        )
+
+    def __getstate__(self) -> dict:
+        # Enviado ao pool de pós-processamento: o lock não é serializável e
+        # os hashes incrementais só valem no processo que os calculou
+        state = self.__dict__.copy()
+        for attr in ("_lock", "_partial", "_finished"):
+            state.pop(attr)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self._partial = {}
+        self._finished = OrderedDict()
+
+    def blob_path(self, digest: str) -> str:
+        """Caminho do blob de um hash."""
+        return os.path.join(self.root, digest[:2], digest)
+
+    def on_progress(self, status: Dict[str, Any]) -> None:
+        """
+        Hook de progresso do yt-dlp: soma ao hash os bytes recebidos desde
+        o último evento. Os eventos de um mesmo arquivo chegam sempre da
+        mesma thread, em ordem.
+        """
+        filename = status.get("filename")
+        if not filename:
+            return
+        state = status.get("status")
+        if state == "downloading":
+            self._feed(
+                filename,
+                status.get("tmpfilename") or filename,
+                available=status.get("downloaded_bytes"),
+            )
+        elif state == "finished":
+            self._feed(filename, filename, finished=True)
+        else:
+            with self._lock:
+                self._partial.pop(filename, None)
+
+    def _feed(
+        self,
+        filename: str,
+        source: str,
+        available: Optional[int] = None,
+        finished: bool = False,
+    ) -> None:
+        """
+        Lê de source os bytes ainda não contabilizados no hash. Durante a
+        transferência, só lê quando houver ao menos chunk_size bytes novos.
+        """
+        with self._lock:
+            partial = self._partial.get(filename)
+            if partial is None:
+                partial = _PartialHash(hashlib.new(self.algorithm))
+                self._partial[filename] = partial
+        if available is not None and available - partial.offset < self.chunk_size:
+            return
+        try:
+            with open(source, "rb") as file:
+                size = os.fstat(file.fileno()).st_size
+                if size < partial.offset:
+                    # Arquivo recomeçado do zero (servidor sem suporte a Range)
+                    partial.hasher = hashlib.new(self.algorithm)
+                    partial.offset = 0
+                file.seek(partial.offset)
+                while chunk := file.read(self.chunk_size):
+                    partial.hasher.update(chunk)
+                    partial.offset += len(chunk)
+            if not finished:
+                return
+            stat = os.stat(filename)
+        except OSError as e:
+            logger.debug("Hash incremental descartado para %s: %s", filename, e)
+            with self._lock:
+                self._partial.pop(filename, None)
+            return
+
+        with self._lock:
+            self._partial.pop(filename, None)
+            if stat.st_size != partial.offset:
+                return
+            key = (stat.st_dev, stat.st_ino)
+            self._finished[key] = (
+                partial.hasher.hexdigest(),
+                stat.st_size,
+                stat.st_mtime_ns,
+            )
+            self._finished.move_to_end(key)
+            while len(self._finished) > _MAX_FINISHED:
+                self._finished.popitem(last=False)
+
+    def _streamed_digest(self, path: str) -> Optional[str]:
+        """Hash calculado durante o download, se o arquivo não mudou desde então."""
+        stat = os.stat(path)
+        with self._lock:
+            entry = self._finished.pop((stat.st_dev, stat.st_ino), None)
+        if entry is None:
+            return None
+        digest, size, mtime_ns = entry
+        if stat.st_size != size or stat.st_mtime_ns != mtime_ns:
+            return None
+        return digest
+
+    def hash_file(self, path: str) -> str:
+        """Calcula o hash de um arquivo lendo-o por inteiro."""
+        hasher = hashlib.new(self.algorithm)
+        with open(path, "rb") as file:
+            while chunk := file.read(self.chunk_size):
+                hasher.update(chunk)
+        return hasher.hexdigest()
+
+    @staticmethod
+    def _link(source: str, target: str) -> bool:
+        """Cria target como hardlink (ou reflink) de source."""
+        try:
+            os.link(source, target)
+            return True
+        except FileExistsError:
+            raise
+        except OSError:
+            pass
+        try:
+            _reflink(source, target)
+            return True
+        except FileExistsError:
+            raise
+        except OSError:
+            return False
+
+    def _replace_with_blob(self, blob: str, path: str) -> bool:
+        """Troca o arquivo por um link para o blob, de forma atômica."""
+        temp = f"{path}.{threading.get_ident()}.dedup"
+        try:
+            if not self._link(blob, temp):
+                return False
+            os.replace(temp, path)
+            return True
+        except OSError as e:
+            logger.warning("Não foi possível deduplicar %s: %s", path, e)
+            try:
+                os.unlink(temp)
+            except OSError:
+                pass
+            return False
+
+    def store(self, path: str) -> Optional[str]:
+        """
+        Guarda o arquivo sob o hash do seu conteúdo, deduplicando-o.
+
+        Returns:
+            Optional[str]: Hash do conteúdo, ou None se o arquivo não existir
+        """
+        try:
+            digest = self._streamed_digest(path) or self.hash_file(path)
+        except OSError as e:
+            logger.warning("Não foi possível calcular o hash de %s: %s", path, e)
+            return None
+
+        blob = self.blob_path(digest)
+        try:
+            os.makedirs(os.path.dirname(blob), exist_ok=True)
+            if self._link(path, blob):
+                logger.debug("Novo blob %s para %s", digest, path)
+                return digest
+            logger.warning("Blob não criado (outro sistema de arquivos?): %s", path)
+            return digest
+        except FileExistsError:
+            pass
+        except OSError as e:
+            logger.warning("Erro ao criar blob de %s: %s", path, e)
+            return digest
+
+        # Conteúdo já armazenado: o arquivo vira um link para o blob
+        if os.path.samefile(path, blob):
+            return digest
+        if self._replace_with_blob(blob, path):
+            logger.info("Conteúdo duplicado, ligado ao blob %s: %s", digest, path)
+        return digest
+
+    def prune(self, referenced: Iterable[str]) -> int:
+        """
+        Remove os blobs cujo hash nenhum vídeo do repositório referencia.
+
+        A quantidade de hardlinks não serve para isso: blobs criados por
+        reflink sempre têm um único link, mesmo quando estão em uso.
+
+        Args:
+            referenced: Hashes de conteúdo gravados no repositório
+
+        Returns:
+            int: Quantidade de blobs removidos
+        """
+        keep = set(referenced)
+        removed = 0
+        try:
+            shards = list(os.scandir(self.root))
+        except FileNotFoundError:
+            return 0
+        for shard in shards:
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.name in keep:
+                    continue
+                try:
+                    if entry.is_file():
+                        os.unlink(entry.path)
+                        removed += 1
+                except OSError as e:
+                    logger.warning("Erro ao remover blob %s: %s", entry.path, e)
+        if removed:
+            logger.info("%s blob(s) sem uso removido(s)", removed)
+        return removed
@@ -0,0 +1,123 @@
+import logging
+import os
+import shutil
+import subprocess
+from typing import List, Optional
+
+from src.domain.entities import FormatProfile
+from src.domain.exceptions import PostprocessFailedException
+from src.domain.services import PostProcessor
+from src.infrastructure.path_allocator import move_to_free_name
+
+logger = logging.getLogger(__name__)
+
+# Pacotes MPEG-TS têm 188 bytes e começam com o byte de sincronismo 0x47
+_TS_PACKET_SIZE = 188
+_TS_SYNC_BYTE = 0x47
+
+# Marca do arquivo temporário gerado pelo ffmpeg (antes da extensão)
+_TEMP_SUFFIX = ".postprocess"
+
+
+def is_mpegts(path: str) -> bool:
+    """Indica se o arquivo é um MPEG-TS (ex: segmentos HLS concatenados)."""
+    with open(path, "rb") as file:
+        head = file.read(_TS_PACKET_SIZE + 1)
+    return (
+        len(head) > _TS_PACKET_SIZE
+        and head[0] == _TS_SYNC_BYTE
+        and head[_TS_PACKET_SIZE] == _TS_SYNC_BYTE
+    )
+
+
+class FFmpegPostProcessor(PostProcessor):
+    """
+    Pós-processamento com ffmpeg, sempre sem recodificar (-c copy):
+
+    - downloads HLS gravados como MPEG-TS com extensão .mp4 são remuxados
+      para MP4, o que o yt-dlp faria no próprio download (FixupM3u8);
+    - no perfil de áudio, arquivos .mp4 viram .m4a só com a faixa de áudio.
+
+    Arquivos que não precisam de nenhuma das etapas não são tocados. O
+    ffmpeg grava em um arquivo temporário, movido com os.replace para o
+    destino; o arquivo original nunca é alterado no lugar (pode ser um
+    hardlink para um blob do ContentAddressedStore). Um .m4a já existente
+    não é sobrescrito: o áudio extraído recebe o próximo sufixo livre.
+
+    Sem o ffmpeg instalado, os arquivos são mantidos como estão.
+    """
+
+    def __init__(self, ffmpeg: str = "ffmpeg", timeout: float = 3600.0):
+        self.ffmpeg = ffmpeg
+        # Tempo máximo (segundos) de cada execução do ffmpeg
+        self.timeout = timeout
+
+    @staticmethod
+    def _command(
+        executable: str, source: str, target: str, remux: bool, audio_only: bool
+    ) -> List[str]:
+        """Monta a linha de comando do ffmpeg."""
+        command = [executable, "-y", "-loglevel", "error", "-i", source]
+        command += ["-map", "0", "-dn", "-ignore_unknown", "-c", "copy"]
+        if audio_only:
+            command += ["-vn", "-sn"]
+        if remux:
+            # Áudio AAC do MPEG-TS vem com cabeçalhos ADTS, inválidos em MP4
+            command += ["-bsf:a", "aac_adtstoasc"]
+        return command + ["-f", "mp4", target]
+
+    def process(
+        self, path: str, profile: Optional[FormatProfile] = None
+    ) -> Optional[str]:
+        """
+        Remuxa e/ou extrai o áudio do arquivo, se necessário.
+
+        Returns:
+            Caminho do arquivo processado, ou None se nada foi alterado
+
+        Raises:
+            PostprocessFailedException: Se o ffmpeg falhar
+        """
+        base, ext = os.path.splitext(path)
+        remux = is_mpegts(path)
+        audio_only = profile is FormatProfile.AUDIO and ext.lower() == ".mp4"
+        if not (remux or audio_only):
+            return None
+        executable = shutil.which(self.ffmpeg)
+        if executable is None:
+            logger.warning(
+                "ffmpeg não encontrado; pós-processamento ignorado: %s", path
+            )
+            return None
+
+        target = base + ".m4a" if audio_only else path
+        temp = base + _TEMP_SUFFIX + os.path.splitext(target)[1]
+        command = self._command(executable, path, temp, remux, audio_only)
+        try:
+            result = subprocess.run(
+                command, capture_output=True, text=True, timeout=self.timeout
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            _remove(temp)
+            raise PostprocessFailedException(path, str(e))
+        if result.returncode != 0:
+            _remove(temp)
+            lines = result.stderr.strip().splitlines()
+            reason = lines[-1] if lines else f"ffmpeg saiu com {result.returncode}"
+            raise PostprocessFailedException(path, reason)
+
+        if target == path:
+            os.replace(temp, target)
+        else:
+            target = move_to_free_name(temp, target)
+            os.unlink(path)
+        logger.info("Arquivo pós-processado: %s", target)
+        return target
+
+
+def _remove(path: str) -> None:
+    """Remove o arquivo temporário, se existir."""
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
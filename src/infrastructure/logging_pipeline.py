@@ -0,0 +1,98 @@
+import json
+import logging
+import queue
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+from typing import Iterable, Optional
+
+# Atributos padrão de LogRecord; o que não estiver aqui veio de extra=...
+_RECORD_ATTRS = frozenset(
+    vars(logging.LogRecord("", logging.INFO, "", 0, "", (), None)).keys()
+) | {"message", "asctime", "taskName"}
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """
+    Formata cada registro como um objeto JSON em uma linha, com data,
+    nível, logger, thread e mensagem. Campos passados com extra=... são
+    incluídos no objeto.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "time": datetime.fromtimestamp(record.created).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                data[key] = value
+        if record.exc_info:
+            data["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            data["exception"] = record.exc_text
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+class _NonBlockingQueueHandler(QueueHandler):
+    """
+    QueueHandler que adia a formatação para a thread do listener.
+
+    O QueueHandler padrão monta a mensagem (msg % args) na thread que
+    registrou o log. Aqui os argumentos são convertidos para str, o que é
+    barato e evita que objetos mutáveis mudem antes da formatação, e o
+    resto do trabalho (formatter, escrita em disco) fica com o listener.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.args:
+            args = record.args
+            if isinstance(args, dict):
+                record.args = {key: _freeze(value) for key, value in args.items()}
+            else:
+                record.args = tuple(_freeze(arg) for arg in args)
+        if record.exc_info:
+            # Tracebacks não atravessam a fila; formata enquanto existem
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def _freeze(value: object) -> object:
+    """Mantém números (para %d/%.2f) e converte o resto para str."""
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    return str(value)
+
+
+def start_queue_logging(
+    handlers: Iterable[logging.Handler],
+    level: int = logging.INFO,
+    logger: Optional[logging.Logger] = None,
+) -> QueueListener:
+    """
+    Liga um QueueHandler ao logger (raiz, por padrão) e escreve nos
+    handlers informados a partir de uma thread própria (QueueListener).
+
+    As threads de download apenas enfileiram o registro; formatação e
+    escrita em disco acontecem no listener. Chame stop() no listener ao
+    encerrar a aplicação para esvaziar a fila.
+
+    Returns:
+        QueueListener: Listener já iniciado
+    """
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    target = logger or logging.getLogger()
+    target.setLevel(level)
+    for handler in list(target.handlers):
+        target.removeHandler(handler)
+        handler.close()
+    target.addHandler(_NonBlockingQueueHandler(log_queue))
+
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    return listener
@@ -0,0 +1,214 @@
+import hashlib
+import logging
+import os
+import re
+import sys
+from dataclasses import dataclass
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+logger = logging.getLogger(__name__)
+
+# Marca dos arquivos ainda não finalizados (antes da extensão)
+INCOMPLETE_SUFFIX = ".incomplete"
+
+_SAFE_KEY = re.compile(r"^[A-Za-z0-9_-]+(:[A-Za-z0-9_-]+)?$")
+
+
+@dataclass
+class PathReservation:
+    """Caminho reservado para o download de um vídeo."""
+
+    key: str
+    directory: str
+    stem: str
+    lock_path: str
+    fd: int
+
+    @property
+    def template(self) -> str:
+        """Template de saída do yt-dlp, apontando para o arquivo temporário."""
+        name = f"{self.stem}{INCOMPLETE_SUFFIX}.%(ext)s"
+        return os.path.join(self.directory, name)
+
+
+class PathAllocator:
+    """
+    Aloca caminhos de saída a partir da chave canônica do vídeo, em vez do
+    título.
+
+    Os arquivos ficam em subdiretórios derivados do hash da chave
+    (``root/3f/a2/youtube-dQw4w9WgXcQ.mp4``), o que mantém os diretórios
+    pequenos, e os nomes usam apenas [A-Za-z0-9_-], válidos em qualquer
+    sistema de arquivos.
+
+    reserve() trava (flock no POSIX, msvcrt.locking no Windows) um arquivo
+    .lock ao lado do destino; se outro worker (thread ou processo) já tiver
+    o mesmo nome travado, tenta o próximo sufixo (-1, -2, ...). A trava é
+    do sistema operacional, então some sozinha se o processo morrer, sem
+    deixar reservas órfãs. O yt-dlp escreve em ``<nome>.incomplete.<ext>``
+    e finalize() publica o arquivo no nome final com um hardlink, então o
+    nome final nunca aponta para um arquivo pela metade nem sobrescreve
+    um arquivo existente. Como o nome temporário é sempre o mesmo para a
+    mesma chave, downloads interrompidos continuam a partir do .part.
+    """
+
+    def __init__(
+        self,
+        root: str = "downloads",
+        levels: int = 2,
+        width: int = 2,
+    ):
+        if levels < 0 or width < 1:
+            raise ValueError("levels deve ser >= 0 e width maior que zero")
+        self.root = root
+        self.levels = levels
+        self.width = width
+
+    @staticmethod
+    def slug(key: str) -> str:
+        """Nome de arquivo seguro para a chave (ex: youtube:X -> youtube-X)."""
+        if _SAFE_KEY.match(key):
+            return key.replace(":", "-")
+        # URLs sem chave canônica: nome derivado do hash
+        return "url-" + hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+
+    def directory_for(self, key: str) -> str:
+        """Subdiretório (shard) da chave."""
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        shards = [
+            digest[level * self.width : (level + 1) * self.width]
+            for level in range(self.levels)
+        ]
+        return os.path.join(self.root, *shards)
+
+    def reserve(self, key: str) -> PathReservation:
+        """
+        Reserva um nome de arquivo para a chave.
+
+        Returns:
+            PathReservation: Reserva a ser liberada com release()
+        """
+        directory = self.directory_for(key)
+        os.makedirs(directory, exist_ok=True)
+        slug = self.slug(key)
+        attempt = 0
+        while True:
+            stem = slug if attempt == 0 else f"{slug}-{attempt}"
+            lock_path = os.path.join(directory, f"{stem}.lock")
+            fd = os.open(lock_path, os.O_CREAT | os.O_RDWR)
+            if not _try_lock(fd):
+                os.close(fd)
+                attempt += 1
+                continue
+            # Quem liberou a reserva pode ter removido o arquivo entre o
+            # open() e a trava; nesse caso a trava vale para um arquivo
+            # que ninguém mais enxerga e é preciso tentar de novo
+            try:
+                current = os.path.samestat(os.fstat(fd), os.stat(lock_path))
+            except FileNotFoundError:
+                current = False
+            if not current:
+                os.close(fd)
+                continue
+            if attempt:
+                logger.info("%s já reservado; usando %s", slug, stem)
+            return PathReservation(key, directory, stem, lock_path, fd)
+
+    @staticmethod
+    def final_path(temp_path: str) -> str:
+        """Nome final de um arquivo temporário (sem a marca .incomplete)."""
+        base, ext = os.path.splitext(temp_path)
+        if base.endswith(INCOMPLETE_SUFFIX):
+            base = base[: -len(INCOMPLETE_SUFFIX)]
+        return base + ext
+
+    def finalize(self, temp_path: str) -> str:
+        """
+        Move o arquivo baixado para o nome final, atomicamente. Se já houver
+        um arquivo com esse nome (ex: o mesmo vídeo baixado antes), ele é
+        preservado e o download recebe o próximo sufixo livre (-1, -2, ...).
+
+        Returns:
+            str: Caminho final
+        """
+        final = self.final_path(temp_path)
+        if final == temp_path or not os.path.exists(temp_path):
+            return final
+        return move_to_free_name(temp_path, final)
+
+    def release(self, reservation: PathReservation) -> None:
+        """Libera a reserva (o arquivo .part, se houver, é mantido)."""
+        if sys.platform == "win32":
+            # No Windows um arquivo aberto não pode ser removido
+            os.close(reservation.fd)
+            _unlink_quietly(reservation.lock_path)
+        else:
+            _unlink_quietly(reservation.lock_path)
+            os.close(reservation.fd)
+
+
+def move_to_free_name(source: str, final: str) -> str:
+    """
+    Move source para final sem sobrescrever nada: se final já existir, usa
+    o próximo sufixo livre (-1, -2, ...).
+
+    Returns:
+        str: Caminho usado
+    """
+    base, ext = os.path.splitext(final)
+    attempt = 0
+    while True:
+        target = final if attempt == 0 else f"{base}-{attempt}{ext}"
+        if _move_exclusive(source, target):
+            if attempt:
+                logger.info("%s já existe; arquivo salvo em %s", final, target)
+            return target
+        attempt += 1
+
+
+def _try_lock(fd: int) -> bool:
+    """Tenta travar o arquivo sem esperar."""
+    try:
+        if sys.platform == "win32":
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        else:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        return False
+    return True
+
+
+def _move_exclusive(source: str, target: str) -> bool:
+    """
+    Move source para target sem sobrescrever um arquivo existente.
+
+    Returns:
+        bool: False se target já existir
+    """
+    try:
+        # O hardlink falha se target existir e o publica de uma só vez
+        os.link(source, target)
+    except FileExistsError:
+        return False
+    except OSError:
+        # Sistemas de arquivos sem hardlinks: reserva o nome com O_EXCL
+        try:
+            os.close(os.open(target, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+        except FileExistsError:
+            return False
+        os.replace(source, target)
+        return True
+    os.unlink(source)
+    return True
+
+
+def _unlink_quietly(path: str) -> None:
+    """Remove o arquivo, ignorando se já não existir ou estiver em uso."""
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
@@ -0,0 +1,137 @@
+import copy
+import json
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from src.infrastructure.sqlite_pool import SQLiteConnectionPool, sqlite_connection
+
+logger = logging.getLogger(__name__)
+
+
+class ProbeCache:
+    """
+    Cache dos metadados extraídos pelo yt-dlp (info dict).
+
+    Tem dois níveis: um LRU em memória, limitado a ``max_entries`` itens,
+    e uma tabela SQLite (probe_cache) com o JSON comprimido em zlib. As
+    entradas expiram após ``ttl_seconds``, já que as URLs de formato
+    devolvidas pelos extratores costumam ser assinadas e temporárias.
+    """
+
+    def __init__(
+        self,
+        db_path: str = "db.sqlite3",
+        pool: Optional[SQLiteConnectionPool] = None,
+        ttl_seconds: float = 3600.0,
+        max_entries: int = 1024,
+    ):
+        self.pool = pool
+        self.db_path = pool.db_path if pool is not None else db_path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+        self._memory: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._init_database()
+
+    def _init_database(self) -> None:
+        """Cria a tabela do cache em disco se não existir."""
+        try:
+            with sqlite_connection(self.db_path, self.pool) as conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS probe_cache (
+                        cache_key TEXT PRIMARY KEY,
+                        info BLOB NOT NULL,
+                        fetched_at REAL NOT NULL
+                    )
+                """)
+        except sqlite3.Error as e:
+            # O cache é opcional: sem a tabela, funciona apenas em memória
+            logger.error("Erro ao inicializar cache de metadados: %s", e)
+
+    def _remember(self, key: str, fetched_at: float, info: Dict[str, Any]) -> None:
+        """Guarda uma entrada no LRU em memória, descartando a mais antiga."""
+        with self._lock:
+            self._memory[key] = (fetched_at, info)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Busca os metadados de uma chave.
+
+        Returns:
+            Cópia do info dict, ou None se ausente ou expirado
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if now - entry[0] < self.ttl_seconds:
+                    self._memory.move_to_end(key)
+                    return copy.deepcopy(entry[1])
+                del self._memory[key]
+
+        try:
+            with sqlite_connection(self.db_path, self.pool) as conn:
+                row = conn.execute(
+                    "SELECT info, fetched_at FROM probe_cache WHERE cache_key = ?",
+                    (key,),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.error("Erro ao ler cache de metadados: %s", e)
+            return None
+
+        if row is None or now - row["fetched_at"] >= self.ttl_seconds:
+            return None
+
+        info = json.loads(zlib.decompress(row["info"]))
+        self._remember(key, row["fetched_at"], info)
+        logger.debug("Metadados carregados do cache em disco: %s", key)
+        return copy.deepcopy(info)
+
+    def put(self, key: str, info: Dict[str, Any]) -> None:
+        """Guarda os metadados de uma chave nos dois níveis do cache."""
+        fetched_at = time.time()
+        self._remember(key, fetched_at, copy.deepcopy(info))
+        try:
+            blob = zlib.compress(json.dumps(info).encode("utf-8"))
+            with sqlite_connection(self.db_path, self.pool) as conn:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO probe_cache (cache_key, info, fetched_at)
+                    VALUES (?, ?, ?)
+                    """,
+                    (key, blob, fetched_at),
+                )
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.error("Erro ao gravar cache de metadados: %s", e)
+
+    def invalidate(self, key: str) -> None:
+        """Remove uma chave do cache."""
+        with self._lock:
+            self._memory.pop(key, None)
+        try:
+            with sqlite_connection(self.db_path, self.pool) as conn:
+                conn.execute("DELETE FROM probe_cache WHERE cache_key = ?", (key,))
+        except sqlite3.Error as e:
+            logger.error("Erro ao invalidar cache de metadados: %s", e)
+
+    def purge_expired(self) -> int:
+        """Remove do disco as entradas expiradas. Retorna quantas foram removidas."""
+        cutoff = time.time() - self.ttl_seconds
+        try:
+            with sqlite_connection(self.db_path, self.pool) as conn:
+                cursor = conn.execute(
+                    "DELETE FROM probe_cache WHERE fetched_at < ?", (cutoff,)
+                )
+                return cursor.rowcount
+        except sqlite3.Error as e:
+            logger.error("Erro ao limpar cache de metadados: %s", e)
+            return 0
@@ -0,0 +1,342 @@
+import bisect
+import logging
+import math
+import threading
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from src.domain.services import MetricsRecorder
+
+logger = logging.getLogger(__name__)
+
+# Limites (segundos) padrão dos histogramas; cobrem de consultas SQLite
+# (milissegundos) a downloads longos (minutos)
+DEFAULT_BUCKETS = (
+    0.001,
+    0.005,
+    0.025,
+    0.1,
+    0.5,
+    1.0,
+    5.0,
+    30.0,
+    120.0,
+    600.0,
+)
+
+# Métricas conhecidas: nome -> (tipo, descrição)
+DEFAULT_METRICS: Dict[str, Tuple[str, str]] = {
+    "ytdl_downloads_total": ("counter", "Downloads processados, por resultado"),
+    "ytdl_download_failures_total": ("counter", "Downloads que falharam, por motivo"),
+    "ytdl_download_duration_seconds": (
+        "histogram",
+        "Duração total dos downloads concluídos",
+    ),
+    "ytdl_active_downloads": ("gauge", "Downloads em andamento no yt-dlp"),
+    "ytdl_downloaded_bytes_total": ("counter", "Bytes recebidos pelo yt-dlp"),
+    "ytdl_sqlite_query_seconds": (
+        "histogram",
+        "Latência das operações no repositório de vídeos",
+    ),
+    "ytdl_queue_jobs": ("gauge", "Jobs na fila persistente, por estado"),
+}
+
+LabelKey = Tuple[Tuple[str, str], ...]
+# Função avaliada a cada coleta: um valor ou {valor do rótulo: valor}
+GaugeCallback = Callable[[], Union[float, Dict[str, float]]]
+
+
+@dataclass
+class _Histogram:
+    counts: List[int]
+    total: float = 0.0
+    count: int = 0
+
+
+@dataclass
+class _Metric:
+    name: str
+    kind: str
+    help: str
+    buckets: Sequence[float] = DEFAULT_BUCKETS
+    values: Dict[LabelKey, Union[float, _Histogram]] = field(default_factory=dict)
+
+
+def _label_key(labels: Dict[str, str]) -> LabelKey:
+    # Chamado a cada medição: os valores só viram str na exportação
+    return tuple(sorted(labels.items())) if labels else ()
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(key: LabelKey, extra: Tuple[Tuple[str, str], ...] = ()) -> str:
+    pairs = key + extra
+    if not pairs:
+        return ""
+    body = ",".join(f'{name}="{_escape(str(value))}"' for name, value in pairs)
+    return "{" + body + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class MetricsRegistry(MetricsRecorder):
+    """
+    Registro de métricas em memória, exportado no formato de texto do
+    Prometheus (versão 0.0.4).
+
+    As métricas de DEFAULT_METRICS já vêm declaradas; nomes desconhecidos
+    são declarados no primeiro uso com o tipo implícito no método chamado.
+    Gauges calculados sob demanda (ex: profundidade da fila) podem ser
+    registrados com gauge_callback e só custam algo no momento da coleta.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, _Metric] = {}
+        self._callbacks: Dict[str, Tuple[str, Optional[str], GaugeCallback]] = {}
+        for name, (kind, help_text) in DEFAULT_METRICS.items():
+            self.declare(name, kind, help_text)
+
+    def declare(
+        self,
+        name: str,
+        kind: str,
+        help_text: str = "",
+        buckets: Optional[Sequence[float]] = None,
+    ) -> None:
+        """Declara uma métrica (counter, gauge ou histogram)."""
+        if kind not in ("counter", "gauge", "histogram"):
+            raise ValueError(f"Tipo de métrica desconhecido: {kind}")
+        with self._lock:
+            self._metrics[name] = _Metric(
+                name=name,
+                kind=kind,
+                help=help_text,
+                buckets=tuple(sorted(buckets)) if buckets else self.buckets,
+            )
+
+    def gauge_callback(
+        self,
+        name: str,
+        help_text: str,
+        callback: GaugeCallback,
+        label: Optional[str] = None,
+    ) -> None:
+        """
+        Registra um gauge calculado na coleta. Com label, callback retorna
+        um dicionário {valor do rótulo: valor}.
+        """
+        with self._lock:
+            self._metrics.pop(name, None)
+            self._callbacks[name] = (help_text, label, callback)
+
+    def _metric(self, name: str, kind: str) -> _Metric:
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = _Metric(name=name, kind=kind, help="", buckets=self.buckets)
+            self._metrics[name] = metric
+        return metric
+
+    def inc(self, name: str, amount: float = 1.0, **labels: str) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            metric = self._metric(name, "counter")
+            if metric.kind == "counter" and amount < 0:
+                raise ValueError(f"Contador {name} não pode diminuir")
+            current = metric.values.get(key, 0.0)
+            if isinstance(current, _Histogram):
+                raise ValueError(f"Métrica {name} é um histograma")
+            metric.values[key] = current + amount
+
+    def set(self, name: str, value: float, **labels: str) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            self._metric(name, "gauge").values[key] = value
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            metric = self._metric(name, "histogram")
+            histogram = metric.values.get(key)
+            if histogram is None:
+                histogram = _Histogram(counts=[0] * len(metric.buckets))
+                metric.values[key] = histogram
+            elif not isinstance(histogram, _Histogram):
+                raise ValueError(f"Métrica {name} não é um histograma")
+            index = bisect.bisect_left(metric.buckets, value)
+            if index < len(histogram.counts):
+                histogram.counts[index] += 1
+            histogram.total += value
+            histogram.count += 1
+
+    def value(self, name: str, **labels: str) -> Optional[float]:
+        """
+        Valor atual de um contador ou gauge, ou a quantidade de observações
+        de um histograma (None se nunca registrado).
+        """
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                return None
+            current = metric.values.get(_label_key(labels))
+        return current if not isinstance(current, _Histogram) else current.count
+
+    def render(self) -> str:
+        """Gera o texto de exposição de todas as métricas."""
+        with self._lock:
+            snapshot = [
+                (
+                    metric,
+                    {
+                        key: (
+                            _Histogram(list(v.counts), v.total, v.count)
+                            if isinstance(v, _Histogram)
+                            else v
+                        )
+                        for key, v in metric.values.items()
+                    },
+                )
+                for metric in self._metrics.values()
+            ]
+            callbacks = list(self._callbacks.items())
+
+        lines: List[str] = []
+        for metric, values in snapshot:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for key, value in sorted(values.items()):
+                if isinstance(value, _Histogram):
+                    lines.extend(self._render_histogram(metric, key, value))
+                else:
+                    lines.append(
+                        f"{metric.name}{_format_labels(key)} {_format_value(value)}"
+                    )
+
+        # Callbacks rodam fora do lock: podem consultar o banco
+        for name, (help_text, label, callback) in callbacks:
+            try:
+                result = callback()
+            except Exception as e:
+                logger.warning("Erro ao calcular a métrica %s: %s", name, e)
+                continue
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} gauge")
+            if not isinstance(result, dict):
+                lines.append(f"{name} {_format_value(result)}")
+                continue
+            if label is None:
+                logger.warning("Métrica %s retornou valores sem rótulo", name)
+                continue
+            for label_value, value in sorted(result.items()):
+                labels = _format_labels(((label, str(label_value)),))
+                lines.append(f"{name}{labels} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _render_histogram(
+        metric: _Metric, key: LabelKey, histogram: _Histogram
+    ) -> List[str]:
+        lines = []
+        cumulative = 0
+        for bound, count in zip(metric.buckets, histogram.counts):
+            cumulative += count
+            labels = _format_labels(key, (("le", _format_value(bound)),))
+            lines.append(f"{metric.name}_bucket{labels} {cumulative}")
+        labels = _format_labels(key, (("le", "+Inf"),))
+        lines.append(f"{metric.name}_bucket{labels} {histogram.count}")
+        lines.append(
+            f"{metric.name}_sum{_format_labels(key)} {_format_value(histogram.total)}"
+        )
+        lines.append(f"{metric.name}_count{_format_labels(key)} {histogram.count}")
+        return lines
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    registry: MetricsRegistry
+    release: Optional[Callable[[], None]] = None
+
+    def do_GET(self) -> None:
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = self.registry.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def finish(self) -> None:
+        try:
+            super().finish()
+        finally:
+            # A thread da conexão termina aqui; libera o que os callbacks
+            # abriram nela (ex: a conexão SQLite do pool)
+            if self.release is not None:
+                self.release()
+
+    def log_message(self, format: str, *args) -> None:
+        logger.debug("metrics: %s", format % args)
+
+
+class MetricsServer:
+    """
+    Servidor HTTP (stdlib) que expõe um MetricsRegistry em /metrics.
+    Roda em uma thread daemon; use close() para encerrá-lo.
+
+    Cada conexão é atendida em uma thread nova. release, se informado, é
+    chamado nessa thread ao fim da conexão (ex: SQLiteConnectionPool.release,
+    para fechar a conexão aberta pelos gauge callbacks).
+    """
+
+    def __init__(
+        self,
+        registry: MetricsRegistry,
+        host: str = "127.0.0.1",
+        port: int = 9464,
+        release: Optional[Callable[[], None]] = None,
+    ):
+        attrs: Dict[str, object] = {"registry": registry}
+        if release is not None:
+            attrs["release"] = staticmethod(release)
+        handler = type("MetricsHandler", (_MetricsHandler,), attrs)
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="metrics-server", daemon=True
+        )
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        """Endereço (host, porta) em que o servidor escuta."""
+        host, port = self._server.server_address[:2]
+        return str(host), port
+
+    def start(self) -> "MetricsServer":
+        """Começa a atender requisições em segundo plano."""
+        self._thread.start()
+        host, port = self.address
+        logger.info("Métricas disponíveis em http://%s:%s/metrics", host, port)
+        return self
+
+    def close(self) -> None:
+        """Encerra o servidor."""
+        if self._thread.is_alive():
+            self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "MetricsServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
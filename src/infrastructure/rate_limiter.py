@@ -0,0 +1,199 @@
+import logging
+import threading
+import time
+from typing import Callable, Dict, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    Token bucket thread-safe.
+
+    Os tokens são repostos continuamente a ``rate`` por segundo, até
+    ``capacity``. acquire() reserva os tokens na hora (o saldo pode ficar
+    negativo) e dorme fora do lock pelo tempo necessário para pagá-los,
+    então várias threads são atendidas em ordem de chegada sem disputar o
+    lock enquanto esperam. Com rate=None o bucket não limita nada.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float],
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._rate: Optional[float] = None
+        self._capacity = 0.0
+        self._tokens = 0.0
+        self._updated_at = clock()
+        self.set_rate(rate, capacity)
+
+    @property
+    def rate(self) -> Optional[float]:
+        """Taxa atual (tokens por segundo), ou None se ilimitada."""
+        return self._rate
+
+    def set_rate(self, rate: Optional[float], capacity: Optional[float] = None) -> None:
+        """
+        Altera a taxa em tempo de execução.
+
+        Args:
+            rate: Tokens por segundo (None ou 0 desativa o limite)
+            capacity: Rajada máxima; por padrão, um segundo de taxa
+        """
+        if rate is not None and rate < 0:
+            raise ValueError("rate não pode ser negativo")
+        with self._lock:
+            self._refill()
+            was_unlimited = self._rate is None
+            self._rate = rate or None
+            self._capacity = capacity if capacity is not None else (rate or 0.0)
+            # Ao ativar o limite o bucket começa cheio: a primeira rajada
+            # não espera
+            if was_unlimited:
+                self._tokens = self._capacity
+            self._tokens = min(self._tokens, self._capacity)
+
+    def _refill(self) -> None:
+        """Repõe os tokens acumulados desde a última atualização (com lock)."""
+        now = self._clock()
+        if self._rate is not None:
+            self._tokens = min(
+                self._capacity, self._tokens + (now - self._updated_at) * self._rate
+            )
+        self._updated_at = now
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Consome tokens, esperando se necessário.
+
+        Returns:
+            float: Segundos de espera
+        """
+        with self._lock:
+            if self._rate is None:
+                return 0.0
+            self._refill()
+            self._tokens -= tokens
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+
+class HostRateLimiter:
+    """
+    Limite de requisições por host: um TokenBucket para cada host.
+
+    Evita que vários workers disparem extrações contra o mesmo site ao
+    mesmo tempo e recebam HTTP 429.
+    """
+
+    def __init__(
+        self,
+        requests_per_second: Optional[float],
+        burst: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, TokenBucket] = {}
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+
+    @staticmethod
+    def _host_of(url: str) -> str:
+        """Host da URL, sem o prefixo www."""
+        host = (urlparse(url).hostname or "").lower()
+        return host[4:] if host.startswith("www.") else host
+
+    def _bucket(self, host: str) -> TokenBucket:
+        """Retorna o bucket do host, criando-o se necessário."""
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(
+                    self.requests_per_second,
+                    self.burst if self.burst is not None else 1.0,
+                    clock=self._clock,
+                    sleep=self._sleep,
+                )
+                self._buckets[host] = bucket
+            return bucket
+
+    def set_rate(
+        self, requests_per_second: Optional[float], burst: Optional[float] = None
+    ) -> None:
+        """Altera o limite de todos os hosts em tempo de execução."""
+        with self._lock:
+            self.requests_per_second = requests_per_second
+            self.burst = burst
+            buckets = list(self._buckets.values())
+        for bucket in buckets:
+            bucket.set_rate(requests_per_second, burst if burst is not None else 1.0)
+
+    def acquire(self, url: str) -> float:
+        """
+        Aguarda a vez de fazer uma requisição ao host da URL.
+
+        Returns:
+            float: Segundos de espera
+        """
+        host = self._host_of(url)
+        wait = self._bucket(host).acquire()
+        if wait > 0:
+            logger.debug(
+                "Limite de requisições para %s: aguardando %.2fs", host, wait
+            )
+        return wait
+
+
+class BandwidthGovernor:
+    """
+    Limite global de banda (bytes/s) compartilhado por todos os downloads.
+
+    Cada worker chama consume() com os bytes recebidos; quando o total
+    passa do orçamento, o worker dorme e, com isso, para de ler do socket.
+    O limite pode ser alterado a qualquer momento com set_limit().
+    """
+
+    def __init__(
+        self,
+        bytes_per_second: Optional[float],
+        burst_seconds: float = 0.25,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.burst_seconds = burst_seconds
+        self._bucket = TokenBucket(None, clock=clock, sleep=sleep)
+        self.set_limit(bytes_per_second)
+
+    @property
+    def bytes_per_second(self) -> Optional[float]:
+        """Limite atual, ou None se ilimitado."""
+        return self._bucket.rate
+
+    def set_limit(self, bytes_per_second: Optional[float]) -> None:
+        """Altera o limite global (None ou 0 desativa)."""
+        capacity = (bytes_per_second or 0.0) * self.burst_seconds
+        self._bucket.set_rate(bytes_per_second, capacity)
+        logger.info("Limite de banda: %s bytes/s", bytes_per_second or "ilimitado")
+
+    def consume(self, nbytes: int) -> float:
+        """
+        Contabiliza bytes recebidos, esperando se o orçamento acabou.
+
+        Returns:
+            float: Segundos de espera
+        """
+        if nbytes <= 0:
+            return 0.0
+        return self._bucket.acquire(nbytes)
@@ -0,0 +1,160 @@
+import logging
+import sqlite3
+from datetime import datetime
+from typing import Dict, Iterable, Optional
+
+from src.domain.entities import FailedDownload
+from src.domain.failures import FailureCategory
+from src.domain.repositories import FailureRepository
+from src.domain.video_key import canonical_video_key
+from src.infrastructure.sqlite_pool import SQLiteConnectionPool, sqlite_connection
+from src.infrastructure.sqlite_repo import IN_CLAUSE_CHUNK_SIZE
+
+logger = logging.getLogger(__name__)
+
+
+class SQLiteFailureRepository(FailureRepository):
+    """
+    Implementação SQLite do FailureRepository (tabela failures).
+    As falhas são indexadas pela chave canônica do vídeo, então variações
+    da URL compartilham o mesmo registro.
+    """
+
+    def __init__(
+        self,
+        db_path: str = "db.sqlite3",
+        pool: Optional[SQLiteConnectionPool] = None,
+    ):
+        self.pool = pool
+        self.db_path = pool.db_path if pool is not None else db_path
+        self._init_database()
+
+    def _init_database(self) -> None:
+        """Cria a tabela de falhas se não existir."""
+        try:
+            with sqlite_connection(self.db_path, self.pool) as conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS failures (
+                        download_key TEXT PRIMARY KEY,
+                        url TEXT NOT NULL,
+                        reason TEXT NOT NULL,
+                        category TEXT NOT NULL,
+                        failed_at TEXT NOT NULL,
+                        expires_at TEXT NOT NULL
+                    )
+                """)
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_failures_expires_at "
+                    "ON failures(expires_at)"
+                )
+        except sqlite3.Error as e:
+            logger.error("Erro ao inicializar tabela de falhas: %s", e)
+
+    @staticmethod
+    def _key(url: str) -> str:
+        """Chave da falha (chave canônica quando houver)."""
+        return canonical_video_key(url) or url
+
+    @staticmethod
+    def _row_to_failure(row: sqlite3.Row) -> FailedDownload:
+        """Converte uma linha da tabela failures em entidade FailedDownload."""
+        return FailedDownload(
+            url=row["url"],
+            reason=row["reason"],
+            category=FailureCategory(row["category"]),
+            failed_at=datetime.fromisoformat(row["failed_at"]),
+            expires_at=datetime.fromisoformat(row["expires_at"]),
+        )
+
+    def record(self, failure: FailedDownload) -> None:
+        """Grava a falha; erros de banco são apenas registrados no log."""
+        try:
+            with sqlite_connection(self.db_path, self.pool) as conn:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO failures
+                        (download_key, url, reason, category, failed_at, expires_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        self._key(failure.url),
+                        failure.url,
+                        failure.reason,
+                        failure.category.value,
+                        failure.failed_at.isoformat(timespec="microseconds"),
+                        failure.expires_at.isoformat(timespec="microseconds"),
+                    ),
+                )
+        except sqlite3.Error as e:
+            logger.error("Erro ao registrar falha de download: %s", e)
+
+    def find(self, url: str) -> Optional[FailedDownload]:
+        """Busca a falha registrada para uma URL."""
+        try:
+            with sqlite_connection(self.db_path, self.pool) as conn:
+                row = conn.execute(
+                    "SELECT * FROM failures WHERE download_key = ?", (self._key(url),)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.error("Erro ao buscar falha de download: %s", e)
+            return None
+        return self._row_to_failure(row) if row else None
+
+    def find_many(self, urls: Iterable[str]) -> Dict[str, FailedDownload]:
+        """Busca as falhas de várias URLs, em blocos de IN (...)."""
+        keys_by_url = {url: self._key(url) for url in urls}
+        keys = list(set(keys_by_url.values()))
+        by_key: Dict[str, FailedDownload] = {}
+        try:
+            with sqlite_connection(self.db_path, self.pool) as conn:
+                for start in range(0, len(keys), IN_CLAUSE_CHUNK_SIZE):
+                    chunk = keys[start : start + IN_CLAUSE_CHUNK_SIZE]
+                    placeholders = ", ".join("?" * len(chunk))
+                    cursor = conn.execute(
+                        f"SELECT * FROM failures WHERE download_key IN ({placeholders})",
+                        chunk,
+                    )
+                    for row in cursor:
+                        by_key[row["download_key"]] = self._row_to_failure(row)
+        except sqlite3.Error as e:
+            logger.error("Erro ao buscar falhas de download em lote: %s", e)
+
+        return {url: by_key[key] for url, key in keys_by_url.items() if key in by_key}
+
+    def delete(self, url: str) -> None:
+        """Remove a falha de uma URL."""
+        try:
+            with sqlite_connection(self.db_path, self.pool) as conn:
+                conn.execute(
+                    "DELETE FROM failures WHERE download_key = ?", (self._key(url),)
+                )
+        except sqlite3.Error as e:
+            logger.error("Erro ao remover falha de download: %s", e)
+
+    def delete_many(self, urls: Iterable[str]) -> None:
+        """Remove as falhas de várias URLs, em blocos de IN (...)."""
+        keys = list({self._key(url) for url in urls})
+        try:
+            with sqlite_connection(self.db_path, self.pool) as conn:
+                for start in range(0, len(keys), IN_CLAUSE_CHUNK_SIZE):
+                    chunk = keys[start : start + IN_CLAUSE_CHUNK_SIZE]
+                    placeholders = ", ".join("?" * len(chunk))
+                    conn.execute(
+                        f"DELETE FROM failures WHERE download_key IN ({placeholders})",
+                        chunk,
+                    )
+        except sqlite3.Error as e:
+            logger.error("Erro ao remover falhas de download em lote: %s", e)
+
+    def purge_expired(self) -> int:
+        """Remove as falhas expiradas."""
+        try:
+            with sqlite_connection(self.db_path, self.pool) as conn:
+                cursor = conn.execute(
+                    "DELETE FROM failures WHERE expires_at <= ?",
+                    (datetime.now().isoformat(timespec="microseconds"),),
+                )
+                return cursor.rowcount
+        except sqlite3.Error as e:
+            logger.error("Erro ao limpar falhas expiradas: %s", e)
+            return 0
@@ -0,0 +1,346 @@
+import logging
+import sqlite3
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from src.domain.entities import Job, JobStatus
+from src.domain.exceptions import JobQueueException
+from src.domain.repositories import JobRepository
+from src.infrastructure.sqlite_pool import (
+    SQLiteConnectionPool,
+    ensure_column,
+    sqlite_connection,
+)
+from src.infrastructure.sqlite_repo import IN_CLAUSE_CHUNK_SIZE
+
+logger = logging.getLogger(__name__)
+
+
+def _now() -> str:
+    """Data/hora atual em ISO 8601 com largura fixa (comparável como texto)."""
+    return datetime.now().isoformat(timespec="microseconds")
+
+
+class SQLiteJobRepository(JobRepository):
+    """
+    Implementação SQLite da fila de jobs de download.
+    Usa o mesmo arquivo de banco do SQLiteVideoRepository, em uma tabela
+    própria (jobs). A reserva de jobs é feita com um único
+    UPDATE ... RETURNING, o que a torna atômica entre processos.
+
+    Jobs devolvidos à fila com backoff guardam em available_at o momento
+    a partir do qual podem ser reservados novamente.
+    """
+
+    def __init__(
+        self,
+        db_path: str = "db.sqlite3",
+        pool: Optional[SQLiteConnectionPool] = None,
+    ):
+        self.pool = pool
+        self.db_path = pool.db_path if pool is not None else db_path
+        self._init_database()
+
+    def _init_database(self) -> None:
+        """Inicializa a tabela de jobs e seus índices se não existirem."""
+        try:
+            with sqlite_connection(self.db_path, self.pool) as conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS jobs (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        url TEXT NOT NULL,
+                        status TEXT NOT NULL,
+                        attempts INTEGER NOT NULL DEFAULT 0,
+                        worker_id TEXT,
+                        lease_expires_at TEXT,
+                        last_error TEXT,
+                        created_at TEXT NOT NULL,
+                        updated_at TEXT NOT NULL,
+                        available_at TEXT,
+                        UNIQUE(url)
+                    )
+                """)
+                ensure_column(conn, "jobs", "available_at", "TEXT")
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status, id)"
+                )
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_jobs_lease "
+                    "ON jobs(status, lease_expires_at)"
+                )
+                logger.info("Fila de jobs inicializada: %s", self.db_path)
+        except sqlite3.Error as e:
+            logger.error("Erro ao inicializar fila de jobs: %s", e)
+            raise JobQueueException(f"Erro ao inicializar fila de jobs: {e}")
+
+    @staticmethod
+    def _row_to_job(row: sqlite3.Row) -> Job:
+        """Converte uma linha da tabela jobs em entidade Job."""
+        lease = row["lease_expires_at"]
+        available_at = row["available_at"]
+        return Job(
+            id=row["id"],
+            url=row["url"],
+            status=JobStatus(row["status"]),
+            attempts=row["attempts"],
+            worker_id=row["worker_id"],
+            lease_expires_at=datetime.fromisoformat(lease) if lease else None,
+            last_error=row["last_error"],
+            created_at=datetime.fromisoformat(row["created_at"]),
+            updated_at=datetime.fromisoformat(row["updated_at"]),
+            available_at=(
+                datetime.fromisoformat(available_at) if available_at else None
+            ),
+        )
+
+    def enqueue_many(self, urls: Iterable[str]) -> int:
+        """Enfileira URLs em uma única transação, ignorando as já conhecidas."""
+        now = _now()
+        try:
+            with sqlite_connection(self.db_path, self.pool) as conn:
+                cursor = conn.executemany(
+                    """
+                    INSERT OR IGNORE INTO jobs (url, status, created_at, updated_at)
+                    VALUES (?, ?, ?, ?)
+                    """,
+                    ((url, JobStatus.PENDING.value, now, now) for url in urls),
+                )
+                inserted = cursor.rowcount
+                logger.info("%s job(s) enfileirado(s)", inserted)
+                return inserted
+        except sqlite3.Error as e:
+            logger.error("Erro ao enfileirar jobs: %s", e)
+            raise JobQueueException(f"Erro ao enfileirar jobs: {e}")
+
+    def enqueue(self, url: str) -> Job:
+        """Enfileira uma URL (se ainda não conhecida) e retorna o seu job."""
+        now = _now()
+        try:
+            with sqlite_connection(self.db_path, self.pool) as conn:
+                conn.execute(
+                    """
+                    INSERT OR IGNORE INTO jobs (url, status, created_at, updated_at)
+                    VALUES (?, ?, ?, ?)
+                    """,
+                    (url, JobStatus.PENDING.value, now, now),
+                )
+                row = conn.execute(
+                    "SELECT * FROM jobs WHERE url = ?", (url,)
+                ).fetchone()
+                return self._row_to_job(row)
+        except sqlite3.Error as e:
+            logger.error("Erro ao enfileirar job: %s", e)
+            raise JobQueueException(f"Erro ao enfileirar job: {e}")
+
+    def find_by_urls(self, urls: Iterable[str]) -> Dict[str, Job]:
+        """Busca os jobs de várias URLs, em blocos de IN (...)."""
+        values = list(set(urls))
+        found: Dict[str, Job] = {}
+        try:
+            with sqlite_connection(self.db_path, self.pool) as conn:
+                for start in range(0, len(values), IN_CLAUSE_CHUNK_SIZE):
+                    chunk = values[start : start + IN_CLAUSE_CHUNK_SIZE]
+                    placeholders = ", ".join("?" * len(chunk))
+                    for row in conn.execute(
+                        f"SELECT * FROM jobs WHERE url IN ({placeholders})", chunk
+                    ):
+                        found[row["url"]] = self._row_to_job(row)
+        except sqlite3.Error as e:
+            logger.error("Erro ao buscar jobs: %s", e)
+            raise JobQueueException(f"Erro ao buscar jobs: {e}")
+        return found
+
+    def reopen_many(self, job_ids: Iterable[int]) -> int:
+        """Devolve à fila jobs done/failed, zerando tentativas e último erro."""
+        ids: List[int] = list(job_ids)
+        now = _now()
+        reopened = 0
+        try:
+            with sqlite_connection(self.db_path, self.pool) as conn:
+                for start in range(0, len(ids), IN_CLAUSE_CHUNK_SIZE):
+                    chunk = ids[start : start + IN_CLAUSE_CHUNK_SIZE]
+                    placeholders = ", ".join("?" * len(chunk))
+                    cursor = conn.execute(
+                        f"""
+                        UPDATE jobs
+                        SET status = ?, attempts = 0, worker_id = NULL,
+                            lease_expires_at = NULL, last_error = NULL,
+                            available_at = NULL, updated_at = ?
+                        WHERE id IN ({placeholders}) AND status IN (?, ?)
+                        """,
+                        (
+                            JobStatus.PENDING.value,
+                            now,
+                            *chunk,
+                            JobStatus.DONE.value,
+                            JobStatus.FAILED.value,
+                        ),
+                    )
+                    reopened += cursor.rowcount
+        except sqlite3.Error as e:
+            logger.error("Erro ao reabrir jobs: %s", e)
+            raise JobQueueException(f"Erro ao reabrir jobs: {e}")
+        if reopened:
+            logger.info("%s job(s) finalizado(s) devolvido(s) à fila", reopened)
+        return reopened
+
+    def claim(self, worker_id: str, lease_seconds: float) -> Optional[Job]:
+        """
+        Reserva o job pendente mais antigo já disponível (ou um com lease
+        expirado). Jobs aguardando backoff são ignorados até available_at.
+        """
+        now = datetime.now()
+        now_iso = now.isoformat(timespec="microseconds")
+        lease = (now + timedelta(seconds=lease_seconds)).isoformat(
+            timespec="microseconds"
+        )
+        try:
+            with sqlite_connection(self.db_path, self.pool) as conn:
+                cursor = conn.execute(
+                    """
+                    UPDATE jobs
+                    SET status = ?, attempts = attempts + 1, worker_id = ?,
+                        lease_expires_at = ?, updated_at = ?
+                    WHERE id = COALESCE(
+                        (SELECT id FROM jobs
+                         WHERE status = ?
+                           AND (available_at IS NULL OR available_at <= ?)
+                         ORDER BY id LIMIT 1),
+                        (SELECT id FROM jobs
+                         WHERE status = ? AND lease_expires_at < ?
+                         ORDER BY lease_expires_at LIMIT 1)
+                    )
+                    RETURNING *
+                    """,
+                    (
+                        JobStatus.RUNNING.value,
+                        worker_id,
+                        lease,
+                        now_iso,
+                        JobStatus.PENDING.value,
+                        now_iso,
+                        JobStatus.RUNNING.value,
+                        now_iso,
+                    ),
+                )
+                row = cursor.fetchone()
+                return self._row_to_job(row) if row else None
+        except sqlite3.Error as e:
+            logger.error("Erro ao reservar job: %s", e)
+            raise JobQueueException(f"Erro ao reservar job: {e}")
+
+    def _update(self, sql: str, params: tuple, action: str) -> int:
+        """Executa uma atualização simples na tabela de jobs."""
+        try:
+            with sqlite_connection(self.db_path, self.pool) as conn:
+                cursor = conn.execute(sql, params)
+                return cursor.rowcount
+        except sqlite3.Error as e:
+            logger.error("Erro ao %s: %s", action, e)
+            raise JobQueueException(f"Erro ao {action}: {e}")
+
+    def complete(self, job_id: int) -> None:
+        """Marca um job como concluído."""
+        self._update(
+            """
+            UPDATE jobs
+            SET status = ?, lease_expires_at = NULL, last_error = NULL,
+                updated_at = ?
+            WHERE id = ?
+            """,
+            (JobStatus.DONE.value, _now(), job_id),
+            "concluir job",
+        )
+
+    def fail(
+        self,
+        job_id: int,
+        reason: str,
+        retry: bool,
+        retry_at: Optional[datetime] = None,
+    ) -> None:
+        """Registra a falha de um job."""
+        status = JobStatus.PENDING if retry else JobStatus.FAILED
+        available_at = (
+            retry_at.isoformat(timespec="microseconds")
+            if retry and retry_at is not None
+            else None
+        )
+        self._update(
+            """
+            UPDATE jobs
+            SET status = ?, lease_expires_at = NULL, last_error = ?,
+                available_at = ?, updated_at = ?
+            WHERE id = ?
+            """,
+            (status.value, reason, available_at, _now(), job_id),
+            "registrar falha do job",
+        )
+
+    def release(self, job_id: int) -> None:
+        """Devolve um job à fila, descontando a tentativa em andamento."""
+        self._update(
+            """
+            UPDATE jobs
+            SET status = ?, attempts = MAX(attempts - 1, 0),
+                lease_expires_at = NULL, updated_at = ?
+            WHERE id = ? AND status = ?
+            """,
+            (JobStatus.PENDING.value, _now(), job_id, JobStatus.RUNNING.value),
+            "liberar job",
+        )
+
+    def requeue_running(self) -> int:
+        """Devolve à fila os jobs que ficaram em execução após um crash."""
+        count = self._update(
+            """
+            UPDATE jobs
+            SET status = ?, attempts = MAX(attempts - 1, 0),
+                lease_expires_at = NULL, updated_at = ?
+            WHERE status = ?
+            """,
+            (JobStatus.PENDING.value, _now(), JobStatus.RUNNING.value),
+            "recuperar jobs em execução",
+        )
+        if count:
+            logger.info("%s job(s) interrompido(s) devolvido(s) à fila", count)
+        return count
+
+    def get(self, job_id: int) -> Optional[Job]:
+        """Busca um job pelo id."""
+        try:
+            with sqlite_connection(self.db_path, self.pool) as conn:
+                row = conn.execute(
+                    "SELECT * FROM jobs WHERE id = ?", (job_id,)
+                ).fetchone()
+                return self._row_to_job(row) if row else None
+        except sqlite3.Error as e:
+            logger.error("Erro ao buscar job: %s", e)
+            return None
+
+    def count_by_status(self) -> Dict[str, int]:
+        """Retorna a quantidade de jobs em cada estado."""
+        counts = {status.value: 0 for status in JobStatus}
+        try:
+            with sqlite_connection(self.db_path, self.pool) as conn:
+                for status, count in conn.execute(
+                    "SELECT status, COUNT(*) FROM jobs GROUP BY status"
+                ):
+                    counts[status] = count
+        except sqlite3.Error as e:
+            logger.error("Erro ao contar jobs: %s", e)
+        return counts
+
+    def next_available_at(self) -> Optional[datetime]:
+        """Retorna o menor available_at dos jobs pendentes (agora, se nulo)."""
+        now = _now()
+        try:
+            with sqlite_connection(self.db_path, self.pool) as conn:
+                (available_at,) = conn.execute(
+                    "SELECT MIN(COALESCE(available_at, ?)) FROM jobs WHERE status = ?",
+                    (now, JobStatus.PENDING.value),
+                ).fetchone()
+                return datetime.fromisoformat(available_at) if available_at else None
+        except sqlite3.Error as e:
+            logger.error("Erro ao consultar a fila de jobs: %s", e)
+            raise JobQueueException(f"Erro ao consultar a fila de jobs: {e}")
@@ -0,0 +1,130 @@
+import logging
+import sqlite3
+from datetime import datetime
+from typing import Iterable, List, Optional
+
+from src.domain.entities import DOWNLOAD_PHASES, DownloadOutcome, DownloadStats
+from src.domain.repositories import DownloadMetricsRepository
+from src.infrastructure.sqlite_pool import SQLiteConnectionPool, sqlite_connection
+
+logger = logging.getLogger(__name__)
+
+# Colunas gravadas, na ordem do INSERT
+_COLUMNS = (
+    "url",
+    "started_at",
+    "outcome",
+    *(f"{phase}_s" for phase in DOWNLOAD_PHASES),
+    "total_s",
+    "bytes_downloaded",
+    "error",
+)
+
+
+class SQLiteDownloadMetricsRepository(DownloadMetricsRepository):
+    """
+    Implementação SQLite do DownloadMetricsRepository (tabela
+    download_metrics). Cada chamada de download gera uma linha; a consulta
+    por intervalo usa o índice em started_at.
+    """
+
+    def __init__(
+        self,
+        db_path: str = "db.sqlite3",
+        pool: Optional[SQLiteConnectionPool] = None,
+    ):
+        self.pool = pool
+        self.db_path = pool.db_path if pool is not None else db_path
+        self._init_database()
+
+    def _init_database(self) -> None:
+        """Cria a tabela de métricas se não existir."""
+        try:
+            with sqlite_connection(self.db_path, self.pool) as conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS download_metrics (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        url TEXT NOT NULL,
+                        started_at TEXT NOT NULL,
+                        outcome TEXT NOT NULL,
+                        validation_s REAL NOT NULL DEFAULT 0,
+                        lookup_s REAL NOT NULL DEFAULT 0,
+                        extraction_s REAL NOT NULL DEFAULT 0,
+                        transfer_s REAL NOT NULL DEFAULT 0,
+                        postprocess_s REAL NOT NULL DEFAULT 0,
+                        save_s REAL NOT NULL DEFAULT 0,
+                        total_s REAL NOT NULL DEFAULT 0,
+                        bytes_downloaded INTEGER NOT NULL DEFAULT 0,
+                        error TEXT
+                    )
+                """)
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_download_metrics_started_at "
+                    "ON download_metrics(started_at)"
+                )
+        except sqlite3.Error as e:
+            logger.error("Erro ao inicializar tabela de métricas: %s", e)
+
+    @staticmethod
+    def _to_row(stats: DownloadStats) -> tuple:
+        """Converte DownloadStats nos valores do INSERT."""
+        return (
+            stats.url,
+            stats.started_at.isoformat(timespec="microseconds"),
+            stats.outcome.value,
+            *(getattr(stats, f"{phase}_s") for phase in DOWNLOAD_PHASES),
+            stats.total_s,
+            stats.bytes_downloaded,
+            stats.error,
+        )
+
+    @staticmethod
+    def _row_to_stats(row: sqlite3.Row) -> DownloadStats:
+        """Converte uma linha da tabela download_metrics em DownloadStats."""
+        return DownloadStats(
+            url=row["url"],
+            started_at=datetime.fromisoformat(row["started_at"]),
+            outcome=DownloadOutcome(row["outcome"]),
+            total_s=row["total_s"],
+            bytes_downloaded=row["bytes_downloaded"],
+            error=row["error"],
+            **{f"{phase}_s": row[f"{phase}_s"] for phase in DOWNLOAD_PHASES},
+        )
+
+    def record(self, stats: DownloadStats) -> None:
+        """Grava as métricas; erros de banco são apenas registrados no log."""
+        self.record_many([stats])
+
+    def record_many(self, stats: Iterable[DownloadStats]) -> None:
+        """Grava as métricas de vários downloads em uma única transação."""
+        rows = [self._to_row(item) for item in stats]
+        if not rows:
+            return
+        placeholders = ", ".join("?" * len(_COLUMNS))
+        try:
+            with sqlite_connection(self.db_path, self.pool) as conn:
+                conn.executemany(
+                    f"INSERT INTO download_metrics ({', '.join(_COLUMNS)}) "
+                    f"VALUES ({placeholders})",
+                    rows,
+                )
+        except sqlite3.Error as e:
+            logger.error("Erro ao registrar métricas de download: %s", e)
+
+    def find_since(
+        self, since: datetime, until: Optional[datetime] = None
+    ) -> List[DownloadStats]:
+        """Retorna as métricas dos downloads iniciados em [since, until)."""
+        query = "SELECT * FROM download_metrics WHERE started_at >= ?"
+        params = [since.isoformat(timespec="microseconds")]
+        if until is not None:
+            query += " AND started_at < ?"
+            params.append(until.isoformat(timespec="microseconds"))
+        query += " ORDER BY started_at"
+        try:
+            with sqlite_connection(self.db_path, self.pool) as conn:
+                rows = conn.execute(query, params).fetchall()
+        except sqlite3.Error as e:
+            logger.error("Erro ao buscar métricas de download: %s", e)
+            return []
+        return [self._row_to_stats(row) for row in rows]
@@ -0,0 +1,112 @@
+import logging
+import sqlite3
+from datetime import datetime
+from typing import Optional
+
+from src.domain.entities import PartialDownload
+from src.domain.repositories import PartialDownloadRepository
+from src.domain.video_key import canonical_video_key
+from src.infrastructure.sqlite_pool import SQLiteConnectionPool, sqlite_connection
+
+logger = logging.getLogger(__name__)
+
+
+class SQLitePartialDownloadRepository(PartialDownloadRepository):
+    """
+    Implementação SQLite do PartialDownloadRepository.
+    O progresso é indexado pela chave canônica do vídeo, então uma variação
+    da URL também encontra o download interrompido.
+    """
+
+    def __init__(
+        self,
+        db_path: str = "db.sqlite3",
+        pool: Optional[SQLiteConnectionPool] = None,
+    ):
+        self.pool = pool
+        self.db_path = pool.db_path if pool is not None else db_path
+        self._init_database()
+
+    def _init_database(self) -> None:
+        """Cria a tabela de downloads parciais se não existir."""
+        try:
+            with sqlite_connection(self.db_path, self.pool) as conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS partial_downloads (
+                        download_key TEXT PRIMARY KEY,
+                        url TEXT NOT NULL,
+                        temp_path TEXT NOT NULL,
+                        bytes_done INTEGER NOT NULL,
+                        total_bytes INTEGER,
+                        format_id TEXT,
+                        etag TEXT,
+                        updated_at TEXT NOT NULL
+                    )
+                """)
+        except sqlite3.Error as e:
+            logger.error("Erro ao inicializar tabela de downloads parciais: %s", e)
+
+    @staticmethod
+    def _key(url: str) -> str:
+        """Chave do download (chave canônica quando houver)."""
+        return canonical_video_key(url) or url
+
+    def save_progress(self, partial: PartialDownload) -> None:
+        """Grava o progresso; falhas são apenas registradas no log."""
+        try:
+            with sqlite_connection(self.db_path, self.pool) as conn:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO partial_downloads (
+                        download_key, url, temp_path, bytes_done, total_bytes,
+                        format_id, etag, updated_at
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        self._key(partial.url),
+                        partial.url,
+                        partial.temp_path,
+                        partial.bytes_done,
+                        partial.total_bytes,
+                        partial.format_id,
+                        partial.etag,
+                        partial.updated_at.isoformat(),
+                    ),
+                )
+        except sqlite3.Error as e:
+            logger.error("Erro ao salvar progresso do download: %s", e)
+
+    def find(self, url: str) -> Optional[PartialDownload]:
+        """Busca o progresso salvo de uma URL."""
+        try:
+            with sqlite_connection(self.db_path, self.pool) as conn:
+                row = conn.execute(
+                    "SELECT * FROM partial_downloads WHERE download_key = ?",
+                    (self._key(url),),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.error("Erro ao buscar progresso do download: %s", e)
+            return None
+
+        if row is None:
+            return None
+        return PartialDownload(
+            url=row["url"],
+            temp_path=row["temp_path"],
+            bytes_done=row["bytes_done"],
+            total_bytes=row["total_bytes"],
+            format_id=row["format_id"],
+            etag=row["etag"],
+            updated_at=datetime.fromisoformat(row["updated_at"]),
+        )
+
+    def delete(self, url: str) -> None:
+        """Remove o progresso de uma URL."""
+        try:
+            with sqlite_connection(self.db_path, self.pool) as conn:
+                conn.execute(
+                    "DELETE FROM partial_downloads WHERE download_key = ?",
+                    (self._key(url),),
+                )
+        except sqlite3.Error as e:
+            logger.error("Erro ao remover progresso do download: %s", e)
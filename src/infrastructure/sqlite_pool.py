@@ -0,0 +1,135 @@
+import logging
+import sqlite3
+import threading
+from contextlib import closing, contextmanager
+from typing import Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SQLiteConnectionPool:
+    """
+    Pool de conexões SQLite persistentes, uma por thread.
+
+    Cada thread reutiliza sempre a mesma conexão, o que evita o custo de
+    abrir o arquivo a cada operação e mantém o cache de statements
+    preparados do módulo sqlite3. O banco é configurado em modo WAL, que
+    permite leituras concorrentes com uma escrita em andamento.
+    """
+
+    def __init__(
+        self,
+        db_path: str = "db.sqlite3",
+        synchronous: str = "NORMAL",
+        cache_size_kib: int = 16384,
+        busy_timeout: float = 5.0,
+        cached_statements: int = 256,
+    ):
+        self.db_path = db_path
+        self.synchronous = synchronous
+        self.cache_size_kib = cache_size_kib
+        self.busy_timeout = busy_timeout
+        self.cached_statements = cached_statements
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: List[sqlite3.Connection] = []
+
+    def _create_connection(self) -> sqlite3.Connection:
+        """Abre e configura uma nova conexão."""
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.busy_timeout,
+            cached_statements=self.cached_statements,
+            # Cada conexão é usada apenas pela thread dona; a flag só
+            # permite que close_all() as feche a partir de outra thread.
+            check_same_thread=False,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(f"PRAGMA synchronous={self.synchronous}")
+        # Valor negativo = tamanho em KiB
+        conn.execute(f"PRAGMA cache_size=-{self.cache_size_kib}")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.row_factory = sqlite3.Row
+
+        with self._lock:
+            self._connections.append(conn)
+        logger.debug("Nova conexão SQLite aberta para %s", self.db_path)
+        return conn
+
+    def connection(self) -> sqlite3.Connection:
+        """Retorna a conexão da thread atual, criando-a se necessário."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._create_connection()
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Fornece a conexão da thread com commit/rollback automáticos."""
+        conn = self.connection()
+        with conn:
+            yield conn
+
+    def release(self) -> None:
+        """
+        Fecha a conexão da thread atual, se houver. Para threads de vida
+        curta (ex: uma por requisição HTTP), que de outra forma deixariam a
+        conexão aberta até o close_all().
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            return
+        self._local.conn = None
+        with self._lock:
+            if conn in self._connections:
+                self._connections.remove(conn)
+        conn.close()
+
+    def close_all(self) -> None:
+        """Fecha todas as conexões abertas pelo pool."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+        logger.debug("%s conexão(ões) SQLite fechada(s)", len(connections))
+
+
+@contextmanager
+def sqlite_connection(
+    db_path: str, pool: Optional[SQLiteConnectionPool] = None
+) -> Iterator[sqlite3.Connection]:
+    """
+    Fornece uma conexão SQLite dentro de uma transação.
+
+    Com pool, reutiliza a conexão persistente da thread atual; sem pool,
+    abre uma conexão nova e a fecha ao final (comportamento original).
+    """
+    if pool is not None:
+        with pool.transaction() as conn:
+            yield conn
+        return
+
+    with closing(sqlite3.connect(db_path)) as conn:
+        conn.row_factory = sqlite3.Row
+        with conn:
+            yield conn
+
+
+def ensure_column(
+    conn: sqlite3.Connection, table: str, column: str, definition: str
+) -> bool:
+    """
+    Adiciona uma coluna à tabela se ela ainda não existir (migração simples).
+
+    Returns:
+        True se a coluna foi criada agora, False se já existia
+    """
+    columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+    if column in columns:
+        return False
+    conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+    logger.info("Migração: coluna %s.%s criada", table, column)
+    return True
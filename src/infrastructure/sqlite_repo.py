@@ -1,29 +1,126 @@
 import logging
 import sqlite3
-from typing import List, Optional
+import time
+from contextlib import nullcontext
+from datetime import datetime
+from typing import (
+    Any,
+    ContextManager,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
-from src.domain.entities import Video
+from src.domain.entities import FormatProfile, PostprocessStatus, Video
 from src.domain.exceptions import VideoNotSavedException
 from src.domain.repositories import VideoRepository
+from src.domain.services import MetricsRecorder
+from src.domain.video_key import canonical_video_key
+from src.infrastructure.sqlite_pool import (
+    SQLiteConnectionPool,
+    ensure_column,
+    sqlite_connection,
+)
 
 logger = logging.getLogger(__name__)
 
+# Limite de parâmetros por consulta IN (...); fica bem abaixo do
+# SQLITE_MAX_VARIABLE_NUMBER das versões antigas (999)
+IN_CLAUSE_CHUNK_SIZE = 500
+
+# Um registro por vídeo: uma variante da URL (mesma video_key) substitui o
+# registro existente; a mesma URL, com ou sem chave canônica, é ignorada
+_UPSERT_VIDEO_SQL = """
+    INSERT INTO videos (
+        url, title, file_path, downloaded_at,
+        video_key, content_hash, format_profile,
+        postprocess_status
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(video_key) WHERE video_key IS NOT NULL DO UPDATE SET
+        url = excluded.url,
+        title = excluded.title,
+        file_path = excluded.file_path,
+        downloaded_at = excluded.downloaded_at,
+        content_hash = excluded.content_hash,
+        format_profile = excluded.format_profile,
+        postprocess_status = excluded.postprocess_status
+    WHERE videos.url <> excluded.url
+    ON CONFLICT DO NOTHING
+"""
+
+
+class _QueryTimer:
+    """Registra a duração do bloco em ytdl_sqlite_query_seconds."""
+
+    __slots__ = ("metrics", "operation", "start")
+
+    def __init__(self, metrics: MetricsRecorder, operation: str):
+        self.metrics = metrics
+        self.operation = operation
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.metrics.observe(
+            "ytdl_sqlite_query_seconds",
+            time.perf_counter() - self.start,
+            operation=self.operation,
+        )
+
 
 class SQLiteVideoRepository(VideoRepository):
     """
     Implementação SQLite do VideoRepository.
     Usa context manager para gerenciar conexões adequadamente
     e evitar memory leaks.
+
+    Sem pool, cada operação abre e fecha sua própria conexão. Com um
+    SQLiteConnectionPool, as operações reutilizam a conexão persistente
+    (em modo WAL) da thread atual, o que é seguro para uso multi-thread.
+
+    Cada vídeo é gravado também com sua chave canônica (video_key), e as
+    buscas por URL usam essa chave quando ela existe; assim youtu.be/X e
+    youtube.com/watch?v=X são reconhecidos como o mesmo vídeo. A chave é
+    única: gravar uma variante de um vídeo já salvo atualiza o registro.
+
+    O hash do conteúdo (content_hash), quando conhecido, é gravado junto
+    e indexado, permitindo encontrar cópias do mesmo arquivo baixadas de
+    URLs diferentes. O perfil de formato usado no download
+    (format_profile) também é gravado, assim como o estado do
+    pós-processamento (postprocess_status), que permite retomar os vídeos
+    ainda não processados quando a aplicação é reiniciada.
+
+    Com um MetricsRecorder, a latência de save, save_many e das buscas é
+    registrada no histograma ytdl_sqlite_query_seconds.
     """
 
-    def __init__(self, db_path: str = "db.sqlite3"):
-        self.db_path = db_path
+    def __init__(
+        self,
+        db_path: str = "db.sqlite3",
+        pool: Optional[SQLiteConnectionPool] = None,
+        metrics: Optional[MetricsRecorder] = None,
+    ):
+        self.pool = pool
+        self.db_path = pool.db_path if pool is not None else db_path
+        self.metrics = metrics
         self._init_database()
 
+    def _timed(self, operation: str) -> ContextManager:
+        """Mede a operação, se houver onde registrar a métrica."""
+        if self.metrics is None:
+            return nullcontext()
+        return _QueryTimer(self.metrics, operation)
+
     def _init_database(self) -> None:
         """Inicializa o banco de dados criando a tabela se não existir."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with sqlite_connection(self.db_path, self.pool) as conn:
                 conn.execute("""
                     CREATE TABLE IF NOT EXISTS videos (
                         id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -31,83 +128,335 @@ class SQLiteVideoRepository(VideoRepository):
                         title TEXT NOT NULL,
                         file_path TEXT NOT NULL,
                         downloaded_at TEXT NOT NULL,
+                        video_key TEXT,
+                        content_hash TEXT,
+                        format_profile TEXT,
+                        postprocess_status TEXT,
                         UNIQUE(url)
                     )
                 """)
-                conn.commit()
-                logger.info(f"Banco de dados inicializado: {self.db_path}")
+                if ensure_column(conn, "videos", "video_key", "TEXT"):
+                    self._backfill_video_keys(conn)
+                self._ensure_unique_video_key(conn)
+                ensure_column(conn, "videos", "content_hash", "TEXT")
+                ensure_column(conn, "videos", "format_profile", "TEXT")
+                ensure_column(conn, "videos", "postprocess_status", "TEXT")
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_videos_content_hash "
+                    "ON videos(content_hash)"
+                )
+                # Parcial: a maioria dos vídeos nunca passa pelo pós-processamento
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_videos_postprocess_status "
+                    "ON videos(postprocess_status) "
+                    "WHERE postprocess_status IS NOT NULL"
+                )
+                # Índice usado pela paginação do histórico (iter_videos)
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_videos_downloaded_at "
+                    "ON videos(downloaded_at)"
+                )
+                logger.info("Banco de dados inicializado: %s", self.db_path)
         except sqlite3.Error as e:
-            logger.error(f"Erro ao inicializar banco de dados: {e}")
+            logger.error("Erro ao inicializar banco de dados: %s", e)
             raise VideoNotSavedException(f"Erro ao inicializar banco: {e}")
 
+    @staticmethod
+    def _backfill_video_keys(conn: sqlite3.Connection) -> None:
+        """Preenche a chave canônica dos vídeos gravados antes da migração."""
+        rows = conn.execute("SELECT id, url FROM videos").fetchall()
+        updates = [
+            (key, row_id)
+            for row_id, url in rows
+            if (key := canonical_video_key(url)) is not None
+        ]
+        conn.executemany("UPDATE videos SET video_key = ? WHERE id = ?", updates)
+        logger.info("Migração: %s chave(s) canônica(s) preenchida(s)", len(updates))
+
+    @staticmethod
+    def _ensure_unique_video_key(conn: sqlite3.Connection) -> None:
+        """
+        Cria o índice UNIQUE de video_key. Bancos com o índice antigo (não
+        único) mantêm só o registro mais antigo de cada vídeo.
+        """
+        indexes = {
+            row["name"]: row["unique"]
+            for row in conn.execute("PRAGMA index_list(videos)")
+        }
+        if indexes.get("idx_videos_video_key"):
+            return
+        cursor = conn.execute("""
+            DELETE FROM videos
+            WHERE video_key IS NOT NULL AND id NOT IN (
+                SELECT MIN(id) FROM videos
+                WHERE video_key IS NOT NULL
+                GROUP BY video_key
+            )
+        """)
+        if cursor.rowcount:
+            logger.info(
+                "Migração: %s vídeo(s) repetido(s) removido(s)", cursor.rowcount
+            )
+        conn.execute("DROP INDEX IF EXISTS idx_videos_video_key")
+        conn.execute(
+            "CREATE UNIQUE INDEX idx_videos_video_key ON videos(video_key) "
+            "WHERE video_key IS NOT NULL"
+        )
+
+    @staticmethod
+    def _video_params(video: Video) -> tuple:
+        """Parâmetros de INSERT de um vídeo."""
+        return (
+            video.url,
+            video.title,
+            video.file_path,
+            video.downloaded_at.isoformat(),
+            canonical_video_key(video.url),
+            video.content_hash,
+            video.format_profile.value if video.format_profile else None,
+            video.postprocess_status.value if video.postprocess_status else None,
+        )
+
     def save(self, video: Video) -> None:
         """Salva um vídeo no banco de dados usando context manager."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute(
-                    """
-                    INSERT INTO videos (url, title, file_path, downloaded_at)
-                    VALUES (?, ?, ?, ?)
-                    """,
-                    (
-                        video.url,
-                        video.title,
-                        video.file_path,
-                        video.downloaded_at.isoformat(),
-                    ),
-                )
-                conn.commit()
-                logger.info(f"Vídeo salvo: {video.title}")
-        except sqlite3.IntegrityError:
-            logger.warning(f"Vídeo já existe no banco: {video.url}")
-            # Não levanta exceção para URLs duplicadas
+            with self._timed("save"), sqlite_connection(
+                self.db_path, self.pool
+            ) as conn:
+                cursor = conn.execute(_UPSERT_VIDEO_SQL, self._video_params(video))
+                if cursor.rowcount:
+                    logger.info("Vídeo salvo: %s", video.title)
+                else:
+                    # Não levanta exceção para URLs duplicadas
+                    logger.warning("Vídeo já existe no banco: %s", video.url)
         except sqlite3.Error as e:
-            logger.error(f"Erro ao salvar vídeo: {e}")
+            logger.error("Erro ao salvar vídeo: %s", e)
             raise VideoNotSavedException(f"Erro ao salvar vídeo no banco: {e}")
 
     def find_by_url(self, url: str) -> Optional[Video]:
-        """Busca um vídeo pela URL."""
+        """Busca um vídeo pela URL (ou por qualquer variação dela)."""
+        key = canonical_video_key(url)
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.execute("SELECT * FROM videos WHERE url = ?", (url,))
-                row = cursor.fetchone()
-
-                if row:
-                    from datetime import datetime
-
-                    return Video(
-                        url=row["url"],
-                        title=row["title"],
-                        file_path=row["file_path"],
-                        downloaded_at=datetime.fromisoformat(row["downloaded_at"]),
+            with self._timed("find_by_url"), sqlite_connection(
+                self.db_path, self.pool
+            ) as conn:
+                if key is not None:
+                    cursor = conn.execute(
+                        "SELECT * FROM videos WHERE video_key = ? LIMIT 1", (key,)
                     )
-                return None
+                else:
+                    cursor = conn.execute("SELECT * FROM videos WHERE url = ?", (url,))
+                row = cursor.fetchone()
+                return self._row_to_video(row) if row else None
         except sqlite3.Error as e:
-            logger.error(f"Erro ao buscar vídeo: {e}")
+            logger.error("Erro ao buscar vídeo: %s", e)
             return None
 
     def get_all(self) -> List[Video]:
         """Retorna todos os vídeos salvos."""
+        return list(self.iter_videos())
+
+    def iter_videos(
+        self,
+        after: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        page_size: int = 500,
+    ) -> Iterator[Video]:
+        """
+        Percorre o histórico do mais recente para o mais antigo.
+
+        Usa paginação por chave (downloaded_at, id) sobre o índice de
+        downloaded_at, então cada página custa o mesmo independentemente
+        do tamanho do histórico e apenas uma página fica em memória.
+        """
+        cursor_key: Optional[Tuple[str, int]] = None
+        remaining = limit
+        while remaining is None or remaining > 0:
+            size = page_size if remaining is None else min(page_size, remaining)
+            params: Tuple[Any, ...]
+            if cursor_key is not None:
+                where, params = "WHERE (downloaded_at, id) < (?, ?)", cursor_key
+            elif after is not None:
+                where, params = "WHERE downloaded_at < ?", (after.isoformat(),)
+            else:
+                where, params = "", ()
+
+            try:
+                with sqlite_connection(self.db_path, self.pool) as conn:
+                    rows = conn.execute(
+                        f"""
+                        SELECT * FROM videos {where}
+                        ORDER BY downloaded_at DESC, id DESC
+                        LIMIT ?
+                        """,
+                        (*params, size),
+                    ).fetchall()
+            except sqlite3.Error as e:
+                logger.error("Erro ao buscar histórico de vídeos: %s", e)
+                return
+
+            for row in rows:
+                yield self._row_to_video(row)
+            if len(rows) < size:
+                return
+
+            cursor_key = (rows[-1]["downloaded_at"], rows[-1]["id"])
+            if remaining is not None:
+                remaining -= len(rows)
+
+    def save_many(self, videos: Iterable[Video]) -> int:
+        """
+        Salva vários vídeos com executemany, em uma única transação.
+        URLs já gravadas são ignoradas; variantes de URL de um vídeo já
+        gravado atualizam o registro dele. Retorna quantos foram gravados.
+        """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.execute(
-                    "SELECT * FROM videos ORDER BY downloaded_at DESC"
+            with self._timed("save_many"), sqlite_connection(
+                self.db_path, self.pool
+            ) as conn:
+                cursor = conn.executemany(
+                    _UPSERT_VIDEO_SQL,
+                    (self._video_params(video) for video in videos),
                 )
-                rows = cursor.fetchall()
+                inserted = cursor.rowcount
+                logger.info("%s vídeo(s) salvo(s) em lote", inserted)
+                return inserted
+        except sqlite3.Error as e:
+            logger.error("Erro ao salvar vídeos em lote: %s", e)
+            raise VideoNotSavedException(f"Erro ao salvar vídeos no banco: {e}")
 
-                from datetime import datetime
+    def find_by_urls(self, urls: Iterable[str]) -> Dict[str, Video]:
+        """
+        Busca vários vídeos pela URL (ou por variações dela).
+        As chaves são consultadas em blocos de IN (...) na mesma transação.
+        """
+        keys_by_url = {url: canonical_video_key(url) for url in urls}
+        keys = list({key for key in keys_by_url.values() if key is not None})
+        raw_urls = [url for url, key in keys_by_url.items() if key is None]
 
-                return [
-                    Video(
-                        url=row["url"],
-                        title=row["title"],
-                        file_path=row["file_path"],
-                        downloaded_at=datetime.fromisoformat(row["downloaded_at"]),
-                    )
-                    for row in rows
-                ]
+        by_key: Dict[str, Video] = {}
+        by_url: Dict[str, Video] = {}
+        try:
+            with self._timed("find_by_urls"), sqlite_connection(
+                self.db_path, self.pool
+            ) as conn:
+                for column, values, target in (
+                    ("video_key", keys, by_key),
+                    ("url", raw_urls, by_url),
+                ):
+                    for start in range(0, len(values), IN_CLAUSE_CHUNK_SIZE):
+                        chunk = values[start : start + IN_CLAUSE_CHUNK_SIZE]
+                        placeholders = ", ".join("?" * len(chunk))
+                        cursor = conn.execute(
+                            f"SELECT * FROM videos WHERE {column} IN ({placeholders})",
+                            chunk,
+                        )
+                        for row in cursor:
+                            target.setdefault(row[column], self._row_to_video(row))
+        except sqlite3.Error as e:
+            logger.error("Erro ao buscar vídeos em lote: %s", e)
+
+        found: Dict[str, Video] = {}
+        for url, key in keys_by_url.items():
+            video = by_key.get(key) if key is not None else by_url.get(url)
+            if video is not None:
+                found[url] = video
+        return found
+
+    def find_by_content_hash(self, content_hash: str) -> Optional[Video]:
+        """Busca o vídeo mais antigo com o mesmo conteúdo."""
+        try:
+            with self._timed("find_by_content_hash"), sqlite_connection(
+                self.db_path, self.pool
+            ) as conn:
+                row = conn.execute(
+                    """
+                    SELECT * FROM videos WHERE content_hash = ?
+                    ORDER BY downloaded_at, id LIMIT 1
+                    """,
+                    (content_hash,),
+                ).fetchone()
+                return self._row_to_video(row) if row else None
+        except sqlite3.Error as e:
+            logger.error("Erro ao buscar vídeo por conteúdo: %s", e)
+            return None
+
+    def content_hashes(self) -> Optional[Set[str]]:
+        """Retorna os hashes de conteúdo distintos gravados em videos."""
+        try:
+            with self._timed("content_hashes"), sqlite_connection(
+                self.db_path, self.pool
+            ) as conn:
+                rows = conn.execute(
+                    "SELECT DISTINCT content_hash FROM videos "
+                    "WHERE content_hash IS NOT NULL"
+                )
+                return {row["content_hash"] for row in rows}
+        except sqlite3.Error as e:
+            logger.error("Erro ao listar hashes de conteúdo: %s", e)
+            return None
+
+    def find_by_postprocess_status(self, status: PostprocessStatus) -> List[Video]:
+        """Busca os vídeos cujo pós-processamento está no estado informado."""
+        try:
+            with self._timed("find_by_postprocess_status"), sqlite_connection(
+                self.db_path, self.pool
+            ) as conn:
+                rows = conn.execute(
+                    """
+                    SELECT * FROM videos WHERE postprocess_status = ?
+                    ORDER BY downloaded_at, id
+                    """,
+                    (status.value,),
+                ).fetchall()
+                return [self._row_to_video(row) for row in rows]
         except sqlite3.Error as e:
-            logger.error(f"Erro ao buscar todos os vídeos: {e}")
+            logger.error("Erro ao buscar vídeos por pós-processamento: %s", e)
             return []
+
+    def update_postprocess(
+        self,
+        url: str,
+        status: PostprocessStatus,
+        file_path: Optional[str] = None,
+        content_hash: Optional[str] = None,
+    ) -> None:
+        """Atualiza o estado do pós-processamento (e o arquivo, se mudou)."""
+        try:
+            with self._timed("update_postprocess"), sqlite_connection(
+                self.db_path, self.pool
+            ) as conn:
+                conn.execute(
+                    """
+                    UPDATE videos
+                    SET postprocess_status = ?,
+                        file_path = COALESCE(?, file_path),
+                        content_hash = COALESCE(?, content_hash)
+                    WHERE url = ?
+                    """,
+                    (status.value, file_path, content_hash, url),
+                )
+        except sqlite3.Error as e:
+            logger.error("Erro ao atualizar pós-processamento: %s", e)
+            raise VideoNotSavedException(
+                f"Erro ao atualizar pós-processamento no banco: {e}"
+            )
+
+    @staticmethod
+    def _row_to_video(row: sqlite3.Row) -> Video:
+        """Converte uma linha da tabela videos em entidade Video."""
+        return Video(
+            url=row["url"],
+            title=row["title"],
+            file_path=row["file_path"],
+            downloaded_at=datetime.fromisoformat(row["downloaded_at"]),
+            content_hash=row["content_hash"],
+            format_profile=(
+                FormatProfile(row["format_profile"]) if row["format_profile"] else None
+            ),
+            postprocess_status=(
+                PostprocessStatus(row["postprocess_status"])
+                if row["postprocess_status"]
+                else None
+            ),
+        )
@@ -0,0 +1,120 @@
+import logging
+import sqlite3
+from datetime import datetime
+from typing import List, Optional
+
+from src.domain.entities import Subscription
+from src.domain.exceptions import InvalidURLException
+from src.domain.repositories import SubscriptionRepository
+from src.domain.video_key import channel_key
+from src.infrastructure.sqlite_pool import SQLiteConnectionPool, sqlite_connection
+
+logger = logging.getLogger(__name__)
+
+
+class SQLiteSubscriptionRepository(SubscriptionRepository):
+    """
+    Implementação SQLite do SubscriptionRepository (tabela subscriptions).
+    As assinaturas são indexadas pela chave do canal, então
+    youtube.com/@canal e youtube.com/@canal/videos são o mesmo canal.
+    """
+
+    def __init__(
+        self,
+        db_path: str = "db.sqlite3",
+        pool: Optional[SQLiteConnectionPool] = None,
+    ):
+        self.pool = pool
+        self.db_path = pool.db_path if pool is not None else db_path
+        self._init_database()
+
+    def _init_database(self) -> None:
+        """Cria a tabela de assinaturas se não existir."""
+        try:
+            with sqlite_connection(self.db_path, self.pool) as conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS subscriptions (
+                        channel_key TEXT PRIMARY KEY,
+                        url TEXT NOT NULL,
+                        last_video_id TEXT,
+                        last_upload_date TEXT,
+                        last_synced_at TEXT
+                    )
+                """)
+        except sqlite3.Error as e:
+            logger.error("Erro ao inicializar tabela de assinaturas: %s", e)
+
+    @staticmethod
+    def _key(url: str) -> str:
+        """
+        Chave do canal.
+
+        Raises:
+            InvalidURLException: Se a URL não for de um canal
+        """
+        key = channel_key(url)
+        if key is None:
+            raise InvalidURLException(url, "URL não é de um canal")
+        return key
+
+    @staticmethod
+    def _row_to_subscription(row: sqlite3.Row) -> Subscription:
+        """Converte uma linha da tabela subscriptions em entidade Subscription."""
+        synced = row["last_synced_at"]
+        return Subscription(
+            url=row["url"],
+            last_video_id=row["last_video_id"],
+            last_upload_date=row["last_upload_date"],
+            last_synced_at=datetime.fromisoformat(synced) if synced else None,
+        )
+
+    def save(self, subscription: Subscription) -> None:
+        """Grava a assinatura; erros de banco são apenas registrados no log."""
+        key = self._key(subscription.url)
+        synced = subscription.last_synced_at
+        try:
+            with sqlite_connection(self.db_path, self.pool) as conn:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO subscriptions (
+                        channel_key, url, last_video_id, last_upload_date,
+                        last_synced_at
+                    ) VALUES (?, ?, ?, ?, ?)
+                    """,
+                    (
+                        key,
+                        subscription.url,
+                        subscription.last_video_id,
+                        subscription.last_upload_date,
+                        synced.isoformat() if synced else None,
+                    ),
+                )
+        except sqlite3.Error as e:
+            logger.error("Erro ao salvar assinatura: %s", e)
+
+    def find(self, url: str) -> Optional[Subscription]:
+        """Busca a assinatura de um canal."""
+        key = channel_key(url)
+        if key is None:
+            return None
+        try:
+            with sqlite_connection(self.db_path, self.pool) as conn:
+                row = conn.execute(
+                    "SELECT * FROM subscriptions WHERE channel_key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.error("Erro ao buscar assinatura: %s", e)
+            return None
+        return self._row_to_subscription(row) if row else None
+
+    def get_all(self) -> List[Subscription]:
+        """Retorna todas as assinaturas, em ordem de chave."""
+        try:
+            with sqlite_connection(self.db_path, self.pool) as conn:
+                rows = conn.execute(
+                    "SELECT * FROM subscriptions ORDER BY channel_key"
+                ).fetchall()
+        except sqlite3.Error as e:
+            logger.error("Erro ao listar assinaturas: %s", e)
+            return []
+        return [self._row_to_subscription(row) for row in rows]
@@ -1,65 +1,672 @@
 import logging
-from typing import Tuple
-
-import yt_dlp
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
 
+from src.domain.entities import (
+    DownloadStats,
+    FormatProfile,
+    PartialDownload,
+    PlaylistEntry,
+)
 from src.domain.exceptions import DownloadFailedException
-from src.domain.services import VideoDownloaderService
+from src.domain.repositories import PartialDownloadRepository
+from src.domain.services import MetricsRecorder, VideoDownloaderService
+from src.domain.video_key import canonical_video_key, is_collection_url
+from src.infrastructure.content_store import ContentAddressedStore
+from src.infrastructure.path_allocator import PathAllocator, PathReservation
+from src.infrastructure.probe_cache import ProbeCache
+from src.infrastructure.rate_limiter import BandwidthGovernor, HostRateLimiter
+
+if TYPE_CHECKING:
+    import yt_dlp
 
 logger = logging.getLogger(__name__)
 
+# Profundidade máxima de coleções aninhadas (canal -> abas -> playlists)
+_MAX_PLAYLIST_DEPTH = 3
+
+# Seletor de formato do yt-dlp de cada perfil. Formatos com áudio e vídeo
+# no mesmo arquivo ("best") vêm antes de "bestvideo+bestaudio": evitam
+# baixar duas streams e juntá-las com ffmpeg. Só o perfil de arquivamento
+# prefere a melhor combinação, mesmo que precise de merge.
+FORMAT_SELECTORS: Dict[FormatProfile, str] = {
+    FormatProfile.AUDIO: "bestaudio/best[height<=480]/best",
+    FormatProfile.SD: "best[height<=720]/bestvideo[height<=720]+bestaudio/best",
+    FormatProfile.ARCHIVAL: "bestvideo*+bestaudio/best",
+}
+
+
+def _yt_dlp() -> ModuleType:
+    """
+    Importa o yt-dlp sob demanda.
+    A importação carrega todos os extratores e custa centenas de
+    milissegundos, então só é feita no primeiro uso real do serviço.
+    """
+    import yt_dlp
+
+    return yt_dlp
+
 
 class YTDLPService(VideoDownloaderService):
     """
     Implementação do VideoDownloaderService usando yt-dlp.
     Agora implementa a abstração do domínio, seguindo DIP.
+
+    Com reuse_session=True o serviço mantém uma instância "quente" de
+    yt_dlp.YoutubeDL por thread, reaproveitando extratores, cookies e o
+    pool de conexões HTTP entre downloads. Nesse modo o serviço deve ser
+    fechado com close() (ou usado como context manager).
+
+    Com um ProbeCache, os metadados obtidos por probe() são reaproveitados
+    pelo download seguinte da mesma URL, evitando uma segunda extração.
+
+    Downloads interrompidos são retomados: o yt-dlp mantém o arquivo .part
+    (continuedl) e, com um PartialDownloadRepository, o progresso (bytes,
+    arquivo temporário e formato) é gravado para que a nova tentativa peça
+    o mesmo formato e continue a partir do último byte recebido.
+
+    Um HostRateLimiter limita as extrações por host e um BandwidthGovernor
+    limita a banda somada de todos os downloads. Ambos podem ser
+    compartilhados entre várias instâncias e ajustados em tempo de
+    execução; como dependem de locks, valem apenas entre threads do mesmo
+    processo (não são enviados a um ProcessPoolExecutor).
+
+    download() aceita um DownloadStats opcional, preenchido pelos hooks de
+    progresso e de pós-processamento do yt-dlp com o tempo de extração,
+    transferência e pós-processamento e com os bytes recebidos.
+
+    Com um MetricsRecorder, o serviço mantém o gauge de downloads em
+    andamento (ytdl_active_downloads) e o contador de bytes recebidos
+    (ytdl_downloaded_bytes_total).
+
+    Com um ContentAddressedStore, o hash de cada arquivo é calculado pelo
+    hook de progresso enquanto o download acontece, para que store() não
+    precise ler o arquivo de novo.
+
+    Com um PathAllocator, o output_template é ignorado: cada download
+    reserva um caminho derivado da chave canônica do vídeo, em
+    subdiretórios por hash, e o arquivo só recebe o nome final depois de
+    concluído.
+
+    Com defer_postprocess=True, as correções que o yt-dlp faria com ffmpeg
+    ao fim do download (fixup, ex: remux de HLS para MP4) são desligadas,
+    para serem feitas fora do worker de download por um PostprocessVideos.
+    A junção de vídeo e áudio baixados separadamente continua no download.
     """
 
-    def __init__(self, output_template: str = "downloads/%(title)s.%(ext)s"):
+    def __init__(
+        self,
+        output_template: str = "downloads/%(title)s.%(ext)s",
+        reuse_session: bool = False,
+        probe_cache: Optional[ProbeCache] = None,
+        partial_repo: Optional[PartialDownloadRepository] = None,
+        fragment_concurrency: int = 1,
+        progress_interval: float = 2.0,
+        request_limiter: Optional[HostRateLimiter] = None,
+        bandwidth: Optional[BandwidthGovernor] = None,
+        metrics: Optional[MetricsRecorder] = None,
+        content_store: Optional[ContentAddressedStore] = None,
+        path_allocator: Optional[PathAllocator] = None,
+        defer_postprocess: bool = False,
+    ):
         self.output_template = output_template
+        self.reuse_session = reuse_session
+        self.probe_cache = probe_cache
+        self.partial_repo = partial_repo
+        # Fragmentos (HLS/DASH) do mesmo vídeo baixados em paralelo
+        self.fragment_concurrency = fragment_concurrency
+        # Intervalo mínimo (segundos) entre gravações de progresso
+        self.progress_interval = progress_interval
+        self.request_limiter = request_limiter
+        self.bandwidth = bandwidth
+        self.metrics = metrics
+        self.content_store = content_store
+        self.path_allocator = path_allocator
+        self.defer_postprocess = defer_postprocess
 
-    def download(self, url: str) -> Tuple[str, str]:
-        """
-        Faz o download de um vídeo usando yt-dlp.
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._sessions: List["yt_dlp.YoutubeDL"] = []
+        self._progress_saved_at: Dict[str, float] = {}
+        # Bytes já contabilizados no limite de banda, por arquivo temporário
+        self._bytes_seen: Dict[str, int] = {}
+        # Métricas dos downloads em andamento, por chave canônica
+        self._active_stats: Dict[str, DownloadStats] = {}
+        # Início (perf_counter, bytes já existentes) de cada transferência
+        self._transfer_started: Dict[str, Tuple[float, int]] = {}
+        # Início de cada pós-processador, por (chave canônica, nome)
+        self._postprocess_started: Dict[Tuple[str, str], float] = {}
 
-        Args:
-            url: URL do vídeo
+    def __getstate__(self) -> dict:
+        # Sessões e locks não são serializáveis (ex: ProcessPoolExecutor);
+        # cada processo cria as suas sob demanda
+        state = self.__dict__.copy()
+        for attr in (
+            "_local",
+            "_lock",
+            "_sessions",
+            "_progress_saved_at",
+            "_bytes_seen",
+            "_active_stats",
+            "_transfer_started",
+            "_postprocess_started",
+        ):
+            state.pop(attr)
+        state["request_limiter"] = None
+        state["bandwidth"] = None
+        state["metrics"] = None
+        state["content_store"] = None
+        return state
 
-        Returns:
-            Tuple[str, str]: (título, caminho do arquivo)
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._sessions = []
+        self._progress_saved_at = {}
+        self._bytes_seen = {}
+        self._active_stats = {}
+        self._transfer_started = {}
+        self._postprocess_started = {}
 
-        Raises:
-            DownloadFailedException: Se o download falhar
-        """
-        ydl_opts = {
+    def _build_options(self) -> dict:
+        """Monta as opções passadas ao yt-dlp."""
+        options = {
             "outtmpl": self.output_template,
             "quiet": True,
             "no_warnings": True,
+            # URLs de vídeo com list= baixam só o vídeo; coleções são
+            # expandidas por iter_playlist()
+            "noplaylist": True,
+            # Mantém o arquivo .part e retoma downloads interrompidos
+            "continuedl": True,
+            "nopart": False,
+            "progress_hooks": [self._on_progress],
+            "postprocessor_hooks": [self._on_postprocess],
         }
+        if self.fragment_concurrency > 1:
+            options["concurrent_fragment_downloads"] = self.fragment_concurrency
+        if self.defer_postprocess:
+            options["fixup"] = "never"
+        return options
 
+    def _on_progress(self, status: Dict[str, Any]) -> None:
+        """
+        Hook de progresso do yt-dlp: limita a banda, grava o progresso,
+        mede a transferência e calcula o hash do conteúdo.
+        """
+        if self.bandwidth is not None or self.metrics is not None:
+            self._count_bytes(status)
+        if self.partial_repo is not None and status.get("status") == "downloading":
+            self._save_progress(status)
+        if self._active_stats:
+            self._measure_transfer(status)
+        if self.content_store is not None:
+            self.content_store.on_progress(status)
+
+    def _on_postprocess(self, status: Dict[str, Any]) -> None:
+        """Hook de pós-processamento do yt-dlp: mede cada pós-processador."""
+        if not self._active_stats:
+            return
+        info = status.get("info_dict") or {}
+        url = info.get("original_url") or info.get("webpage_url")
+        if not url:
+            return
+        key = (self._cache_key(url), status.get("postprocessor") or "")
+        now = time.perf_counter()
+        with self._lock:
+            if status.get("status") == "started":
+                self._postprocess_started[key] = now
+                return
+            if status.get("status") != "finished":
+                return
+            started = self._postprocess_started.pop(key, None)
+            stats = self._active_stats.get(key[0])
+        if started is not None and stats is not None:
+            stats.add("postprocess", now - started)
+
+    def _measure_transfer(self, status: Dict[str, Any]) -> None:
+        """
+        Soma às métricas do download o tempo entre o primeiro evento
+        "downloading" e o evento final de cada arquivo, e os bytes recebidos
+        nesse intervalo (sem contar o que já existia no .part).
+        """
+        # O evento "finished" traz apenas filename (sem tmpfilename)
+        key = status.get("filename")
+        if not key:
+            return
+        downloaded = int(status.get("downloaded_bytes") or 0)
+        now = time.perf_counter()
+        with self._lock:
+            if status.get("status") == "downloading":
+                self._transfer_started.setdefault(key, (now, downloaded))
+                return
+            started = self._transfer_started.pop(key, None)
+        # Arquivo já baixado antes: "finished" sem nenhuma transferência
+        if started is None:
+            return
+        info = status.get("info_dict") or {}
+        url = info.get("original_url") or info.get("webpage_url")
+        with self._lock:
+            stats = self._active_stats.get(self._cache_key(url)) if url else None
+        if stats is None:
+            return
+        started_at, initial_bytes = started
+        stats.add("transfer", now - started_at)
+        if status.get("status") == "finished":
+            total = downloaded or int(status.get("total_bytes") or 0)
+            stats.bytes_downloaded += max(total - initial_bytes, 0)
+
+    @contextmanager
+    def _active(self) -> Iterator[None]:
+        """Mantém o gauge de downloads em andamento durante o bloco."""
+        if self.metrics is None:
+            yield
+            return
+        self.metrics.inc("ytdl_active_downloads")
+        try:
+            yield
+        finally:
+            self.metrics.inc("ytdl_active_downloads", -1)
+
+    @contextmanager
+    def _tracking(self, url: str, stats: Optional[DownloadStats]) -> Iterator[None]:
+        """Associa stats aos hooks enquanto o download da URL estiver ativo."""
+        if stats is None:
+            yield
+            return
+        key = self._cache_key(url)
+        with self._lock:
+            self._active_stats[key] = stats
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._active_stats.pop(key, None)
+
+    @contextmanager
+    def _reserved_path(self, url: str) -> Iterator[Optional[PathReservation]]:
+        """Reserva o caminho de saída da URL durante o download."""
+        if self.path_allocator is None:
+            yield None
+            return
+        reservation = self.path_allocator.reserve(self._cache_key(url))
+        try:
+            yield reservation
+        finally:
+            self.path_allocator.release(reservation)
+
+    def _count_bytes(self, status: Dict[str, Any]) -> None:
+        """
+        Contabiliza no limite de banda (e nas métricas) os bytes recebidos
+        desde o último evento. O hook roda na thread que lê o socket, então
+        a espera do BandwidthGovernor segura a leitura do download.
+        """
+        key = status.get("tmpfilename") or status.get("filename")
+        if not key:
+            return
+        downloaded = int(status.get("downloaded_bytes") or 0)
+        with self._lock:
+            if status.get("status") != "downloading":
+                self._bytes_seen.pop(key, None)
+                return
+            # Na primeira notificação de um download retomado, os bytes
+            # já existentes no .part não contam
+            previous = self._bytes_seen.get(key, downloaded)
+            self._bytes_seen[key] = downloaded
+        if self.bandwidth is not None:
+            self.bandwidth.consume(downloaded - previous)
+        if self.metrics is not None and downloaded > previous:
+            self.metrics.inc("ytdl_downloaded_bytes_total", downloaded - previous)
+
+    def _save_progress(self, status: Dict[str, Any]) -> None:
+        """Grava o estado do download parcial, no máximo uma vez por intervalo."""
+        info = status.get("info_dict") or {}
+        url = info.get("original_url") or info.get("webpage_url")
+        temp_path = status.get("tmpfilename") or status.get("filename")
+        if self.partial_repo is None or not url or not temp_path:
+            return
+
+        key = self._cache_key(url)
+        now = time.monotonic()
+        with self._lock:
+            if now - self._progress_saved_at.get(key, 0.0) < self.progress_interval:
+                return
+            self._progress_saved_at[key] = now
+
+        self.partial_repo.save_progress(
+            PartialDownload(
+                url=url,
+                temp_path=temp_path,
+                bytes_done=int(status.get("downloaded_bytes") or 0),
+                total_bytes=status.get("total_bytes")
+                or status.get("total_bytes_estimate"),
+                format_id=self._format_id(info),
+                updated_at=datetime.now(),
+            )
+        )
+
+    @staticmethod
+    def _format_id(info: Dict[str, Any]) -> Optional[str]:
+        """
+        Seletor que reproduz o formato em andamento. Em downloads mesclados
+        (bestvideo+bestaudio) o info_dict traz o format_id do stream atual;
+        o seletor completo vem de requested_formats.
+        """
+        requested = info.get("requested_formats")
+        if requested:
+            return "+".join(str(f["format_id"]) for f in requested)
+        return info.get("format_id")
+
+    def _resume_state(self, url: str) -> Optional[PartialDownload]:
+        """Retorna o progresso salvo da URL, se o arquivo .part ainda existir."""
+        if self.partial_repo is None:
+            return None
+        partial = self.partial_repo.find(url)
+        if partial is None:
+            return None
+        if not os.path.exists(partial.temp_path):
+            self.partial_repo.delete(url)
+            return None
+        logger.info(
+            "Retomando download de %s a partir de %s bytes", url, partial.bytes_done
+        )
+        return partial
+
+    def _clear_progress(self, url: str) -> None:
+        """Remove o progresso de um download concluído."""
+        if self.partial_repo is None:
+            return
+        self.partial_repo.delete(url)
+
+    @staticmethod
+    @contextmanager
+    def _override_params(ydl: "yt_dlp.YoutubeDL", **params: Any) -> Iterator[None]:
+        """
+        Altera temporariamente parâmetros de uma instância YoutubeDL.
+
+        O YoutubeDL compila o parâmetro format no construtor
+        (format_selector), então alterá-lo depois exige compilar o seletor
+        de novo.
+        """
+        params = {key: value for key, value in params.items() if value is not None}
+        if not params:
+            yield
+            return
+        previous = {key: ydl.params.get(key) for key in params}
+        previous_selector = ydl.format_selector
+        ydl.params.update(params)
+        if "format" in params:
+            ydl.format_selector = ydl.build_format_selector(params["format"])
         try:
-            logger.info(f"Iniciando download de: {url}")
+            yield
+        finally:
+            ydl.params.update(previous)
+            ydl.format_selector = previous_selector
+
+    def _session(self) -> "yt_dlp.YoutubeDL":
+        """Retorna a instância YoutubeDL da thread atual, criando-a se preciso."""
+        ydl = getattr(self._local, "ydl", None)
+        if ydl is None:
+            ydl = _yt_dlp().YoutubeDL(self._build_options())
+            self._local.ydl = ydl
+            with self._lock:
+                self._sessions.append(ydl)
+            logger.debug("Nova sessão yt-dlp criada")
+        return ydl
+
+    @contextmanager
+    def _youtube_dl(self) -> Iterator["yt_dlp.YoutubeDL"]:
+        """Fornece uma instância YoutubeDL (reutilizada ou descartável)."""
+        if self.reuse_session:
+            yield self._session()
+        else:
+            with _yt_dlp().YoutubeDL(self._build_options()) as ydl:
+                yield ydl
+
+    @staticmethod
+    def _cache_key(url: str) -> str:
+        """Chave do cache de metadados (chave canônica quando houver)."""
+        return canonical_video_key(url) or url
 
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=True)
+    def probe(self, url: str) -> Dict[str, Any]:
+        """
+        Obtém os metadados de um vídeo sem baixá-lo (download=False).
+
+        Args:
+            url: URL do vídeo
 
+        Returns:
+            Dict[str, Any]: info dict do yt-dlp, serializável em JSON
+
+        Raises:
+            DownloadFailedException: Se a extração falhar
+        """
+        yt_dlp = _yt_dlp()
+        key = self._cache_key(url)
+        if self.probe_cache is not None:
+            cached = self.probe_cache.get(key)
+            if cached is not None:
+                logger.debug("Metadados em cache para: %s", url)
+                return cached
+
+        if self.request_limiter is not None:
+            self.request_limiter.acquire(url)
+        try:
+            with self._youtube_dl() as ydl:
+                info = ydl.extract_info(url, download=False)
                 if not info:
                     raise DownloadFailedException(
                         url, "Não foi possível extrair informações do vídeo"
                     )
+                info = ydl.sanitize_info(info)
+        except DownloadFailedException:
+            raise
+        except yt_dlp.utils.DownloadError as e:
+            logger.error("Erro ao extrair metadados: %s", e)
+            raise DownloadFailedException(url, str(e))
+        except Exception as e:
+            logger.error("Erro inesperado ao extrair metadados: %s", e)
+            raise DownloadFailedException(url, f"Erro inesperado: {e}")
 
-                title = info.get("title")
-                if not title:
-                    title = "video_sem_titulo"
+        if self.probe_cache is not None:
+            self.probe_cache.put(key, info)
+        return info
 
-                filename = ydl.prepare_filename(info)
+    def iter_playlist(self, url: str) -> Iterator[PlaylistEntry]:
+        """
+        Enumera os vídeos de uma playlist ou canal sem extraí-los.
+
+        Usa extract_flat com process=False: as entradas vêm do gerador do
+        extrator, então cada página só é buscada quando as entradas da
+        anterior forem consumidas.
+
+        Args:
+            url: URL da playlist ou canal
+
+        Yields:
+            PlaylistEntry: Um vídeo da coleção
+
+        Raises:
+            DownloadFailedException: Se a enumeração falhar
+        """
+        yt_dlp = _yt_dlp()
+        if self.request_limiter is not None:
+            self.request_limiter.acquire(url)
+
+        options = {
+            **self._build_options(),
+            "extract_flat": "in_playlist",
+            "lazy_playlist": True,
+        }
+        try:
+            # Instância dedicada: a sessão da thread continua livre para
+            # downloads enquanto o gerador estiver suspenso
+            with yt_dlp.YoutubeDL(options) as ydl:
+                result = ydl.extract_info(url, download=False, process=False)
+                if not result:
+                    raise DownloadFailedException(
+                        url, "Não foi possível listar os vídeos da coleção"
+                    )
+                yield from self._flat_entries(ydl, result, depth=0)
+        except DownloadFailedException:
+            raise
+        except yt_dlp.utils.DownloadError as e:
+            logger.error("Erro ao listar coleção: %s", e)
+            raise DownloadFailedException(url, str(e))
+        except Exception as e:
+            logger.error("Erro inesperado ao listar coleção: %s", e)
+            raise DownloadFailedException(url, f"Erro inesperado: {e}")
+
+    def _flat_entries(
+        self, ydl: "yt_dlp.YoutubeDL", result: Dict[str, Any], depth: int
+    ) -> Iterator[PlaylistEntry]:
+        """Percorre as entradas de uma coleção, descendo em sub-coleções."""
+        if result.get("_type") in ("url", "url_transparent") and result.get("url"):
+            # Redirecionamento (ex: canal -> aba de vídeos)
+            if depth >= _MAX_PLAYLIST_DEPTH:
+                return
+            result = ydl.extract_info(result["url"], download=False, process=False)
+            depth += 1
+
+        for entry in result.get("entries") or ():
+            if not entry:
+                continue
+            entry_url = entry.get("webpage_url") or entry.get("url")
+            nested = entry.get("_type") == "playlist" or (
+                entry_url is not None and is_collection_url(entry_url)
+            )
+            if nested:
+                if depth + 1 < _MAX_PLAYLIST_DEPTH:
+                    yield from self._flat_entries(ydl, entry, depth + 1)
+                continue
+            if not entry_url:
+                continue
+            yield PlaylistEntry(
+                url=entry_url,
+                video_id=entry.get("id"),
+                title=entry.get("title"),
+                upload_date=entry.get("upload_date"),
+            )
+
+    def _extract_and_download(self, ydl: "yt_dlp.YoutubeDL", url: str) -> Any:
+        """
+        Baixa o vídeo, reaproveitando os metadados em cache quando houver.
+        Se os metadados em cache estiverem obsoletos (ex: URL de formato
+        expirada), descarta-os e faz a extração completa.
+        """
+        if self.probe_cache is not None:
+            key = self._cache_key(url)
+            cached = self.probe_cache.get(key)
+            if cached is not None:
+                try:
+                    logger.debug("Reutilizando metadados em cache para: %s", url)
+                    return ydl.process_ie_result(cached, download=True)
+                except _yt_dlp().utils.DownloadError as e:
+                    logger.warning("Metadados em cache obsoletos (%s); extraindo", e)
+                    self.probe_cache.invalidate(key)
+        return ydl.extract_info(url, download=True)
+
+    def close(self) -> None:
+        """Fecha todas as sessões yt-dlp mantidas pelo serviço."""
+        with self._lock:
+            sessions, self._sessions = self._sessions, []
+        for ydl in sessions:
+            try:
+                ydl.close()
+            except Exception as e:
+                logger.warning("Erro ao fechar sessão yt-dlp: %s", e)
+        self._local = threading.local()
+        if sessions:
+            logger.debug("%s sessão(ões) yt-dlp fechada(s)", len(sessions))
+
+    def _run_download(
+        self,
+        ydl: "yt_dlp.YoutubeDL",
+        url: str,
+        stats: Optional[DownloadStats],
+        reservation: Optional[PathReservation],
+    ) -> Tuple[str, str]:
+        """Baixa o vídeo com a sessão já configurada e finaliza o arquivo."""
+        started = time.perf_counter()
+        measured = stats.transfer_s + stats.postprocess_s if stats else 0.0
+        try:
+            info = self._extract_and_download(ydl, url)
+        finally:
+            if stats is not None:
+                elapsed = time.perf_counter() - started
+                measured = stats.transfer_s + stats.postprocess_s - measured
+                stats.add("extraction", max(elapsed - measured, 0.0))
+
+        if not info:
+            raise DownloadFailedException(
+                url, "Não foi possível extrair informações do vídeo"
+            )
+
+        title = info.get("title")
+        if not title:
+            title = "video_sem_titulo"
+
+        filename = ydl.prepare_filename(info)
+        if reservation is not None and self.path_allocator is not None:
+            filename = self.path_allocator.finalize(filename)
+
+        self._clear_progress(url)
+        logger.info("Download concluído: %s", title)
+        return title, filename
+
+    def download(
+        self,
+        url: str,
+        stats: Optional[DownloadStats] = None,
+        profile: Optional[FormatProfile] = None,
+    ) -> Tuple[str, str]:
+        """
+        Faz o download de um vídeo usando yt-dlp.
+
+        Args:
+            url: URL do vídeo
+            stats: Métricas opcionais a preencher. O tempo de extração é o
+                tempo total do yt-dlp menos transferência e pós-processamento.
+            profile: Perfil de formato (FORMAT_SELECTORS). Um download
+                retomado mantém o formato já em andamento.
+
+        Returns:
+            Tuple[str, str]: (título, caminho do arquivo)
+
+        Raises:
+            DownloadFailedException: Se o download falhar
+        """
+        yt_dlp = _yt_dlp()
+        try:
+            logger.info("Iniciando download de: %s", url)
 
-                logger.info(f"Download concluído: {title}")
-                return title, filename
+            if self.request_limiter is not None:
+                self.request_limiter.acquire(url)
+            resume = self._resume_state(url)
+            format_selector = FORMAT_SELECTORS.get(profile) if profile else None
+            if resume is not None and resume.format_id:
+                format_selector = resume.format_id
+            with self._reserved_path(url) as reservation, self._youtube_dl() as ydl:
+                outtmpl = {"default": reservation.template} if reservation else None
+                with self._override_params(
+                    ydl, format=format_selector, outtmpl=outtmpl
+                ), self._tracking(url, stats), self._active():
+                    return self._run_download(ydl, url, stats, reservation)
 
         except yt_dlp.utils.DownloadError as e:
-            logger.error(f"Erro no download: {e}")
+            logger.error("Erro no download: %s", e)
             raise DownloadFailedException(url, str(e))
         except Exception as e:
-            logger.error(f"Erro inesperado no download: {e}")
+            logger.error("Erro inesperado no download: %s", e)
             raise DownloadFailedException(url, f"Erro inesperado: {e}")
+        finally:
+            # Também em falhas: workers longos (--serve, --sync) não acumulam
+            # uma entrada por download abandonado
+            with self._lock:
+                self._progress_saved_at.pop(self._cache_key(url), None)
@@ -1,7 +1,13 @@
+import argparse
+import json
 import logging
 import os
 import platform
+import sys
+from datetime import timedelta
+from typing import Iterable, Iterator, List, Optional, TextIO
 
+from src.domain.entities import FormatProfile, Video
 from src.domain.exceptions import (
     DownloadFailedException,
     InvalidURLException,
@@ -48,17 +54,17 @@ def run_cli(download_usecase):
         print("=" * 60)
 
     except InvalidURLException as e:
-        logger.error(f"URL inválida: {e}")
+        logger.error("URL inválida: %s", e)
         print(f"\n❌ Erro: {e}")
         print("Por favor, forneça uma URL válida (ex: https://youtube.com/watch?v=...)")
 
     except DownloadFailedException as e:
-        logger.error(f"Falha no download: {e}")
+        logger.error("Falha no download: %s", e)
         print(f"\n❌ Erro ao baixar vídeo: {e.reason}")
         print("Verifique se a URL está correta e se você tem conexão com a internet.")
 
     except VideoNotSavedException as e:
-        logger.error(f"Erro ao salvar: {e}")
+        logger.error("Erro ao salvar: %s", e)
         print(f"\n❌ Erro ao salvar vídeo no banco de dados: {e}")
         print("O vídeo foi baixado mas não foi registrado no histórico.")
 
@@ -72,3 +78,379 @@ def run_cli(download_usecase):
         print("Por favor, tente novamente ou reporte o problema.")
 
     print()
+
+
+_RATE_SUFFIXES = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3}
+
+
+def parse_rate(value: str) -> float:
+    """
+    Converte uma taxa em bytes/s, aceitando os sufixos K, M e G
+    (ex: "500K", "2.5M").
+    """
+    text = value.strip().upper()
+    suffix = text[-1:] if text[-1:] in _RATE_SUFFIXES else ""
+    number = text[: len(text) - len(suffix)]
+    try:
+        rate = float(number) * _RATE_SUFFIXES[suffix]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"taxa inválida: {value}")
+    if rate <= 0:
+        raise argparse.ArgumentTypeError("a taxa deve ser maior que zero")
+    return rate
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Cria o parser dos argumentos de linha de comando."""
+    parser = argparse.ArgumentParser(
+        description="Download de vídeos do YouTube.",
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="ARQUIVO",
+        help="baixa as URLs do arquivo (uma por linha); use - para stdin",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=4,
+        metavar="N",
+        help="quantidade de downloads simultâneos no modo batch (padrão: 4)",
+    )
+    parser.add_argument(
+        "--per-host",
+        type=int,
+        metavar="N",
+        help="limite de downloads simultâneos por host (padrão: o valor de --jobs)",
+    )
+    parser.add_argument(
+        "--history",
+        type=int,
+        nargs="?",
+        const=20,
+        metavar="N",
+        help="lista os N vídeos baixados mais recentemente (padrão: 20)",
+    )
+    parser.add_argument(
+        "--stats",
+        type=float,
+        nargs="?",
+        const=24,
+        metavar="HORAS",
+        help="resume as métricas de download das últimas HORAS horas (padrão: 24)",
+    )
+    parser.add_argument(
+        "--limit-rate",
+        type=parse_rate,
+        metavar="TAXA",
+        help="limite de banda somado de todos os downloads, em bytes/s (ex: 2M)",
+    )
+    parser.add_argument(
+        "--host-rps",
+        type=float,
+        metavar="N",
+        help="máximo de requisições por segundo a um mesmo host",
+    )
+    parser.add_argument(
+        "--retry-failed",
+        action="store_true",
+        help="tenta de novo URLs que falharam recentemente (ignora o cache de falhas)",
+    )
+    parser.add_argument(
+        "--profile",
+        choices=[profile.value for profile in FormatProfile],
+        help=(
+            "formato a baixar: audio (só áudio), 720p (até 720p, arquivo único) "
+            "ou archival (melhor qualidade); padrão: escolha do yt-dlp"
+        ),
+    )
+    parser.add_argument(
+        "--no-dedup",
+        action="store_true",
+        help="não deduplica arquivos idênticos baixados de URLs diferentes",
+    )
+    parser.add_argument(
+        "--postprocess",
+        action="store_true",
+        help=(
+            "remuxa e extrai o áudio com ffmpeg em um pool de processos, "
+            "separado dos downloads"
+        ),
+    )
+    parser.add_argument(
+        "--serve",
+        type=int,
+        nargs="?",
+        const=8765,
+        metavar="PORTA",
+        help=(
+            "modo servidor: API HTTP local para enfileirar URLs e consultar "
+            "jobs e histórico (padrão: porta 8765); --jobs define os workers"
+        ),
+    )
+    parser.add_argument(
+        "--sync",
+        nargs="*",
+        metavar="CANAL",
+        help=(
+            "sincroniza os canais informados (ou todos os já sincronizados), "
+            "baixando apenas os vídeos novos"
+        ),
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        metavar="PORTA",
+        help="expõe métricas no formato Prometheus em http://127.0.0.1:PORTA/metrics",
+    )
+    parser.add_argument(
+        "--log-format",
+        choices=("text", "json"),
+        default="text",
+        help="formato do arquivo de log em logs/ (json: um objeto por linha)",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="nos modos batch, histórico e stats, imprime um objeto JSON por linha",
+    )
+    return parser
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Lê e valida os argumentos de linha de comando."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.jobs < 1:
+        parser.error("--jobs deve ser maior que zero")
+    if args.per_host is None:
+        args.per_host = args.jobs
+    elif args.per_host < 1:
+        parser.error("--per-host deve ser maior que zero")
+    if args.host_rps is not None and args.host_rps <= 0:
+        parser.error("--host-rps deve ser maior que zero")
+    if args.stats is not None and args.stats <= 0:
+        parser.error("--stats deve ser maior que zero")
+    if args.metrics_port is not None and not 0 <= args.metrics_port <= 65535:
+        parser.error("--metrics-port deve estar entre 0 e 65535")
+    if args.serve is not None and not 0 <= args.serve <= 65535:
+        parser.error("--serve deve estar entre 0 e 65535")
+    if args.profile is not None:
+        args.profile = FormatProfile(args.profile)
+    return args
+
+
+def iter_urls(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Lê URLs de forma preguiçosa, ignorando linhas vazias e comentários (#).
+    """
+    for line in lines:
+        url = line.strip()
+        if url and not url.startswith("#"):
+            yield url
+
+
+def _result_to_dict(result) -> dict:
+    """Converte um resultado do lote em dicionário serializável."""
+    data = {"url": result.url, "ok": result.ok}
+    if result.video is not None:
+        data.update(
+            title=result.video.title,
+            file_path=result.video.file_path,
+            downloaded_at=result.video.downloaded_at.isoformat(),
+        )
+    if result.error is not None:
+        data["error"] = getattr(result.error, "reason", None) or str(result.error)
+    return data
+
+
+def run_batch_cli(
+    batch_usecase,
+    lines: Iterable[str],
+    json_output: bool = False,
+    out: TextIO = sys.stdout,
+    expander=None,
+    queue_usecase=None,
+) -> int:
+    """
+    Interface não interativa: baixa todas as URLs recebidas.
+
+    Args:
+        batch_usecase: Caso de uso DownloadVideoBatch
+        lines: Linhas com as URLs (arquivo ou stdin), lidas sob demanda
+        json_output: Se True, imprime um objeto JSON por linha
+        out: Destino da saída
+        expander: Caso de uso ExpandPlaylist opcional; playlists e canais
+            são expandidos nos seus vídeos ainda não baixados
+        queue_usecase: Caso de uso ProcessDownloadQueue opcional; as URLs
+            passam pela fila persistente e um lote interrompido continua
+            de onde parou na próxima execução
+
+    Returns:
+        int: Código de saída (0 se todas as URLs foram baixadas, 1 caso contrário)
+    """
+    succeeded = failed = 0
+
+    def on_expand_error(url: str, error: Exception) -> None:
+        nonlocal failed
+        failed += 1
+        reason = getattr(error, "reason", None) or str(error)
+        if json_output:
+            data = {"url": url, "ok": False, "error": reason}
+            out.write(json.dumps(data, ensure_ascii=False) + "\n")
+        else:
+            out.write(f"❌ {url}: {reason}\n")
+        out.flush()
+
+    urls = iter_urls(lines)
+    if expander is not None:
+        urls = expander.expand(urls, on_error=on_expand_error)
+
+    if queue_usecase is not None:
+        results = queue_usecase.run_batch(batch_usecase, urls)
+    else:
+        results = batch_usecase.run(urls)
+
+    for result in results:
+        if result.ok:
+            succeeded += 1
+        else:
+            failed += 1
+            logger.error("Falha no lote para %s: %s", result.url, result.error)
+
+        if json_output:
+            out.write(json.dumps(_result_to_dict(result), ensure_ascii=False) + "\n")
+        elif result.ok:
+            out.write(f"✅ {result.url} -> {result.video.file_path}\n")
+        else:
+            out.write(f"❌ {result.url}: {_result_to_dict(result)['error']}\n")
+        out.flush()
+
+    logger.info("Lote finalizado: %s sucesso(s), %s falha(s)", succeeded, failed)
+    if not json_output:
+        print(
+            f"\nConcluído: {succeeded} sucesso(s), {failed} falha(s)", file=sys.stderr
+        )
+    return 0 if failed == 0 else 1
+
+
+def run_sync_cli(
+    sync_usecase,
+    queue_usecase,
+    channel_urls: Iterable[str],
+    json_output: bool = False,
+    out: TextIO = sys.stdout,
+) -> int:
+    """
+    Interface não interativa: sincroniza canais e baixa os vídeos novos.
+
+    Args:
+        sync_usecase: Caso de uso SyncChannel
+        queue_usecase: Caso de uso ProcessDownloadQueue
+        channel_urls: URLs dos canais
+        json_output: Se True, imprime um objeto JSON por canal
+        out: Destino da saída
+
+    Returns:
+        int: Código de saída (0 se todos os canais foram sincronizados)
+    """
+    failed = 0
+    for url in channel_urls:
+        try:
+            result = sync_usecase.execute(url, queue_usecase)
+        except (InvalidURLException, DownloadFailedException) as e:
+            failed += 1
+            logger.error("Falha ao sincronizar %s: %s", url, e)
+            reason = getattr(e, "reason", None) or str(e)
+            data = {"url": url, "ok": False, "error": reason}
+            text = f"❌ {url}: {reason}"
+        else:
+            data = {"url": url, "ok": True, "new": len(result.new_urls)}
+            text = f"🔄 {url}: {len(result.new_urls)} vídeo(s) novo(s)"
+        out.write((json.dumps(data, ensure_ascii=False) if json_output else text) + "\n")
+        out.flush()
+
+    # Baixa os vídeos enfileirados (inclusive os de execuções interrompidas)
+    queue_usecase.recover()
+    processed = queue_usecase.run()
+    if not json_output:
+        print(f"\n{processed} download(s) processado(s)", file=sys.stderr)
+    return 0 if failed == 0 else 1
+
+
+def video_to_dict(video: Video) -> dict:
+    """Representação JSON de um vídeo (histórico e API HTTP)."""
+    return {
+        "url": video.url,
+        "title": video.title,
+        "file_path": video.file_path,
+        "downloaded_at": video.downloaded_at.isoformat(),
+        "content_hash": video.content_hash,
+        "format_profile": (
+            video.format_profile.value if video.format_profile else None
+        ),
+        "postprocess_status": (
+            video.postprocess_status.value if video.postprocess_status else None
+        ),
+    }
+
+
+def run_history_cli(
+    video_repo, limit: int = 20, json_output: bool = False, out: TextIO = sys.stdout
+) -> None:
+    """
+    Lista o histórico de downloads, do mais recente para o mais antigo.
+    Os vídeos são lidos sob demanda, sem carregar o histórico inteiro.
+    """
+    for video in video_repo.iter_videos(limit=limit):
+        if json_output:
+            data = video_to_dict(video)
+            out.write(json.dumps(data, ensure_ascii=False) + "\n")
+        else:
+            out.write(
+                f"{video.downloaded_at.strftime('%d/%m/%Y %H:%M:%S')}  "
+                f"{video.title}  ({video.file_path})\n"
+            )
+
+
+def _format_bytes(value: float) -> str:
+    """Formata uma quantidade de bytes com o maior sufixo adequado."""
+    for unit in ("B", "KB", "MB"):
+        if abs(value) < 1024:
+            return f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GB"
+
+
+def run_stats_cli(
+    summary_usecase,
+    hours: float = 24,
+    json_output: bool = False,
+    out: TextIO = sys.stdout,
+) -> None:
+    """Imprime o resumo das métricas de download das últimas horas."""
+    summary = summary_usecase.execute(timedelta(hours=hours))
+    if json_output:
+        out.write(json.dumps(summary.to_dict(), ensure_ascii=False) + "\n")
+        return
+
+    out.write(
+        f"Downloads de {summary.since.strftime('%d/%m/%Y %H:%M')} "
+        f"a {summary.until.strftime('%d/%m/%Y %H:%M')}: {summary.count}\n"
+    )
+    for outcome, count in sorted(summary.outcomes.items()):
+        out.write(f"  {outcome}: {count}\n")
+    if not summary.latencies:
+        return
+
+    out.write("\nLatência (s)        p50      p95      p99\n")
+    for phase, values in summary.latencies.items():
+        out.write(
+            f"  {phase:<15}{values['p50']:>8.2f} {values['p95']:>8.2f} "
+            f"{values['p99']:>8.2f}\n"
+        )
+    out.write(
+        f"\nBytes recebidos: {_format_bytes(summary.bytes_downloaded)}\n"
+        f"Velocidade média: {_format_bytes(summary.avg_speed)}/s\n"
+        f"Vazão: {summary.downloads_per_hour:.1f} download(s)/hora\n"
+    )
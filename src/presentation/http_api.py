@@ -0,0 +1,271 @@
+"""
+API HTTP/JSON local do modo servidor (--serve).
+
+Mantém em memória um ProcessDownloadQueue (com o DownloadVideo, o
+YTDLPService e o repositório já inicializados) e atende, apenas com a
+biblioteca padrão:
+
+    POST /jobs        {"url": "..."} -> 202 com o job criado
+    GET  /jobs/<id>   estado do job (e o vídeo, depois de baixado)
+    GET  /videos      histórico, do mais recente (?limit=N, padrão 20)
+
+POST /jobs só valida e grava o job na fila; o download é feito pelos
+workers em segundo plano.
+"""
+
+import json
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from src.domain.entities import Job
+from src.domain.exceptions import InvalidURLException, JobQueueException
+from src.domain.repositories import VideoRepository
+from src.presentation.cli import video_to_dict
+from src.usecases.process_download_queue import ProcessDownloadQueue
+
+logger = logging.getLogger(__name__)
+
+# Tamanho máximo do corpo de POST /jobs
+MAX_BODY_BYTES = 64 * 1024
+# Limite de ?limit= em GET /videos
+MAX_HISTORY_LIMIT = 1000
+
+
+class ApiError(Exception):
+    """Erro de requisição, devolvido ao cliente como {"error": ...}."""
+
+    def __init__(self, status: int, message: str):
+        self.status = status
+        super().__init__(message)
+
+
+def job_to_dict(job: Job) -> dict:
+    """Representação JSON de um job."""
+    return {
+        "id": job.id,
+        "url": job.url,
+        "status": job.status.value,
+        "attempts": job.attempts,
+        "created_at": job.created_at.isoformat(),
+        "updated_at": job.updated_at.isoformat(),
+        "available_at": job.available_at.isoformat() if job.available_at else None,
+        "last_error": job.last_error,
+    }
+
+
+class _ApiHandler(BaseHTTPRequestHandler):
+    # Keep-alive: clientes que enviam vários jobs reaproveitam a conexão
+    protocol_version = "HTTP/1.1"
+    # Cabeçalhos e corpo saem em escritas separadas; com Nagle, a segunda
+    # espera o ACK atrasado do cliente (~40 ms por resposta)
+    disable_nagle_algorithm = True
+    api: "DownloadApiServer"
+
+    def do_POST(self) -> None:
+        self._dispatch(self._post_routes)
+
+    def do_GET(self) -> None:
+        self._dispatch(self._get_routes)
+
+    def _dispatch(self, routes) -> None:
+        parts = urlsplit(self.path)
+        try:
+            status, data = routes(parts.path.rstrip("/"), parse_qs(parts.query))
+        except ApiError as e:
+            status, data = e.status, {"error": str(e)}
+        except JobQueueException as e:
+            logger.error("Erro na fila de jobs: %s", e)
+            status, data = 503, {"error": str(e)}
+        except Exception:
+            logger.exception("Erro ao atender %s %s", self.command, self.path)
+            status, data = 500, {"error": "erro interno"}
+        if status >= 400:
+            # O corpo pode não ter sido lido; não reaproveita a conexão
+            self.close_connection = True
+        self._send_json(status, data)
+
+    def _post_routes(self, path: str, query: dict) -> Tuple[int, Any]:
+        if path != "/jobs":
+            raise ApiError(404, "rota não encontrada")
+        url = self._read_json().get("url")
+        if not isinstance(url, str):
+            raise ApiError(400, 'campo "url" obrigatório')
+        try:
+            job = self.api.queue.submit(url)
+        except InvalidURLException as e:
+            raise ApiError(400, str(e))
+        return 202, job_to_dict(job)
+
+    def _get_routes(self, path: str, query: dict) -> Tuple[int, Any]:
+        if path == "/videos":
+            return 200, self.api.history(self._limit(query))
+        prefix, _, job_id = path.rpartition("/")
+        if prefix == "/jobs" and job_id.isdigit():
+            data = self.api.job_status(int(job_id))
+            if data is None:
+                raise ApiError(404, f"job {job_id} não encontrado")
+            return 200, data
+        raise ApiError(404, "rota não encontrada")
+
+    def _read_json(self) -> dict:
+        """Lê o corpo da requisição como um objeto JSON."""
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            raise ApiError(400, "Content-Length inválido")
+        if length > MAX_BODY_BYTES:
+            raise ApiError(413, "corpo da requisição muito grande")
+        try:
+            data = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            raise ApiError(400, "JSON inválido")
+        if not isinstance(data, dict):
+            raise ApiError(400, "o corpo deve ser um objeto JSON")
+        return data
+
+    @staticmethod
+    def _limit(query: dict) -> int:
+        """Lê ?limit= de GET /videos."""
+        value = query.get("limit", ["20"])[-1]
+        if not value.isdigit() or not 1 <= int(value) <= MAX_HISTORY_LIMIT:
+            raise ApiError(400, f"limit deve estar entre 1 e {MAX_HISTORY_LIMIT}")
+        return int(value)
+
+    def _send_json(self, status: int, data: Any) -> None:
+        body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def finish(self) -> None:
+        try:
+            super().finish()
+        finally:
+            # Fim da conexão (e da thread que a atendeu): fecha o que as
+            # rotas abriram nela, como a conexão SQLite do pool
+            if self.api.release is not None:
+                self.api.release()
+
+    def log_message(self, format: str, *args) -> None:
+        logger.debug("api: %s", format % args)
+
+
+class DownloadApiServer:
+    """
+    Servidor HTTP (stdlib) do modo servidor, com um pool de workers que
+    processam a fila de downloads em segundo plano.
+
+    start() sobe os workers e o servidor em threads daemon; serve_forever()
+    atende na thread atual até Ctrl+C. close() para de aceitar requisições,
+    acorda os workers e espera até shutdown_timeout segundos pelos downloads
+    em andamento; os que não terminarem voltam à fila na próxima execução
+    (ProcessDownloadQueue.recover).
+
+    Cada conexão HTTP é atendida em uma thread nova; release, se informado,
+    é chamado nessa thread ao fim da conexão (ex: SQLiteConnectionPool.release).
+    """
+
+    def __init__(
+        self,
+        queue: ProcessDownloadQueue,
+        video_repo: VideoRepository,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        workers: int = 4,
+        shutdown_timeout: float = 5.0,
+        release: Optional[Callable[[], None]] = None,
+    ):
+        if workers < 1:
+            raise ValueError("workers deve ser maior que zero")
+        self.queue = queue
+        self.repo = video_repo
+        self.workers = workers
+        self.shutdown_timeout = shutdown_timeout
+        self.release = release
+
+        handler = type("ApiHandler", (_ApiHandler,), {"api": self})
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._serving: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        """Endereço (host, porta) em que o servidor escuta."""
+        host, port = self._server.server_address[:2]
+        return str(host), port
+
+    def job_status(self, job_id: int) -> Optional[dict]:
+        """Estado de um job e, depois de baixado, o vídeo correspondente."""
+        job = self.queue.jobs.get(job_id)
+        if job is None:
+            return None
+        data = job_to_dict(job)
+        video = self.repo.find_by_url(job.url)
+        data["video"] = video_to_dict(video) if video is not None else None
+        return data
+
+    def history(self, limit: int) -> List[dict]:
+        """Os vídeos baixados mais recentemente."""
+        return [video_to_dict(video) for video in self.repo.iter_videos(limit=limit)]
+
+    def _start_workers(self) -> None:
+        if self._threads:
+            return
+        self.queue.recover()
+        for index in range(self.workers):
+            thread = threading.Thread(
+                target=self.queue.serve,
+                args=(self._stop,),
+                name=f"download-worker-{index}",
+                daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def start(self) -> "DownloadApiServer":
+        """Sobe os workers e atende requisições em segundo plano."""
+        self._start_workers()
+        self._serving = threading.Thread(
+            target=self._server.serve_forever, name="api-server", daemon=True
+        )
+        self._serving.start()
+        host, port = self.address
+        logger.info("API disponível em http://%s:%s", host, port)
+        return self
+
+    def serve_forever(self) -> None:
+        """Sobe os workers e atende requisições na thread atual."""
+        self._start_workers()
+        host, port = self.address
+        logger.info("API disponível em http://%s:%s", host, port)
+        self._server.serve_forever()
+
+    def close(self) -> None:
+        """Encerra o servidor e os workers."""
+        if self._serving is not None and self._serving.is_alive():
+            self._server.shutdown()
+        self._server.server_close()
+        self._stop.set()
+        self.queue.wake()
+        deadline = time.monotonic() + self.shutdown_timeout
+        for thread in self._threads:
+            thread.join(max(0.0, deadline - time.monotonic()))
+            if thread.is_alive():
+                logger.warning(
+                    "%s ainda baixando; o job volta à fila na próxima execução",
+                    thread.name,
+                )
+
+    def __enter__(self) -> "DownloadApiServer":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
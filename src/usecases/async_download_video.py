@@ -0,0 +1,128 @@
+import asyncio
+import logging
+from datetime import datetime
+from typing import AsyncIterator, Iterable, Optional, Set
+
+from src.domain.entities import Video
+from src.domain.exceptions import DomainException, DownloadFailedException
+from src.domain.repositories import VideoRepository
+from src.domain.services import AsyncVideoDownloaderService
+from src.usecases.download_video import validate_video_url
+from src.usecases.download_video_batch import BatchItemResult
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncDownloadVideo:
+    """
+    Versão assíncrona (asyncio) do caso de uso DownloadVideo.
+
+    Suporta tempo limite por download, cancelamento (cancelar a task
+    cancela o download pendente) e processamento de várias URLs com
+    resultados devolvidos à medida que terminam (estilo as_completed).
+
+    As consultas e gravações no repositório rodam fora do event loop, com
+    o run_blocking do downloader.
+    """
+
+    def __init__(
+        self,
+        downloader_service: AsyncVideoDownloaderService,
+        video_repo: VideoRepository,
+        max_concurrency: int = 4,
+    ):
+        self.downloader = downloader_service
+        self.repo = video_repo
+        self.max_concurrency = max_concurrency
+
+    async def execute(self, url: str, timeout: Optional[float] = None) -> Video:
+        """
+        Executa o download de um vídeo.
+
+        Args:
+            url: URL do vídeo a ser baixado
+            timeout: Tempo limite do download em segundos (opcional)
+
+        Returns:
+            Video: Entidade Video com informações do download
+
+        Raises:
+            InvalidURLException: Se a URL for inválida ou de playlist/canal
+            DownloadFailedException: Se o download falhar ou exceder o tempo
+        """
+        logger.info("Iniciando processo de download assíncrono para URL: %s", url)
+        validate_video_url(url)
+
+        # O repositório é síncrono (SQLite): as chamadas rodam fora do loop
+        existing_video = await self.downloader.run_blocking(self.repo.find_by_url, url)
+        if existing_video:
+            logger.info(
+                "Vídeo já foi baixado anteriormente: %s", existing_video.title
+            )
+            return existing_video
+
+        try:
+            title, path = await asyncio.wait_for(
+                self.downloader.download(url), timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            logger.error("Tempo limite excedido no download de: %s", url)
+            raise DownloadFailedException(url, f"Tempo limite de {timeout}s excedido")
+
+        video = Video(
+            url=url, title=title, file_path=path, downloaded_at=datetime.now()
+        )
+        await self.downloader.run_blocking(self.repo.save, video)
+        logger.info("Vídeo salvo no repositório: %s", title)
+        return video
+
+    async def _execute_item(
+        self, index: int, url: str, timeout: Optional[float]
+    ) -> BatchItemResult:
+        """Executa uma URL e converte erros de domínio em resultado."""
+        try:
+            video = await self.execute(url, timeout=timeout)
+        except DomainException as e:
+            return BatchItemResult(index=index, url=url, error=e)
+        return BatchItemResult(index=index, url=url, video=video)
+
+    async def stream(
+        self, urls: Iterable[str], timeout: Optional[float] = None
+    ) -> AsyncIterator[BatchItemResult]:
+        """
+        Processa várias URLs, devolvendo cada resultado assim que fica pronto.
+
+        No máximo ``max_concurrency`` downloads ficam ativos ao mesmo tempo e
+        as URLs são lidas sob demanda. Se o consumidor parar de iterar, os
+        downloads pendentes são cancelados.
+
+        Args:
+            urls: URLs a serem baixadas
+            timeout: Tempo limite de cada download em segundos (opcional)
+
+        Yields:
+            BatchItemResult: Resultados na ordem em que terminam
+        """
+        source = enumerate(urls)
+        pending: Set[asyncio.Task] = set()
+        try:
+            while True:
+                for index, url in source:
+                    pending.add(
+                        asyncio.create_task(self._execute_item(index, url, timeout))
+                    )
+                    if len(pending) >= self.max_concurrency:
+                        break
+                if not pending:
+                    return
+
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
@@ -1,56 +1,257 @@
 import logging
-from datetime import datetime
+from contextlib import nullcontext
+from datetime import datetime, timedelta
+from typing import Any, ContextManager, Dict, Optional, Tuple
 from urllib.parse import urlparse
 
-from src.domain.entities import Video
-from src.domain.exceptions import InvalidURLException
-from src.domain.repositories import VideoRepository
-from src.domain.services import VideoDownloaderService
+from src.domain.entities import (
+    DownloadOutcome,
+    DownloadStats,
+    FailedDownload,
+    FormatProfile,
+    PostprocessStatus,
+    Video,
+)
+from src.domain.exceptions import DownloadFailedException, InvalidURLException
+from src.domain.failures import DEFAULT_FAILURE_TTLS, FailureCategory, classify_failure
+from src.domain.repositories import (
+    DownloadMetricsRepository,
+    FailureRepository,
+    VideoRepository,
+)
+from src.domain.services import (
+    ContentStore,
+    MetricsRecorder,
+    VideoDownloaderService,
+)
+from src.domain.video_key import is_collection_url
+from src.usecases.postprocess_videos import PostprocessVideos
 
 logger = logging.getLogger(__name__)
 
 
+def validate_url(url: str) -> None:
+    """
+    Valida se a URL é válida.
+
+    Raises:
+        InvalidURLException: Se a URL for inválida
+    """
+    if not url or not url.strip():
+        raise InvalidURLException(url, "URL não pode ser vazia")
+
+    # Valida se é uma URL válida
+    try:
+        result = urlparse(url)
+        if not all([result.scheme, result.netloc]):
+            raise InvalidURLException(url, "URL mal formatada")
+
+        if result.scheme not in ["http", "https"]:
+            raise InvalidURLException(url, "URL deve começar com http:// ou https://")
+    except Exception as e:
+        raise InvalidURLException(url, f"URL inválida: {str(e)}")
+
+
+def validate_video_url(url: str) -> None:
+    """
+    Valida se a URL é válida e aponta para um único vídeo.
+
+    Raises:
+        InvalidURLException: Se a URL for inválida ou de playlist/canal
+    """
+    validate_url(url)
+    if is_collection_url(url):
+        raise InvalidURLException(
+            url, "URL de playlist ou canal (use o modo --batch para expandi-la)"
+        )
+
+
+def failure_label(error: Exception) -> str:
+    """Motivo de uma falha para as métricas (categoria ou tipo do erro)."""
+    if isinstance(error, DownloadFailedException):
+        return classify_failure(error.reason).value
+    return type(error).__name__
+
+
+def timed(stats: Optional[DownloadStats], phase: str) -> ContextManager:
+    """Mede uma fase em stats, ou não faz nada se as métricas estão desligadas."""
+    return stats.phase(phase) if stats is not None else nullcontext()
+
+
 class DownloadVideo:
     """
     Caso de uso para download de vídeos.
     Orquestra a validação, download e persistência de vídeos.
+
+    Com um FailureRepository, falhas permanentes (vídeo privado, removido,
+    bloqueado na região) são lembradas por um prazo que depende da
+    categoria, e a URL não é baixada de novo até a falha expirar, a menos
+    que retry_failed seja True.
+
+    Com um DownloadMetricsRepository, cada chamada grava o tempo gasto em
+    cada fase (validação, consulta, extração, transferência,
+    pós-processamento e gravação), os bytes recebidos e o resultado.
+    Com um MetricsRecorder, os mesmos resultados alimentam os contadores de
+    downloads e de falhas por motivo e o histograma de duração.
+
+    Com um ContentStore, cada arquivo baixado é guardado pelo hash do
+    conteúdo (cópias idênticas de URLs diferentes viram links para o mesmo
+    blob) e o hash é gravado junto com o vídeo.
+
+    O perfil de formato (áudio, até 720p, arquivamento) pode ser definido
+    para todas as chamadas (profile) ou em cada execute(), e é gravado no
+    vídeo. Vídeos já baixados são devolvidos como estão, qualquer que seja
+    o perfil pedido.
+
+    Com um PostprocessVideos, o vídeo é gravado com o pós-processamento
+    pendente e o arquivo segue para o pool de processos dele; execute()
+    retorna sem esperar o processamento terminar.
     """
 
     def __init__(
-        self, downloader_service: VideoDownloaderService, video_repo: VideoRepository
+        self,
+        downloader_service: VideoDownloaderService,
+        video_repo: VideoRepository,
+        failure_repo: Optional[FailureRepository] = None,
+        retry_failed: bool = False,
+        failure_ttls: Optional[Dict[FailureCategory, timedelta]] = None,
+        metrics_repo: Optional[DownloadMetricsRepository] = None,
+        metrics: Optional[MetricsRecorder] = None,
+        content_store: Optional[ContentStore] = None,
+        profile: Optional[FormatProfile] = None,
+        postprocess: Optional[PostprocessVideos] = None,
     ):
         self.downloader = downloader_service
         self.repo = video_repo
+        self.failure_repo = failure_repo
+        self.retry_failed = retry_failed
+        self.failure_ttls = (
+            DEFAULT_FAILURE_TTLS if failure_ttls is None else failure_ttls
+        )
+        self.metrics_repo = metrics_repo
+        self.metrics = metrics
+        self.content_store = content_store
+        self.profile = profile
+        self.postprocess = postprocess
 
     def _validate_url(self, url: str) -> None:
         """
-        Valida se a URL é válida.
+        Valida se a URL é válida e aponta para um único vídeo.
 
         Raises:
-            InvalidURLException: Se a URL for inválida
+            InvalidURLException: Se a URL for inválida ou de playlist/canal
         """
-        if not url or not url.strip():
-            raise InvalidURLException(url, "URL não pode ser vazia")
+        validate_video_url(url)
 
-        # Valida se é uma URL válida
-        try:
-            result = urlparse(url)
-            if not all([result.scheme, result.netloc]):
-                raise InvalidURLException(url, "URL mal formatada")
+    def _check_known_failure(self, url: str, failure: Optional[FailedDownload]) -> None:
+        """
+        Verifica se a URL falhou recentemente.
+
+        Raises:
+            DownloadFailedException: Se houver uma falha ainda válida em cache
+        """
+        if failure is None or self.retry_failed:
+            return
+        if failure.expires_at <= datetime.now():
+            return
+        logger.info(
+            "Download ignorado, falha conhecida até %s: %s",
+            failure.expires_at.isoformat(timespec="seconds"),
+            url,
+        )
+        raise DownloadFailedException(
+            url, f"Falha conhecida ({failure.category.value}): {failure.reason}"
+        )
+
+    def _record_failure(self, url: str, error: Exception) -> None:
+        """Lembra falhas de download cuja categoria tem prazo configurado."""
+        if self.failure_repo is None or not isinstance(error, DownloadFailedException):
+            return
+        category = classify_failure(error.reason)
+        ttl = self.failure_ttls.get(category)
+        if not ttl:
+            return
+        now = datetime.now()
+        self.failure_repo.record(
+            FailedDownload(
+                url=url,
+                reason=error.reason,
+                category=category,
+                failed_at=now,
+                expires_at=now + ttl,
+            )
+        )
+        logger.info("Falha registrada (%s) para %s", category.value, url)
+
+    def _new_stats(self, url: str) -> Optional[DownloadStats]:
+        """Cria as métricas de um download, se houver onde gravá-las."""
+        if self.metrics_repo is None and self.metrics is None:
+            return None
+        return DownloadStats(url=url, started_at=datetime.now())
+
+    def _publish(
+        self,
+        outcome: DownloadOutcome,
+        error: Optional[Exception] = None,
+        duration: Optional[float] = None,
+    ) -> None:
+        """Atualiza os contadores e o histograma do MetricsRecorder."""
+        if self.metrics is None:
+            return
+        self.metrics.inc("ytdl_downloads_total", outcome=outcome.value)
+        if outcome is DownloadOutcome.DOWNLOADED and duration is not None:
+            self.metrics.observe("ytdl_download_duration_seconds", duration)
+        elif outcome is DownloadOutcome.FAILED and error is not None:
+            self.metrics.inc(
+                "ytdl_download_failures_total", reason=failure_label(error)
+            )
+
+    def _record_stats(
+        self, stats: DownloadStats, error: Optional[Exception] = None
+    ) -> None:
+        """Grava as métricas de um download e atualiza os contadores."""
+        if self.metrics_repo is not None:
+            self.metrics_repo.record(stats)
+        self._publish(stats.outcome, error, stats.total_s)
+
+    def _download(
+        self,
+        url: str,
+        stats: Optional[DownloadStats],
+        profile: Optional[FormatProfile] = None,
+    ) -> Tuple[str, str]:
+        """Chama o downloader, repassando métricas e perfil apenas se definidos."""
+        options: Dict[str, Any] = {}
+        if stats is not None:
+            options["stats"] = stats
+        if profile is not None:
+            options["profile"] = profile
+        return self.downloader.download(url, **options)
 
-            if result.scheme not in ["http", "https"]:
-                raise InvalidURLException(
-                    url, "URL deve começar com http:// ou https://"
+    def _postprocess_status(self) -> Optional[PostprocessStatus]:
+        """Estado inicial do pós-processamento dos vídeos baixados."""
+        return PostprocessStatus.PENDING if self.postprocess is not None else None
+
+    def _store_content(self, path: str) -> Optional[str]:
+        """Deduplica o arquivo baixado pelo conteúdo e retorna o hash."""
+        if self.content_store is None:
+            return None
+        content_hash = self.content_store.store(path)
+        if content_hash is not None:
+            original = self.repo.find_by_content_hash(content_hash)
+            if original is not None:
+                logger.info(
+                    "Mesmo conteúdo já baixado de %s: %s", original.url, path
                 )
-        except Exception as e:
-            raise InvalidURLException(url, f"URL inválida: {str(e)}")
+        return content_hash
 
-    def execute(self, url: str) -> Video:
+    def execute(self, url: str, profile: Optional[FormatProfile] = None) -> Video:
         """
         Executa o download de um vídeo.
 
         Args:
             url: URL do vídeo a ser baixado
+            profile: Perfil de formato (padrão: o perfil do caso de uso)
 
         Returns:
             Video: Entidade Video com informações do download
@@ -59,37 +260,98 @@ class DownloadVideo:
             InvalidURLException: Se a URL for inválida
             DownloadFailedException: Se o download falhar
         """
-        logger.info(f"Iniciando processo de download para URL: {url}")
+        profile = profile or self.profile
+        stats = self._new_stats(url)
+        if stats is None:
+            return self._execute(url, None, profile)
+        error: Optional[Exception] = None
+        try:
+            with stats.phase("total"):
+                return self._execute(url, stats, profile)
+        except Exception as e:
+            error = e
+            if stats.outcome is DownloadOutcome.PENDING:
+                stats.outcome = DownloadOutcome.FAILED
+            stats.error = str(e)
+            raise
+        finally:
+            self._record_stats(stats, error)
+
+    def _execute(
+        self,
+        url: str,
+        stats: Optional[DownloadStats],
+        profile: Optional[FormatProfile] = None,
+    ) -> Video:
+        """Executa o download, medindo cada fase em stats (se informado)."""
+        logger.info("Iniciando processo de download para URL: %s", url)
 
         # Valida URL
-        self._validate_url(url)
+        with timed(stats, "validation"):
+            self._validate_url(url)
         logger.debug("URL validada com sucesso")
 
         # Verifica se já foi baixado
-        existing_video = self.repo.find_by_url(url)
+        with timed(stats, "lookup"):
+            existing_video = self.repo.find_by_url(url)
         if existing_video:
-            logger.info(f"Vídeo já foi baixado anteriormente: {existing_video.title}")
+            logger.info(
+                "Vídeo já foi baixado anteriormente: %s", existing_video.title
+            )
+            if stats is not None:
+                stats.outcome = DownloadOutcome.EXISTING
             return existing_video
 
+        # Verifica se falhou recentemente (cache negativo)
+        with timed(stats, "lookup"):
+            failure = self.failure_repo.find(url) if self.failure_repo else None
+        try:
+            self._check_known_failure(url, failure)
+        except DownloadFailedException:
+            if stats is not None:
+                stats.outcome = DownloadOutcome.SKIPPED
+            raise
+
         # Faz o download
         try:
-            title, path = self.downloader.download(url)
-            logger.info(f"Download concluído: {title}")
+            title, path = self._download(url, stats, profile)
+            logger.info("Download concluído: %s", title)
         except Exception as e:
-            logger.error(f"Erro ao fazer download: {e}")
+            logger.error("Erro ao fazer download: %s", e)
+            self._record_failure(url, e)
             raise
 
+        if failure is not None and self.failure_repo is not None:
+            self.failure_repo.delete(url)
+
+        # Deduplica pelo conteúdo
+        with timed(stats, "postprocess"):
+            content_hash = self._store_content(path)
+
         # Cria entidade
         video = Video(
-            url=url, title=title, file_path=path, downloaded_at=datetime.now()
+            url=url,
+            title=title,
+            file_path=path,
+            downloaded_at=datetime.now(),
+            content_hash=content_hash,
+            format_profile=profile,
+            postprocess_status=self._postprocess_status(),
         )
 
         # Persiste
         try:
-            self.repo.save(video)
-            logger.info(f"Vídeo salvo no repositório: {title}")
+            with timed(stats, "save"):
+                self.repo.save(video)
+            logger.info("Vídeo salvo no repositório: %s", title)
         except Exception as e:
-            logger.error(f"Erro ao salvar vídeo: {e}")
+            logger.error("Erro ao salvar vídeo: %s", e)
             raise
 
+        # Remux e extração de áudio seguem em outro processo
+        if self.postprocess is not None:
+            self.postprocess.submit(video)
+
+        if stats is not None:
+            stats.outcome = DownloadOutcome.DOWNLOADED
         return video
@@ -0,0 +1,432 @@
+import logging
+import time
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import islice
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from src.domain.entities import DownloadOutcome, DownloadStats, FormatProfile, Video
+from src.domain.exceptions import DomainException, DownloadFailedException
+from src.domain.repositories import (
+    DownloadMetricsRepository,
+    FailureRepository,
+    VideoRepository,
+)
+from src.domain.services import (
+    ContentStore,
+    MetricsRecorder,
+    VideoDownloaderService,
+)
+from src.domain.video_key import canonical_video_key
+from src.usecases.download_video import DownloadVideo
+from src.usecases.postprocess_videos import PostprocessVideos
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BatchItemResult:
+    """Resultado do processamento de uma URL dentro de um lote."""
+
+    index: int
+    url: str
+    video: Optional[Video] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        """Indica se a URL foi processada com sucesso."""
+        return self.error is None
+
+
+class DownloadVideoBatch(DownloadVideo):
+    """
+    Caso de uso para download de vídeos em lote.
+
+    Reaproveita a validação do DownloadVideo, mas executa os downloads em
+    um pool de threads (ou processos) com limite de concorrência por host.
+    Consultas e gravações no repositório são feitas em lote. Os resultados
+    são devolvidos na mesma ordem das URLs de entrada, à medida que ficam
+    prontos.
+
+    As métricas por download (metrics_repo e metrics) cobrem transferência,
+    extração e gravação; validação e consultas são feitas por bloco e não
+    entram nelas. Com processos, apenas o tempo total é medido.
+
+    Com um ContentStore, a deduplicação roda na thread que consome os
+    resultados. Com threads, o hash já vem calculado durante o download;
+    com processos, store() precisa ler o arquivo inteiro.
+
+    Com um PostprocessVideos, os vídeos de cada rodada são enviados ao
+    pool de pós-processamento logo depois de gravados.
+    """
+
+    def __init__(
+        self,
+        downloader_service: VideoDownloaderService,
+        video_repo: VideoRepository,
+        max_workers: int = 4,
+        per_host_limit: int = 2,
+        use_processes: bool = False,
+        window: Optional[int] = None,
+        failure_repo: Optional[FailureRepository] = None,
+        retry_failed: bool = False,
+        metrics_repo: Optional[DownloadMetricsRepository] = None,
+        metrics: Optional[MetricsRecorder] = None,
+        content_store: Optional[ContentStore] = None,
+        profile: Optional[FormatProfile] = None,
+        postprocess: Optional[PostprocessVideos] = None,
+    ):
+        super().__init__(
+            downloader_service,
+            video_repo,
+            failure_repo=failure_repo,
+            retry_failed=retry_failed,
+            metrics_repo=metrics_repo,
+            metrics=metrics,
+            content_store=content_store,
+            profile=profile,
+            postprocess=postprocess,
+        )
+        if max_workers < 1:
+            raise ValueError("max_workers deve ser maior que zero")
+        if per_host_limit < 1:
+            raise ValueError("per_host_limit deve ser maior que zero")
+
+        self.max_workers = max_workers
+        self.per_host_limit = per_host_limit
+        self.use_processes = use_processes
+        # Quantidade máxima de URLs lidas e ainda não devolvidas ao chamador;
+        # também é o tamanho dos blocos consultados com find_by_urls
+        self.window = window or max(max_workers * 4, 100)
+
+    def _create_executor(self) -> Executor:
+        """Cria o pool de execução configurado."""
+        if self.use_processes:
+            return ProcessPoolExecutor(max_workers=self.max_workers)
+        return ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="download"
+        )
+
+    @staticmethod
+    def _host_of(url: str) -> str:
+        """Retorna o host da URL (usado para limitar a concorrência)."""
+        return urlparse(url).netloc.lower()
+
+    @staticmethod
+    def _video_key(url: str) -> str:
+        """Chave que identifica o vídeo da URL (a canônica, quando houver)."""
+        return canonical_video_key(url) or url
+
+    @classmethod
+    def _group_duplicates(
+        cls,
+        items: List[Tuple[int, str]],
+        leaders: Dict[str, int],
+    ) -> Tuple[List[Tuple[int, str]], Dict[int, List[Tuple[int, str]]]]:
+        """
+        Agrupa os itens que apontam para o mesmo vídeo (a mesma URL ou
+        variantes dela, pela chave canônica).
+
+        Args:
+            items: Itens que precisam de download
+            leaders: Índice do item que baixa cada vídeo ainda em andamento,
+                pela chave; atualizado com os novos vídeos
+
+        Returns:
+            Tuple com (um item por vídeo, demais itens de cada vídeo pelo
+            índice do item que será baixado)
+        """
+        unique: List[Tuple[int, str]] = []
+        duplicates: Dict[int, List[Tuple[int, str]]] = {}
+        for index, url in items:
+            leader = leaders.setdefault(cls._video_key(url), index)
+            if leader == index:
+                unique.append((index, url))
+            else:
+                duplicates.setdefault(leader, []).append((index, url))
+        return unique, duplicates
+
+    def _prepare_chunk(
+        self, items: List[Tuple[int, str]], leaders: Dict[str, int]
+    ) -> Tuple[
+        List[BatchItemResult],
+        List[Tuple[int, str]],
+        Dict[int, List[Tuple[int, str]]],
+    ]:
+        """
+        Valida um bloco de URLs e verifica quais já foram baixadas (ou
+        falharam recentemente), com uma única consulta a cada repositório.
+        URLs que apontam para o mesmo vídeo de outra URL do bloco, ou de
+        um download ainda em andamento (leaders), são baixadas uma vez.
+
+        Returns:
+            Tuple com (resultados já resolvidos, itens que precisam de
+            download, itens repetidos pelo índice do item baixado)
+        """
+        resolved: List[BatchItemResult] = []
+        valid: List[Tuple[int, str]] = []
+        for index, url in items:
+            try:
+                self._validate_url(url)
+            except DomainException as e:
+                self._publish(DownloadOutcome.FAILED, e)
+                resolved.append(BatchItemResult(index=index, url=url, error=e))
+            else:
+                valid.append((index, url))
+
+        existing = self.repo.find_by_urls(url for _, url in valid) if valid else {}
+        pending: List[Tuple[int, str]] = []
+        for index, url in valid:
+            video = existing.get(url)
+            if video:
+                logger.info("Vídeo já foi baixado anteriormente: %s", video.title)
+                self._publish(DownloadOutcome.EXISTING)
+                resolved.append(BatchItemResult(index=index, url=url, video=video))
+            else:
+                pending.append((index, url))
+
+        if self.failure_repo is not None and not self.retry_failed and pending:
+            failures = self.failure_repo.find_many(url for _, url in pending)
+            not_failed: List[Tuple[int, str]] = []
+            for index, url in pending:
+                try:
+                    self._check_known_failure(url, failures.get(url))
+                except DownloadFailedException as e:
+                    self._publish(DownloadOutcome.SKIPPED)
+                    resolved.append(BatchItemResult(index=index, url=url, error=e))
+                else:
+                    not_failed.append((index, url))
+            pending = not_failed
+
+        pending, duplicates = self._group_duplicates(pending, leaders)
+        return resolved, pending, duplicates
+
+    def _resolve_duplicates(
+        self, result: BatchItemResult, duplicates: List[Tuple[int, str]]
+    ) -> List[BatchItemResult]:
+        """Repete o resultado de um download para as URLs do mesmo vídeo."""
+        resolved = []
+        for index, url in duplicates:
+            if result.ok:
+                self._publish(DownloadOutcome.EXISTING)
+            else:
+                self._publish(DownloadOutcome.FAILED, result.error)
+            resolved.append(
+                BatchItemResult(
+                    index=index, url=url, video=result.video, error=result.error
+                )
+            )
+        return resolved
+
+    def _submit(
+        self,
+        executor: Executor,
+        url: str,
+        stats: Optional[DownloadStats],
+        profile: Optional[FormatProfile] = None,
+    ) -> Future:
+        """Envia um download ao pool (métricas detalhadas só com threads)."""
+        options: Dict[str, Any] = {}
+        if stats is not None and not self.use_processes:
+            options["stats"] = stats
+        if profile is not None:
+            options["profile"] = profile
+        return executor.submit(self.downloader.download, url, **options)
+
+    def _finish(
+        self,
+        finished: List[Tuple[int, str, Future, Optional[DownloadStats]]],
+        profile: Optional[FormatProfile] = None,
+    ) -> List[BatchItemResult]:
+        """
+        Monta os resultados dos downloads concluídos e persiste os vídeos
+        bem-sucedidos em uma única transação, removendo as suas falhas
+        antigas do cache negativo.
+        """
+        results: List[BatchItemResult] = []
+        round_stats: Dict[int, DownloadStats] = {}
+        for index, url, future, stats in finished:
+            if stats is not None:
+                round_stats[index] = stats
+            try:
+                title, path = future.result()
+            except Exception as e:
+                logger.error("Erro ao fazer download de %s: %s", url, e)
+                self._record_failure(url, e)
+                results.append(BatchItemResult(index=index, url=url, error=e))
+                continue
+
+            logger.info("Download concluído: %s", title)
+            video = Video(
+                url=url,
+                title=title,
+                file_path=path,
+                downloaded_at=datetime.now(),
+                content_hash=self._store_content(path),
+                format_profile=profile,
+                postprocess_status=self._postprocess_status(),
+            )
+            results.append(BatchItemResult(index=index, url=url, video=video))
+
+        videos = [result.video for result in results if result.video]
+        save_started = time.perf_counter()
+        if videos:
+            try:
+                self.repo.save_many(videos)
+            except Exception as e:
+                logger.error("Erro ao salvar vídeos: %s", e)
+                for result in results:
+                    if result.video:
+                        result.video, result.error = None, e
+            else:
+                # Baixados com sucesso: saem do cache negativo
+                if self.failure_repo is not None:
+                    self.failure_repo.delete_many([video.url for video in videos])
+                if self.postprocess is not None:
+                    for video in videos:
+                        self.postprocess.submit(video)
+
+        if round_stats:
+            self._record_round_stats(results, round_stats, save_started)
+        return results
+
+    def _record_round_stats(
+        self,
+        results: List[BatchItemResult],
+        round_stats: Dict[int, DownloadStats],
+        save_started: float,
+    ) -> None:
+        """
+        Fecha as métricas de uma rodada de downloads, grava-as juntas e
+        atualiza os contadores.
+        """
+        save_s = time.perf_counter() - save_started
+        now = datetime.now()
+        for result in results:
+            stats = round_stats[result.index]
+            stats.total_s = (now - stats.started_at).total_seconds()
+            if result.ok:
+                stats.save_s = save_s
+                stats.outcome = DownloadOutcome.DOWNLOADED
+            else:
+                stats.outcome = DownloadOutcome.FAILED
+                stats.error = str(result.error)
+            self._publish(stats.outcome, result.error, stats.total_s)
+        if self.metrics_repo is not None:
+            self.metrics_repo.record_many(round_stats.values())
+
+    def run(
+        self, urls: Iterable[str], profile: Optional[FormatProfile] = None
+    ) -> Iterator[BatchItemResult]:
+        """
+        Processa um conjunto de URLs.
+
+        As URLs são consumidas de forma preguiçosa: no máximo ``window``
+        URLs ficam em memória entre leitura e devolução do resultado.
+        A deduplicação é feita por blocos com find_by_urls e os vídeos
+        baixados são salvos com save_many. Um vídeo que aparece de novo
+        (mesmo em outro bloco) enquanto ainda está sendo baixado reaproveita
+        esse download.
+
+        Args:
+            urls: Iterável de URLs a serem baixadas
+            profile: Perfil de formato (padrão: o perfil do caso de uso)
+
+        Yields:
+            BatchItemResult: Um resultado por URL, na ordem de entrada
+        """
+        profile = profile or self.profile
+        source = enumerate(urls)
+        source_exhausted = False
+
+        # URLs validadas e ainda não baixadas, aguardando worker ou vaga no host
+        ready: Deque[Tuple[int, str]] = deque()
+        in_flight: Dict[Future, Tuple[int, str, Optional[DownloadStats]]] = {}
+        host_active: Dict[str, int] = {}
+        # Resultados prontos mas ainda não devolvidos (fora de ordem)
+        completed: Dict[int, BatchItemResult] = {}
+        # URLs repetidas, pelo índice do item que será baixado, e o item
+        # que baixa cada vídeo em andamento, pela chave; vídeos já
+        # concluídos são encontrados no repositório
+        duplicates: Dict[int, List[Tuple[int, str]]] = {}
+        leaders: Dict[str, int] = {}
+        next_index = 0
+        next_to_yield = 0
+
+        with self._create_executor() as executor:
+            while True:
+                # Lê um novo bloco de URLs, respeitando a janela. Espera a
+                # janela esvaziar pela metade para não consultar o
+                # repositório com blocos de uma única URL.
+                room = self.window - (next_index - next_to_yield)
+                if (
+                    not source_exhausted
+                    and room > 0
+                    and (len(ready) < self.max_workers or room >= self.window // 2)
+                ):
+                    chunk = list(islice(source, room))
+                    if len(chunk) < room:
+                        source_exhausted = True
+                    if chunk:
+                        next_index = chunk[-1][0] + 1
+                        resolved, pending, repeated = self._prepare_chunk(
+                            chunk, leaders
+                        )
+                        for result in resolved:
+                            completed[result.index] = result
+                        ready.extend(pending)
+                        for leader, items in repeated.items():
+                            duplicates.setdefault(leader, []).extend(items)
+
+                # Envia ao pool as URLs cujo host ainda tem vaga
+                for _ in range(len(ready)):
+                    if len(in_flight) >= self.max_workers:
+                        break
+                    index, url = ready.popleft()
+                    host = self._host_of(url)
+                    if host_active.get(host, 0) >= self.per_host_limit:
+                        ready.append((index, url))
+                        continue
+                    host_active[host] = host_active.get(host, 0) + 1
+                    stats = self._new_stats(url)
+                    future = self._submit(executor, url, stats, profile)
+                    in_flight[future] = (index, url, stats)
+
+                # Devolve tudo o que já está pronto, em ordem
+                while next_to_yield in completed:
+                    yield completed.pop(next_to_yield)
+                    next_to_yield += 1
+
+                if not in_flight:
+                    if source_exhausted and not ready:
+                        break
+                    continue
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                finished = []
+                for future in done:
+                    index, url, stats = in_flight.pop(future)
+                    host_active[self._host_of(url)] -= 1
+                    finished.append((index, url, future, stats))
+                for result in self._finish(finished, profile):
+                    completed[result.index] = result
+                    leaders.pop(self._video_key(result.url), None)
+                    for duplicate in self._resolve_duplicates(
+                        result, duplicates.pop(result.index, [])
+                    ):
+                        completed[duplicate.index] = duplicate
+
+        while next_to_yield in completed:
+            yield completed.pop(next_to_yield)
+            next_to_yield += 1
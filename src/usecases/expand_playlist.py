@@ -0,0 +1,102 @@
+import logging
+from itertools import islice
+from typing import Callable, Iterable, Iterator, Optional, Set
+
+from src.domain.exceptions import DomainException
+from src.domain.repositories import VideoRepository
+from src.domain.services import VideoDownloaderService
+from src.domain.video_key import canonical_video_key, is_collection_url
+
+logger = logging.getLogger(__name__)
+
+
+class ExpandPlaylist:
+    """
+    Caso de uso para expandir playlists e canais em URLs de vídeo.
+
+    As entradas são lidas da coleção sob demanda (sem extração individual)
+    e verificadas no repositório em blocos, pela chave canônica; apenas os
+    vídeos ainda não baixados são devolvidos. Assim, sincronizar de novo
+    um canal grande só baixa os vídeos novos.
+    """
+
+    def __init__(
+        self,
+        downloader_service: VideoDownloaderService,
+        video_repo: VideoRepository,
+        chunk_size: int = 100,
+    ):
+        if chunk_size < 1:
+            raise ValueError("chunk_size deve ser maior que zero")
+        self.downloader = downloader_service
+        self.repo = video_repo
+        self.chunk_size = chunk_size
+
+    def iter_new_urls(self, url: str) -> Iterator[str]:
+        """
+        Enumera os vídeos ainda não baixados de uma playlist ou canal.
+
+        Args:
+            url: URL da playlist ou canal
+
+        Yields:
+            str: URL de cada vídeo novo, na ordem da coleção
+
+        Raises:
+            DownloadFailedException: Se a enumeração falhar
+        """
+        entries = self.downloader.iter_playlist(url)
+        # Vídeos repetidos na coleção (ex: em duas abas do canal)
+        seen: Set[str] = set()
+        total = new = 0
+        while chunk := list(islice(entries, self.chunk_size)):
+            total += len(chunk)
+            known = self.repo.find_by_urls(entry.url for entry in chunk)
+            for entry in chunk:
+                key = canonical_video_key(entry.url) or entry.url
+                if entry.url in known or key in seen:
+                    continue
+                seen.add(key)
+                new += 1
+                yield entry.url
+        logger.info("Coleção expandida: %s (%s novo(s) de %s)", url, new, total)
+
+    def expand(
+        self,
+        urls: Iterable[str],
+        on_error: Optional[Callable[[str, DomainException], None]] = None,
+    ) -> Iterator[str]:
+        """
+        Substitui as URLs de coleção pelos seus vídeos novos; as demais
+        URLs passam sem alteração.
+
+        Args:
+            urls: URLs de vídeos e/ou coleções
+            on_error: Chamado quando uma coleção não pode ser listada; sem
+                ele, o erro é propagado
+        """
+        for url in urls:
+            if not is_collection_url(url):
+                yield url
+                continue
+            try:
+                yield from self.iter_new_urls(url)
+            except DomainException as e:
+                if on_error is None:
+                    raise
+                logger.error("Erro ao expandir coleção %s: %s", url, e)
+                on_error(url, e)
+
+    def enqueue(self, url: str, queue, limit: Optional[int] = None) -> int:
+        """
+        Enfileira os vídeos novos de uma coleção na fila de downloads.
+
+        Args:
+            url: URL da playlist ou canal
+            queue: Caso de uso ProcessDownloadQueue
+            limit: Quantidade máxima de vídeos a enfileirar
+
+        Returns:
+            int: Quantidade de jobs novos criados
+        """
+        return queue.enqueue(islice(self.iter_new_urls(url), limit))
@@ -0,0 +1,195 @@
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from functools import partial
+from logging.handlers import QueueHandler, QueueListener
+from multiprocessing.queues import Queue
+from typing import Optional, Set, Tuple
+
+from src.domain.entities import FormatProfile, PostprocessStatus, Video
+from src.domain.exceptions import DomainException
+from src.domain.repositories import VideoRepository
+from src.domain.services import ContentStore, PostProcessor
+
+logger = logging.getLogger(__name__)
+
+
+def _init_worker(log_queue: "Queue[logging.LogRecord]", level: int) -> None:
+    """
+    Executado ao iniciar cada processo do pool. Os handlers herdados do pai
+    escrevem em filas que só existem no processo pai; os registros passam a
+    ir para log_queue, que o pai repassa aos próprios loggers.
+    """
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(level)
+
+
+class _ForwardHandler(logging.Handler):
+    """Entrega, no processo pai, os registros vindos dos processos do pool."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        logging.getLogger(record.name).handle(record)
+
+
+def _run_postprocess(
+    processor: PostProcessor,
+    content_store: Optional[ContentStore],
+    path: str,
+    profile: Optional[FormatProfile],
+) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Executado no processo do pool: processa o arquivo e, se ele mudou,
+    recalcula o hash do conteúdo.
+
+    Returns:
+        Tuple com (caminho processado, hash), ou None nos campos inalterados
+    """
+    processed = processor.process(path, profile)
+    if processed is None or content_store is None:
+        return processed, None
+    return processed, content_store.store(processed)
+
+
+class PostprocessVideos:
+    """
+    Caso de uso para o pós-processamento dos vídeos baixados (remux,
+    extração de áudio), fora dos workers de download.
+
+    Os downloads terminam, gravam o vídeo com postprocess_status=pending e
+    entregam o arquivo a submit(); o trabalho de CPU roda em um
+    ProcessPoolExecutor (por padrão, um processo por núcleo) enquanto os
+    workers de download já seguem para a próxima URL. Ao terminar, o
+    estado passa a done (com o novo caminho e hash, se o arquivo mudou)
+    ou failed.
+
+    Como o estado fica no repositório, vídeos cujo processamento não
+    terminou (aplicação encerrada ou interrompida) continuam pending e são
+    reenviados por resume() na próxima execução.
+    """
+
+    def __init__(
+        self,
+        processor: PostProcessor,
+        video_repo: VideoRepository,
+        max_workers: Optional[int] = None,
+        content_store: Optional[ContentStore] = None,
+    ):
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers deve ser maior que zero")
+        self.processor = processor
+        self.repo = video_repo
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.content_store = content_store
+
+        self._lock = threading.Lock()
+        self._executor: Optional[Executor] = None
+        self._listener: Optional[QueueListener] = None
+        self._pending: Set[Future] = set()
+
+    def _create_executor(self) -> Executor:
+        """
+        Cria o pool de processos (sob demanda, no primeiro submit), com os
+        logs dos processos encaminhados ao pai por uma fila.
+        """
+        log_queue: "Queue[logging.LogRecord]" = multiprocessing.Queue()
+        self._listener = QueueListener(log_queue, _ForwardHandler())
+        self._listener.start()
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=_init_worker,
+            initargs=(log_queue, logging.getLogger().getEffectiveLevel()),
+        )
+
+    @property
+    def pending(self) -> int:
+        """Quantidade de arquivos enviados e ainda não processados."""
+        with self._lock:
+            return len(self._pending)
+
+    def submit(self, video: Video) -> Future:
+        """
+        Envia o arquivo de um vídeo já gravado ao pool de pós-processamento.
+
+        Returns:
+            Future com (caminho processado, hash), ambos opcionais
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = self._create_executor()
+            future = self._executor.submit(
+                _run_postprocess,
+                self.processor,
+                self.content_store,
+                video.file_path,
+                video.format_profile,
+            )
+            self._pending.add(future)
+        logger.debug("Pós-processamento enfileirado: %s", video.file_path)
+        future.add_done_callback(partial(self._finish, video))
+        return future
+
+    def _finish(self, video: Video, future: Future) -> None:
+        """Grava no repositório o resultado do pós-processamento."""
+        with self._lock:
+            self._pending.discard(future)
+        if future.cancelled():
+            # Encerrado antes de começar: continua pending para o resume()
+            return
+        try:
+            try:
+                path, content_hash = future.result()
+            except Exception as e:
+                logger.error("Erro no pós-processamento de %s: %s", video.file_path, e)
+                self.repo.update_postprocess(video.url, PostprocessStatus.FAILED)
+                return
+            self.repo.update_postprocess(
+                video.url,
+                PostprocessStatus.DONE,
+                file_path=path,
+                content_hash=content_hash,
+            )
+            logger.info("Pós-processamento concluído: %s", path or video.file_path)
+        except DomainException as e:
+            logger.error("Erro ao gravar pós-processamento de %s: %s", video.url, e)
+
+    def resume(self) -> int:
+        """
+        Reenvia os vídeos cujo pós-processamento não terminou em uma
+        execução anterior.
+
+        Returns:
+            int: Quantidade de vídeos reenviados
+        """
+        videos = self.repo.find_by_postprocess_status(PostprocessStatus.PENDING)
+        for video in videos:
+            self.submit(video)
+        if videos:
+            logger.info("%s pós-processamento(s) retomado(s)", len(videos))
+        return len(videos)
+
+    def close(self, wait: bool = True) -> None:
+        """
+        Encerra o pool.
+
+        Args:
+            wait: Espera os arquivos enviados serem processados; com False,
+                os que ainda não começaram ficam pending para o resume()
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+            listener, self._listener = self._listener, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=not wait)
+        if listener is not None:
+            listener.stop()
+
+    def __enter__(self) -> "PostprocessVideos":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
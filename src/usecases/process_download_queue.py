@@ -0,0 +1,429 @@
+import logging
+import os
+import socket
+import threading
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+from src.domain.entities import DownloadOutcome, Job, JobStatus, Video
+from src.domain.exceptions import (
+    DomainException,
+    DownloadFailedException,
+    InvalidURLException,
+)
+from src.domain.failures import classify_failure
+from src.domain.repositories import JobRepository
+from src.usecases.download_video import DownloadVideo
+from src.usecases.download_video_batch import BatchItemResult, DownloadVideoBatch
+from src.usecases.retry_policy import HostErrorTracker, RetryPolicy
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# URLs gravadas por transação ao enfileirar (e conferidas contra os jobs
+# já finalizados)
+_ENQUEUE_CHUNK_SIZE = 500
+
+
+def _chunks(items: Iterable[T]) -> Iterator[List[T]]:
+    """Agrupa os itens em listas de até _ENQUEUE_CHUNK_SIZE, sob demanda."""
+    iterator = iter(items)
+    while chunk := list(islice(iterator, _ENQUEUE_CHUNK_SIZE)):
+        yield chunk
+
+
+class ProcessDownloadQueue:
+    """
+    Caso de uso para processar a fila persistente de downloads.
+
+    URLs são validadas uma única vez, ao serem enfileiradas. Os workers
+    reservam jobs com lease; se o processo cair (ou for interrompido com
+    Ctrl+C) os jobs voltam à fila e a próxima execução continua de onde
+    parou, sem repetir os downloads já concluídos.
+
+    Falhas de download são classificadas pela mensagem de erro: as
+    transitórias (429, 5xx, timeouts) voltam à fila após um backoff
+    exponencial com jitter, alongado para hosts com taxa de erro alta; as
+    permanentes (vídeo privado, removido, bloqueado) ficam como failed.
+    Enfileirar de novo a URL de um job finalizado só o reabre se o vídeo
+    sumiu do repositório ou se a falha não vale mais (retry_failed ou
+    prazo do cache negativo vencido).
+
+    No modo batch, run_batch() baixa os jobs com um DownloadVideoBatch,
+    em blocos reservados da fila: um lote interrompido continua de onde
+    parou na próxima execução.
+
+    Em modo servidor, vários workers chamam serve() em threads próprias e
+    esperam por novos jobs com a fila vazia; submit() enfileira uma URL e
+    acorda os workers na hora, sem esperar o próximo ciclo de consulta.
+    """
+
+    def __init__(
+        self,
+        download_usecase: DownloadVideo,
+        job_repo: JobRepository,
+        max_attempts: int = 3,
+        lease_seconds: float = 600.0,
+        worker_id: Optional[str] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        host_errors: Optional[HostErrorTracker] = None,
+        host_penalty: float = 3.0,
+    ):
+        self.usecase = download_usecase
+        self.jobs = job_repo
+        self.max_attempts = max_attempts
+        self.lease_seconds = lease_seconds
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.host_errors = host_errors or HostErrorTracker()
+        # Com 100% de erros no host, o teto do backoff é multiplicado por
+        # (1 + host_penalty)
+        self.host_penalty = host_penalty
+
+        # Avisa os workers de serve() que há jobs novos; a geração evita
+        # perder avisos dados entre a consulta à fila e a espera
+        self._new_jobs = threading.Condition()
+        self._generation = 0
+
+    def _valid_urls(self, urls: Iterable[str]) -> Iterator[str]:
+        """Filtra as URLs inválidas, registrando-as no log."""
+        for url in urls:
+            url = url.strip()
+            try:
+                self.usecase._validate_url(url)
+            except InvalidURLException as e:
+                logger.warning("URL ignorada ao enfileirar: %s", e)
+                continue
+            yield url
+
+    def enqueue(self, urls: Iterable[str]) -> int:
+        """
+        Enfileira URLs para download.
+
+        Args:
+            urls: URLs a serem enfileiradas
+
+        Returns:
+            int: Quantidade de jobs novos criados
+        """
+        created = 0
+        for chunk in _chunks(self._valid_urls(urls)):
+            created += self.jobs.enqueue_many(chunk)
+            self._reopen_finished(chunk)
+        return created
+
+    def submit(self, url: str) -> Job:
+        """
+        Valida e enfileira uma URL, acordando os workers de serve().
+
+        Returns:
+            Job: Job da URL (o existente, se ela já estava na fila)
+
+        Raises:
+            InvalidURLException: Se a URL for inválida
+        """
+        url = url.strip()
+        self.usecase._validate_url(url)
+        job = self.jobs.enqueue(url)
+        if job.status in (JobStatus.DONE, JobStatus.FAILED):
+            self._reopen_finished([url])
+            job = self.jobs.get(job.id) or job
+        self.wake()
+        return job
+
+    def _reopen_finished(
+        self, urls: List[str]
+    ) -> Tuple[Dict[str, Video], Dict[str, DownloadFailedException]]:
+        """
+        Devolve à fila os jobs finalizados das URLs que precisam ser baixadas
+        de novo: os concluídos cujo vídeo não está mais no repositório e os
+        que falharam, a menos que a falha continue valendo no cache negativo.
+
+        Returns:
+            Tuple com (vídeo de cada job concluído mantido, erro de cada job
+            que falhou mantido), por URL
+        """
+        finished = {
+            url: job
+            for url, job in self.jobs.find_by_urls(urls).items()
+            if job.status in (JobStatus.DONE, JobStatus.FAILED)
+        }
+        if not finished:
+            return {}, {}
+
+        done = [url for url, job in finished.items() if job.status is JobStatus.DONE]
+        videos = self.usecase.repo.find_by_urls(done) if done else {}
+
+        failed = [url for url in finished if url not in done]
+        skipped: Dict[str, DownloadFailedException] = {}
+        if failed and self.usecase.failure_repo is not None:
+            failures = self.usecase.failure_repo.find_many(failed)
+            for url in failed:
+                try:
+                    self.usecase._check_known_failure(url, failures.get(url))
+                except DownloadFailedException as e:
+                    skipped[url] = e
+
+        self.jobs.reopen_many(
+            job.id
+            for url, job in finished.items()
+            if url not in videos and url not in skipped
+        )
+        return videos, skipped
+
+    def wake(self) -> None:
+        """
+        Acorda os workers que esperam em serve() (ex: após enfileirar jobs
+        ou sinalizar o stop_event).
+        """
+        with self._new_jobs:
+            self._generation += 1
+            self._new_jobs.notify_all()
+
+    def _retry_at(self, job: Job) -> datetime:
+        """Calcula quando um job que falhou pode ser tentado de novo."""
+        penalty = 1.0 + self.host_penalty * self.host_errors.error_rate(job.url)
+        delay = self.retry_policy.delay(job.attempts, penalty)
+        return datetime.now() + timedelta(seconds=delay)
+
+    def _handle_failure(self, job: Job, error: Exception) -> bool:
+        """
+        Decide entre nova tentativa (com backoff) e falha permanente.
+
+        Returns:
+            bool: True se o job falhou definitivamente
+        """
+        if isinstance(error, DownloadFailedException):
+            category = classify_failure(error.reason)
+            retry = category.retryable and job.attempts < self.max_attempts
+        else:
+            category = None
+            retry = job.attempts < self.max_attempts
+
+        if not retry:
+            logger.warning(
+                "Job %s falhou definitivamente (%s): %s", job.id, category, error
+            )
+            self.jobs.fail(job.id, str(error), retry=False)
+            return True
+
+        retry_at = self._retry_at(job)
+        logger.warning(
+            "Job %s falhou (%s), nova tentativa após %s: %s",
+            job.id,
+            category,
+            retry_at.isoformat(timespec="seconds"),
+            error,
+        )
+        self.jobs.fail(job.id, str(error), retry=True, retry_at=retry_at)
+        return False
+
+    def _record_error(self, job: Job, error: Exception) -> bool:
+        """
+        Registra a falha de uma tentativa do job.
+
+        Returns:
+            bool: True se o job falhou definitivamente
+        """
+        if isinstance(error, InvalidURLException):
+            self.jobs.fail(job.id, str(error), retry=False)
+            return True
+        self.host_errors.record(job.url, success=False)
+        return self._handle_failure(job, error)
+
+    def recover(self) -> int:
+        """Devolve à fila os jobs interrompidos em uma execução anterior."""
+        return self.jobs.requeue_running()
+
+    def run_once(self) -> Optional[Job]:
+        """
+        Reserva e processa um único job.
+
+        Returns:
+            Job processado, ou None se a fila estiver vazia
+        """
+        job = self.jobs.claim(self.worker_id, self.lease_seconds)
+        if job is None:
+            return None
+
+        logger.info(
+            "Processando job %s (tentativa %s): %s", job.id, job.attempts, job.url
+        )
+        try:
+            self.usecase.execute(job.url)
+        except (KeyboardInterrupt, SystemExit):
+            # Ctrl+C ou encerramento: devolve o job à fila antes de propagar
+            self.jobs.release(job.id)
+            raise
+        except DomainException as e:
+            self._record_error(job, e)
+        except Exception as e:
+            # Erro inesperado também conta como tentativa: um job que sempre
+            # falha termina como failed em vez de voltar à fila para sempre
+            logger.exception("Erro inesperado no job %s: %s", job.id, job.url)
+            self._record_error(job, e)
+        else:
+            self.host_errors.record(job.url, success=True)
+            self.jobs.complete(job.id)
+        return job
+
+    def _wait_for_backoff(self, stop_event: Optional[threading.Event] = None) -> bool:
+        """
+        Espera o próximo job pendente sair do backoff.
+
+        Returns:
+            bool: False se não restam jobs pendentes ou stop_event foi
+                sinalizado durante a espera
+        """
+        available_at = self.jobs.next_available_at()
+        if available_at is None:
+            return False
+        delay = (available_at - datetime.now()).total_seconds()
+        if delay > 0:
+            logger.info("Aguardando %.1fs pelo backoff do próximo job", delay)
+            # Sem stop_event, um Event nunca sinalizado serve de sleep
+            if (stop_event or threading.Event()).wait(delay):
+                return False
+        return True
+
+    def run(
+        self,
+        max_jobs: Optional[int] = None,
+        stop_event: Optional[threading.Event] = None,
+    ) -> int:
+        """
+        Processa jobs até a fila esvaziar. Se os jobs pendentes estiverem
+        aguardando backoff, espera o primeiro ficar disponível.
+
+        Args:
+            max_jobs: Limite opcional de jobs a processar
+            stop_event: Evento opcional para interromper o processamento
+
+        Returns:
+            int: Quantidade de jobs processados
+        """
+        processed = 0
+        while max_jobs is None or processed < max_jobs:
+            if stop_event is not None and stop_event.is_set():
+                break
+            if self.run_once() is not None:
+                processed += 1
+            elif not self._wait_for_backoff(stop_event):
+                break
+        logger.info("%s job(s) processado(s) pelo worker %s", processed, self.worker_id)
+        return processed
+
+    def _claim_many(self, limit: int) -> List[Job]:
+        """Reserva até limit jobs da fila."""
+        claimed: List[Job] = []
+        while len(claimed) < limit:
+            job = self.jobs.claim(self.worker_id, self.lease_seconds)
+            if job is None:
+                break
+            claimed.append(job)
+        return claimed
+
+    def run_batch(
+        self, batch_usecase: DownloadVideoBatch, urls: Iterable[str]
+    ) -> Iterator[BatchItemResult]:
+        """
+        Enfileira as URLs e baixa os jobs pendentes com o DownloadVideoBatch.
+
+        As URLs são validadas e gravadas na fila antes dos downloads. Os
+        jobs são reservados em blocos do tamanho da janela do lote; jobs de
+        uma execução interrompida entram junto. URLs de jobs já concluídos
+        (com o vídeo no repositório) ou com falha ainda válida no cache
+        negativo não são baixadas de novo, mas também recebem resultado.
+        Jobs que falharam com erro transitório são tentados de novo depois
+        do backoff.
+
+        Args:
+            batch_usecase: Caso de uso que executa os downloads de cada bloco
+            urls: URLs a serem baixadas
+
+        Yields:
+            BatchItemResult: Um resultado por URL recebida e por job que
+                concluiu ou falhou definitivamente
+        """
+        invalid: List[BatchItemResult] = []
+
+        def valid_items() -> Iterator[Tuple[int, str]]:
+            for index, url in enumerate(urls):
+                url = url.strip()
+                try:
+                    batch_usecase._validate_url(url)
+                except InvalidURLException as e:
+                    batch_usecase._publish(DownloadOutcome.FAILED, e)
+                    invalid.append(BatchItemResult(index=index, url=url, error=e))
+                    continue
+                yield index, url
+
+        for chunk in _chunks(valid_items()):
+            chunk_urls = [url for _, url in chunk]
+            self.jobs.enqueue_many(chunk_urls)
+            videos, skipped = self._reopen_finished(chunk_urls)
+            yield from invalid
+            invalid.clear()
+            for index, url in chunk:
+                if url in videos:
+                    logger.info(
+                        "Vídeo já foi baixado anteriormente: %s", videos[url].title
+                    )
+                    batch_usecase._publish(DownloadOutcome.EXISTING)
+                    yield BatchItemResult(index=index, url=url, video=videos[url])
+                elif url in skipped:
+                    batch_usecase._publish(DownloadOutcome.SKIPPED)
+                    yield BatchItemResult(index=index, url=url, error=skipped[url])
+        yield from invalid
+        self.recover()
+
+        while True:
+            pending = {job.url: job for job in self._claim_many(batch_usecase.window)}
+            if not pending:
+                if self._wait_for_backoff():
+                    continue
+                break
+            try:
+                for result in batch_usecase.run(list(pending)):
+                    job = pending.pop(result.url)
+                    if result.error is None:
+                        self.host_errors.record(job.url, success=True)
+                        self.jobs.complete(job.id)
+                        yield result
+                    elif self._record_error(job, result.error):
+                        yield result
+            except BaseException:
+                # Ctrl+C ou erro fatal: devolve o resto do bloco à fila
+                for job in pending.values():
+                    self.jobs.release(job.id)
+                raise
+
+    def serve(self, stop_event: threading.Event, poll_interval: float = 1.0) -> int:
+        """
+        Processa jobs até stop_event ser sinalizado. Com a fila vazia,
+        espera um submit() (ou poll_interval segundos, para pegar jobs
+        liberados pelo backoff) antes de consultar a fila de novo.
+
+        Returns:
+            int: Quantidade de jobs processados
+        """
+        processed = 0
+        while not stop_event.is_set():
+            seen = self._generation
+            try:
+                job = self.run_once()
+            except Exception:
+                # Ex: banco indisponível ao reservar; o worker continua vivo
+                logger.exception("Erro inesperado no worker %s", self.worker_id)
+                job = None
+            if job is not None:
+                processed += 1
+                continue
+            with self._new_jobs:
+                self._new_jobs.wait_for(
+                    lambda: self._generation != seen or stop_event.is_set(),
+                    timeout=poll_interval,
+                )
+        return processed
@@ -0,0 +1,97 @@
+import random
+import threading
+from collections import defaultdict, deque
+from typing import Callable, Deque, Dict, Optional
+from urllib.parse import urlparse
+
+
+class RetryPolicy:
+    """
+    Backoff exponencial com jitter completo ("full jitter").
+
+    A espera da tentativa n é sorteada entre 0 e
+    min(max_delay, base_delay * multiplier ** (n - 1)). O sorteio espalha
+    as novas tentativas no tempo, evitando que vários workers voltem a
+    bater no mesmo servidor ao mesmo tempo depois de um erro 429/5xx.
+    """
+
+    def __init__(
+        self,
+        base_delay: float = 5.0,
+        max_delay: float = 900.0,
+        multiplier: float = 2.0,
+        rng: Optional[Callable[[float, float], float]] = None,
+    ):
+        if base_delay < 0 or max_delay < base_delay:
+            raise ValueError("Requer 0 <= base_delay <= max_delay")
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self._uniform = rng or random.uniform
+
+    def ceiling(self, attempt: int) -> float:
+        """Espera máxima (sem jitter) antes da tentativa seguinte à ``attempt``."""
+        exponent = max(attempt - 1, 0)
+        try:
+            delay = self.base_delay * self.multiplier**exponent
+        except OverflowError:
+            return self.max_delay
+        return min(self.max_delay, delay)
+
+    def delay(self, attempt: int, penalty: float = 1.0) -> float:
+        """
+        Sorteia a espera antes de uma nova tentativa.
+
+        Args:
+            attempt: Número de tentativas já feitas (1 na primeira falha)
+            penalty: Fator multiplicativo do teto (ex: hosts instáveis)
+
+        Returns:
+            float: Segundos de espera
+        """
+        ceiling = min(self.max_delay, self.ceiling(attempt) * penalty)
+        return self._uniform(0.0, ceiling)
+
+
+class HostErrorTracker:
+    """
+    Taxa de erro por host, calculada sobre os últimos ``window`` resultados.
+
+    Usada para alongar o backoff de hosts que estão falhando muito (ex:
+    aplicando limite de requisições) sem afetar os demais.
+    """
+
+    def __init__(self, window: int = 50):
+        self.window = window
+        self._outcomes: Dict[str, Deque[bool]] = defaultdict(
+            lambda: deque(maxlen=self.window)
+        )
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        """Host da URL, sem o prefixo www."""
+        host = (urlparse(url).hostname or "").lower()
+        return host[4:] if host.startswith("www.") else host
+
+    def record(self, url: str, success: bool) -> None:
+        """Registra o resultado de um download."""
+        with self._lock:
+            self._outcomes[self.host_of(url)].append(success)
+
+    def error_rate(self, url: str) -> float:
+        """Fração de falhas recentes do host da URL (0.0 sem histórico)."""
+        with self._lock:
+            outcomes = self._outcomes.get(self.host_of(url))
+            if not outcomes:
+                return 0.0
+            return outcomes.count(False) / len(outcomes)
+
+    def snapshot(self) -> Dict[str, float]:
+        """Taxa de erro atual de cada host conhecido."""
+        with self._lock:
+            return {
+                host: outcomes.count(False) / len(outcomes)
+                for host, outcomes in self._outcomes.items()
+                if outcomes
+            }
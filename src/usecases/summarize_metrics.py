@@ -0,0 +1,115 @@
+import math
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Sequence
+
+from src.domain.entities import DOWNLOAD_PHASES, DownloadOutcome, DownloadStats
+from src.domain.repositories import DownloadMetricsRepository
+
+# Percentis reportados no resumo
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """
+    Percentil com interpolação linear entre as amostras vizinhas.
+    Retorna 0.0 para uma sequência vazia.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    low = math.floor(rank)
+    high = math.ceil(rank)
+    if low == high:
+        return ordered[low]
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+@dataclass
+class MetricsSummary:
+    """Resumo das métricas de download em uma janela de tempo."""
+
+    since: datetime
+    until: datetime
+    count: int = 0
+    outcomes: Dict[str, int] = field(default_factory=dict)
+    # fase (ou "total") -> {"p50": s, "p95": s, "p99": s}, só downloads concluídos
+    latencies: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    bytes_downloaded: int = 0
+    # bytes / soma dos tempos de transferência (velocidade média por download)
+    avg_speed: float = 0.0
+    # downloads concluídos por hora na janela
+    downloads_per_hour: float = 0.0
+
+    def to_dict(self) -> dict:
+        """Representação serializável em JSON."""
+        return {
+            "since": self.since.isoformat(timespec="seconds"),
+            "until": self.until.isoformat(timespec="seconds"),
+            "count": self.count,
+            "outcomes": self.outcomes,
+            "latencies": self.latencies,
+            "bytes_downloaded": self.bytes_downloaded,
+            "avg_speed": self.avg_speed,
+            "downloads_per_hour": self.downloads_per_hour,
+        }
+
+
+class SummarizeMetrics:
+    """
+    Caso de uso que resume as métricas gravadas: quantidade por resultado,
+    percentis de latência (total e por fase) e vazão em uma janela de tempo.
+    """
+
+    def __init__(
+        self,
+        metrics_repo: DownloadMetricsRepository,
+        clock: Callable[[], datetime] = datetime.now,
+    ):
+        self.metrics_repo = metrics_repo
+        self.clock = clock
+
+    def execute(
+        self, window: timedelta, until: Optional[datetime] = None
+    ) -> MetricsSummary:
+        """
+        Resume os downloads iniciados na janela que termina em until.
+
+        Args:
+            window: Duração da janela
+            until: Fim da janela (padrão: agora)
+
+        Returns:
+            MetricsSummary: Resumo da janela
+        """
+        until = until or self.clock()
+        since = until - window
+        stats = self.metrics_repo.find_since(since, until)
+
+        summary = MetricsSummary(since=since, until=until, count=len(stats))
+        for item in stats:
+            outcome = item.outcome.value
+            summary.outcomes[outcome] = summary.outcomes.get(outcome, 0) + 1
+
+        downloaded = [s for s in stats if s.outcome is DownloadOutcome.DOWNLOADED]
+        summary.latencies = self._latencies(downloaded)
+        summary.bytes_downloaded = sum(s.bytes_downloaded for s in downloaded)
+        transfer = sum(s.transfer_s for s in downloaded)
+        summary.avg_speed = summary.bytes_downloaded / transfer if transfer else 0.0
+        hours = window.total_seconds() / 3600
+        summary.downloads_per_hour = len(downloaded) / hours if hours else 0.0
+        return summary
+
+    @staticmethod
+    def _latencies(stats: List[DownloadStats]) -> Dict[str, Dict[str, float]]:
+        """Calcula os percentis do tempo total e de cada fase."""
+        if not stats:
+            return {}
+        latencies = {}
+        for phase in ("total", *DOWNLOAD_PHASES):
+            values = [getattr(s, f"{phase}_s") for s in stats]
+            latencies[phase] = {
+                f"p{pct}": percentile(values, pct) for pct in PERCENTILES
+            }
+        return latencies
@@ -0,0 +1,166 @@
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional, Set
+
+from src.domain.entities import PlaylistEntry, Subscription
+from src.domain.exceptions import InvalidURLException
+from src.domain.repositories import SubscriptionRepository, VideoRepository
+from src.domain.services import VideoDownloaderService
+from src.domain.video_key import canonical_video_key, channel_key
+from src.usecases.download_video import validate_url
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ChannelSyncResult:
+    """Resultado da sincronização de um canal."""
+
+    url: str
+    new_urls: List[str] = field(default_factory=list)
+    scanned: int = 0
+    # True se a enumeração parou em conteúdo já conhecido
+    reached_known: bool = False
+
+
+class SyncChannel:
+    """
+    Caso de uso para sincronizar canais de forma incremental.
+
+    Para cada canal é guardado o vídeo mais novo já visto (id e data de
+    upload). Como a aba de vídeos de um canal vem do mais novo para o
+    mais antigo, a enumeração para ao encontrar esse vídeo, um vídeo mais
+    antigo que ele, ou uma sequência de ``known_streak`` vídeos já
+    baixados (caso o vídeo de referência tenha sido removido). A
+    paginação é preguiçosa, então o custo passa a ser proporcional aos
+    uploads novos e não ao tamanho do canal.
+    """
+
+    def __init__(
+        self,
+        downloader_service: VideoDownloaderService,
+        video_repo: VideoRepository,
+        subscription_repo: SubscriptionRepository,
+        chunk_size: int = 30,
+        known_streak: int = 30,
+    ):
+        if chunk_size < 1 or known_streak < 1:
+            raise ValueError("chunk_size e known_streak devem ser maiores que zero")
+        self.downloader = downloader_service
+        self.repo = video_repo
+        self.subscriptions = subscription_repo
+        self.chunk_size = chunk_size
+        self.known_streak = known_streak
+
+    @staticmethod
+    def _is_known(entry: PlaylistEntry, subscription: Subscription) -> bool:
+        """Indica se a entrada é o vídeo de referência ou anterior a ele."""
+        if entry.video_id and entry.video_id == subscription.last_video_id:
+            return True
+        return bool(
+            entry.upload_date
+            and subscription.last_upload_date
+            and entry.upload_date < subscription.last_upload_date
+        )
+
+    def _collect(
+        self,
+        chunk: List[PlaylistEntry],
+        result: ChannelSyncResult,
+        seen: Set[str],
+        streak: int,
+    ) -> int:
+        """
+        Separa os vídeos novos de um bloco, com uma consulta ao repositório.
+
+        Returns:
+            int: Sequência atual de vídeos já baixados
+        """
+        known = self.repo.find_by_urls(entry.url for entry in chunk)
+        for entry in chunk:
+            if entry.url in known:
+                streak += 1
+                continue
+            streak = 0
+            key = canonical_video_key(entry.url) or entry.url
+            if key not in seen:
+                seen.add(key)
+                result.new_urls.append(entry.url)
+        return streak
+
+    def execute(self, url: str, queue=None) -> ChannelSyncResult:
+        """
+        Sincroniza um canal.
+
+        Args:
+            url: URL do canal
+            queue: ProcessDownloadQueue opcional onde os vídeos novos são
+                enfileirados
+
+        Returns:
+            ChannelSyncResult: Vídeos novos encontrados, do mais novo para
+            o mais antigo
+
+        Raises:
+            InvalidURLException: Se a URL não for de um canal
+            DownloadFailedException: Se a enumeração falhar
+        """
+        validate_url(url)
+        if channel_key(url) is None:
+            raise InvalidURLException(
+                url, "Sincronização incremental requer a URL de um canal"
+            )
+
+        subscription = self.subscriptions.find(url) or Subscription(url=url)
+        result = ChannelSyncResult(url=url)
+        seen: Set[str] = set()
+        newest: Optional[PlaylistEntry] = None
+        chunk: List[PlaylistEntry] = []
+        streak = 0
+
+        entries = self.downloader.iter_playlist(url)
+        try:
+            for entry in entries:
+                if newest is None:
+                    newest = entry
+                if self._is_known(entry, subscription):
+                    result.reached_known = True
+                    break
+                result.scanned += 1
+                chunk.append(entry)
+                if len(chunk) >= self.chunk_size:
+                    streak = self._collect(chunk, result, seen, streak)
+                    chunk = []
+                    if streak >= self.known_streak:
+                        result.reached_known = True
+                        break
+        finally:
+            # Interrompe a paginação (fecha o gerador e a sessão do yt-dlp)
+            close = getattr(entries, "close", None)
+            if close is not None:
+                close()
+        if chunk:
+            self._collect(chunk, result, seen, streak)
+
+        # Enfileira antes de avançar a referência: se a fila falhar, a
+        # próxima sincronização encontra os mesmos vídeos novos
+        if queue is not None and result.new_urls:
+            queue.enqueue(result.new_urls)
+
+        if newest is not None:
+            subscription.url = url
+            subscription.last_video_id = newest.video_id or subscription.last_video_id
+            subscription.last_upload_date = (
+                newest.upload_date or subscription.last_upload_date
+            )
+        subscription.last_synced_at = datetime.now()
+        self.subscriptions.save(subscription)
+
+        logger.info(
+            "Canal sincronizado: %s (%s novo(s), %s entrada(s) lida(s))",
+            url,
+            len(result.new_urls),
+            result.scanned,
+        )
+        return result
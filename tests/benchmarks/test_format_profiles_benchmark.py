@@ -0,0 +1,139 @@
+"""
+Benchmark: bytes transferidos e tempo de download por perfil de formato.
+
+Usa o yt-dlp de verdade contra um servidor HTTP local que publica um
+vídeo HLS com quatro formatos: 1080p só vídeo, 720p e 360p com áudio
+embutido e uma faixa só de áudio. O perfil de arquivamento precisa do
+ffmpeg para juntar vídeo e áudio e só é medido quando ele está instalado.
+
+Execute com: pytest tests/benchmarks -m slow -s
+"""
+
+import os
+import shutil
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.domain.entities import FormatProfile
+from src.infrastructure.path_allocator import PathAllocator
+
+SEGMENTS = 8
+# Tamanho de cada segmento, por faixa
+SEGMENT_BYTES = {
+    "v1080": 512 * 1024,
+    "v720": 256 * 1024,
+    "v360": 64 * 1024,
+    "audio": 32 * 1024,
+}
+
+MASTER = """#EXTM3U
+#EXT-X-VERSION:3
+#EXT-X-MEDIA:TYPE=AUDIO,GROUP-ID="aud",NAME="audio",DEFAULT=YES,AUTOSELECT=YES,\
+URI="audio.m3u8"
+#EXT-X-STREAM-INF:BANDWIDTH=4000000,RESOLUTION=1920x1080,CODECS="avc1.640028",\
+AUDIO="aud"
+v1080.m3u8
+#EXT-X-STREAM-INF:BANDWIDTH=2000000,RESOLUTION=1280x720,\
+CODECS="avc1.4d401f,mp4a.40.2"
+v720.m3u8
+#EXT-X-STREAM-INF:BANDWIDTH=600000,RESOLUTION=640x360,CODECS="avc1.4d401e,mp4a.40.2"
+v360.m3u8
+"""
+
+
+def _media_playlist(track: str) -> str:
+    lines = ["#EXTM3U", "#EXT-X-VERSION:3", "#EXT-X-TARGETDURATION:2"]
+    for i in range(SEGMENTS):
+        lines += ["#EXTINF:2.0,", f"{track}_{i}.ts"]
+    lines.append("#EXT-X-ENDLIST")
+    return "\n".join(lines) + "\n"
+
+
+def _fixture_files() -> dict:
+    files = {"/master.m3u8": MASTER.encode("ascii")}
+    for track, size in SEGMENT_BYTES.items():
+        files[f"/{track}.m3u8"] = _media_playlist(track).encode("ascii")
+        segment = os.urandom(size)
+        for i in range(SEGMENTS):
+            files[f"/{track}_{i}.ts"] = segment
+    return files
+
+
+class _FixtureServer(ThreadingHTTPServer):
+    """Servidor local que conta os bytes enviados."""
+
+    daemon_threads = True
+
+    def __init__(self, files: dict):
+        super().__init__(("127.0.0.1", 0), _FixtureHandler)
+        self.files = files
+        self.bytes_sent = 0
+        self.lock = threading.Lock()
+
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:
+        body = self.server.files.get(self.path.split("?", 1)[0])
+        if body is None:
+            self.send_error(404)
+            return
+        content_type = (
+            "application/vnd.apple.mpegurl"
+            if self.path.endswith(".m3u8")
+            else "video/mp2t"
+        )
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        with self.server.lock:
+            self.server.bytes_sent += len(body)
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+@pytest.mark.slow
+def test_bytes_and_time_per_profile(tmp_path):
+    """Compara bytes transferidos e tempo de parede de cada perfil."""
+    # Arrange
+    pytest.importorskip("yt_dlp")
+    from src.infrastructure.yt_dlp_service import YTDLPService
+
+    profiles = [None, FormatProfile.AUDIO, FormatProfile.SD]
+    if shutil.which("ffmpeg"):
+        profiles.append(FormatProfile.ARCHIVAL)
+    server = _FixtureServer(_fixture_files())
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/master.m3u8"
+
+    # Act
+    measured = {}
+    try:
+        for profile in profiles:
+            name = profile.value if profile else "padrão"
+            service = YTDLPService(
+                path_allocator=PathAllocator(root=str(tmp_path / name))
+            )
+            before = server.bytes_sent
+            start = time.perf_counter()
+            _, path = service.download(url, profile=profile)
+            elapsed = time.perf_counter() - start
+            measured[name] = (server.bytes_sent - before, elapsed)
+            assert os.path.exists(path)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    # Assert
+    print()
+    for name, (sent, elapsed) in measured.items():
+        print(f"{name:>9}: {sent / 1024:8,.0f} KiB em {elapsed * 1000:6.0f} ms")
+    assert measured["audio"][0] < measured["720p"][0]
+    assert measured["720p"][0] <= measured["padrão"][0]
+    if "archival" in measured:
+        assert measured["720p"][0] < measured["archival"][0]
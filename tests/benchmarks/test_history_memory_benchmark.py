@@ -0,0 +1,61 @@
+"""
+Benchmark de memória: get_all() vs. iter_videos() em um histórico grande.
+
+Execute com: pytest tests/benchmarks -m slow -s
+"""
+
+import tracemalloc
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.domain.entities import Video
+from src.infrastructure.sqlite_pool import SQLiteConnectionPool
+from src.infrastructure.sqlite_repo import SQLiteVideoRepository
+
+ROWS = 100_000
+
+
+def _peak_memory(func) -> int:
+    """Executa func e retorna o pico de memória alocada (bytes)."""
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+@pytest.mark.slow
+def test_iter_videos_memory_is_constant(temp_db_path):
+    """Compara o pico de memória ao percorrer 100k vídeos."""
+    # Arrange
+    pool = SQLiteConnectionPool(temp_db_path)
+    repo = SQLiteVideoRepository(pool=pool)
+    base = datetime(2024, 1, 1)
+    repo.save_many(
+        Video(
+            url=f"https://youtube.com/watch?v={i}",
+            title=f"Video {i}",
+            file_path=f"downloads/{i}.mp4",
+            downloaded_at=base + timedelta(seconds=i),
+        )
+        for i in range(ROWS)
+    )
+
+    def stream():
+        count = 0
+        for _ in repo.iter_videos():
+            count += 1
+        assert count == ROWS
+
+    # Act
+    materialized = _peak_memory(lambda: len(repo.get_all()))
+    streamed = _peak_memory(stream)
+    pool.close_all()
+
+    # Assert
+    print(
+        f"\nget_all: {materialized / 2**20:.1f} MiB | "
+        f"iter_videos: {streamed / 2**20:.1f} MiB"
+    )
+    assert streamed < materialized / 10
@@ -0,0 +1,70 @@
+"""
+Benchmark: latência de POST /jobs no modo servidor.
+
+Mede o tempo de resposta de cada envio por uma conexão keep-alive, com a
+fila SQLite de verdade e os workers consumindo os jobs ao mesmo tempo;
+cada download é simulado por uma espera, como a de um download real pela
+rede.
+
+Execute com: pytest tests/benchmarks -m slow -s
+"""
+
+import http.client
+import json
+import statistics
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from src.infrastructure.sqlite_job_repo import SQLiteJobRepository
+from src.infrastructure.sqlite_pool import SQLiteConnectionPool
+from src.presentation.http_api import DownloadApiServer
+from src.usecases.download_video import DownloadVideo
+from src.usecases.process_download_queue import ProcessDownloadQueue
+
+REQUESTS = 2_000
+NETWORK_S = 0.05
+
+
+class _NetworkBoundDownload(DownloadVideo):
+    """Download que só espera pela "rede"."""
+
+    def execute(self, url, profile=None):
+        time.sleep(NETWORK_S)
+
+
+@pytest.mark.slow
+def test_submit_latency(temp_db_path):
+    """Mede a latência (mediana e p99) de POST /jobs."""
+    # Arrange
+    pool = SQLiteConnectionPool(temp_db_path)
+    queue = ProcessDownloadQueue(
+        _NetworkBoundDownload(Mock(), Mock()), SQLiteJobRepository(pool=pool)
+    )
+    server = DownloadApiServer(queue, Mock(), port=0).start()
+    conn = http.client.HTTPConnection(*server.address, timeout=5)
+
+    # Act
+    latencies = []
+    try:
+        for i in range(REQUESTS):
+            body = json.dumps({"url": f"https://youtube.com/watch?v={i}"}).encode()
+            start = time.perf_counter()
+            conn.request("POST", "/jobs", body=body)
+            response = conn.getresponse()
+            response.read()
+            latencies.append(time.perf_counter() - start)
+            assert response.status == 202
+    finally:
+        conn.close()
+        server.close()
+        pool.close_all()
+
+    # Assert
+    latencies.sort()
+    median = statistics.median(latencies)
+    p99 = latencies[int(len(latencies) * 0.99)]
+    print(f"\nPOST /jobs: mediana {median * 1000:.3f} ms | p99 {p99 * 1000:.3f} ms")
+    assert queue.jobs.count_by_status()["pending"] < REQUESTS
+    assert median < 0.001
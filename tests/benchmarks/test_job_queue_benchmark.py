@@ -0,0 +1,44 @@
+"""
+Benchmark de vazão da fila de jobs (reserva com UPDATE ... RETURNING).
+
+Execute com: pytest tests/benchmarks -m slow -s
+"""
+
+import time
+
+import pytest
+
+from src.infrastructure.sqlite_job_repo import SQLiteJobRepository
+from src.infrastructure.sqlite_pool import SQLiteConnectionPool
+
+QUEUED_JOBS = 10_000
+
+
+@pytest.mark.slow
+def test_claim_throughput_with_10k_jobs(temp_db_path):
+    """Mede reservas por segundo com 10k jobs na fila."""
+    # Arrange
+    pool = SQLiteConnectionPool(temp_db_path)
+    repo = SQLiteJobRepository(pool=pool)
+    start = time.perf_counter()
+    repo.enqueue_many(f"https://youtube.com/watch?v={i}" for i in range(QUEUED_JOBS))
+    enqueue_elapsed = time.perf_counter() - start
+
+    # Act - reserva metade dos jobs; a fila continua com 5k+ pendentes
+    claims = QUEUED_JOBS // 2
+    start = time.perf_counter()
+    for _ in range(claims):
+        job = repo.claim("bench", lease_seconds=600)
+        assert job is not None
+    claim_elapsed = time.perf_counter() - start
+
+    # Assert
+    claims_per_sec = claims / claim_elapsed
+    print(
+        f"\nenqueue: {QUEUED_JOBS / enqueue_elapsed:,.0f} jobs/s | "
+        f"claim: {claims_per_sec:,.0f} claims/s"
+    )
+    assert repo.count_by_status()["running"] == claims
+    pool.close_all()
+    # Limite folgado: serve para detectar uma regressão para varredura completa
+    assert claims_per_sec > 100
@@ -0,0 +1,83 @@
+"""
+Microbenchmark: custo por chamada de logger.info com 32 threads, usando um
+FileHandler síncrono e o pipeline QueueHandler/QueueListener.
+
+Execute com: pytest tests/benchmarks -m slow -s
+"""
+
+import logging
+import threading
+import time
+
+import pytest
+
+from src.infrastructure.logging_pipeline import start_queue_logging
+
+THREADS = 32
+CALLS_PER_THREAD = 2_000
+
+
+def _per_call_us(logger: logging.Logger) -> float:
+    """
+    Mede o tempo médio (µs) que cada thread passa dentro de logger.info,
+    como um worker de download registrando o progresso.
+    """
+    barrier = threading.Barrier(THREADS)
+    elapsed = []
+
+    def worker(worker_id: int) -> None:
+        barrier.wait()
+        start = time.perf_counter()
+        for i in range(CALLS_PER_THREAD):
+            logger.info("Worker %d: download %d concluído (%d bytes)", worker_id, i, i)
+        elapsed.append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return sum(elapsed) / (THREADS * CALLS_PER_THREAD) * 1e6
+
+
+def _file_handler(path) -> logging.FileHandler:
+    handler = logging.FileHandler(path, encoding="utf-8")
+    handler.setFormatter(
+        logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    )
+    return handler
+
+
+@pytest.mark.slow
+def test_queue_logging_is_cheaper_per_call(tmp_path):
+    """Compara o custo por chamada do handler síncrono e do pipeline em fila."""
+    # Arrange
+    sync_logger = logging.getLogger("bench.sync")
+    sync_logger.propagate = False
+    sync_logger.setLevel(logging.INFO)
+    sync_handler = _file_handler(tmp_path / "sync.log")
+    sync_logger.addHandler(sync_handler)
+
+    queued_logger = logging.getLogger("bench.queued")
+    queued_logger.propagate = False
+    listener = start_queue_logging(
+        [_file_handler(tmp_path / "queued.log")], logger=queued_logger
+    )
+
+    # Act
+    sync_us = _per_call_us(sync_logger)
+    queued_us = _per_call_us(queued_logger)
+    listener.stop()
+    sync_logger.removeHandler(sync_handler)
+    sync_handler.close()
+
+    # Assert
+    total = THREADS * CALLS_PER_THREAD
+    with open(tmp_path / "queued.log", encoding="utf-8") as log_file:
+        assert sum(1 for _ in log_file) == total
+    print(
+        f"\n{THREADS} threads | FileHandler: {sync_us:.1f} µs/chamada | "
+        f"QueueHandler: {queued_us:.1f} µs/chamada | "
+        f"speedup: {sync_us / queued_us:.1f}x"
+    )
+    assert queued_us < sync_us
@@ -0,0 +1,66 @@
+"""
+Microbenchmark: custo da instrumentação do repositório de vídeos.
+
+Execute com: pytest tests/benchmarks -m slow -s
+"""
+
+import time
+from datetime import datetime
+
+import pytest
+
+from src.domain.entities import Video
+from src.infrastructure.prometheus import MetricsRegistry
+from src.infrastructure.sqlite_pool import SQLiteConnectionPool
+from src.infrastructure.sqlite_repo import SQLiteVideoRepository
+
+ROWS = 1_000
+LOOKUPS = 10_000
+ROUNDS = 5
+
+
+def _ops_per_sec(repo: SQLiteVideoRepository) -> float:
+    """Mede buscas por URL por segundo (metade acertos, metade falhas)."""
+    start = time.perf_counter()
+    for i in range(LOOKUPS):
+        repo.find_by_url(f"https://youtube.com/watch?v={i % (ROWS * 2)}")
+    return LOOKUPS / (time.perf_counter() - start)
+
+
+@pytest.mark.slow
+def test_metrics_overhead_is_small(temp_db_path):
+    """Compara ops/s de find_by_url sem métricas e com MetricsRegistry."""
+    # Arrange
+    pool = SQLiteConnectionPool(temp_db_path)
+    plain = SQLiteVideoRepository(pool=pool)
+    registry = MetricsRegistry()
+    instrumented = SQLiteVideoRepository(pool=pool, metrics=registry)
+    plain.save_many(
+        Video(
+            url=f"https://youtube.com/watch?v={i}",
+            title=f"Video {i}",
+            file_path=f"downloads/{i}.mp4",
+            downloaded_at=datetime(2024, 1, 1),
+        )
+        for i in range(ROWS)
+    )
+    _ops_per_sec(plain)  # aquecimento
+
+    # Act: melhor de várias rodadas intercaladas, para reduzir o ruído
+    plain_ops = instrumented_ops = 0.0
+    for _ in range(ROUNDS):
+        plain_ops = max(plain_ops, _ops_per_sec(plain))
+        instrumented_ops = max(instrumented_ops, _ops_per_sec(instrumented))
+    pool.close_all()
+
+    # Assert
+    overhead = plain_ops / instrumented_ops - 1
+    print(
+        f"\nsem métricas: {plain_ops:,.0f} ops/s | "
+        f"com métricas: {instrumented_ops:,.0f} ops/s | "
+        f"overhead: {overhead:.1%}"
+    )
+    assert registry.value("ytdl_sqlite_query_seconds", operation="find_by_url") == (
+        LOOKUPS * ROUNDS
+    )
+    assert overhead < 0.5
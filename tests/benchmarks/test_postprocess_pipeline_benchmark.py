@@ -0,0 +1,102 @@
+"""
+Benchmark: pós-processamento no worker de download x em um pool de
+processos separado.
+
+A rede é simulada com sleep e o pós-processamento com trabalho de CPU em
+Python puro. Mede quando a etapa de rede termina (o lote devolve todos os
+resultados) e quando todo o trabalho termina.
+
+Execute com: pytest tests/benchmarks -m slow -s
+"""
+
+import os
+import time
+
+import pytest
+
+from src.domain.entities import PostprocessStatus
+from src.domain.services import PostProcessor, VideoDownloaderService
+from src.infrastructure.sqlite_pool import SQLiteConnectionPool
+from src.infrastructure.sqlite_repo import SQLiteVideoRepository
+from src.usecases.download_video_batch import DownloadVideoBatch
+from src.usecases.postprocess_videos import PostprocessVideos
+
+VIDEOS = 12
+DOWNLOAD_WORKERS = 2
+NETWORK_S = 0.05
+CPU_ITERATIONS = 400_000
+
+
+class _CpuBoundProcessor(PostProcessor):
+    """Simula um remux/transcodificação: só CPU, sem alterar o arquivo."""
+
+    def process(self, path, profile=None):
+        sum(i * i for i in range(CPU_ITERATIONS))
+        return None
+
+
+class _SimulatedDownloader(VideoDownloaderService):
+    """Downloader que espera pela "rede" e, opcionalmente, pós-processa."""
+
+    def __init__(self, directory, inline_processor=None):
+        self.directory = directory
+        self.inline_processor = inline_processor
+
+    def download(self, url, stats=None, profile=None):
+        time.sleep(NETWORK_S)
+        path = os.path.join(self.directory, url.rsplit("=", 1)[1] + ".mp4")
+        with open(path, "wb") as file:
+            file.write(b"video")
+        if self.inline_processor is not None:
+            self.inline_processor.process(path, profile)
+        return "Video", path
+
+
+def _run(tmp_path, db_path, deferred):
+    """Baixa o lote e retorna (fim da etapa de rede, fim de tudo), em s."""
+    pool = SQLiteConnectionPool(db_path)
+    repo = SQLiteVideoRepository(pool=pool)
+    processor = _CpuBoundProcessor()
+    postprocess = PostprocessVideos(processor, repo) if deferred else None
+    downloader = _SimulatedDownloader(
+        str(tmp_path), inline_processor=None if deferred else processor
+    )
+    usecase = DownloadVideoBatch(
+        downloader, repo, max_workers=DOWNLOAD_WORKERS, postprocess=postprocess
+    )
+    name = "deferred" if deferred else "inline"
+    urls = [f"https://example.com/watch?v={name}{i}" for i in range(VIDEOS)]
+
+    start = time.perf_counter()
+    results = list(usecase.run(urls))
+    network_done = time.perf_counter() - start
+    if postprocess is not None:
+        postprocess.close()
+    all_done = time.perf_counter() - start
+
+    assert all(result.ok for result in results)
+    if deferred:
+        assert repo.find_by_postprocess_status(PostprocessStatus.PENDING) == []
+    pool.close_all()
+    return network_done, all_done
+
+
+@pytest.mark.slow
+def test_deferred_postprocess_frees_download_workers(tmp_path, temp_db_path):
+    """Compara o pós-processamento no worker de download e em outro pool."""
+    # Act
+    inline = _run(tmp_path, temp_db_path, deferred=False)
+    deferred = _run(tmp_path, temp_db_path, deferred=True)
+
+    # Assert
+    print(f"\nnúcleos: {os.cpu_count()}")
+    for name, (network_done, all_done) in (
+        ("inline", inline),
+        ("deferred", deferred),
+    ):
+        print(
+            f"{name:>8}: rede concluída em {network_done * 1000:6.0f} ms | "
+            f"tudo em {all_done * 1000:6.0f} ms"
+        )
+    # Sem o trabalho de CPU, os workers de download terminam a rede antes
+    assert deferred[0] < inline[0]
@@ -0,0 +1,56 @@
+"""
+Microbenchmark: conexão por chamada vs. pool de conexões persistentes.
+
+Execute com: pytest tests/benchmarks -m slow -s
+"""
+
+import time
+from datetime import datetime
+
+import pytest
+
+from src.domain.entities import Video
+from src.infrastructure.sqlite_pool import SQLiteConnectionPool
+from src.infrastructure.sqlite_repo import SQLiteVideoRepository
+
+ROWS = 2_000
+LOOKUPS = 5_000
+
+
+def _ops_per_sec(repo: SQLiteVideoRepository) -> float:
+    """Mede buscas por URL por segundo (metade acertos, metade falhas)."""
+    start = time.perf_counter()
+    for i in range(LOOKUPS):
+        repo.find_by_url(f"https://youtube.com/watch?v={i % (ROWS * 2)}")
+    return LOOKUPS / (time.perf_counter() - start)
+
+
+@pytest.mark.slow
+def test_pooled_lookups_are_faster(temp_db_path):
+    """Compara ops/s de find_by_url com e sem pool."""
+    # Arrange
+    pool = SQLiteConnectionPool(temp_db_path)
+    pooled = SQLiteVideoRepository(pool=pool)
+    per_call = SQLiteVideoRepository(db_path=temp_db_path)
+    for i in range(ROWS):
+        pooled.save(
+            Video(
+                url=f"https://youtube.com/watch?v={i}",
+                title=f"Video {i}",
+                file_path=f"downloads/{i}.mp4",
+                downloaded_at=datetime(2024, 1, 1),
+            )
+        )
+
+    # Act
+    per_call_ops = _ops_per_sec(per_call)
+    pooled_ops = _ops_per_sec(pooled)
+    pool.close_all()
+
+    # Assert
+    print(
+        f"\nopen-per-call: {per_call_ops:,.0f} ops/s | "
+        f"pooled: {pooled_ops:,.0f} ops/s | "
+        f"speedup: {pooled_ops / per_call_ops:.1f}x"
+    )
+    assert pooled_ops > per_call_ops
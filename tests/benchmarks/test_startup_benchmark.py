@@ -0,0 +1,47 @@
+"""
+Benchmark de inicialização a frio do main.py, medido com -X importtime.
+
+Falha se o tempo de importação ultrapassar o orçamento definido abaixo.
+Execute com: pytest tests/benchmarks -m slow -s
+"""
+
+import re
+import subprocess
+import sys
+
+import pytest
+
+# Orçamento de importação do main.py (microssegundos). Importar o yt-dlp
+# sozinho já custa várias centenas de milissegundos.
+STARTUP_BUDGET_US = 150_000
+RUNS = 5
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s+\d+ \|\s+(\d+) \|\s+(\S.*)$")
+
+
+def _cumulative_import_us(module: str) -> int:
+    """Roda um interpretador novo e devolve o tempo cumulativo de um import."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match and match.group(2).strip() == module:
+            return int(match.group(1))
+    raise AssertionError(f"{module} não encontrado na saída de -X importtime")
+
+
+@pytest.mark.slow
+def test_main_cold_start_within_budget():
+    """Testa que importar o main.py fica dentro do orçamento."""
+    # Act - usa a melhor de algumas execuções para reduzir ruído
+    best = min(_cumulative_import_us("main") for _ in range(RUNS))
+
+    # Assert
+    print(
+        f"\nimport main: {best / 1000:.1f} ms (orçamento: {STARTUP_BUDGET_US / 1000:.0f} ms)"
+    )
+    assert best < STARTUP_BUDGET_US
@@ -31,11 +31,12 @@ def temp_db_path():
 
     yield path
 
-    # Cleanup
-    try:
-        os.unlink(path)
-    except:
-        pass
+    # Cleanup (inclui os arquivos auxiliares do modo WAL)
+    for suffix in ("", "-wal", "-shm"):
+        try:
+            os.unlink(path + suffix)
+        except:
+            pass
 
 
 @pytest.fixture
@@ -3,10 +3,11 @@ Testes unitários para entidades do domínio.
 """
 
 from datetime import datetime
+from unittest.mock import patch
 
 import pytest
 
-from src.domain.entities import Video
+from src.domain.entities import DownloadStats, Video
 
 
 class TestVideo:
@@ -61,3 +62,35 @@ class TestVideo:
 
         # Act & Assert
         assert video1 == video2
+
+
+class TestDownloadStats:
+    """Testes para a entidade DownloadStats."""
+
+    def test_phase_accumulates_time(self):
+        """Testa que phase() soma o tempo medido ao campo da fase."""
+        # Arrange
+        stats = DownloadStats(url="https://example.com/v", started_at=datetime.now())
+
+        # Act
+        with patch("src.domain.entities.time.perf_counter", side_effect=[1.0, 1.5]):
+            with stats.phase("lookup"):
+                pass
+        stats.add("lookup", 0.25)
+
+        # Assert
+        assert stats.lookup_s == pytest.approx(0.75)
+
+    def test_speed(self):
+        """Testa a velocidade média da transferência."""
+        # Arrange
+        stats = DownloadStats(
+            url="https://example.com/v",
+            started_at=datetime.now(),
+            transfer_s=2.0,
+            bytes_downloaded=1000,
+        )
+
+        # Act / Assert
+        assert stats.speed == 500.0
+        assert DownloadStats(url="x", started_at=datetime.now()).speed == 0.0
@@ -8,6 +8,7 @@ from src.domain.exceptions import (
     DomainException,
     DownloadFailedException,
     InvalidURLException,
+    JobQueueException,
     VideoNotSavedException,
 )
 
@@ -60,12 +61,21 @@ class TestExceptions:
         assert isinstance(exc, DomainException)
         assert reason in str(exc)
 
+    def test_job_queue_exception(self):
+        """Testa JobQueueException."""
+        reason = "database is locked"
+        exc = JobQueueException(reason)
+
+        assert isinstance(exc, DomainException)
+        assert reason in str(exc)
+
     def test_exceptions_can_be_caught_as_domain_exception(self):
         """Testa que todas as exceções podem ser capturadas como DomainException."""
         exceptions = [
             InvalidURLException("test"),
             DownloadFailedException("url", "reason"),
             VideoNotSavedException("reason"),
+            JobQueueException("reason"),
         ]
 
         for exc in exceptions:
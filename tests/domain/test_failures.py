@@ -0,0 +1,78 @@
+"""
+Testes unitários para a classificação de falhas de download.
+"""
+
+import pytest
+
+from src.domain.failures import FailureCategory, classify_failure
+
+
+class TestClassifyFailure:
+    """Testes para classify_failure."""
+
+    @pytest.mark.parametrize(
+        "reason, category",
+        [
+            ("HTTP Error 429: Too Many Requests", FailureCategory.RATE_LIMITED),
+            ("HTTP Error 503: Service Unavailable", FailureCategory.SERVER_ERROR),
+            ("HTTP Error 502: Bad Gateway", FailureCategory.SERVER_ERROR),
+            ("HTTP Error 504", FailureCategory.SERVER_ERROR),
+            ("Unable to extract video 503 of the playlist", FailureCategory.UNKNOWN),
+            ("The read operation timed out", FailureCategory.TIMEOUT),
+            ("Tempo limite de 30s excedido", FailureCategory.TIMEOUT),
+            ("[Errno 104] Connection reset by peer", FailureCategory.NETWORK),
+            (
+                "Private video. Sign in if you've been granted access",
+                FailureCategory.PRIVATE,
+            ),
+            (
+                "Sign in to confirm you’re not a bot",
+                FailureCategory.RATE_LIMITED,
+            ),
+            ("Sign in to confirm you're not a bot", FailureCategory.RATE_LIMITED),
+            ("Video unavailable", FailureCategory.UNAVAILABLE),
+            (
+                "This video has been removed by the uploader",
+                FailureCategory.UNAVAILABLE,
+            ),
+            ("HTTP Error 404: Not Found", FailureCategory.UNAVAILABLE),
+            (
+                "The uploader has not made this video available in your country",
+                FailureCategory.GEO_BLOCKED,
+            ),
+            ("Unsupported URL: https://example.com", FailureCategory.UNSUPPORTED),
+            ("Erro inesperado", FailureCategory.UNKNOWN),
+            ("", FailureCategory.UNKNOWN),
+            (None, FailureCategory.UNKNOWN),
+        ],
+    )
+    def test_categories(self, reason, category):
+        """Testa a classificação de mensagens de erro comuns do yt-dlp."""
+        assert classify_failure(reason) is category
+
+    @pytest.mark.parametrize(
+        "category",
+        [
+            FailureCategory.RATE_LIMITED,
+            FailureCategory.SERVER_ERROR,
+            FailureCategory.TIMEOUT,
+            FailureCategory.NETWORK,
+            FailureCategory.UNKNOWN,
+        ],
+    )
+    def test_retryable_categories(self, category):
+        """Testa que falhas transitórias podem ser retentadas."""
+        assert category.retryable is True
+
+    @pytest.mark.parametrize(
+        "category",
+        [
+            FailureCategory.PRIVATE,
+            FailureCategory.UNAVAILABLE,
+            FailureCategory.GEO_BLOCKED,
+            FailureCategory.UNSUPPORTED,
+        ],
+    )
+    def test_permanent_categories(self, category):
+        """Testa que falhas permanentes não são retentadas."""
+        assert category.retryable is False
@@ -0,0 +1,125 @@
+"""
+Testes unitários para a canonicalização de URLs de vídeo.
+"""
+
+import pytest
+
+from src.domain.video_key import canonical_video_key, channel_key, is_collection_url
+
+
+class TestCanonicalVideoKey:
+    """Testes para canonical_video_key."""
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+            "https://youtube.com/watch?v=dQw4w9WgXcQ&t=10s",
+            "http://m.youtube.com/watch?feature=share&v=dQw4w9WgXcQ",
+            "https://music.youtube.com/watch?v=dQw4w9WgXcQ&list=RDdQw4w9WgXcQ",
+            "https://youtu.be/dQw4w9WgXcQ",
+            "https://youtu.be/dQw4w9WgXcQ?si=abc&t=42",
+            "https://www.youtube.com/shorts/dQw4w9WgXcQ",
+            "https://www.youtube.com/embed/dQw4w9WgXcQ?autoplay=1",
+            "https://www.youtube-nocookie.com/embed/dQw4w9WgXcQ",
+            "https://www.youtube.com/live/dQw4w9WgXcQ",
+            "  https://WWW.YOUTUBE.COM/watch?v=dQw4w9WgXcQ  ",
+        ],
+    )
+    def test_youtube_variants_share_key(self, url):
+        """Testa que variações de URL do YouTube geram a mesma chave."""
+        assert canonical_video_key(url) == "youtube:dQw4w9WgXcQ"
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "https://vimeo.com/76979871",
+            "https://player.vimeo.com/video/76979871?h=abc",
+        ],
+    )
+    def test_vimeo_variants_share_key(self, url):
+        """Testa que variações de URL do Vimeo geram a mesma chave."""
+        assert canonical_video_key(url) == "vimeo:76979871"
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "https://youtube.com/watch?v=123",
+            "https://www.youtube.com/playlist?list=PL123",
+            "https://www.youtube.com/@canal",
+            "https://example.com/watch?v=dQw4w9WgXcQ",
+            "not-a-url",
+            "",
+            None,
+        ],
+    )
+    def test_unknown_urls_have_no_key(self, url):
+        """Testa que URLs não reconhecidas não geram chave."""
+        assert canonical_video_key(url) is None
+
+
+class TestIsCollectionURL:
+    """Testes para is_collection_url."""
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "https://www.youtube.com/playlist?list=PL123",
+            "https://www.youtube.com/@canal",
+            "https://www.youtube.com/@canal/videos",
+            "https://youtube.com/channel/UC1234567890",
+            "https://www.youtube.com/c/Canal",
+            "https://www.youtube.com/user/canal",
+            "https://vimeo.com/channels/staffpicks",
+            "https://vimeo.com/showcase/123",
+        ],
+    )
+    def test_collections(self, url):
+        """Testa que playlists e canais são reconhecidos."""
+        assert is_collection_url(url) is True
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ&list=PL123",
+            "https://youtu.be/dQw4w9WgXcQ",
+            "https://vimeo.com/76979871",
+            "https://www.youtube.com/",
+            "https://example.com/playlist?list=1",
+            "not-a-url",
+        ],
+    )
+    def test_single_videos_and_others(self, url):
+        """Testa que vídeos e URLs desconhecidas não são coleções."""
+        assert is_collection_url(url) is False
+
+
+class TestChannelKey:
+    """Testes para channel_key."""
+
+    @pytest.mark.parametrize(
+        "url, key",
+        [
+            ("https://www.youtube.com/@Canal", "youtube:@canal"),
+            ("https://youtube.com/@canal/videos?view=0", "youtube:@canal"),
+            ("https://www.youtube.com/channel/UCabc/videos", "youtube:channel:UCabc"),
+            ("https://www.youtube.com/c/Canal", "youtube:c:canal"),
+            ("https://vimeo.com/channels/StaffPicks", "vimeo:channels:staffpicks"),
+        ],
+    )
+    def test_channels(self, url, key):
+        """Testa a chave de canais, ignorando abas e maiúsculas."""
+        assert channel_key(url) == key
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "https://www.youtube.com/playlist?list=PL123",
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+            "https://vimeo.com/showcase/123",
+            "https://example.com/@canal",
+        ],
+    )
+    def test_non_channels(self, url):
+        """Testa que playlists e vídeos não têm chave de canal."""
+        assert channel_key(url) is None
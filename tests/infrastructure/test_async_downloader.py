@@ -0,0 +1,99 @@
+"""
+Testes unitários para ExecutorAsyncDownloader.
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from src.domain.exceptions import DownloadFailedException
+from src.infrastructure.async_downloader import ExecutorAsyncDownloader
+
+
+class TestExecutorAsyncDownloader:
+    """Testes para o adaptador assíncrono de downloads."""
+
+    def test_download_runs_in_executor(self):
+        """Testa que o download roda fora da thread do event loop."""
+        # Arrange
+        threads = []
+
+        def download(url):
+            threads.append(threading.current_thread())
+            return "Video", "downloads/video.mp4"
+
+        mock_downloader = Mock()
+        mock_downloader.download.side_effect = download
+
+        async def scenario():
+            async with ExecutorAsyncDownloader(mock_downloader) as downloader:
+                return await downloader.download("https://youtube.com/watch?v=1")
+
+        # Act
+        result = asyncio.run(scenario())
+
+        # Assert
+        assert result == ("Video", "downloads/video.mp4")
+        assert threads[0] is not threading.main_thread()
+        mock_downloader.close.assert_called_once()
+
+    def test_concurrency_is_bounded(self):
+        """Testa que no máximo max_workers downloads rodam ao mesmo tempo."""
+        # Arrange
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def download(url):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.02)
+            with lock:
+                state["active"] -= 1
+            return "Video", url
+
+        mock_downloader = Mock()
+        mock_downloader.download.side_effect = download
+
+        async def scenario():
+            async with ExecutorAsyncDownloader(mock_downloader, max_workers=2) as d:
+                await asyncio.gather(*(d.download(str(i)) for i in range(6)))
+
+        # Act
+        asyncio.run(scenario())
+
+        # Assert
+        assert state["peak"] == 2
+
+    def test_run_blocking_uses_download_executor(self):
+        """Testa que run_blocking roda no mesmo pool limitado dos downloads."""
+
+        # Arrange
+        async def scenario():
+            async with ExecutorAsyncDownloader(Mock(), max_workers=1) as downloader:
+                return await downloader.run_blocking(
+                    lambda: threading.current_thread().name
+                )
+
+        # Act
+        name = asyncio.run(scenario())
+
+        # Assert
+        assert name.startswith("async-download")
+
+    def test_errors_propagate(self):
+        """Testa que exceções do downloader síncrono são propagadas."""
+        # Arrange
+        mock_downloader = Mock()
+        mock_downloader.download.side_effect = DownloadFailedException("u", "x")
+
+        async def scenario():
+            async with ExecutorAsyncDownloader(mock_downloader) as downloader:
+                await downloader.download("u")
+
+        # Act & Assert
+        with pytest.raises(DownloadFailedException):
+            asyncio.run(scenario())
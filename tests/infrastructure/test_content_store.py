@@ -0,0 +1,227 @@
+"""
+Testes unitários para ContentAddressedStore.
+"""
+
+import hashlib
+import os
+import pickle
+from unittest.mock import patch
+
+from src.infrastructure.content_store import ContentAddressedStore
+
+DATA = b"conteudo do video " * 1000
+DIGEST = hashlib.sha256(DATA).hexdigest()
+
+
+def _write(path, data=DATA):
+    with open(path, "wb") as file:
+        file.write(data)
+    return str(path)
+
+
+class TestContentAddressedStore:
+    """Testes para o armazenamento endereçado por conteúdo."""
+
+    def test_store_creates_blob_linked_to_file(self, tmp_path):
+        """Testa que o primeiro arquivo vira o blob (mesmo inode)."""
+        # Arrange
+        store = ContentAddressedStore(root=str(tmp_path / ".objects"))
+        path = _write(tmp_path / "a.mp4")
+
+        # Act
+        digest = store.store(path)
+
+        # Assert
+        assert digest == DIGEST
+        blob = store.blob_path(DIGEST)
+        assert blob == str(tmp_path / ".objects" / DIGEST[:2] / DIGEST)
+        assert os.path.samefile(path, blob)
+
+    def test_duplicate_becomes_hardlink(self, tmp_path):
+        """Testa que uma cópia idêntica passa a apontar para o mesmo blob."""
+        # Arrange
+        store = ContentAddressedStore(root=str(tmp_path / ".objects"))
+        first = _write(tmp_path / "a.mp4")
+        second = _write(tmp_path / "b.mp4")
+        store.store(first)
+
+        # Act
+        digest = store.store(second)
+
+        # Assert
+        assert digest == DIGEST
+        assert os.path.samefile(first, second)
+        assert os.stat(second).st_nlink == 3
+        with open(second, "rb") as file:
+            assert file.read() == DATA
+
+    def test_different_content_is_not_linked(self, tmp_path):
+        """Testa que arquivos diferentes ficam em blobs diferentes."""
+        # Arrange
+        store = ContentAddressedStore(root=str(tmp_path / ".objects"))
+        first = _write(tmp_path / "a.mp4")
+        second = _write(tmp_path / "b.mp4", b"outro")
+
+        # Act
+        store.store(first)
+        digest = store.store(second)
+
+        # Assert
+        assert digest == hashlib.sha256(b"outro").hexdigest()
+        assert not os.path.samefile(first, second)
+
+    def test_store_missing_file(self, tmp_path):
+        """Testa que um arquivo inexistente não gera hash."""
+        store = ContentAddressedStore(root=str(tmp_path / ".objects"))
+
+        assert store.store(str(tmp_path / "nao_existe.mp4")) is None
+
+    def test_store_without_links_keeps_file(self, tmp_path):
+        """Testa que, sem hardlink nem reflink, o arquivo é mantido."""
+        # Arrange
+        store = ContentAddressedStore(root=str(tmp_path / ".objects"))
+        path = _write(tmp_path / "a.mp4")
+
+        # Act
+        with patch("os.link", side_effect=OSError("EXDEV")), patch(
+            "src.infrastructure.content_store._reflink", side_effect=OSError
+        ):
+            digest = store.store(path)
+
+        # Assert
+        assert digest == DIGEST
+        assert not os.path.exists(store.blob_path(DIGEST))
+        assert os.path.exists(path)
+
+    def test_hash_computed_from_progress_hooks(self, tmp_path):
+        """
+        Testa que o hash é calculado durante o download e que store() não
+        lê o arquivo de novo.
+        """
+        # Arrange
+        store = ContentAddressedStore(root=str(tmp_path / ".objects"), chunk_size=4)
+        final = str(tmp_path / "a.mp4")
+        part = final + ".part"
+        _write(part, DATA[:5000])
+        store.on_progress(
+            {
+                "status": "downloading",
+                "filename": final,
+                "tmpfilename": part,
+                "downloaded_bytes": 5000,
+            }
+        )
+        _write(part, DATA)
+        os.replace(part, final)
+
+        # Act
+        store.on_progress(
+            {"status": "finished", "filename": final, "downloaded_bytes": len(DATA)}
+        )
+        with patch.object(store, "hash_file") as hash_file:
+            digest = store.store(final)
+
+        # Assert
+        assert digest == DIGEST
+        hash_file.assert_not_called()
+
+    def test_streamed_hash_survives_rename(self, tmp_path):
+        """Testa que o hash incremental vale após renomear o arquivo."""
+        # Arrange
+        store = ContentAddressedStore(root=str(tmp_path / ".objects"))
+        temp = _write(tmp_path / "a.incomplete.mp4")
+        store.on_progress({"status": "finished", "filename": temp})
+        final = str(tmp_path / "a.mp4")
+        os.replace(temp, final)
+
+        # Act
+        with patch.object(store, "hash_file") as hash_file:
+            digest = store.store(final)
+
+        # Assert
+        assert digest == DIGEST
+        hash_file.assert_not_called()
+
+    def test_hash_recomputed_if_file_changed(self, tmp_path):
+        """Testa que o hash incremental é descartado se o arquivo mudar."""
+        # Arrange
+        store = ContentAddressedStore(root=str(tmp_path / ".objects"))
+        final = _write(tmp_path / "a.mp4", b"original")
+        store.on_progress({"status": "finished", "filename": final})
+        _write(final, DATA)
+
+        # Act
+        digest = store.store(final)
+
+        # Assert
+        assert digest == DIGEST
+
+    def test_restarted_download_rehashes_from_start(self, tmp_path):
+        """Testa que um .part recomeçado do zero reinicia o hash."""
+        # Arrange
+        store = ContentAddressedStore(root=str(tmp_path / ".objects"), chunk_size=1)
+        final = str(tmp_path / "a.mp4")
+        _write(final, b"x" * 100)
+        store.on_progress(
+            {"status": "downloading", "filename": final, "downloaded_bytes": 100}
+        )
+        _write(final, DATA[:10])
+
+        # Act
+        store.on_progress({"status": "finished", "filename": final})
+
+        # Assert
+        with patch.object(store, "hash_file") as hash_file:
+            assert store.store(final) == hashlib.sha256(DATA[:10]).hexdigest()
+        hash_file.assert_not_called()
+
+    def test_prune_removes_unused_blobs(self, tmp_path):
+        """Testa que só os blobs sem vídeo no repositório são removidos."""
+        # Arrange
+        store = ContentAddressedStore(root=str(tmp_path / ".objects"))
+        kept = _write(tmp_path / "a.mp4")
+        removed = _write(tmp_path / "b.mp4", b"outro")
+        store.store(kept)
+        store.store(removed)
+
+        # Act
+        count = store.prune([DIGEST])
+
+        # Assert
+        assert count == 1
+        assert os.path.exists(store.blob_path(DIGEST))
+        assert not os.path.exists(store.blob_path(hashlib.sha256(b"outro").hexdigest()))
+
+    def test_prune_keeps_referenced_blob_with_single_link(self, tmp_path):
+        """Testa que um blob em uso com um único link (reflink) é mantido."""
+        # Arrange
+        store = ContentAddressedStore(root=str(tmp_path / ".objects"))
+        path = _write(tmp_path / "a.mp4")
+        store.store(path)
+        os.unlink(path)
+
+        # Act
+        count = store.prune({DIGEST})
+
+        # Assert
+        assert count == 0
+        assert os.path.exists(store.blob_path(DIGEST))
+
+    def test_prune_without_root(self, tmp_path):
+        """Testa prune() antes de qualquer blob existir."""
+        store = ContentAddressedStore(root=str(tmp_path / ".objects"))
+
+        assert store.prune(set()) == 0
+
+    def test_pickle_round_trip(self, tmp_path):
+        """Testa que o store pode ser enviado a outro processo (pickle)."""
+        # Arrange
+        store = ContentAddressedStore(root=str(tmp_path / ".objects"))
+        path = _write(tmp_path / "a.mp4")
+
+        # Act
+        copy = pickle.loads(pickle.dumps(store))
+
+        # Assert
+        assert copy.store(path) == DIGEST
+        assert os.path.samefile(path, store.blob_path(DIGEST))
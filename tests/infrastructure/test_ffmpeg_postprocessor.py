@@ -0,0 +1,139 @@
+"""
+Testes unitários para FFmpegPostProcessor.
+"""
+
+import os
+import pickle
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from src.domain.entities import FormatProfile
+from src.domain.exceptions import PostprocessFailedException
+from src.infrastructure.ffmpeg_postprocessor import FFmpegPostProcessor, is_mpegts
+
+# Dois pacotes MPEG-TS (188 bytes, começando pelo byte de sincronismo)
+TS_DATA = (b"\x47" + b"\x00" * 187) * 2
+MP4_DATA = b"\x00\x00\x00\x20ftypisom" + b"\x00" * 400
+
+
+def _write(path, data):
+    path.write_bytes(data)
+    return str(path)
+
+
+def _fake_ffmpeg(returncode=0, stderr=""):
+    """Simula o ffmpeg: grava o arquivo de saída (último argumento)."""
+
+    def run(command, **kwargs):
+        if returncode == 0:
+            with open(command[-1], "wb") as file:
+                file.write(MP4_DATA)
+        return subprocess.CompletedProcess(command, returncode, "", stderr)
+
+    return run
+
+
+@pytest.fixture
+def ffmpeg_installed():
+    with patch("shutil.which", return_value="/usr/bin/ffmpeg"):
+        yield
+
+
+class TestFFmpegPostProcessor:
+    """Testes para o pós-processamento com ffmpeg."""
+
+    def test_is_mpegts(self, tmp_path):
+        """Testa a detecção de MPEG-TS pelo byte de sincronismo."""
+        assert is_mpegts(_write(tmp_path / "a.mp4", TS_DATA))
+        assert not is_mpegts(_write(tmp_path / "b.mp4", MP4_DATA))
+        assert not is_mpegts(_write(tmp_path / "c.mp4", b"\x47"))
+
+    def test_mp4_file_is_untouched(self, tmp_path, ffmpeg_installed):
+        """Testa que um MP4 de verdade, sem perfil de áudio, não é alterado."""
+        path = _write(tmp_path / "a.mp4", MP4_DATA)
+
+        with patch("subprocess.run") as run:
+            assert FFmpegPostProcessor().process(path) is None
+
+        run.assert_not_called()
+
+    def test_mpegts_is_remuxed_in_place(self, tmp_path, ffmpeg_installed):
+        """Testa o remux de MPEG-TS para MP4, mantendo o nome."""
+        # Arrange
+        path = _write(tmp_path / "a.mp4", TS_DATA)
+
+        # Act
+        with patch("subprocess.run", side_effect=_fake_ffmpeg()) as run:
+            result = FFmpegPostProcessor().process(path)
+
+        # Assert
+        command = run.call_args.args[0]
+        assert result == path
+        assert command[0] == "/usr/bin/ffmpeg"
+        assert ["-bsf:a", "aac_adtstoasc"] == command[-5:-3]
+        assert ["-c", "copy"] == command[command.index("-c") : command.index("-c") + 2]
+        assert "-vn" not in command
+        with open(path, "rb") as file:
+            assert file.read() == MP4_DATA
+        assert os.listdir(tmp_path) == ["a.mp4"]
+
+    def test_audio_profile_extracts_audio(self, tmp_path, ffmpeg_installed):
+        """Testa que o perfil de áudio gera um .m4a e remove o original."""
+        # Arrange
+        path = _write(tmp_path / "a.mp4", MP4_DATA)
+
+        # Act
+        with patch("subprocess.run", side_effect=_fake_ffmpeg()) as run:
+            result = FFmpegPostProcessor().process(path, FormatProfile.AUDIO)
+
+        # Assert
+        assert result == str(tmp_path / "a.m4a")
+        assert "-vn" in run.call_args.args[0]
+        assert "aac_adtstoasc" not in run.call_args.args[0]
+        assert os.listdir(tmp_path) == ["a.m4a"]
+
+    def test_audio_keeps_existing_m4a(self, tmp_path, ffmpeg_installed):
+        """Testa que um .m4a já existente não é sobrescrito."""
+        # Arrange
+        path = _write(tmp_path / "a.mp4", MP4_DATA)
+        existing = _write(tmp_path / "a.m4a", b"outro audio")
+
+        # Act
+        with patch("subprocess.run", side_effect=_fake_ffmpeg()):
+            result = FFmpegPostProcessor().process(path, FormatProfile.AUDIO)
+
+        # Assert
+        assert result == str(tmp_path / "a-1.m4a")
+        with open(existing, "rb") as file:
+            assert file.read() == b"outro audio"
+        assert sorted(os.listdir(tmp_path)) == ["a-1.m4a", "a.m4a"]
+
+    def test_ffmpeg_error(self, tmp_path, ffmpeg_installed):
+        """Testa que um erro do ffmpeg levanta exceção e mantém o original."""
+        # Arrange
+        path = _write(tmp_path / "a.mp4", TS_DATA)
+        run = _fake_ffmpeg(returncode=1, stderr="aviso\nInvalid data found\n")
+
+        # Act & Assert
+        with patch("subprocess.run", side_effect=run):
+            with pytest.raises(PostprocessFailedException) as excinfo:
+                FFmpegPostProcessor().process(path)
+        assert excinfo.value.reason == "Invalid data found"
+        assert os.listdir(tmp_path) == ["a.mp4"]
+
+    def test_without_ffmpeg(self, tmp_path):
+        """Testa que, sem ffmpeg, o arquivo é mantido como está."""
+        path = _write(tmp_path / "a.mp4", TS_DATA)
+
+        with patch("shutil.which", return_value=None), patch("subprocess.run") as run:
+            assert FFmpegPostProcessor().process(path) is None
+
+        run.assert_not_called()
+
+    def test_exception_survives_pickle(self):
+        """Testa que a exceção volta intacta de um processo do pool."""
+        error = pickle.loads(pickle.dumps(PostprocessFailedException("a.mp4", "x")))
+
+        assert (error.path, error.reason) == ("a.mp4", "x")
@@ -0,0 +1,141 @@
+"""
+Testes unitários para o pipeline de logging assíncrono.
+"""
+
+import json
+import logging
+import sys
+import threading
+
+import pytest
+
+from src.infrastructure.logging_pipeline import JsonLinesFormatter, start_queue_logging
+
+
+class ListHandler(logging.Handler):
+    """Handler que guarda as mensagens formatadas e a thread que as escreveu."""
+
+    def __init__(self):
+        super().__init__()
+        self.lines = []
+        self.threads = set()
+
+    def emit(self, record):
+        self.threads.add(threading.current_thread().name)
+        self.lines.append(self.format(record))
+
+
+@pytest.fixture
+def pipeline_logger():
+    """Logger isolado (sem propagação para o logger raiz)."""
+    logger = logging.getLogger("tests.logging_pipeline")
+    logger.propagate = False
+    yield logger
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+
+
+class TestStartQueueLogging:
+    """Testes para o QueueHandler/QueueListener."""
+
+    def test_records_are_written_by_listener_thread(self, pipeline_logger):
+        """Testa que a escrita acontece fora da thread que registrou o log."""
+        # Arrange
+        handler = ListHandler()
+        listener = start_queue_logging([handler], logger=pipeline_logger)
+
+        # Act
+        pipeline_logger.info("Download concluído: %s (%d bytes)", "Video", 1024)
+        listener.stop()
+
+        # Assert
+        assert handler.lines == ["Download concluído: Video (1024 bytes)"]
+        assert "MainThread" not in handler.threads
+
+    def test_mutable_args_are_frozen_when_logged(self, pipeline_logger):
+        """Testa que argumentos mutáveis valem pelo estado no momento do log."""
+        # Arrange
+        handler = ListHandler()
+        listener = start_queue_logging([handler], logger=pipeline_logger)
+        pending = ["a"]
+
+        # Act
+        pipeline_logger.info("Pendentes: %s", pending)
+        pending.append("b")
+        listener.stop()
+
+        # Assert
+        assert handler.lines == ["Pendentes: ['a']"]
+
+    def test_level_filters_before_queueing(self, pipeline_logger):
+        """Testa que mensagens abaixo do nível não entram na fila."""
+        # Arrange
+        handler = ListHandler()
+        listener = start_queue_logging(
+            [handler], level=logging.WARNING, logger=pipeline_logger
+        )
+
+        # Act
+        pipeline_logger.info("ignorada")
+        pipeline_logger.warning("registrada")
+        listener.stop()
+
+        # Assert
+        assert handler.lines == ["registrada"]
+
+    def test_exception_traceback_survives_queue(self, pipeline_logger):
+        """Testa que o traceback de logger.exception chega ao handler."""
+        # Arrange
+        handler = ListHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        listener = start_queue_logging([handler], logger=pipeline_logger)
+
+        # Act
+        try:
+            raise ValueError("falhou")
+        except ValueError:
+            pipeline_logger.exception("Erro fatal")
+        listener.stop()
+
+        # Assert
+        assert "Erro fatal" in handler.lines[0]
+        assert "ValueError: falhou" in handler.lines[0]
+
+
+class TestJsonLinesFormatter:
+    """Testes para o formato JSON lines."""
+
+    def test_format_includes_fields_and_extra(self):
+        """Testa os campos padrão e os campos de extra=..."""
+        # Arrange
+        record = logging.LogRecord(
+            "src.usecases", logging.INFO, __file__, 1, "Job %s", (7,), None
+        )
+        record.url = "https://youtube.com/watch?v=1"
+
+        # Act
+        data = json.loads(JsonLinesFormatter().format(record))
+
+        # Assert
+        assert data["message"] == "Job 7"
+        assert data["level"] == "INFO"
+        assert data["logger"] == "src.usecases"
+        assert data["url"] == "https://youtube.com/watch?v=1"
+        assert "time" in data and "thread" in data
+        assert "args" not in data and "msg" not in data
+
+    def test_format_includes_exception(self):
+        """Testa que exceções são serializadas no campo exception."""
+        # Arrange
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError:
+            record = logging.LogRecord(
+                "x", logging.ERROR, __file__, 1, "Erro", (), sys.exc_info()
+            )
+
+        # Act
+        data = json.loads(JsonLinesFormatter().format(record))
+
+        # Assert
+        assert "RuntimeError: boom" in data["exception"]
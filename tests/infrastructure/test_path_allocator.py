@@ -0,0 +1,153 @@
+"""
+Testes unitários para PathAllocator.
+"""
+
+import os
+import subprocess
+import sys
+import threading
+
+from src.infrastructure.path_allocator import PathAllocator
+
+
+class TestPathAllocator:
+    """Testes para a alocação de caminhos de saída."""
+
+    def test_reserve_shards_by_key(self, tmp_path):
+        """Testa que o caminho fica em subdiretórios derivados da chave."""
+        # Arrange
+        allocator = PathAllocator(root=str(tmp_path))
+
+        # Act
+        reservation = allocator.reserve("youtube:dQw4w9WgXcQ")
+
+        # Assert
+        relative = os.path.relpath(reservation.directory, tmp_path)
+        shards = relative.split(os.sep)
+        assert len(shards) == 2 and all(len(shard) == 2 for shard in shards)
+        assert reservation.stem == "youtube-dQw4w9WgXcQ"
+        assert reservation.template == os.path.join(
+            reservation.directory, "youtube-dQw4w9WgXcQ.incomplete.%(ext)s"
+        )
+        assert allocator.reserve("youtube:dQw4w9WgXcQ").directory == (
+            reservation.directory
+        )
+
+    def test_unsafe_key_is_hashed(self, tmp_path):
+        """Testa que chaves com caracteres inválidos viram um nome seguro."""
+        # Arrange
+        allocator = PathAllocator(root=str(tmp_path))
+
+        # Act
+        slug = allocator.slug("https://example.com/a b/<video>?x=1")
+
+        # Assert
+        assert slug.startswith("url-")
+        assert all(char.isalnum() or char in "-_" for char in slug)
+
+    def test_reserved_name_gets_suffix(self, tmp_path):
+        """Testa que uma reserva ativa não é entregue a outro worker."""
+        # Arrange
+        allocator = PathAllocator(root=str(tmp_path))
+        first = allocator.reserve("youtube:abc")
+
+        # Act
+        second = allocator.reserve("youtube:abc")
+
+        # Assert
+        assert first.stem == "youtube-abc"
+        assert second.stem == "youtube-abc-1"
+
+    def test_release_frees_name(self, tmp_path):
+        """Testa que o nome volta a ficar disponível após release()."""
+        # Arrange
+        allocator = PathAllocator(root=str(tmp_path))
+        allocator.release(allocator.reserve("youtube:abc"))
+
+        # Act
+        reservation = allocator.reserve("youtube:abc")
+
+        # Assert
+        assert reservation.stem == "youtube-abc"
+        assert not os.path.exists(
+            os.path.join(reservation.directory, "youtube-abc-1.lock")
+        )
+
+    def test_concurrent_reservations_are_unique(self, tmp_path):
+        """Testa que várias threads nunca recebem o mesmo nome."""
+        # Arrange
+        allocator = PathAllocator(root=str(tmp_path))
+        stems = []
+        barrier = threading.Barrier(16)
+
+        def worker():
+            barrier.wait()
+            stems.append(allocator.reserve("youtube:abc").stem)
+
+        threads = [threading.Thread(target=worker) for _ in range(16)]
+
+        # Act
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        assert len(set(stems)) == 16
+
+    def test_reservation_of_dead_process_is_reused(self, tmp_path):
+        """Testa que a reserva some quando o processo dono termina."""
+        # Arrange
+        code = (
+            "from src.infrastructure.path_allocator import PathAllocator; "
+            f"PathAllocator(root={str(tmp_path)!r}).reserve('youtube:abc')"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+        allocator = PathAllocator(root=str(tmp_path))
+
+        # Act
+        reservation = allocator.reserve("youtube:abc")
+
+        # Assert
+        assert reservation.stem == "youtube-abc"
+
+    def test_finalize_moves_to_final_name(self, tmp_path):
+        """Testa que o arquivo temporário é movido para o nome final."""
+        # Arrange
+        allocator = PathAllocator(root=str(tmp_path))
+        reservation = allocator.reserve("youtube:abc")
+        temp = reservation.template % {"ext": "mp4"}
+        with open(temp, "wb") as file:
+            file.write(b"video")
+
+        # Act
+        final = allocator.finalize(temp)
+
+        # Assert
+        assert final == os.path.join(reservation.directory, "youtube-abc.mp4")
+        assert not os.path.exists(temp)
+        with open(final, "rb") as file:
+            assert file.read() == b"video"
+
+    def test_finalize_does_not_overwrite_existing_file(self, tmp_path):
+        """Testa que finalize não sobrescreve um arquivo final existente."""
+        # Arrange
+        allocator = PathAllocator(root=str(tmp_path))
+        reservation = allocator.reserve("youtube:abc")
+        temp = reservation.template % {"ext": "mp4"}
+        existing = os.path.join(reservation.directory, "youtube-abc.mp4")
+        with open(existing, "wb") as file:
+            file.write(b"anterior")
+        with open(temp, "wb") as file:
+            file.write(b"video")
+
+        # Act
+        final = allocator.finalize(temp)
+
+        # Assert
+        assert final == os.path.join(reservation.directory, "youtube-abc-1.mp4")
+        assert not os.path.exists(temp)
+        with open(existing, "rb") as file:
+            assert file.read() == b"anterior"
+        with open(final, "rb") as file:
+            assert file.read() == b"video"
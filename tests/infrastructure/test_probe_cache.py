@@ -0,0 +1,105 @@
+"""
+Testes unitários para ProbeCache.
+"""
+
+import sqlite3
+from unittest.mock import patch
+
+from src.infrastructure.probe_cache import ProbeCache
+
+INFO = {"id": "abc", "title": "Video", "formats": [{"format_id": "18"}]}
+
+
+class TestProbeCache:
+    """Testes para o cache de metadados."""
+
+    def test_put_and_get(self, temp_db_path):
+        """Testa gravar e ler uma entrada do cache."""
+        # Arrange
+        cache = ProbeCache(db_path=temp_db_path)
+
+        # Act
+        cache.put("youtube:abc", INFO)
+
+        # Assert
+        assert cache.get("youtube:abc") == INFO
+        assert cache.get("youtube:outro") is None
+
+    def test_get_returns_copy(self, temp_db_path):
+        """Testa que alterar o retorno não corrompe o cache."""
+        # Arrange
+        cache = ProbeCache(db_path=temp_db_path)
+        cache.put("k", INFO)
+
+        # Act
+        cache.get("k")["formats"].clear()
+
+        # Assert
+        assert cache.get("k") == INFO
+
+    def test_disk_cache_survives_new_instance(self, temp_db_path):
+        """Testa que o cache em disco é compartilhado entre instâncias."""
+        # Arrange
+        ProbeCache(db_path=temp_db_path).put("k", INFO)
+
+        # Act
+        found = ProbeCache(db_path=temp_db_path).get("k")
+
+        # Assert
+        assert found == INFO
+
+    def test_disk_cache_is_compressed(self, temp_db_path):
+        """Testa que o JSON é armazenado comprimido."""
+        # Arrange
+        cache = ProbeCache(db_path=temp_db_path)
+        big_info = {"description": "x" * 10_000}
+
+        # Act
+        cache.put("k", big_info)
+
+        # Assert
+        with sqlite3.connect(temp_db_path) as conn:
+            blob = conn.execute("SELECT info FROM probe_cache").fetchone()[0]
+        assert len(blob) < 1_000
+
+    def test_ttl_expiration(self, temp_db_path):
+        """Testa que entradas expiradas não são devolvidas."""
+        # Arrange
+        cache = ProbeCache(db_path=temp_db_path, ttl_seconds=10)
+        with patch("src.infrastructure.probe_cache.time.time", return_value=1000.0):
+            cache.put("k", INFO)
+
+        # Act & Assert
+        with patch("src.infrastructure.probe_cache.time.time", return_value=1005.0):
+            assert cache.get("k") == INFO
+        with patch("src.infrastructure.probe_cache.time.time", return_value=1011.0):
+            assert cache.get("k") is None
+            assert cache.purge_expired() == 1
+
+    def test_lru_eviction(self, temp_db_path):
+        """Testa que o LRU em memória descarta a entrada menos usada."""
+        # Arrange
+        cache = ProbeCache(db_path=temp_db_path, max_entries=2)
+        cache.put("a", {"id": "a"})
+        cache.put("b", {"id": "b"})
+        cache.get("a")  # "a" passa a ser a mais recente
+
+        # Act
+        cache.put("c", {"id": "c"})
+
+        # Assert
+        assert list(cache._memory) == ["a", "c"]
+        # A entrada descartada da memória continua disponível em disco
+        assert cache.get("b") == {"id": "b"}
+
+    def test_invalidate(self, temp_db_path):
+        """Testa remover uma entrada do cache."""
+        # Arrange
+        cache = ProbeCache(db_path=temp_db_path)
+        cache.put("k", INFO)
+
+        # Act
+        cache.invalidate("k")
+
+        # Assert
+        assert cache.get("k") is None
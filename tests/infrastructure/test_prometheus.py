@@ -0,0 +1,183 @@
+"""
+Testes unitários para MetricsRegistry e MetricsServer.
+"""
+
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+from src.infrastructure.prometheus import MetricsRegistry, MetricsServer
+from src.infrastructure.sqlite_pool import SQLiteConnectionPool
+
+
+class TestMetricsRegistry:
+    """Testes para o registro de métricas e o formato de exposição."""
+
+    def test_counter_with_labels(self):
+        """Testa contadores com rótulos e a linha exportada."""
+        # Arrange
+        registry = MetricsRegistry()
+
+        # Act
+        registry.inc("ytdl_downloads_total", outcome="downloaded")
+        registry.inc("ytdl_downloads_total", 2, outcome="downloaded")
+        registry.inc("ytdl_downloads_total", outcome="failed")
+
+        # Assert
+        text = registry.render()
+        assert "# TYPE ytdl_downloads_total counter" in text
+        assert 'ytdl_downloads_total{outcome="downloaded"} 3' in text
+        assert 'ytdl_downloads_total{outcome="failed"} 1' in text
+
+    def test_counter_cannot_decrease(self):
+        """Testa que contadores não aceitam valores negativos."""
+        registry = MetricsRegistry()
+        with pytest.raises(ValueError):
+            registry.inc("ytdl_downloads_total", -1)
+
+    def test_histogram_and_gauge_values_do_not_mix(self):
+        """Testa que inc/observe rejeitam uma métrica de outro tipo."""
+        registry = MetricsRegistry()
+        registry.observe("ytdl_download_duration_seconds", 1.0)
+        registry.set("ytdl_active_downloads", 2)
+        with pytest.raises(ValueError):
+            registry.inc("ytdl_download_duration_seconds")
+        with pytest.raises(ValueError):
+            registry.observe("ytdl_active_downloads", 1.0)
+
+    def test_gauge_goes_up_and_down(self):
+        """Testa que gauges podem subir, descer e ser definidos."""
+        # Arrange
+        registry = MetricsRegistry()
+
+        # Act
+        registry.inc("ytdl_active_downloads")
+        registry.inc("ytdl_active_downloads")
+        registry.inc("ytdl_active_downloads", -1)
+
+        # Assert
+        assert registry.value("ytdl_active_downloads") == 1
+        registry.set("ytdl_active_downloads", 5)
+        assert registry.value("ytdl_active_downloads") == 5
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Testa buckets cumulativos, soma e contagem do histograma."""
+        # Arrange
+        registry = MetricsRegistry(buckets=(0.1, 1.0))
+
+        # Act
+        for value in (0.05, 0.1, 0.5, 3.0):
+            registry.observe("ytdl_sqlite_query_seconds", value, operation="save")
+
+        # Assert
+        text = registry.render()
+        prefix = 'ytdl_sqlite_query_seconds_bucket{operation="save",'
+        assert prefix + 'le="0.1"} 2' in text
+        assert prefix + 'le="1"} 3' in text
+        assert prefix + 'le="+Inf"} 4' in text
+        assert 'ytdl_sqlite_query_seconds_sum{operation="save"} 3.65' in text
+        assert 'ytdl_sqlite_query_seconds_count{operation="save"} 4' in text
+
+    def test_undeclared_metric_and_escaping(self):
+        """Testa métricas não declaradas e o escape de rótulos."""
+        # Arrange
+        registry = MetricsRegistry()
+
+        # Act
+        registry.inc("custom_total", reason='say "hi"\n')
+
+        # Assert
+        assert 'custom_total{reason="say \\"hi\\"\\n"} 1' in registry.render()
+
+    def test_gauge_callback_is_evaluated_on_render(self):
+        """Testa gauges calculados no momento da coleta."""
+        # Arrange
+        registry = MetricsRegistry()
+        depth = {"pending": 3, "running": 1}
+        registry.gauge_callback(
+            "ytdl_queue_jobs", "Jobs", lambda: dict(depth), label="status"
+        )
+
+        # Act
+        depth["pending"] = 7
+        text = registry.render()
+
+        # Assert
+        assert 'ytdl_queue_jobs{status="pending"} 7' in text
+        assert 'ytdl_queue_jobs{status="running"} 1' in text
+        assert text.count("# TYPE ytdl_queue_jobs gauge") == 1
+
+    def test_failing_callback_is_skipped(self):
+        """Testa que um callback com erro não derruba a coleta."""
+        # Arrange
+        registry = MetricsRegistry()
+        registry.gauge_callback("broken", "Quebrado", lambda: 1 / 0)
+        registry.inc("ytdl_downloads_total", outcome="downloaded")
+
+        # Act
+        text = registry.render()
+
+        # Assert
+        assert "broken" not in text
+        assert "ytdl_downloads_total" in text
+
+
+class TestMetricsServer:
+    """Testes para o endpoint HTTP /metrics."""
+
+    def test_serves_metrics(self):
+        """Testa que GET /metrics devolve o texto de exposição."""
+        # Arrange
+        registry = MetricsRegistry()
+        registry.inc("ytdl_downloaded_bytes_total", 1024)
+
+        # Act
+        with MetricsServer(registry, port=0) as server:
+            host, port = server.address
+            with urllib.request.urlopen(f"http://{host}:{port}/metrics") as response:
+                body = response.read().decode("utf-8")
+                content_type = response.headers["Content-Type"]
+
+        # Assert
+        assert "ytdl_downloaded_bytes_total 1024" in body
+        assert content_type.startswith("text/plain; version=0.0.4")
+
+    def test_unknown_path_is_404(self):
+        """Testa que outros caminhos respondem 404."""
+        # Arrange
+        registry = MetricsRegistry()
+
+        # Act / Assert
+        with MetricsServer(registry, port=0) as server:
+            host, port = server.address
+            with pytest.raises(urllib.error.HTTPError) as exc_info:
+                urllib.request.urlopen(f"http://{host}:{port}/")
+        assert exc_info.value.code == 404
+
+    def test_releases_callback_connection_per_request(self, temp_db_path):
+        """Testa que as conexões abertas pelos callbacks não se acumulam."""
+        # Arrange
+        pool = SQLiteConnectionPool(temp_db_path)
+        registry = MetricsRegistry()
+        registry.gauge_callback(
+            "ytdl_queue_jobs",
+            "Jobs na fila",
+            lambda: {"pending": pool.connection().execute("SELECT 1").fetchone()[0]},
+            label="status",
+        )
+
+        # Act
+        with MetricsServer(registry, port=0, release=pool.release) as server:
+            host, port = server.address
+            for _ in range(20):
+                with urllib.request.urlopen(f"http://{host}:{port}/metrics") as r:
+                    r.read()
+            deadline = time.monotonic() + 5
+            while pool._connections and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+        # Assert
+        assert pool._connections == []
+        pool.close_all()
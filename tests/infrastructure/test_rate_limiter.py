@@ -0,0 +1,223 @@
+"""
+Testes unitários para TokenBucket, HostRateLimiter e BandwidthGovernor.
+"""
+
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.infrastructure.rate_limiter import (
+    BandwidthGovernor,
+    HostRateLimiter,
+    TokenBucket,
+)
+
+PAYLOAD = b"x" * (256 * 1024)
+CHUNK_SIZE = 16 * 1024
+
+
+class FakeClock:
+    """Relógio controlado pelo teste; sleep() apenas avança o tempo."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+class PayloadHandler(BaseHTTPRequestHandler):
+    """Servidor HTTP local que devolve sempre o mesmo conteúdo."""
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(PAYLOAD)))
+        self.end_headers()
+        self.wfile.write(PAYLOAD)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def payload_server():
+    """Sobe um servidor HTTP local para os testes de banda."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), PayloadHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/video"
+    server.shutdown()
+    server.server_close()
+
+
+def fetch(url, governor):
+    """Baixa a URL em blocos, contabilizando cada bloco no governor."""
+    total = 0
+    with urllib.request.urlopen(url) as response:
+        while chunk := response.read(CHUNK_SIZE):
+            governor.consume(len(chunk))
+            total += len(chunk)
+    return total
+
+
+class TestTokenBucket:
+    """Testes para o token bucket."""
+
+    def test_burst_then_wait(self):
+        """Testa que a rajada inicial não espera e o excesso espera."""
+        # Arrange
+        clock = FakeClock()
+        bucket = TokenBucket(rate=10, capacity=2, clock=clock, sleep=clock.sleep)
+
+        # Act
+        waits = [bucket.acquire() for _ in range(4)]
+
+        # Assert
+        assert waits == [0.0, 0.0, pytest.approx(0.1), pytest.approx(0.1)]
+
+    def test_refill_over_time(self):
+        """Testa que os tokens são repostos com o tempo, até a capacidade."""
+        # Arrange
+        clock = FakeClock()
+        bucket = TokenBucket(rate=10, capacity=2, clock=clock, sleep=clock.sleep)
+        bucket.acquire(2)
+
+        # Act
+        clock.now += 10
+
+        # Assert
+        assert bucket.acquire(2) == 0.0
+        assert bucket.acquire(1) == pytest.approx(0.1)
+
+    def test_unlimited(self):
+        """Testa que rate=None não limita."""
+        # Arrange
+        bucket = TokenBucket(rate=None)
+
+        # Act & Assert
+        assert all(bucket.acquire(1e9) == 0.0 for _ in range(10))
+
+    def test_set_rate_at_runtime(self):
+        """Testa a alteração da taxa em tempo de execução."""
+        # Arrange
+        clock = FakeClock()
+        bucket = TokenBucket(rate=10, capacity=1, clock=clock, sleep=clock.sleep)
+        bucket.acquire()
+
+        # Act
+        bucket.set_rate(100, capacity=1)
+
+        # Assert
+        assert bucket.rate == 100
+        assert bucket.acquire() == pytest.approx(0.01)
+
+    def test_negative_rate(self):
+        """Testa que taxas negativas são rejeitadas."""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=-1)
+
+
+class TestHostRateLimiter:
+    """Testes para o limite de requisições por host."""
+
+    def test_limits_each_host_independently(self):
+        """Testa que cada host tem seu próprio bucket."""
+        # Arrange
+        clock = FakeClock()
+        limiter = HostRateLimiter(2, clock=clock, sleep=clock.sleep)
+
+        # Act
+        waits = [
+            limiter.acquire("https://www.youtube.com/watch?v=1"),
+            limiter.acquire("https://youtube.com/watch?v=2"),
+            limiter.acquire("https://vimeo.com/1"),
+        ]
+
+        # Assert
+        assert waits == [0.0, pytest.approx(0.5), 0.0]
+
+    def test_set_rate_updates_existing_hosts(self):
+        """Testa que o novo limite vale também para hosts já conhecidos."""
+        # Arrange
+        clock = FakeClock()
+        limiter = HostRateLimiter(1, clock=clock, sleep=clock.sleep)
+        limiter.acquire("https://example.com/a")
+
+        # Act
+        limiter.set_rate(None)
+
+        # Assert
+        assert limiter.acquire("https://example.com/b") == 0.0
+
+
+class TestBandwidthGovernor:
+    """Testes para o limite global de banda."""
+
+    def test_consume_waits_when_budget_is_exceeded(self):
+        """Testa que o excesso de bytes é pago com espera."""
+        # Arrange
+        clock = FakeClock()
+        governor = BandwidthGovernor(
+            1000, burst_seconds=0.1, clock=clock, sleep=clock.sleep
+        )
+
+        # Act
+        first = governor.consume(100)
+        second = governor.consume(500)
+
+        # Assert
+        assert first == 0.0
+        assert second == pytest.approx(0.5)
+
+    def test_set_limit_disables(self):
+        """Testa que set_limit(None) remove o limite."""
+        # Arrange
+        governor = BandwidthGovernor(1)
+
+        # Act
+        governor.set_limit(None)
+
+        # Assert
+        assert governor.bytes_per_second is None
+        assert governor.consume(10**9) == 0.0
+
+    @pytest.mark.parametrize("workers", [1, 4, 8])
+    def test_aggregate_throughput_stays_within_budget(self, payload_server, workers):
+        """
+        Testa, contra um servidor HTTP local, que a banda somada dos
+        workers respeita o orçamento qualquer que seja a quantidade deles.
+        """
+        # Arrange
+        budget = 4 * 1024 * 1024
+        governor = BandwidthGovernor(budget, burst_seconds=0.05)
+        downloads = 8
+        results = []
+
+        def worker(count):
+            for _ in range(count):
+                results.append(fetch(payload_server, governor))
+
+        per_worker = [downloads // workers] * workers
+        threads = [threading.Thread(target=worker, args=(n,)) for n in per_worker]
+
+        # Act
+        start = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.monotonic() - start
+
+        # Assert
+        total = sum(results)
+        assert total == downloads * len(PAYLOAD)
+        allowed = budget * elapsed + budget * 0.05
+        assert total <= allowed * 1.05
@@ -0,0 +1,120 @@
+"""
+Testes unitários para SQLiteFailureRepository.
+"""
+
+from datetime import datetime, timedelta
+
+from src.domain.entities import FailedDownload
+from src.domain.failures import FailureCategory
+from src.infrastructure.sqlite_failure_repo import SQLiteFailureRepository
+
+
+def make_failure(url="https://youtube.com/watch?v=dQw4w9WgXcQ", ttl=timedelta(days=1)):
+    now = datetime(2024, 1, 1, 12, 0, 0)
+    return FailedDownload(
+        url=url,
+        reason="Private video",
+        category=FailureCategory.PRIVATE,
+        failed_at=now,
+        expires_at=now + ttl,
+    )
+
+
+class TestSQLiteFailureRepository:
+    """Testes para o cache negativo de downloads."""
+
+    def test_record_and_find(self, temp_db_path):
+        """Testa gravar e recuperar uma falha."""
+        # Arrange
+        repo = SQLiteFailureRepository(db_path=temp_db_path)
+        failure = make_failure()
+
+        # Act
+        repo.record(failure)
+
+        # Assert
+        assert repo.find(failure.url) == failure
+
+    def test_find_by_url_variant(self, temp_db_path):
+        """Testa que variações da URL compartilham o registro."""
+        # Arrange
+        repo = SQLiteFailureRepository(db_path=temp_db_path)
+        repo.record(make_failure())
+
+        # Act
+        found = repo.find("https://youtu.be/dQw4w9WgXcQ")
+
+        # Assert
+        assert found is not None
+        assert found.category is FailureCategory.PRIVATE
+
+    def test_find_many(self, temp_db_path):
+        """Testa a busca de várias URLs em uma consulta."""
+        # Arrange
+        repo = SQLiteFailureRepository(db_path=temp_db_path)
+        repo.record(make_failure())
+        repo.record(make_failure(url="https://example.com/a"))
+        urls = [
+            "https://youtu.be/dQw4w9WgXcQ",
+            "https://example.com/a",
+            "https://example.com/b",
+        ]
+
+        # Act
+        found = repo.find_many(urls)
+
+        # Assert
+        assert set(found) == {"https://youtu.be/dQw4w9WgXcQ", "https://example.com/a"}
+
+    def test_delete(self, temp_db_path):
+        """Testa a remoção de uma falha."""
+        # Arrange
+        repo = SQLiteFailureRepository(db_path=temp_db_path)
+        failure = make_failure()
+        repo.record(failure)
+
+        # Act
+        repo.delete(failure.url)
+
+        # Assert
+        assert repo.find(failure.url) is None
+
+    def test_delete_many(self, temp_db_path):
+        """Testa a remoção das falhas de várias URLs."""
+        # Arrange
+        repo = SQLiteFailureRepository(db_path=temp_db_path)
+        repo.record(make_failure())
+        repo.record(make_failure(url="https://example.com/a"))
+        repo.record(make_failure(url="https://example.com/b"))
+
+        # Act
+        repo.delete_many(["https://youtu.be/dQw4w9WgXcQ", "https://example.com/a"])
+
+        # Assert
+        assert list(repo.find_many(["https://example.com/b"])) == [
+            "https://example.com/b"
+        ]
+        assert repo.find(make_failure().url) is None
+        assert repo.find("https://example.com/a") is None
+
+    def test_purge_expired(self, temp_db_path):
+        """Testa que apenas as falhas expiradas são removidas."""
+        # Arrange
+        repo = SQLiteFailureRepository(db_path=temp_db_path)
+        repo.record(make_failure(url="https://example.com/old"))
+        fresh = FailedDownload(
+            url="https://example.com/new",
+            reason="Video unavailable",
+            category=FailureCategory.UNAVAILABLE,
+            failed_at=datetime.now(),
+            expires_at=datetime.now() + timedelta(days=7),
+        )
+        repo.record(fresh)
+
+        # Act
+        removed = repo.purge_expired()
+
+        # Assert
+        assert removed == 1
+        assert repo.find("https://example.com/old") is None
+        assert repo.find("https://example.com/new") == fresh
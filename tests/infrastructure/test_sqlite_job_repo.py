@@ -0,0 +1,273 @@
+"""
+Testes unitários para SQLiteJobRepository.
+"""
+
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+
+from src.domain.entities import JobStatus
+from src.infrastructure.sqlite_job_repo import SQLiteJobRepository
+
+
+class TestSQLiteJobRepository:
+    """Testes para a fila de jobs em SQLite."""
+
+    def test_init_creates_jobs_table(self, temp_db_path):
+        """Testa que a tabela jobs é criada na inicialização."""
+        # Act
+        SQLiteJobRepository(db_path=temp_db_path)
+
+        # Assert
+        with sqlite3.connect(temp_db_path) as conn:
+            cursor = conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='table' AND name='jobs'"
+            )
+            assert cursor.fetchone() is not None
+
+    def test_enqueue_ignores_duplicates(self, temp_db_path):
+        """Testa que URLs já enfileiradas não são duplicadas."""
+        # Arrange
+        repo = SQLiteJobRepository(db_path=temp_db_path)
+
+        # Act
+        first = repo.enqueue_many(["https://a.com/1", "https://a.com/2"])
+        second = repo.enqueue_many(["https://a.com/2", "https://a.com/3"])
+
+        # Assert
+        assert first == 2
+        assert second == 1
+        assert repo.count_by_status()["pending"] == 3
+
+    def test_enqueue_returns_job(self, temp_db_path):
+        """Testa que enqueue() retorna o job novo ou o já existente."""
+        # Arrange
+        repo = SQLiteJobRepository(db_path=temp_db_path)
+
+        # Act
+        job = repo.enqueue("https://a.com/1")
+        claimed = repo.claim("w1", lease_seconds=60)
+        again = repo.enqueue("https://a.com/1")
+
+        # Assert
+        assert job.id == claimed.id
+        assert job.status is JobStatus.PENDING
+        assert again.id == job.id
+        assert again.status is JobStatus.RUNNING
+        assert repo.count_by_status()["running"] == 1
+
+    def test_claim_in_fifo_order(self, temp_db_path):
+        """Testa que os jobs são reservados na ordem de chegada."""
+        # Arrange
+        repo = SQLiteJobRepository(db_path=temp_db_path)
+        repo.enqueue_many(["https://a.com/1", "https://a.com/2"])
+
+        # Act
+        job1 = repo.claim("worker", lease_seconds=60)
+        job2 = repo.claim("worker", lease_seconds=60)
+        job3 = repo.claim("worker", lease_seconds=60)
+
+        # Assert
+        assert job1.url == "https://a.com/1"
+        assert job1.status == JobStatus.RUNNING
+        assert job1.attempts == 1
+        assert job1.worker_id == "worker"
+        assert job2.url == "https://a.com/2"
+        assert job3 is None
+
+    def test_claim_expired_lease(self, temp_db_path):
+        """Testa que jobs com lease expirado podem ser reservados novamente."""
+        # Arrange
+        repo = SQLiteJobRepository(db_path=temp_db_path)
+        repo.enqueue_many(["https://a.com/1"])
+        repo.claim("crashed", lease_seconds=-1)
+
+        # Act
+        job = repo.claim("worker", lease_seconds=60)
+
+        # Assert
+        assert job is not None
+        assert job.worker_id == "worker"
+        assert job.attempts == 2
+
+    def test_complete_and_fail(self, temp_db_path):
+        """Testa as transições para done, pending (retry) e failed."""
+        # Arrange
+        repo = SQLiteJobRepository(db_path=temp_db_path)
+        repo.enqueue_many(["https://a.com/1", "https://a.com/2", "https://a.com/3"])
+        job1 = repo.claim("w", 60)
+        job2 = repo.claim("w", 60)
+        job3 = repo.claim("w", 60)
+
+        # Act
+        repo.complete(job1.id)
+        repo.fail(job2.id, "HTTP Error 503", retry=True)
+        repo.fail(job3.id, "Private video", retry=False)
+
+        # Assert
+        assert repo.get(job1.id).status == JobStatus.DONE
+        assert repo.get(job2.id).status == JobStatus.PENDING
+        assert repo.get(job2.id).last_error == "HTTP Error 503"
+        assert repo.get(job3.id).status == JobStatus.FAILED
+        assert repo.count_by_status() == {
+            "pending": 1,
+            "running": 0,
+            "done": 1,
+            "failed": 1,
+        }
+
+    def test_claim_respects_backoff(self, temp_db_path):
+        """Testa que jobs em backoff só são reservados após available_at."""
+        # Arrange
+        repo = SQLiteJobRepository(db_path=temp_db_path)
+        repo.enqueue_many(["https://a.com/1", "https://a.com/2"])
+        first = repo.claim("w1", lease_seconds=60)
+        repo.fail(
+            first.id,
+            "HTTP Error 429",
+            retry=True,
+            retry_at=datetime.now() + timedelta(hours=1),
+        )
+
+        # Act
+        second = repo.claim("w1", lease_seconds=60)
+        third = repo.claim("w1", lease_seconds=60)
+
+        # Assert
+        assert second.url == "https://a.com/2"
+        assert third is None
+        assert repo.get(first.id).available_at is not None
+
+    def test_claim_after_backoff_expires(self, temp_db_path):
+        """Testa que o job volta a ser reservado quando o backoff termina."""
+        # Arrange
+        repo = SQLiteJobRepository(db_path=temp_db_path)
+        repo.enqueue_many(["https://a.com/1"])
+        job = repo.claim("w1", lease_seconds=60)
+        repo.fail(job.id, "HTTP Error 503", retry=True, retry_at=datetime.now())
+
+        # Act
+        again = repo.claim("w1", lease_seconds=60)
+
+        # Assert
+        assert again.id == job.id
+        assert again.attempts == 2
+
+    def test_find_by_urls_and_reopen_many(self, temp_db_path):
+        """Testa a busca por URLs e a reabertura de jobs finalizados."""
+        # Arrange
+        repo = SQLiteJobRepository(db_path=temp_db_path)
+        repo.enqueue_many(["https://a.com/1", "https://a.com/2", "https://a.com/3"])
+        done = repo.claim("w1", lease_seconds=60)
+        failed = repo.claim("w1", lease_seconds=60)
+        running = repo.claim("w1", lease_seconds=60)
+        repo.complete(done.id)
+        repo.fail(failed.id, "Private video", retry=False)
+
+        # Act
+        found = repo.find_by_urls(["https://a.com/1", "https://a.com/2", "x"])
+        count = repo.reopen_many([done.id, failed.id, running.id])
+
+        # Assert
+        assert set(found) == {"https://a.com/1", "https://a.com/2"}
+        assert count == 2
+        assert repo.get(failed.id).status is JobStatus.PENDING
+        assert repo.get(failed.id).attempts == 0
+        assert repo.get(failed.id).last_error is None
+        assert repo.get(running.id).status is JobStatus.RUNNING
+
+    def test_next_available_at(self, temp_db_path):
+        """Testa o próximo momento em que um job pendente pode ser reservado."""
+        # Arrange
+        repo = SQLiteJobRepository(db_path=temp_db_path)
+        retry_at = datetime.now() + timedelta(hours=1)
+        empty = repo.next_available_at()
+        repo.enqueue_many(["https://a.com/1"])
+        job = repo.claim("w1", lease_seconds=60)
+        running = repo.next_available_at()
+        repo.fail(job.id, "HTTP Error 429", retry=True, retry_at=retry_at)
+
+        # Act
+        waiting = repo.next_available_at()
+
+        # Assert
+        assert empty is None
+        assert running is None
+        assert waiting == retry_at
+
+    def test_migration_adds_available_at(self, temp_db_path):
+        """Testa a migração de uma tabela jobs criada sem available_at."""
+        # Arrange
+        with sqlite3.connect(temp_db_path) as conn:
+            conn.execute("""
+                CREATE TABLE jobs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    url TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    worker_id TEXT,
+                    lease_expires_at TEXT,
+                    last_error TEXT,
+                    created_at TEXT NOT NULL,
+                    updated_at TEXT NOT NULL,
+                    UNIQUE(url)
+                )
+            """)
+        conn.close()
+
+        # Act
+        repo = SQLiteJobRepository(db_path=temp_db_path)
+        repo.enqueue_many(["https://a.com/1"])
+
+        # Assert
+        assert repo.claim("w1", lease_seconds=60).available_at is None
+
+    def test_requeue_running_after_crash(self, temp_db_path):
+        """Testa que jobs em execução voltam à fila após reinício."""
+        # Arrange
+        repo = SQLiteJobRepository(db_path=temp_db_path)
+        repo.enqueue_many(["https://a.com/1"])
+        job = repo.claim("w", 600)
+
+        # Act - simula reinício com uma nova instância
+        restarted = SQLiteJobRepository(db_path=temp_db_path)
+        count = restarted.requeue_running()
+
+        # Assert
+        assert count == 1
+        recovered = restarted.get(job.id)
+        assert recovered.status == JobStatus.PENDING
+        assert recovered.attempts == 0
+
+    def test_concurrent_claims_are_exclusive(self, temp_db_path):
+        """Testa que dois workers nunca reservam o mesmo job."""
+        # Arrange
+        repo = SQLiteJobRepository(db_path=temp_db_path)
+        repo.enqueue_many(f"https://a.com/{i}" for i in range(200))
+        claimed = []
+        lock = threading.Lock()
+
+        def worker(name):
+            while True:
+                job = repo.claim(name, 60)
+                if job is None:
+                    return
+                with lock:
+                    claimed.append(job.id)
+
+        threads = [threading.Thread(target=worker, args=(f"w{i}",)) for i in range(4)]
+
+        # Act
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        assert len(claimed) == 200
+        assert len(set(claimed)) == 200
+
+    def test_get_not_found(self, temp_db_path):
+        """Testa buscar job inexistente."""
+        repo = SQLiteJobRepository(db_path=temp_db_path)
+        assert repo.get(999) is None
@@ -0,0 +1,86 @@
+"""
+Testes unitários para SQLiteDownloadMetricsRepository.
+"""
+
+from datetime import datetime, timedelta
+
+from src.domain.entities import DownloadOutcome, DownloadStats
+from src.infrastructure.sqlite_metrics_repo import SQLiteDownloadMetricsRepository
+
+START = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def make_stats(offset_minutes=0, outcome=DownloadOutcome.DOWNLOADED):
+    return DownloadStats(
+        url="https://youtube.com/watch?v=dQw4w9WgXcQ",
+        started_at=START + timedelta(minutes=offset_minutes),
+        outcome=outcome,
+        validation_s=0.001,
+        lookup_s=0.002,
+        extraction_s=1.5,
+        transfer_s=10.0,
+        postprocess_s=0.5,
+        save_s=0.003,
+        total_s=12.1,
+        bytes_downloaded=5_000_000,
+    )
+
+
+class TestSQLiteDownloadMetricsRepository:
+    """Testes para a tabela download_metrics."""
+
+    def test_record_and_find_since(self, temp_db_path):
+        """Testa gravar e recuperar as métricas de um download."""
+        # Arrange
+        repo = SQLiteDownloadMetricsRepository(db_path=temp_db_path)
+        stats = make_stats()
+
+        # Act
+        repo.record(stats)
+        found = repo.find_since(START)
+
+        # Assert
+        assert found == [stats]
+
+    def test_find_since_filters_window(self, temp_db_path):
+        """Testa que apenas downloads iniciados na janela são retornados."""
+        # Arrange
+        repo = SQLiteDownloadMetricsRepository(db_path=temp_db_path)
+        repo.record_many([make_stats(offset) for offset in (0, 30, 60, 90)])
+
+        # Act
+        found = repo.find_since(
+            START + timedelta(minutes=30), START + timedelta(minutes=90)
+        )
+
+        # Assert
+        assert [s.started_at for s in found] == [
+            START + timedelta(minutes=30),
+            START + timedelta(minutes=60),
+        ]
+
+    def test_failed_download_keeps_error(self, temp_db_path):
+        """Testa que o resultado e o erro de falhas são preservados."""
+        # Arrange
+        repo = SQLiteDownloadMetricsRepository(db_path=temp_db_path)
+        stats = make_stats(outcome=DownloadOutcome.FAILED)
+        stats.error = "HTTP Error 503"
+
+        # Act
+        repo.record(stats)
+
+        # Assert
+        found = repo.find_since(START)[0]
+        assert found.outcome is DownloadOutcome.FAILED
+        assert found.error == "HTTP Error 503"
+
+    def test_record_many_empty(self, temp_db_path):
+        """Testa que gravar uma lista vazia não falha."""
+        # Arrange
+        repo = SQLiteDownloadMetricsRepository(db_path=temp_db_path)
+
+        # Act
+        repo.record_many([])
+
+        # Assert
+        assert repo.find_since(START) == []
@@ -0,0 +1,82 @@
+"""
+Testes unitários para SQLitePartialDownloadRepository.
+"""
+
+from datetime import datetime
+
+from src.domain.entities import PartialDownload
+from src.infrastructure.sqlite_partial_repo import SQLitePartialDownloadRepository
+
+
+def make_partial(url="https://youtube.com/watch?v=dQw4w9WgXcQ", bytes_done=1024):
+    return PartialDownload(
+        url=url,
+        temp_path="downloads/Video.mp4.part",
+        bytes_done=bytes_done,
+        total_bytes=4096,
+        format_id="18",
+        updated_at=datetime(2024, 1, 1, 12, 0, 0),
+    )
+
+
+class TestSQLitePartialDownloadRepository:
+    """Testes para o repositório de downloads parciais."""
+
+    def test_save_and_find(self, temp_db_path):
+        """Testa gravar e recuperar o progresso de um download."""
+        # Arrange
+        repo = SQLitePartialDownloadRepository(db_path=temp_db_path)
+        partial = make_partial()
+
+        # Act
+        repo.save_progress(partial)
+        found = repo.find(partial.url)
+
+        # Assert
+        assert found == partial
+
+    def test_save_overwrites_progress(self, temp_db_path):
+        """Testa que uma nova gravação substitui o progresso anterior."""
+        # Arrange
+        repo = SQLitePartialDownloadRepository(db_path=temp_db_path)
+        repo.save_progress(make_partial(bytes_done=1024))
+
+        # Act
+        repo.save_progress(make_partial(bytes_done=2048))
+
+        # Assert
+        assert repo.find(make_partial().url).bytes_done == 2048
+
+    def test_find_by_url_variant(self, temp_db_path):
+        """Testa que uma variação da URL encontra o mesmo download."""
+        # Arrange
+        repo = SQLitePartialDownloadRepository(db_path=temp_db_path)
+        repo.save_progress(make_partial())
+
+        # Act
+        found = repo.find("https://youtu.be/dQw4w9WgXcQ")
+
+        # Assert
+        assert found is not None
+        assert found.format_id == "18"
+
+    def test_delete(self, temp_db_path):
+        """Testa a remoção do progresso."""
+        # Arrange
+        repo = SQLitePartialDownloadRepository(db_path=temp_db_path)
+        partial = make_partial()
+        repo.save_progress(partial)
+
+        # Act
+        repo.delete(partial.url)
+
+        # Assert
+        assert repo.find(partial.url) is None
+
+    def test_find_missing(self, temp_db_path):
+        """Testa busca de URL sem progresso salvo."""
+        # Arrange
+        repo = SQLitePartialDownloadRepository(db_path=temp_db_path)
+
+        # Act & Assert
+        assert repo.find("https://example.com/video") is None
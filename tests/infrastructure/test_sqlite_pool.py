@@ -0,0 +1,146 @@
+"""
+Testes unitários para SQLiteConnectionPool.
+"""
+
+import sqlite3
+import threading
+
+import pytest
+
+from src.infrastructure.sqlite_pool import SQLiteConnectionPool, sqlite_connection
+
+
+class TestSQLiteConnectionPool:
+    """Testes para o pool de conexões SQLite."""
+
+    def test_same_connection_per_thread(self, temp_db_path):
+        """Testa que a mesma thread sempre recebe a mesma conexão."""
+        # Arrange
+        pool = SQLiteConnectionPool(temp_db_path)
+
+        # Act
+        conn1 = pool.connection()
+        conn2 = pool.connection()
+
+        # Assert
+        assert conn1 is conn2
+        pool.close_all()
+
+    def test_different_connection_per_thread(self, temp_db_path):
+        """Testa que threads diferentes recebem conexões diferentes."""
+        # Arrange
+        pool = SQLiteConnectionPool(temp_db_path)
+        connections = []
+
+        def worker():
+            connections.append(pool.connection())
+
+        # Act
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        connections.append(pool.connection())
+
+        # Assert
+        assert connections[0] is not connections[1]
+        pool.close_all()
+
+    def test_wal_and_pragmas(self, temp_db_path):
+        """Testa que as conexões são configuradas em modo WAL."""
+        # Arrange
+        pool = SQLiteConnectionPool(temp_db_path, cache_size_kib=4096)
+
+        # Act
+        conn = pool.connection()
+
+        # Assert
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] == -4096
+        pool.close_all()
+
+    def test_transaction_rollback_on_error(self, temp_db_path):
+        """Testa que erros dentro da transação desfazem as alterações."""
+        # Arrange
+        pool = SQLiteConnectionPool(temp_db_path)
+        with pool.transaction() as conn:
+            conn.execute("CREATE TABLE t (x INTEGER)")
+
+        # Act
+        with pytest.raises(RuntimeError):
+            with pool.transaction() as conn:
+                conn.execute("INSERT INTO t VALUES (1)")
+                raise RuntimeError("falha")
+
+        # Assert
+        with pool.transaction() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+        pool.close_all()
+
+    def test_close_all(self, temp_db_path):
+        """Testa que close_all fecha as conexões e permite reabrir."""
+        # Arrange
+        pool = SQLiteConnectionPool(temp_db_path)
+        conn = pool.connection()
+
+        # Act
+        pool.close_all()
+
+        # Assert
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+        assert pool.connection() is not conn
+        pool.close_all()
+
+    def test_release_closes_thread_connection(self, temp_db_path):
+        """Testa que release fecha só a conexão da thread atual."""
+        # Arrange
+        pool = SQLiteConnectionPool(temp_db_path)
+        conn = pool.connection()
+        other = []
+        thread = threading.Thread(target=lambda: other.append(pool.connection()))
+        thread.start()
+        thread.join()
+
+        # Act
+        pool.release()
+
+        # Assert
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+        other[0].execute("SELECT 1")
+        assert pool._connections == [other[0]]
+        assert pool.connection() is not conn
+        pool.close_all()
+
+
+class TestSQLiteConnection:
+    """Testes para o helper sqlite_connection."""
+
+    def test_without_pool_commits_and_closes(self, temp_db_path):
+        """Testa que, sem pool, a conexão é fechada após o uso."""
+        # Act
+        with sqlite_connection(temp_db_path) as conn:
+            conn.execute("CREATE TABLE t (x INTEGER)")
+            conn.execute("INSERT INTO t VALUES (1)")
+
+        # Assert
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+        with sqlite3.connect(temp_db_path) as other:
+            assert other.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 1
+
+    def test_with_pool_reuses_connection(self, temp_db_path):
+        """Testa que, com pool, a conexão da thread é reutilizada."""
+        # Arrange
+        pool = SQLiteConnectionPool(temp_db_path)
+
+        # Act
+        with sqlite_connection(temp_db_path, pool) as conn1:
+            pass
+        with sqlite_connection(temp_db_path, pool) as conn2:
+            pass
+
+        # Assert
+        assert conn1 is conn2
+        pool.close_all()
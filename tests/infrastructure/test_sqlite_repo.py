@@ -3,11 +3,13 @@ Testes unitários para SQLiteVideoRepository.
 """
 
 from datetime import datetime
+from unittest.mock import Mock
 
 import pytest
 
-from src.domain.entities import Video
+from src.domain.entities import FormatProfile, PostprocessStatus, Video
 from src.domain.exceptions import VideoNotSavedException
+from src.infrastructure.sqlite_pool import SQLiteConnectionPool
 from src.infrastructure.sqlite_repo import SQLiteVideoRepository
 
 
@@ -143,3 +145,417 @@ class TestSQLiteVideoRepository:
             cursor = conn.execute("SELECT COUNT(*) FROM videos")
             count = cursor.fetchone()[0]
             assert count == 1
+
+    def test_pooled_repository(self, temp_db_path, sample_video):
+        """Testa o repositório usando o pool de conexões persistentes."""
+        # Arrange
+        pool = SQLiteConnectionPool(temp_db_path)
+        repo = SQLiteVideoRepository(pool=pool)
+
+        # Act
+        repo.save(sample_video)
+        repo.save(sample_video)  # Duplicado não deve quebrar a conexão
+        found = repo.find_by_url(sample_video.url)
+        all_videos = repo.get_all()
+        pool.close_all()
+
+        # Assert
+        assert repo.db_path == temp_db_path
+        assert found == sample_video
+        assert len(all_videos) == 1
+
+    def test_save_many(self, temp_db_path, sample_video):
+        """Testa salvar vários vídeos de uma vez, ignorando duplicados."""
+        # Arrange
+        repo = SQLiteVideoRepository(db_path=temp_db_path)
+        repo.save(sample_video)
+        videos = [
+            Video(
+                url=f"https://youtube.com/watch?v={i}",
+                title=f"Video {i}",
+                file_path=f"downloads/{i}.mp4",
+                downloaded_at=datetime(2024, 1, 1, 10, 0, i),
+            )
+            for i in range(3)
+        ]
+
+        # Act
+        inserted = repo.save_many(videos + [sample_video])
+
+        # Assert
+        assert inserted == 3
+        assert len(repo.get_all()) == 4
+
+    def test_find_by_urls(self, temp_db_path):
+        """Testa buscar vários vídeos em blocos maiores que o limite do IN."""
+        # Arrange
+        from src.infrastructure import sqlite_repo
+
+        repo = SQLiteVideoRepository(db_path=temp_db_path)
+        total = sqlite_repo.IN_CLAUSE_CHUNK_SIZE + 10
+        repo.save_many(
+            Video(
+                url=f"https://youtube.com/watch?v={i}",
+                title=f"Video {i}",
+                file_path=f"downloads/{i}.mp4",
+                downloaded_at=datetime(2024, 1, 1),
+            )
+            for i in range(total)
+        )
+        urls = [f"https://youtube.com/watch?v={i}" for i in range(total + 5)]
+
+        # Act
+        found = repo.find_by_urls(urls)
+
+        # Assert
+        assert len(found) == total
+        assert found["https://youtube.com/watch?v=3"].title == "Video 3"
+        assert "https://youtube.com/watch?v=" + str(total) not in found
+
+    def test_find_by_urls_empty(self, temp_db_path):
+        """Testa buscar com lista vazia de URLs."""
+        repo = SQLiteVideoRepository(db_path=temp_db_path)
+        assert repo.find_by_urls([]) == {}
+
+    def test_iter_videos_paginates_with_ties(self, temp_db_path):
+        """Testa a paginação por chave com datas repetidas."""
+        # Arrange
+        repo = SQLiteVideoRepository(db_path=temp_db_path)
+        repo.save_many(
+            Video(
+                url=f"https://youtube.com/watch?v={i}",
+                title=f"Video {i}",
+                file_path=f"downloads/{i}.mp4",
+                # Várias linhas por data, para exercitar o desempate por id
+                downloaded_at=datetime(2024, 1, 1 + i // 3),
+            )
+            for i in range(10)
+        )
+
+        # Act
+        videos = list(repo.iter_videos(page_size=4))
+
+        # Assert
+        assert len(videos) == 10
+        assert len({v.url for v in videos}) == 10
+        dates = [v.downloaded_at for v in videos]
+        assert dates == sorted(dates, reverse=True)
+
+    def test_iter_videos_after_and_limit(self, temp_db_path):
+        """Testa os parâmetros after e limit de iter_videos."""
+        # Arrange
+        repo = SQLiteVideoRepository(db_path=temp_db_path)
+        repo.save_many(
+            Video(
+                url=f"https://youtube.com/watch?v={day}",
+                title=f"Video {day}",
+                file_path=f"downloads/{day}.mp4",
+                downloaded_at=datetime(2024, 1, day),
+            )
+            for day in range(1, 11)
+        )
+
+        # Act
+        videos = list(
+            repo.iter_videos(after=datetime(2024, 1, 8), limit=3, page_size=2)
+        )
+
+        # Assert
+        assert [v.downloaded_at.day for v in videos] == [7, 6, 5]
+
+    def test_iter_videos_is_lazy(self, temp_db_path, sample_video):
+        """Testa que iter_videos não consulta o banco antes de ser consumido."""
+        # Arrange
+        repo = SQLiteVideoRepository(db_path=temp_db_path)
+        repo.save(sample_video)
+
+        # Act
+        iterator = repo.iter_videos()
+
+        # Assert
+        assert next(iterator) == sample_video
+        assert next(iterator, None) is None
+
+    def test_downloaded_at_index_created(self, temp_db_path):
+        """Testa que o índice de downloaded_at é criado."""
+        # Act
+        SQLiteVideoRepository(db_path=temp_db_path)
+
+        # Assert
+        import sqlite3
+
+        with sqlite3.connect(temp_db_path) as conn:
+            cursor = conn.execute(
+                "SELECT name FROM sqlite_master "
+                "WHERE type='index' AND name='idx_videos_downloaded_at'"
+            )
+            assert cursor.fetchone() is not None
+
+    def test_find_by_url_matches_url_variants(self, temp_db_path):
+        """Testa que variações da mesma URL encontram o vídeo salvo."""
+        # Arrange
+        repo = SQLiteVideoRepository(db_path=temp_db_path)
+        video = Video(
+            url="https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+            title="Video",
+            file_path="downloads/video.mp4",
+            downloaded_at=datetime(2024, 1, 1),
+        )
+        repo.save(video)
+        variants = [
+            "https://youtu.be/dQw4w9WgXcQ",
+            "https://m.youtube.com/watch?v=dQw4w9WgXcQ&t=10s",
+            "https://www.youtube.com/shorts/dQw4w9WgXcQ",
+        ]
+
+        # Act
+        found = [repo.find_by_url(url) for url in variants]
+        found_many = repo.find_by_urls(variants + ["https://youtu.be/xxxxxxxxxxx"])
+
+        # Assert
+        assert found == [video, video, video]
+        assert set(found_many) == set(variants)
+
+    def test_migration_adds_video_key(self, temp_db_path):
+        """Testa a migração de um banco criado antes da coluna video_key."""
+        # Arrange - cria a tabela no formato antigo
+        import sqlite3
+
+        with sqlite3.connect(temp_db_path) as conn:
+            conn.execute("""
+                CREATE TABLE videos (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    url TEXT NOT NULL,
+                    title TEXT NOT NULL,
+                    file_path TEXT NOT NULL,
+                    downloaded_at TEXT NOT NULL,
+                    UNIQUE(url)
+                )
+            """)
+            conn.execute(
+                "INSERT INTO videos (url, title, file_path, downloaded_at) "
+                "VALUES (?, ?, ?, ?)",
+                (
+                    "https://youtu.be/dQw4w9WgXcQ",
+                    "Old",
+                    "downloads/old.mp4",
+                    "2024-01-01T00:00:00",
+                ),
+            )
+
+        # Act
+        repo = SQLiteVideoRepository(db_path=temp_db_path)
+
+        # Assert
+        found = repo.find_by_url("https://www.youtube.com/watch?v=dQw4w9WgXcQ")
+        assert found is not None
+        assert found.title == "Old"
+        with sqlite3.connect(temp_db_path) as conn:
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM videos WHERE video_key = ?",
+                ("youtube:dQw4w9WgXcQ",),
+            ).fetchall()
+            assert "idx_videos_video_key" in str(plan)
+
+    def test_url_variant_updates_existing_video(self, temp_db_path):
+        """Testa que uma variante da URL atualiza o registro do vídeo."""
+        # Arrange
+        repo = SQLiteVideoRepository(db_path=temp_db_path)
+        first = Video(
+            url="https://youtu.be/dQw4w9WgXcQ",
+            title="Old",
+            file_path="downloads/old.mp4",
+            downloaded_at=datetime(2024, 1, 1),
+        )
+        variant = Video(
+            url="https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+            title="New",
+            file_path="downloads/new.mp4",
+            downloaded_at=datetime(2024, 1, 2),
+        )
+
+        # Act
+        repo.save(first)
+        repo.save_many([variant])
+
+        # Assert
+        videos = repo.get_all()
+        assert len(videos) == 1
+        assert videos[0].url == variant.url
+        assert videos[0].file_path == "downloads/new.mp4"
+
+    def test_same_url_keeps_existing_video(self, temp_db_path):
+        """Testa que salvar de novo a mesma URL não altera o registro."""
+        # Arrange
+        repo = SQLiteVideoRepository(db_path=temp_db_path)
+        url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+        first = Video(
+            url=url,
+            title="Old",
+            file_path="downloads/old.mp4",
+            downloaded_at=datetime(2024, 1, 1),
+        )
+        again = Video(
+            url=url,
+            title="New",
+            file_path="downloads/new.mp4",
+            downloaded_at=datetime(2024, 1, 2),
+        )
+
+        # Act
+        repo.save(first)
+        repo.save(again)
+        saved = repo.save_many([again])
+
+        # Assert
+        assert saved == 0
+        videos = repo.get_all()
+        assert len(videos) == 1
+        assert videos[0].title == "Old"
+        assert videos[0].file_path == "downloads/old.mp4"
+
+    def test_migration_removes_duplicate_video_keys(self, temp_db_path):
+        """Testa a troca do índice antigo de video_key por um UNIQUE."""
+        # Arrange - banco com o índice não único e duas variantes do vídeo
+        import sqlite3
+
+        key, day = "youtube:dQw4w9WgXcQ", "2024-01-01T00:00:00"
+        with sqlite3.connect(temp_db_path) as conn:
+            conn.execute("""
+                CREATE TABLE videos (
+                    id INTEGER PRIMARY key AUTOINCREMENT,
+                    url TEXT NOT NULL,
+                    title TEXT NOT NULL,
+                    file_path TEXT NOT NULL,
+                    downloaded_at TEXT NOT NULL,
+                    video_key TEXT,
+                    UNIQUE(url)
+                )
+            """)
+            conn.execute("CREATE INDEX idx_videos_video_key ON videos(video_key)")
+            conn.executemany(
+                "INSERT INTO videos (url, title, file_path, downloaded_at, video_key) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [
+                    ("https://youtu.be/dQw4w9WgXcQ", "A", "a", day, key),
+                    ("https://youtube.com/watch?v=dQw4w9WgXcQ", "B", "b", day, key),
+                    ("https://example.com/x", "C", "c", day, None),
+                ],
+            )
+
+        # Act
+        repo = SQLiteVideoRepository(db_path=temp_db_path)
+
+        # Assert
+        assert sorted(video.title for video in repo.get_all()) == ["A", "C"]
+        with sqlite3.connect(temp_db_path) as conn:
+            with pytest.raises(sqlite3.IntegrityError):
+                conn.execute(
+                    "INSERT INTO videos (url, title, file_path, downloaded_at, "
+                    "video_key) VALUES ('u', 't', 'f', 'd', ?)",
+                    (key,),
+                )
+
+    def test_records_query_latency(self, temp_db_path, sample_video):
+        """Testa que as operações registram latência no MetricsRecorder."""
+        # Arrange
+        metrics = Mock()
+        repo = SQLiteVideoRepository(db_path=temp_db_path, metrics=metrics)
+
+        # Act
+        repo.save(sample_video)
+        repo.find_by_url(sample_video.url)
+        repo.find_by_urls([sample_video.url])
+
+        # Assert
+        operations = [c.kwargs["operation"] for c in metrics.observe.call_args_list]
+        assert operations == ["save", "find_by_url", "find_by_urls"]
+        assert all(
+            c.args[0] == "ytdl_sqlite_query_seconds" and c.args[1] >= 0
+            for c in metrics.observe.call_args_list
+        )
+
+    def test_content_hash_round_trip(self, temp_db_path, sample_video):
+        """Testa que o hash do conteúdo é gravado e usado na busca."""
+        # Arrange
+        repo = SQLiteVideoRepository(db_path=temp_db_path)
+        sample_video.content_hash = "abc123"
+        mirror = Video(
+            url="https://youtube.com/watch?v=mirror1",
+            title="Mirror",
+            file_path="downloads/mirror.mp4",
+            downloaded_at=datetime(2024, 1, 2),
+            content_hash="abc123",
+        )
+
+        # Act
+        repo.save(sample_video)
+        repo.save_many([mirror])
+
+        # Assert
+        assert repo.find_by_url(mirror.url).content_hash == "abc123"
+        assert repo.find_by_content_hash("abc123").url == sample_video.url
+        assert repo.find_by_content_hash("outro") is None
+
+    def test_content_hashes(self, temp_db_path, sample_video):
+        """Testa a lista de hashes de conteúdo em uso."""
+        # Arrange
+        repo = SQLiteVideoRepository(db_path=temp_db_path)
+        sample_video.content_hash = "abc123"
+        unhashed = Video(
+            url="https://youtube.com/watch?v=nohash1",
+            title="Sem hash",
+            file_path="downloads/nohash.mp4",
+            downloaded_at=datetime(2024, 1, 2),
+        )
+        repo.save_many([sample_video, unhashed])
+
+        # Act
+        hashes = repo.content_hashes()
+
+        # Assert
+        assert hashes == {"abc123"}
+
+    def test_format_profile_round_trip(self, temp_db_path, sample_video):
+        """Testa que o perfil de formato é gravado e lido de volta."""
+        # Arrange
+        repo = SQLiteVideoRepository(db_path=temp_db_path)
+        sample_video.format_profile = FormatProfile.AUDIO
+
+        # Act
+        repo.save(sample_video)
+
+        # Assert
+        assert repo.find_by_url(sample_video.url).format_profile is FormatProfile.AUDIO
+
+    def test_postprocess_status_lifecycle(self, temp_db_path, sample_video):
+        """Testa a busca de pendentes e a atualização do pós-processamento."""
+        # Arrange
+        repo = SQLiteVideoRepository(db_path=temp_db_path)
+        sample_video.postprocess_status = PostprocessStatus.PENDING
+        sample_video.content_hash = "abc"
+        repo.save(sample_video)
+        repo.save(
+            Video(
+                url="https://youtube.com/watch?v=outro",
+                title="Outro",
+                file_path="downloads/outro.mp4",
+                downloaded_at=datetime(2024, 1, 2),
+            )
+        )
+
+        # Act
+        pending = repo.find_by_postprocess_status(PostprocessStatus.PENDING)
+        repo.update_postprocess(
+            sample_video.url,
+            PostprocessStatus.DONE,
+            file_path="downloads/test_video.m4a",
+        )
+
+        # Assert
+        assert [video.url for video in pending] == [sample_video.url]
+        assert repo.find_by_postprocess_status(PostprocessStatus.PENDING) == []
+        video = repo.find_by_url(sample_video.url)
+        assert video.postprocess_status is PostprocessStatus.DONE
+        assert video.file_path == "downloads/test_video.m4a"
+        assert video.content_hash == "abc"
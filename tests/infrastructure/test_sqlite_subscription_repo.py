@@ -0,0 +1,68 @@
+"""
+Testes unitários para SQLiteSubscriptionRepository.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from src.domain.entities import Subscription
+from src.domain.exceptions import InvalidURLException
+from src.infrastructure.sqlite_subscription_repo import SQLiteSubscriptionRepository
+
+
+class TestSQLiteSubscriptionRepository:
+    """Testes para o repositório de assinaturas de canais."""
+
+    def test_save_and_find(self, temp_db_path):
+        """Testa gravar e recuperar uma assinatura."""
+        # Arrange
+        repo = SQLiteSubscriptionRepository(db_path=temp_db_path)
+        subscription = Subscription(
+            url="https://www.youtube.com/@canal",
+            last_video_id="dQw4w9WgXcQ",
+            last_upload_date="20240101",
+            last_synced_at=datetime(2024, 1, 2, 3, 0, 0),
+        )
+
+        # Act
+        repo.save(subscription)
+
+        # Assert
+        assert repo.find("https://www.youtube.com/@canal") == subscription
+
+    def test_find_by_channel_tab(self, temp_db_path):
+        """Testa que a aba de vídeos encontra a assinatura do canal."""
+        # Arrange
+        repo = SQLiteSubscriptionRepository(db_path=temp_db_path)
+        repo.save(Subscription(url="https://www.youtube.com/@Canal"))
+
+        # Act
+        found = repo.find("https://youtube.com/@canal/videos")
+
+        # Assert
+        assert found is not None
+
+    def test_save_updates_mark(self, temp_db_path):
+        """Testa que uma nova gravação substitui a referência."""
+        # Arrange
+        repo = SQLiteSubscriptionRepository(db_path=temp_db_path)
+        url = "https://vimeo.com/channels/staffpicks"
+        repo.save(Subscription(url=url, last_video_id="1"))
+
+        # Act
+        repo.save(Subscription(url=url, last_video_id="2"))
+
+        # Assert
+        assert repo.find(url).last_video_id == "2"
+        assert len(repo.get_all()) == 1
+
+    def test_save_rejects_non_channel(self, temp_db_path):
+        """Testa que apenas URLs de canal podem ser assinadas."""
+        # Arrange
+        repo = SQLiteSubscriptionRepository(db_path=temp_db_path)
+
+        # Act & Assert
+        with pytest.raises(InvalidURLException):
+            repo.save(Subscription(url="https://www.youtube.com/playlist?list=PL1"))
+        assert repo.find("https://www.youtube.com/playlist?list=PL1") is None
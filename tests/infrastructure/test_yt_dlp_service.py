@@ -2,13 +2,16 @@
 Testes unitários para YTDLPService.
 """
 
+import os
+from datetime import datetime
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 import yt_dlp
 
+from src.domain.entities import DownloadStats, FormatProfile, PartialDownload
 from src.domain.exceptions import DownloadFailedException
-from src.infrastructure.yt_dlp_service import YTDLPService
+from src.infrastructure.yt_dlp_service import FORMAT_SELECTORS, YTDLPService
 
 
 class TestYTDLPService:
@@ -37,6 +40,43 @@ class TestYTDLPService:
             "https://youtube.com/watch?v=test123", download=True
         )
 
+    @patch("yt_dlp.YoutubeDL")
+    def test_download_with_path_allocator(self, mock_yt_dlp_class, tmp_path):
+        """Testa que o download usa o caminho reservado e o finaliza."""
+        # Arrange
+        from src.infrastructure.path_allocator import PathAllocator
+
+        mock_ydl_instance = MagicMock()
+        mock_ydl_instance.params = {"outtmpl": {"default": "downloads/%(title)s"}}
+        mock_yt_dlp_class.return_value.__enter__.return_value = mock_ydl_instance
+        allocator = PathAllocator(root=str(tmp_path))
+        templates = []
+
+        def extract_info(url, download):
+            template = mock_ydl_instance.params["outtmpl"]["default"]
+            templates.append(template)
+            with open(template % {"ext": "mp4"}, "wb") as file:
+                file.write(b"video")
+            return {"title": "Test Video", "ext": "mp4"}
+
+        def prepare_filename(info):
+            return templates[0] % {"ext": info["ext"]}
+
+        mock_ydl_instance.extract_info.side_effect = extract_info
+        mock_ydl_instance.prepare_filename.side_effect = prepare_filename
+        service = YTDLPService(path_allocator=allocator)
+
+        # Act
+        _, filename = service.download("https://youtu.be/dQw4w9WgXcQ")
+
+        # Assert
+        assert templates[0].endswith("youtube-dQw4w9WgXcQ.incomplete.%(ext)s")
+        assert filename.endswith("youtube-dQw4w9WgXcQ.mp4")
+        assert os.path.exists(filename)
+        assert not os.path.exists(templates[0] % {"ext": "mp4"})
+        assert mock_ydl_instance.params["outtmpl"]["default"] == "downloads/%(title)s"
+        assert allocator.reserve("youtube:dQw4w9WgXcQ").stem == "youtube-dQw4w9WgXcQ"
+
     @patch("yt_dlp.YoutubeDL")
     def test_download_no_info_returned(self, mock_yt_dlp_class):
         """Testa quando não consegue extrair informações."""
@@ -138,3 +178,715 @@ class TestYTDLPService:
         # Verifica se o template foi usado
         call_args = mock_yt_dlp_class.call_args
         assert call_args[0][0]["outtmpl"] == "custom/path/%(title)s.%(ext)s"
+
+
+class TestYTDLPServiceSession:
+    """Testes para o modo de sessão reutilizável do YTDLPService."""
+
+    @patch("yt_dlp.YoutubeDL")
+    def test_session_reuses_instance(self, mock_yt_dlp_class):
+        """Testa que a mesma instância YoutubeDL é usada em vários downloads."""
+        # Arrange
+        mock_ydl_instance = mock_yt_dlp_class.return_value
+        mock_ydl_instance.extract_info.return_value = {"title": "Video"}
+        mock_ydl_instance.prepare_filename.return_value = "downloads/Video.mp4"
+
+        service = YTDLPService(reuse_session=True)
+
+        # Act
+        service.download("https://youtube.com/watch?v=1")
+        service.download("https://youtube.com/watch?v=2")
+
+        # Assert
+        assert mock_yt_dlp_class.call_count == 1
+        assert mock_ydl_instance.extract_info.call_count == 2
+        mock_ydl_instance.close.assert_not_called()
+
+    @patch("yt_dlp.YoutubeDL")
+    def test_session_per_thread(self, mock_yt_dlp_class):
+        """Testa que cada thread recebe sua própria instância."""
+        # Arrange
+        import threading
+
+        mock_yt_dlp_class.side_effect = lambda opts: MagicMock()
+        service = YTDLPService(reuse_session=True)
+        sessions = []
+
+        def worker():
+            sessions.append(service._session())
+
+        # Act
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        sessions.append(service._session())
+
+        # Assert
+        assert sessions[0] is not sessions[1]
+        assert mock_yt_dlp_class.call_count == 2
+
+    @patch("yt_dlp.YoutubeDL")
+    def test_close_closes_sessions(self, mock_yt_dlp_class):
+        """Testa que close() fecha as sessões abertas."""
+        # Arrange
+        mock_ydl_instance = mock_yt_dlp_class.return_value
+        mock_ydl_instance.extract_info.return_value = {"title": "Video"}
+
+        # Act
+        with YTDLPService(reuse_session=True) as service:
+            service.download("https://youtube.com/watch?v=1")
+
+        # Assert
+        mock_ydl_instance.close.assert_called_once()
+        assert service._sessions == []
+
+    @patch("yt_dlp.YoutubeDL")
+    def test_session_error_is_wrapped(self, mock_yt_dlp_class):
+        """Testa que erros no modo sessão continuam virando DownloadFailed."""
+        # Arrange
+        mock_yt_dlp_class.return_value.extract_info.side_effect = (
+            yt_dlp.utils.DownloadError("Video unavailable")
+        )
+        service = YTDLPService(reuse_session=True)
+
+        # Act & Assert
+        with pytest.raises(DownloadFailedException):
+            service.download("https://youtube.com/watch?v=1")
+
+    def test_service_is_picklable(self):
+        """Testa que o serviço pode ser enviado a um ProcessPoolExecutor."""
+        # Arrange
+        import pickle
+
+        service = YTDLPService(reuse_session=True)
+
+        # Act
+        clone = pickle.loads(pickle.dumps(service))
+
+        # Assert
+        assert clone.reuse_session is True
+        assert clone._sessions == []
+
+
+class TestYTDLPServiceProbe:
+    """Testes para probe() e o reaproveitamento de metadados."""
+
+    @patch("yt_dlp.YoutubeDL")
+    def test_probe_does_not_download(self, mock_yt_dlp_class):
+        """Testa que probe extrai metadados com download=False."""
+        # Arrange
+        mock_ydl_instance = MagicMock()
+        mock_yt_dlp_class.return_value.__enter__.return_value = mock_ydl_instance
+        mock_ydl_instance.extract_info.return_value = {"title": "Video"}
+        mock_ydl_instance.sanitize_info.side_effect = lambda info: info
+
+        service = YTDLPService()
+
+        # Act
+        info = service.probe("https://youtube.com/watch?v=test123")
+
+        # Assert
+        assert info == {"title": "Video"}
+        mock_ydl_instance.extract_info.assert_called_once_with(
+            "https://youtube.com/watch?v=test123", download=False
+        )
+
+    @patch("yt_dlp.YoutubeDL")
+    def test_probe_uses_cache(self, mock_yt_dlp_class):
+        """Testa que probe consulta o cache antes do extrator."""
+        # Arrange
+        mock_cache = Mock()
+        mock_cache.get.return_value = {"title": "Cached"}
+        service = YTDLPService(probe_cache=mock_cache)
+
+        # Act
+        info = service.probe("https://youtu.be/dQw4w9WgXcQ")
+
+        # Assert
+        assert info == {"title": "Cached"}
+        mock_cache.get.assert_called_once_with("youtube:dQw4w9WgXcQ")
+        mock_yt_dlp_class.assert_not_called()
+
+    @patch("yt_dlp.YoutubeDL")
+    def test_probe_stores_in_cache(self, mock_yt_dlp_class):
+        """Testa que o resultado do probe é guardado no cache."""
+        # Arrange
+        mock_ydl_instance = MagicMock()
+        mock_yt_dlp_class.return_value.__enter__.return_value = mock_ydl_instance
+        mock_ydl_instance.extract_info.return_value = {"title": "Video"}
+        mock_ydl_instance.sanitize_info.side_effect = lambda info: info
+        mock_cache = Mock()
+        mock_cache.get.return_value = None
+        service = YTDLPService(probe_cache=mock_cache)
+
+        # Act
+        service.probe("https://example.com/video")
+
+        # Assert
+        mock_cache.put.assert_called_once_with(
+            "https://example.com/video", {"title": "Video"}
+        )
+
+    @patch("yt_dlp.YoutubeDL")
+    def test_probe_error(self, mock_yt_dlp_class):
+        """Testa que erros de extração viram DownloadFailedException."""
+        # Arrange
+        mock_ydl_instance = MagicMock()
+        mock_yt_dlp_class.return_value.__enter__.return_value = mock_ydl_instance
+        mock_ydl_instance.extract_info.side_effect = yt_dlp.utils.DownloadError(
+            "Private video"
+        )
+        service = YTDLPService()
+
+        # Act & Assert
+        with pytest.raises(DownloadFailedException) as exc_info:
+            service.probe("https://youtube.com/watch?v=test123")
+        assert "Private video" in str(exc_info.value)
+
+    @patch("yt_dlp.YoutubeDL")
+    def test_download_reuses_cached_info(self, mock_yt_dlp_class):
+        """Testa que o download reaproveita os metadados do probe."""
+        # Arrange
+        mock_ydl_instance = MagicMock()
+        mock_yt_dlp_class.return_value.__enter__.return_value = mock_ydl_instance
+        cached = {"title": "Cached", "formats": []}
+        mock_ydl_instance.process_ie_result.return_value = cached
+        mock_ydl_instance.prepare_filename.return_value = "downloads/Cached.mp4"
+        mock_cache = Mock()
+        mock_cache.get.return_value = cached
+        service = YTDLPService(probe_cache=mock_cache)
+
+        # Act
+        title, _ = service.download("https://youtube.com/watch?v=test123")
+
+        # Assert
+        assert title == "Cached"
+        mock_ydl_instance.process_ie_result.assert_called_once_with(
+            cached, download=True
+        )
+        mock_ydl_instance.extract_info.assert_not_called()
+
+    @patch("yt_dlp.YoutubeDL")
+    def test_download_falls_back_when_cache_is_stale(self, mock_yt_dlp_class):
+        """Testa que metadados obsoletos são descartados e re-extraídos."""
+        # Arrange
+        mock_ydl_instance = MagicMock()
+        mock_yt_dlp_class.return_value.__enter__.return_value = mock_ydl_instance
+        mock_ydl_instance.process_ie_result.side_effect = yt_dlp.utils.DownloadError(
+            "HTTP Error 403: Forbidden"
+        )
+        mock_ydl_instance.extract_info.return_value = {"title": "Fresh"}
+        mock_cache = Mock()
+        mock_cache.get.return_value = {"title": "Stale"}
+        service = YTDLPService(probe_cache=mock_cache)
+
+        # Act
+        title, _ = service.download("https://youtube.com/watch?v=test123")
+
+        # Assert
+        assert title == "Fresh"
+        mock_cache.invalidate.assert_called_once()
+
+
+class TestYTDLPServiceResume:
+    """Testes para a retomada de downloads interrompidos."""
+
+    URL = "https://youtube.com/watch?v=dQw4w9WgXcQ"
+
+    def _progress(self, downloaded=1024):
+        return {
+            "status": "downloading",
+            "tmpfilename": "downloads/Video.mp4.part",
+            "downloaded_bytes": downloaded,
+            "total_bytes": 4096,
+            "info_dict": {"original_url": self.URL, "format_id": "18"},
+        }
+
+    def test_options_enable_resume(self):
+        """Testa que as opções mantêm o .part e ativam fragmentos paralelos."""
+        # Arrange
+        service = YTDLPService(fragment_concurrency=4)
+
+        # Act
+        options = service._build_options()
+
+        # Assert
+        assert options["continuedl"] is True
+        assert options["nopart"] is False
+        assert options["concurrent_fragment_downloads"] == 4
+        assert options["progress_hooks"] == [service._on_progress]
+
+    def test_defer_postprocess_disables_fixup(self):
+        """Testa que, com pós-processamento adiado, o yt-dlp não faz fixup."""
+        assert "fixup" not in YTDLPService()._build_options()
+        options = YTDLPService(defer_postprocess=True)._build_options()
+        assert options["fixup"] == "never"
+
+    def test_progress_hook_saves_partial(self):
+        """Testa que o hook de progresso grava o estado do download."""
+        # Arrange
+        partial_repo = Mock()
+        service = YTDLPService(partial_repo=partial_repo)
+
+        # Act
+        service._on_progress(self._progress())
+
+        # Assert
+        partial = partial_repo.save_progress.call_args[0][0]
+        assert partial.url == self.URL
+        assert partial.temp_path == "downloads/Video.mp4.part"
+        assert partial.bytes_done == 1024
+        assert partial.total_bytes == 4096
+        assert partial.format_id == "18"
+
+    def test_progress_hook_saves_merged_format(self):
+        """Testa que downloads mesclados gravam o seletor de todos os streams."""
+        # Arrange
+        partial_repo = Mock()
+        service = YTDLPService(partial_repo=partial_repo)
+        status = self._progress()
+        status["info_dict"]["format_id"] = "137"
+        status["info_dict"]["requested_formats"] = [
+            {"format_id": "137"},
+            {"format_id": "140"},
+        ]
+
+        # Act
+        service._on_progress(status)
+
+        # Assert
+        partial = partial_repo.save_progress.call_args[0][0]
+        assert partial.format_id == "137+140"
+
+    def test_progress_hook_is_throttled(self):
+        """Testa que o progresso é gravado no máximo uma vez por intervalo."""
+        # Arrange
+        partial_repo = Mock()
+        service = YTDLPService(partial_repo=partial_repo, progress_interval=60)
+
+        # Act
+        service._on_progress(self._progress(1024))
+        service._on_progress(self._progress(2048))
+
+        # Assert
+        partial_repo.save_progress.assert_called_once()
+
+    def test_progress_hook_ignores_finished(self):
+        """Testa que eventos que não são de progresso são ignorados."""
+        # Arrange
+        partial_repo = Mock()
+        service = YTDLPService(partial_repo=partial_repo)
+
+        # Act
+        service._on_progress({"status": "finished", "info_dict": {}})
+
+        # Assert
+        partial_repo.save_progress.assert_not_called()
+
+    @patch("yt_dlp.YoutubeDL")
+    def test_failed_download_forgets_progress_throttle(self, mock_yt_dlp_class):
+        """Testa que uma falha não deixa a URL no controle de intervalo."""
+        # Arrange
+        import yt_dlp
+
+        partial_repo = Mock()
+        partial_repo.find.return_value = None
+        service = YTDLPService(reuse_session=True, partial_repo=partial_repo)
+
+        def fail(url, download):
+            service._on_progress(self._progress())
+            raise yt_dlp.utils.DownloadError("Connection reset")
+
+        mock_yt_dlp_class.return_value.extract_info.side_effect = fail
+
+        # Act
+        with pytest.raises(DownloadFailedException):
+            service.download(self.URL)
+
+        # Assert
+        partial_repo.save_progress.assert_called_once()
+        partial_repo.delete.assert_not_called()
+        assert service._progress_saved_at == {}
+
+    @patch("yt_dlp.YoutubeDL")
+    def test_resume_requests_same_format(self, mock_yt_dlp_class, tmp_path):
+        """Testa que a retomada pede o mesmo formato do arquivo .part."""
+        # Arrange
+        part_file = tmp_path / "Video.mp4.part"
+        part_file.write_bytes(b"x" * 1024)
+        partial_repo = Mock()
+        partial_repo.find.return_value = PartialDownload(
+            url=self.URL,
+            temp_path=str(part_file),
+            bytes_done=1024,
+            updated_at=datetime.now(),
+            format_id="18",
+        )
+
+        mock_ydl_instance = mock_yt_dlp_class.return_value
+        mock_ydl_instance.params = {"format": "best"}
+        formats_seen = []
+        mock_ydl_instance.extract_info.side_effect = lambda url, download: (
+            formats_seen.append(mock_ydl_instance.params["format"])
+            or {"title": "Video"}
+        )
+        service = YTDLPService(reuse_session=True, partial_repo=partial_repo)
+
+        # Act
+        service.download(self.URL)
+
+        # Assert
+        assert formats_seen == ["18"]
+        assert mock_ydl_instance.params["format"] == "best"
+        partial_repo.delete.assert_called_once_with(self.URL)
+
+    @patch("yt_dlp.YoutubeDL")
+    def test_profile_selects_format(self, mock_yt_dlp_class):
+        """Testa que o perfil vira o seletor de formato do download."""
+        # Arrange
+        mock_ydl_instance = mock_yt_dlp_class.return_value
+        mock_ydl_instance.params = {"format": None}
+        formats_seen = []
+        mock_ydl_instance.extract_info.side_effect = lambda url, download: (
+            formats_seen.append(mock_ydl_instance.params["format"])
+            or {"title": "Video"}
+        )
+        service = YTDLPService(reuse_session=True)
+
+        # Act
+        service.download(self.URL, profile=FormatProfile.SD)
+        service.download(self.URL)
+
+        # Assert
+        assert formats_seen == [FORMAT_SELECTORS[FormatProfile.SD], None]
+        assert FORMAT_SELECTORS[FormatProfile.SD].startswith("best[height<=720]")
+
+    @patch("yt_dlp.YoutubeDL")
+    def test_stale_partial_is_discarded(self, mock_yt_dlp_class):
+        """Testa que o progresso sem arquivo .part é descartado."""
+        # Arrange
+        partial_repo = Mock()
+        partial_repo.find.return_value = PartialDownload(
+            url=self.URL,
+            temp_path="/nao/existe.part",
+            bytes_done=1024,
+            updated_at=datetime.now(),
+            format_id="18",
+        )
+        mock_ydl_instance = mock_yt_dlp_class.return_value
+        mock_ydl_instance.params = {}
+        mock_ydl_instance.extract_info.return_value = {"title": "Video"}
+        service = YTDLPService(reuse_session=True, partial_repo=partial_repo)
+
+        # Act
+        service.download(self.URL)
+
+        # Assert
+        assert "format" not in mock_ydl_instance.params
+        assert partial_repo.delete.call_count == 2
+
+    @patch("yt_dlp.YoutubeDL")
+    def test_failed_download_keeps_partial(self, mock_yt_dlp_class):
+        """Testa que uma falha mantém o progresso para a próxima tentativa."""
+        # Arrange
+        partial_repo = Mock()
+        partial_repo.find.return_value = None
+        mock_yt_dlp_class.return_value.extract_info.side_effect = (
+            yt_dlp.utils.DownloadError("Connection reset")
+        )
+        service = YTDLPService(reuse_session=True, partial_repo=partial_repo)
+
+        # Act
+        with pytest.raises(DownloadFailedException):
+            service.download(self.URL)
+
+        # Assert
+        partial_repo.delete.assert_not_called()
+
+
+class TestYTDLPServiceRateLimit:
+    """Testes para os limites de requisições e de banda."""
+
+    def test_progress_hook_consumes_bandwidth(self):
+        """Testa que o hook contabiliza apenas os bytes novos."""
+        # Arrange
+        bandwidth = Mock()
+        service = YTDLPService(bandwidth=bandwidth)
+
+        def event(downloaded, status="downloading"):
+            return {
+                "status": status,
+                "tmpfilename": "downloads/Video.mp4.part",
+                "downloaded_bytes": downloaded,
+            }
+
+        # Act
+        service._on_progress(event(1000))
+        service._on_progress(event(1500))
+        service._on_progress(event(4000))
+        service._on_progress(event(4000, status="finished"))
+
+        # Assert
+        consumed = [c.args[0] for c in bandwidth.consume.call_args_list]
+        assert consumed == [0, 500, 2500]
+        assert service._bytes_seen == {}
+
+    @patch("yt_dlp.YoutubeDL")
+    def test_download_waits_for_host_limiter(self, mock_yt_dlp_class):
+        """Testa que o download respeita o limite de requisições do host."""
+        # Arrange
+        limiter = Mock()
+        mock_ydl_instance = mock_yt_dlp_class.return_value
+        mock_ydl_instance.extract_info.return_value = {"title": "Video"}
+        service = YTDLPService(reuse_session=True, request_limiter=limiter)
+
+        # Act
+        service.download("https://youtube.com/watch?v=1")
+
+        # Assert
+        limiter.acquire.assert_called_once_with("https://youtube.com/watch?v=1")
+
+    def test_limits_are_not_pickled(self):
+        """Testa que os limites (com locks) não são enviados a outro processo."""
+        # Arrange
+        import pickle
+
+        from src.infrastructure.rate_limiter import BandwidthGovernor, HostRateLimiter
+
+        service = YTDLPService(
+            request_limiter=HostRateLimiter(1), bandwidth=BandwidthGovernor(1000)
+        )
+
+        # Act
+        clone = pickle.loads(pickle.dumps(service))
+
+        # Assert
+        assert clone.request_limiter is None
+        assert clone.bandwidth is None
+
+
+class TestYTDLPServicePlaylist:
+    """Testes para a enumeração de playlists e canais."""
+
+    @patch("yt_dlp.YoutubeDL")
+    def test_iter_playlist_uses_flat_lazy_extraction(self, mock_yt_dlp_class):
+        """Testa que a coleção é lida com extract_flat, sem processar entradas."""
+        # Arrange
+        mock_ydl_instance = MagicMock()
+        mock_yt_dlp_class.return_value.__enter__.return_value = mock_ydl_instance
+        mock_ydl_instance.extract_info.return_value = {
+            "_type": "playlist",
+            "entries": iter(
+                [
+                    {
+                        "_type": "url",
+                        "url": "https://www.youtube.com/watch?v=aaaaaaaaaaa",
+                        "id": "aaaaaaaaaaa",
+                        "title": "A",
+                    },
+                    None,
+                    {"_type": "url", "url": "https://vimeo.com/2", "id": "2"},
+                ]
+            ),
+        }
+        service = YTDLPService()
+
+        # Act
+        entries = list(service.iter_playlist("https://www.youtube.com/@canal"))
+
+        # Assert
+        assert [e.url for e in entries] == [
+            "https://www.youtube.com/watch?v=aaaaaaaaaaa",
+            "https://vimeo.com/2",
+        ]
+        assert entries[0].title == "A"
+        options = mock_yt_dlp_class.call_args[0][0]
+        assert options["extract_flat"] == "in_playlist"
+        assert options["lazy_playlist"] is True
+        mock_ydl_instance.extract_info.assert_called_once_with(
+            "https://www.youtube.com/@canal", download=False, process=False
+        )
+
+    @patch("yt_dlp.YoutubeDL")
+    def test_iter_playlist_descends_into_tabs(self, mock_yt_dlp_class):
+        """Testa que abas do canal (sub-coleções) também são percorridas."""
+        # Arrange
+        mock_ydl_instance = MagicMock()
+        mock_yt_dlp_class.return_value.__enter__.return_value = mock_ydl_instance
+        videos_tab = {
+            "_type": "playlist",
+            "entries": [{"url": "https://www.youtube.com/watch?v=bbbbbbbbbbb"}],
+        }
+        mock_ydl_instance.extract_info.side_effect = [
+            {
+                "_type": "playlist",
+                "entries": [
+                    {"_type": "url", "url": "https://www.youtube.com/@canal/videos"}
+                ],
+            },
+            videos_tab,
+        ]
+        service = YTDLPService()
+
+        # Act
+        entries = list(service.iter_playlist("https://www.youtube.com/@canal"))
+
+        # Assert
+        assert [e.url for e in entries] == [
+            "https://www.youtube.com/watch?v=bbbbbbbbbbb"
+        ]
+
+    @patch("yt_dlp.YoutubeDL")
+    def test_iter_playlist_error(self, mock_yt_dlp_class):
+        """Testa que erros do yt-dlp viram DownloadFailedException."""
+        # Arrange
+        mock_ydl_instance = MagicMock()
+        mock_yt_dlp_class.return_value.__enter__.return_value = mock_ydl_instance
+        mock_ydl_instance.extract_info.side_effect = yt_dlp.utils.DownloadError(
+            "This playlist does not exist"
+        )
+        service = YTDLPService()
+
+        # Act & Assert
+        with pytest.raises(DownloadFailedException):
+            list(service.iter_playlist("https://www.youtube.com/playlist?list=X"))
+
+    def test_download_options_disable_playlists(self):
+        """Testa que o download de um vídeo nunca baixa a playlist inteira."""
+        assert YTDLPService()._build_options()["noplaylist"] is True
+
+
+class TestYTDLPServiceMetrics:
+    """Testes para as métricas preenchidas pelos hooks do yt-dlp."""
+
+    URL = "https://youtube.com/watch?v=dQw4w9WgXcQ"
+
+    @patch("yt_dlp.YoutubeDL")
+    def test_download_fills_stats(self, mock_yt_dlp_class):
+        """Testa transferência, pós-processamento, extração e bytes."""
+        # Arrange
+        mock_ydl_instance = mock_yt_dlp_class.return_value
+        service = YTDLPService(reuse_session=True)
+        stats = DownloadStats(url=self.URL, started_at=datetime.now())
+        info = {"original_url": self.URL}
+
+        def progress(status, downloaded):
+            service._on_progress(
+                {
+                    "status": status,
+                    "filename": "downloads/Video.mp4",
+                    "downloaded_bytes": downloaded,
+                    "info_dict": info,
+                }
+            )
+
+        def extract_info(url, download):
+            progress("downloading", 1000)
+            progress("downloading", 3000)
+            progress("finished", 5000)
+            for status in ("started", "finished"):
+                service._on_postprocess(
+                    {"status": status, "postprocessor": "Merger", "info_dict": info}
+                )
+            return {"title": "Video"}
+
+        mock_ydl_instance.extract_info.side_effect = extract_info
+        clock = iter([0.0, 1.0, 1.0, 4.0, 4.5, 5.0, 6.0])
+
+        # Act
+        with patch(
+            "src.infrastructure.yt_dlp_service.time.perf_counter",
+            side_effect=lambda: next(clock),
+        ):
+            service.download(self.URL, stats=stats)
+
+        # Assert
+        assert stats.transfer_s == pytest.approx(3.0)
+        assert stats.postprocess_s == pytest.approx(0.5)
+        assert stats.extraction_s == pytest.approx(2.5)
+        # Os 1000 bytes do primeiro evento já existiam no .part
+        assert stats.bytes_downloaded == 4000
+        assert service._active_stats == {}
+
+    @patch("yt_dlp.YoutubeDL")
+    def test_download_updates_recorder(self, mock_yt_dlp_class):
+        """Testa o gauge de downloads ativos e o contador de bytes."""
+        # Arrange
+        metrics = Mock()
+        service = YTDLPService(reuse_session=True, metrics=metrics)
+        mock_ydl_instance = mock_yt_dlp_class.return_value
+
+        def extract_info(url, download):
+            metrics.inc.assert_called_with("ytdl_active_downloads")
+            for downloaded in (100, 600):
+                service._on_progress(
+                    {
+                        "status": "downloading",
+                        "tmpfilename": "downloads/Video.mp4.part",
+                        "downloaded_bytes": downloaded,
+                    }
+                )
+            return {"title": "Video"}
+
+        mock_ydl_instance.extract_info.side_effect = extract_info
+
+        # Act
+        service.download(self.URL)
+
+        # Assert
+        assert [c.args for c in metrics.inc.call_args_list] == [
+            ("ytdl_active_downloads",),
+            ("ytdl_downloaded_bytes_total", 500),
+            ("ytdl_active_downloads", -1),
+        ]
+
+    def test_hooks_ignore_untracked_downloads(self):
+        """Testa que os hooks não medem nada sem download com métricas."""
+        # Arrange
+        service = YTDLPService()
+
+        # Act
+        service._on_progress(
+            {"status": "downloading", "filename": "a.mp4", "downloaded_bytes": 1}
+        )
+
+        # Assert
+        assert service._transfer_started == {}
+
+    def test_progress_forwarded_to_content_store(self):
+        """Testa que o hook de progresso alimenta o hash do ContentStore."""
+        # Arrange
+        content_store = Mock()
+        service = YTDLPService(content_store=content_store)
+        status = {"status": "finished", "filename": "a.mp4"}
+
+        # Act
+        service._on_progress(status)
+
+        # Assert
+        content_store.on_progress.assert_called_once_with(status)
+
+
+class TestLazyImport:
+    """Testes para a importação tardia do yt-dlp."""
+
+    def test_module_import_does_not_load_yt_dlp(self):
+        """Testa que importar o serviço (e o main) não carrega o yt-dlp."""
+        # Arrange
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, main\n"
+            "from src.infrastructure.yt_dlp_service import YTDLPService\n"
+            "YTDLPService()\n"
+            "print('yt_dlp' in sys.modules)"
+        )
+
+        # Act
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        # Assert
+        assert result.stdout.strip() == "False"
@@ -2,19 +2,33 @@
 Testes unitários para a interface CLI.
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from io import StringIO
 from unittest.mock import MagicMock, Mock, patch
 
+import json
+
 import pytest
 
-from src.domain.entities import Video
+from src.domain.entities import FormatProfile, Video
 from src.domain.exceptions import (
     DownloadFailedException,
     InvalidURLException,
     VideoNotSavedException,
 )
-from src.presentation.cli import clear_screen, run_cli
+from src.presentation.cli import (
+    clear_screen,
+    iter_urls,
+    parse_args,
+    run_batch_cli,
+    run_cli,
+    run_history_cli,
+    run_stats_cli,
+    run_sync_cli,
+)
+from src.usecases.download_video_batch import BatchItemResult
+from src.usecases.summarize_metrics import MetricsSummary
+from src.usecases.sync_channel import ChannelSyncResult
 
 
 class TestClearScreen:
@@ -243,3 +257,359 @@ class TestRunCLI:
 
         # Pelo menos uma das chamadas deve conter o título
         assert any("Amazing Video" in str(call) for call in print_calls)
+
+
+class TestParseArgs:
+    """Testes para os argumentos de linha de comando."""
+
+    def test_defaults(self):
+        """Testa que sem argumentos o modo interativo é usado."""
+        args = parse_args([])
+        assert args.batch is None
+        assert args.jobs == 4
+        assert args.per_host == 4
+        assert args.json is False
+
+    def test_batch_options(self):
+        """Testa as opções do modo batch."""
+        args = parse_args(["--batch", "-", "--jobs", "8", "--per-host", "2", "--json"])
+        assert args.batch == "-"
+        assert args.jobs == 8
+        assert args.per_host == 2
+        assert args.json is True
+
+    def test_history_option(self):
+        """Testa a opção --history com e sem valor."""
+        assert parse_args(["--history"]).history == 20
+        assert parse_args(["--history", "5"]).history == 5
+        assert parse_args([]).history is None
+
+    def test_stats_option(self):
+        """Testa a opção --stats com e sem janela."""
+        assert parse_args(["--stats"]).stats == 24
+        assert parse_args(["--stats", "0.5"]).stats == 0.5
+        assert parse_args([]).stats is None
+        with pytest.raises(SystemExit):
+            parse_args(["--stats", "0"])
+
+    def test_metrics_port_option(self):
+        """Testa a opção --metrics-port."""
+        assert parse_args(["--metrics-port", "9464"]).metrics_port == 9464
+        assert parse_args([]).metrics_port is None
+        with pytest.raises(SystemExit):
+            parse_args(["--metrics-port", "70000"])
+
+    def test_rate_limit_options(self):
+        """Testa --limit-rate com sufixos e --host-rps."""
+        args = parse_args(["--limit-rate", "2M", "--host-rps", "0.5"])
+        assert args.limit_rate == 2 * 1024 * 1024
+        assert args.host_rps == 0.5
+        assert parse_args(["--limit-rate", "500k"]).limit_rate == 500 * 1024
+        assert parse_args([]).limit_rate is None
+
+    def test_invalid_rate(self):
+        """Testa que taxas inválidas encerram com erro."""
+        with pytest.raises(SystemExit):
+            parse_args(["--limit-rate", "rápido"])
+        with pytest.raises(SystemExit):
+            parse_args(["--limit-rate", "0"])
+
+    def test_retry_failed_option(self):
+        """Testa a opção --retry-failed."""
+        assert parse_args([]).retry_failed is False
+        assert parse_args(["--retry-failed"]).retry_failed is True
+
+    def test_profile_option(self):
+        """Testa a opção --profile."""
+        assert parse_args([]).profile is None
+        assert parse_args(["--profile", "720p"]).profile is FormatProfile.SD
+        with pytest.raises(SystemExit):
+            parse_args(["--profile", "4k"])
+
+    def test_no_dedup_option(self):
+        """Testa a opção --no-dedup."""
+        assert parse_args([]).no_dedup is False
+        assert parse_args(["--no-dedup"]).no_dedup is True
+
+    def test_postprocess_option(self):
+        """Testa a opção --postprocess."""
+        assert parse_args([]).postprocess is False
+        assert parse_args(["--postprocess"]).postprocess is True
+
+    def test_serve_option(self):
+        """Testa a opção --serve e a porta padrão."""
+        assert parse_args([]).serve is None
+        assert parse_args(["--serve"]).serve == 8765
+        assert parse_args(["--serve", "9000"]).serve == 9000
+        with pytest.raises(SystemExit):
+            parse_args(["--serve", "70000"])
+
+    def test_invalid_jobs(self):
+        """Testa que --jobs precisa ser positivo."""
+        with pytest.raises(SystemExit):
+            parse_args(["--jobs", "0"])
+
+
+class TestIterUrls:
+    """Testes para a leitura de URLs do modo batch."""
+
+    def test_skips_blank_lines_and_comments(self):
+        """Testa que linhas vazias e comentários são ignorados."""
+        lines = ["https://a.com/1\n", "\n", "  # comentário\n", " https://a.com/2 "]
+        assert list(iter_urls(lines)) == ["https://a.com/1", "https://a.com/2"]
+
+    def test_is_lazy(self):
+        """Testa que as linhas são lidas sob demanda."""
+        # Arrange
+        consumed = []
+
+        def lines():
+            for i in range(3):
+                consumed.append(i)
+                yield f"https://a.com/{i}\n"
+
+        # Act
+        first = next(iter_urls(lines()))
+
+        # Assert
+        assert first == "https://a.com/0"
+        assert consumed == [0]
+
+
+class TestRunBatchCLI:
+    """Testes para a interface não interativa."""
+
+    def _usecase(self):
+        """Cria um caso de uso de lote falso com um sucesso e uma falha."""
+        video = Video(
+            url="https://youtube.com/watch?v=1",
+            title="Video 1",
+            file_path="downloads/1.mp4",
+            downloaded_at=datetime(2024, 1, 1, 12, 0, 0),
+        )
+        mock_usecase = Mock()
+        mock_usecase.run.side_effect = lambda urls: iter(
+            [
+                BatchItemResult(index=0, url=video.url, video=video),
+                BatchItemResult(
+                    index=1,
+                    url="https://youtube.com/watch?v=2",
+                    error=DownloadFailedException(
+                        "https://youtube.com/watch?v=2", "Private video"
+                    ),
+                ),
+            ]
+        )
+        return mock_usecase
+
+    @patch("builtins.print")
+    def test_json_output(self, mock_print):
+        """Testa a saída JSON (um objeto por linha)."""
+        # Arrange
+        out = StringIO()
+
+        # Act
+        exit_code = run_batch_cli(
+            self._usecase(), ["https://youtube.com/watch?v=1"], True, out
+        )
+
+        # Assert
+        lines = [json.loads(line) for line in out.getvalue().splitlines()]
+        assert exit_code == 1
+        assert lines[0]["ok"] is True
+        assert lines[0]["file_path"] == "downloads/1.mp4"
+        assert lines[1] == {
+            "url": "https://youtube.com/watch?v=2",
+            "ok": False,
+            "error": "Private video",
+        }
+
+    @patch("builtins.print")
+    def test_text_output(self, mock_print):
+        """Testa a saída em texto."""
+        # Arrange
+        out = StringIO()
+
+        # Act
+        run_batch_cli(self._usecase(), [], out=out)
+
+        # Assert
+        text = out.getvalue()
+        assert "downloads/1.mp4" in text
+        assert "Private video" in text
+
+    def test_expander_failure_is_reported(self):
+        """Testa que uma coleção que não pode ser listada conta como falha."""
+
+        # Arrange
+        def expand(urls, on_error):
+            for url in urls:
+                on_error(url, DownloadFailedException(url, "Playlist privada"))
+            return iter([])
+
+        expander = Mock()
+        expander.expand.side_effect = expand
+        mock_usecase = Mock()
+        mock_usecase.run.side_effect = lambda urls: iter(list(urls))
+        out = StringIO()
+
+        # Act
+        exit_code = run_batch_cli(
+            mock_usecase,
+            ["https://www.youtube.com/playlist?list=PL1"],
+            json_output=True,
+            out=out,
+            expander=expander,
+        )
+
+        # Assert
+        assert exit_code == 1
+        assert json.loads(out.getvalue()) == {
+            "url": "https://www.youtube.com/playlist?list=PL1",
+            "ok": False,
+            "error": "Playlist privada",
+        }
+
+    def test_queue_usecase(self):
+        """Testa que, com a fila, o lote é processado por run_batch."""
+        # Arrange
+        batch = self._usecase()
+        queue = Mock()
+        queue.run_batch.side_effect = lambda usecase, urls: usecase.run(urls)
+        out = StringIO()
+
+        # Act
+        exit_code = run_batch_cli(
+            batch, ["https://youtube.com/watch?v=1"], True, out, queue_usecase=queue
+        )
+
+        # Assert
+        assert exit_code == 1
+        assert len(out.getvalue().splitlines()) == 2
+        assert queue.run_batch.call_args.args[0] is batch
+
+    def test_exit_code_success(self):
+        """Testa que o código de saída é 0 quando tudo dá certo."""
+        # Arrange
+        mock_usecase = Mock()
+        mock_usecase.run.return_value = iter([])
+
+        # Act & Assert
+        assert run_batch_cli(mock_usecase, [], json_output=True, out=StringIO()) == 0
+
+
+class TestRunSyncCLI:
+    """Testes para a sincronização de canais pela linha de comando."""
+
+    def test_sync_enqueues_and_processes(self):
+        """Testa que cada canal é sincronizado e a fila é processada."""
+        # Arrange
+        mock_sync = Mock()
+        mock_sync.execute.side_effect = [
+            ChannelSyncResult(url="a", new_urls=["https://youtube.com/watch?v=1"]),
+            InvalidURLException("b", "URL não é de um canal"),
+        ]
+        mock_queue = Mock()
+        mock_queue.run.return_value = 1
+        out = StringIO()
+
+        # Act
+        exit_code = run_sync_cli(
+            mock_sync, mock_queue, ["a", "b"], json_output=True, out=out
+        )
+
+        # Assert
+        lines = [json.loads(line) for line in out.getvalue().splitlines()]
+        assert exit_code == 1
+        assert lines[0] == {"url": "a", "ok": True, "new": 1}
+        assert lines[1]["ok"] is False
+        mock_queue.recover.assert_called_once()
+        mock_queue.run.assert_called_once()
+
+    def test_sync_option(self):
+        """Testa --sync com e sem canais."""
+        assert parse_args([]).sync is None
+        assert parse_args(["--sync"]).sync == []
+        assert parse_args(["--sync", "a", "b"]).sync == ["a", "b"]
+
+
+class TestRunHistoryCLI:
+    """Testes para a listagem do histórico."""
+
+    def test_lists_recent_videos(self, sample_video):
+        """Testa que o histórico é lido com iter_videos e o limite informado."""
+        # Arrange
+        mock_repo = Mock()
+        mock_repo.iter_videos.return_value = iter([sample_video])
+        out = StringIO()
+
+        # Act
+        run_history_cli(mock_repo, limit=5, json_output=True, out=out)
+
+        # Assert
+        mock_repo.iter_videos.assert_called_once_with(limit=5)
+        data = json.loads(out.getvalue())
+        assert data["title"] == sample_video.title
+
+    def test_text_output(self, sample_video):
+        """Testa a listagem em texto."""
+        # Arrange
+        mock_repo = Mock()
+        mock_repo.iter_videos.return_value = iter([sample_video])
+        out = StringIO()
+
+        # Act
+        run_history_cli(mock_repo, out=out)
+
+        # Assert
+        assert "01/01/2024 12:00:00" in out.getvalue()
+        assert sample_video.title in out.getvalue()
+
+
+class TestRunStatsCLI:
+    """Testes para o resumo das métricas de download."""
+
+    def _summary(self):
+        return MetricsSummary(
+            since=datetime(2024, 1, 1, 12, 0),
+            until=datetime(2024, 1, 2, 12, 0),
+            count=3,
+            outcomes={"downloaded": 2, "failed": 1},
+            latencies={"total": {"p50": 1.5, "p95": 9.25, "p99": 9.85}},
+            bytes_downloaded=3 * 1024 * 1024,
+            avg_speed=512 * 1024,
+            downloads_per_hour=0.08,
+        )
+
+    def test_text_output(self):
+        """Testa o resumo em texto com percentis e vazão."""
+        # Arrange
+        usecase = Mock()
+        usecase.execute.return_value = self._summary()
+        out = StringIO()
+
+        # Act
+        run_stats_cli(usecase, hours=24, out=out)
+
+        # Assert
+        usecase.execute.assert_called_once_with(timedelta(hours=24))
+        text = out.getvalue()
+        assert "failed: 1" in text
+        assert "9.25" in text
+        assert "3.0 MB" in text
+        assert "512.0 KB/s" in text
+
+    def test_json_output(self):
+        """Testa o resumo em JSON."""
+        # Arrange
+        usecase = Mock()
+        usecase.execute.return_value = self._summary()
+        out = StringIO()
+
+        # Act
+        run_stats_cli(usecase, hours=1, json_output=True, out=out)
+
+        # Assert
+        data = json.loads(out.getvalue())
+        assert data["count"] == 3
+        assert data["latencies"]["total"]["p95"] == 9.25
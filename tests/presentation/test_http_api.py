@@ -0,0 +1,205 @@
+"""
+Testes para a API HTTP do modo servidor.
+"""
+
+import http.client
+import json
+import time
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from src.domain.entities import Job, JobStatus, Video
+from src.domain.exceptions import InvalidURLException, JobQueueException
+from src.infrastructure.sqlite_pool import SQLiteConnectionPool
+from src.infrastructure.sqlite_repo import SQLiteVideoRepository
+from src.presentation.http_api import DownloadApiServer
+
+URL = "https://youtube.com/watch?v=1"
+
+
+def make_job(status=JobStatus.PENDING):
+    return Job(
+        id=7,
+        url=URL,
+        status=status,
+        attempts=0,
+        created_at=datetime(2024, 1, 1),
+        updated_at=datetime(2024, 1, 1),
+    )
+
+
+def make_video():
+    return Video(
+        url=URL,
+        title="Video",
+        file_path="downloads/a.mp4",
+        downloaded_at=datetime(2024, 1, 2),
+    )
+
+
+@pytest.fixture
+def api():
+    """Servidor em uma porta livre, com fila e repositório mock."""
+    queue = Mock()
+    queue.serve.return_value = 0
+    repo = Mock()
+    server = DownloadApiServer(queue, repo, port=0, workers=2).start()
+    conn = http.client.HTTPConnection(*server.address, timeout=5)
+    yield server, queue, repo, conn
+    conn.close()
+    server.close()
+
+
+def request(conn, method, path, body=None):
+    """Faz uma requisição e retorna (status, JSON da resposta)."""
+    payload = json.dumps(body).encode() if isinstance(body, dict) else body
+    conn.request(method, path, body=payload)
+    response = conn.getresponse()
+    return response.status, json.loads(response.read())
+
+
+class TestDownloadApiServer:
+    """Testes para as rotas da API."""
+
+    def test_workers_started(self, api):
+        """Testa que os workers e a recuperação da fila são iniciados."""
+        server, queue, _, _ = api
+
+        queue.recover.assert_called_once()
+        assert queue.serve.call_count == 2
+
+    def test_post_job(self, api):
+        """Testa que POST /jobs enfileira a URL e responde 202."""
+        # Arrange
+        _, queue, _, conn = api
+        queue.submit.return_value = make_job()
+
+        # Act
+        status, data = request(conn, "POST", "/jobs", {"url": URL})
+
+        # Assert
+        assert status == 202
+        assert data["id"] == 7
+        assert data["status"] == "pending"
+        queue.submit.assert_called_once_with(URL)
+
+    def test_keep_alive(self, api):
+        """Testa que várias requisições reaproveitam a mesma conexão."""
+        _, queue, _, conn = api
+        queue.submit.return_value = make_job()
+
+        for _ in range(3):
+            assert request(conn, "POST", "/jobs", {"url": URL})[0] == 202
+
+        assert queue.submit.call_count == 3
+
+    def test_post_invalid_requests(self, api):
+        """Testa as respostas 400 para URL, JSON ou corpo inválidos."""
+        # Arrange
+        server, queue, _, _ = api
+        queue.submit.side_effect = InvalidURLException("x", "URL mal formatada")
+
+        # Act & Assert
+        for body in ({"url": "x"}, {}, b"{nao e json", b"[1]"):
+            conn = http.client.HTTPConnection(*server.address, timeout=5)
+            status, data = request(conn, "POST", "/jobs", body)
+            conn.close()
+            assert status == 400
+            assert data["error"]
+
+    def test_post_queue_unavailable(self, api):
+        """Testa que erros da fila viram 503."""
+        _, queue, _, conn = api
+        queue.submit.side_effect = JobQueueException("database is locked")
+
+        status, data = request(conn, "POST", "/jobs", {"url": URL})
+
+        assert status == 503
+        assert "locked" in data["error"]
+
+    def test_get_job_with_video(self, api):
+        """Testa que GET /jobs/<id> inclui o vídeo depois do download."""
+        # Arrange
+        _, queue, repo, conn = api
+        queue.jobs.get.return_value = make_job(JobStatus.DONE)
+        repo.find_by_url.return_value = make_video()
+
+        # Act
+        status, data = request(conn, "GET", "/jobs/7")
+
+        # Assert
+        assert status == 200
+        assert data["status"] == "done"
+        assert data["video"]["file_path"] == "downloads/a.mp4"
+        queue.jobs.get.assert_called_once_with(7)
+
+    def test_get_unknown_job(self, api):
+        """Testa 404 para jobs e rotas inexistentes."""
+        _, queue, _, conn = api
+        queue.jobs.get.return_value = None
+
+        assert request(conn, "GET", "/jobs/99")[0] == 404
+        conn.close()
+        assert request(conn, "GET", "/nada")[0] == 404
+
+    def test_get_videos(self, api):
+        """Testa o histórico em GET /videos, com limite."""
+        # Arrange
+        _, _, repo, conn = api
+        repo.iter_videos.return_value = iter([make_video()])
+
+        # Act
+        status, data = request(conn, "GET", "/videos?limit=5")
+
+        # Assert
+        assert status == 200
+        assert [video["title"] for video in data] == ["Video"]
+        repo.iter_videos.assert_called_once_with(limit=5)
+        conn.close()
+        assert request(conn, "GET", "/videos?limit=0")[0] == 400
+
+    def test_request_threads_release_connections(self, temp_db_path):
+        """Testa que as conexões SQLite das requisições não se acumulam."""
+        # Arrange
+        pool = SQLiteConnectionPool(temp_db_path)
+        repo = SQLiteVideoRepository(temp_db_path, pool=pool)
+        queue = Mock()
+        queue.serve.return_value = 0
+        opened = len(pool._connections)
+
+        # Act
+        with DownloadApiServer(
+            queue, repo, port=0, release=pool.release
+        ).start() as server:
+            for _ in range(50):
+                conn = http.client.HTTPConnection(*server.address, timeout=5)
+                assert request(conn, "GET", "/videos")[0] == 200
+                conn.close()
+            deadline = time.monotonic() + 5
+            while len(pool._connections) > opened and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+        # Assert
+        assert len(pool._connections) == opened
+        pool.close_all()
+
+    def test_close_stops_workers(self):
+        """Testa que close() sinaliza os workers e acorda os ociosos."""
+        # Arrange
+        queue = Mock()
+        queue.serve.side_effect = lambda stop: stop.wait(5)
+        server = DownloadApiServer(queue, Mock(), port=0, workers=2).start()
+
+        # Act
+        server.close()
+
+        # Assert
+        queue.wake.assert_called_once()
+        assert not any(thread.is_alive() for thread in server._threads)
+
+    def test_invalid_workers(self):
+        """Testa que é preciso ao menos um worker."""
+        with pytest.raises(ValueError):
+            DownloadApiServer(Mock(), Mock(), port=0, workers=0)
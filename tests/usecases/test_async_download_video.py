@@ -0,0 +1,174 @@
+"""
+Testes unitários para o caso de uso AsyncDownloadVideo.
+"""
+
+import asyncio
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from src.domain.exceptions import DownloadFailedException, InvalidURLException
+from src.domain.services import AsyncVideoDownloaderService
+from src.usecases.async_download_video import AsyncDownloadVideo
+
+
+class FakeAsyncDownloader(AsyncVideoDownloaderService):
+    """Downloader assíncrono falso, com atraso configurável por URL."""
+
+    def __init__(self, delays=None, failures=()):
+        self.delays = delays or {}
+        self.failures = set(failures)
+        self.calls = []
+        self.cancelled = []
+
+    async def download(self, url):
+        self.calls.append(url)
+        try:
+            await asyncio.sleep(self.delays.get(url, 0))
+        except asyncio.CancelledError:
+            self.cancelled.append(url)
+            raise
+        if url in self.failures:
+            raise DownloadFailedException(url, "Vídeo não encontrado")
+        return f"Title {url[-1]}", f"downloads/{url[-1]}.mp4"
+
+
+def make_repo(existing=None):
+    """Cria um repositório mock que conhece apenas os vídeos informados."""
+    mock_repo = Mock()
+    mock_repo.find_by_url.side_effect = lambda url: (existing or {}).get(url)
+    return mock_repo
+
+
+class TestAsyncDownloadVideo:
+    """Testes para o caso de uso assíncrono."""
+
+    def test_execute_success(self):
+        """Testa download assíncrono bem-sucedido."""
+        # Arrange
+        mock_repo = make_repo()
+        usecase = AsyncDownloadVideo(FakeAsyncDownloader(), mock_repo)
+
+        # Act
+        video = asyncio.run(usecase.execute("https://youtube.com/watch?v=1"))
+
+        # Assert
+        assert video.title == "Title 1"
+        mock_repo.save.assert_called_once_with(video)
+
+    def test_repository_runs_off_event_loop(self):
+        """Testa que consultas e gravações no repositório não bloqueiam o loop."""
+        # Arrange
+        threads = []
+        mock_repo = Mock()
+        mock_repo.find_by_url.side_effect = lambda url: threads.append(
+            threading.current_thread()
+        )
+        mock_repo.save.side_effect = lambda video: threads.append(
+            threading.current_thread()
+        )
+        usecase = AsyncDownloadVideo(FakeAsyncDownloader(), mock_repo)
+
+        # Act
+        asyncio.run(usecase.execute("https://youtube.com/watch?v=1"))
+
+        # Assert
+        assert len(threads) == 2
+        assert threading.main_thread() not in threads
+
+    def test_execute_with_existing_video(self, sample_video):
+        """Testa que vídeo já baixado não é baixado novamente."""
+        # Arrange
+        downloader = FakeAsyncDownloader()
+        usecase = AsyncDownloadVideo(
+            downloader, make_repo({sample_video.url: sample_video})
+        )
+
+        # Act
+        video = asyncio.run(usecase.execute(sample_video.url))
+
+        # Assert
+        assert video == sample_video
+        assert downloader.calls == []
+
+    def test_execute_invalid_url(self):
+        """Testa que URL inválida levanta exceção."""
+        usecase = AsyncDownloadVideo(FakeAsyncDownloader(), make_repo())
+        with pytest.raises(InvalidURLException):
+            asyncio.run(usecase.execute("not-a-url"))
+
+    def test_execute_rejects_playlist_url(self):
+        """Testa que URLs de playlist são recusadas sem tentar o download."""
+        # Arrange
+        downloader = FakeAsyncDownloader()
+        mock_repo = make_repo()
+        usecase = AsyncDownloadVideo(downloader, mock_repo)
+        url = "https://www.youtube.com/playlist?list=PL123"
+
+        # Act & Assert
+        with pytest.raises(InvalidURLException):
+            asyncio.run(usecase.execute(url))
+        assert downloader.calls == []
+        mock_repo.find_by_url.assert_not_called()
+
+    def test_execute_timeout(self):
+        """Testa que o tempo limite cancela o download."""
+        # Arrange
+        url = "https://youtube.com/watch?v=1"
+        downloader = FakeAsyncDownloader(delays={url: 5})
+        mock_repo = make_repo()
+        usecase = AsyncDownloadVideo(downloader, mock_repo)
+
+        # Act & Assert
+        with pytest.raises(DownloadFailedException) as exc_info:
+            asyncio.run(usecase.execute(url, timeout=0.01))
+        assert "Tempo limite" in str(exc_info.value)
+        assert downloader.cancelled == [url]
+        mock_repo.save.assert_not_called()
+
+    def test_stream_yields_as_completed(self):
+        """Testa que os resultados saem na ordem em que terminam."""
+        # Arrange
+        urls = [f"https://youtube.com/watch?v={i}" for i in range(3)]
+        downloader = FakeAsyncDownloader(
+            delays={urls[0]: 0.05, urls[1]: 0.0, urls[2]: 0.02},
+            failures={urls[2]},
+        )
+        usecase = AsyncDownloadVideo(downloader, make_repo(), max_concurrency=3)
+
+        async def collect():
+            return [result async for result in usecase.stream(urls)]
+
+        # Act
+        results = asyncio.run(collect())
+
+        # Assert
+        assert [r.index for r in results] == [1, 2, 0]
+        assert isinstance(results[1].error, DownloadFailedException)
+        assert results[2].ok
+
+    def test_stream_bounds_concurrency(self):
+        """Testa que no máximo max_concurrency downloads ficam ativos."""
+        # Arrange
+        urls = [f"https://youtube.com/watch?v={i}" for i in range(10)]
+        delays = {url: 1 for url in urls}
+        delays[urls[0]] = 0.01
+        downloader = FakeAsyncDownloader(delays=delays)
+        usecase = AsyncDownloadVideo(downloader, make_repo(), max_concurrency=2)
+
+        async def first_result():
+            stream = usecase.stream(iter(urls))
+            result = await stream.__anext__()
+            started = len(downloader.calls)
+            await stream.aclose()
+            return result, started
+
+        # Act
+        result, started = asyncio.run(first_result())
+
+        # Assert
+        assert result.ok
+        assert started <= 3
+        # O download restante foi cancelado ao fechar o stream
+        assert len(downloader.cancelled) >= 1
@@ -2,13 +2,20 @@
 Testes unitários para o caso de uso DownloadVideo.
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from unittest.mock import MagicMock, Mock
 
 import pytest
 
-from src.domain.entities import Video
+from src.domain.entities import (
+    DownloadOutcome,
+    FailedDownload,
+    FormatProfile,
+    PostprocessStatus,
+    Video,
+)
 from src.domain.exceptions import DownloadFailedException, InvalidURLException
+from src.domain.failures import FailureCategory
 from src.usecases.download_video import DownloadVideo
 
 
@@ -116,6 +123,18 @@ class TestDownloadVideo:
 
         assert "Vídeo não encontrado" in str(exc_info.value)
 
+    def test_execute_rejects_playlist_url(self):
+        """Testa que URLs de playlist/canal não são baixadas como um vídeo."""
+        # Arrange
+        mock_downloader = Mock()
+        usecase = DownloadVideo(mock_downloader, Mock())
+
+        # Act & Assert
+        with pytest.raises(InvalidURLException):
+            usecase.execute("https://www.youtube.com/playlist?list=PL123")
+
+        mock_downloader.download.assert_not_called()
+
     def test_validate_url_valid(self, valid_urls):
         """Testa validação de URLs válidas."""
         # Arrange
@@ -141,3 +160,323 @@ class TestDownloadVideo:
         for url in invalid_urls:
             with pytest.raises(InvalidURLException):
                 usecase._validate_url(url)
+
+
+def make_failure(expires_in=timedelta(days=1)):
+    """Cria uma falha registrada para os testes do cache negativo."""
+    now = datetime.now()
+    return FailedDownload(
+        url="https://youtube.com/watch?v=test",
+        reason="Private video",
+        category=FailureCategory.PRIVATE,
+        failed_at=now,
+        expires_at=now + expires_in,
+    )
+
+
+class TestDownloadVideoFailureCache:
+    """Testes para o cache negativo de falhas do DownloadVideo."""
+
+    URL = "https://youtube.com/watch?v=test"
+
+    def _usecase(self, downloader, failure_repo, **kwargs):
+        mock_repo = Mock()
+        mock_repo.find_by_url.return_value = None
+        return DownloadVideo(downloader, mock_repo, failure_repo=failure_repo, **kwargs)
+
+    def test_known_failure_skips_download(self):
+        """Testa que uma falha ainda válida evita uma nova tentativa."""
+        # Arrange
+        mock_downloader = Mock()
+        failure_repo = Mock()
+        failure_repo.find.return_value = make_failure()
+        usecase = self._usecase(mock_downloader, failure_repo)
+
+        # Act & Assert
+        with pytest.raises(DownloadFailedException) as exc_info:
+            usecase.execute(self.URL)
+
+        assert "Private video" in exc_info.value.reason
+        mock_downloader.download.assert_not_called()
+        failure_repo.record.assert_not_called()
+
+    def test_expired_failure_is_retried(self):
+        """Testa que falhas expiradas não bloqueiam o download."""
+        # Arrange
+        mock_downloader = Mock()
+        mock_downloader.download.return_value = ("Video", "downloads/Video.mp4")
+        failure_repo = Mock()
+        failure_repo.find.return_value = make_failure(expires_in=-timedelta(seconds=1))
+        usecase = self._usecase(mock_downloader, failure_repo)
+
+        # Act
+        usecase.execute(self.URL)
+
+        # Assert
+        mock_downloader.download.assert_called_once()
+        failure_repo.delete.assert_called_once_with(self.URL)
+
+    def test_retry_failed_overrides_cache(self):
+        """Testa que retry_failed ignora o cache de falhas."""
+        # Arrange
+        mock_downloader = Mock()
+        mock_downloader.download.return_value = ("Video", "downloads/Video.mp4")
+        failure_repo = Mock()
+        failure_repo.find.return_value = make_failure()
+        usecase = self._usecase(mock_downloader, failure_repo, retry_failed=True)
+
+        # Act
+        usecase.execute(self.URL)
+
+        # Assert
+        mock_downloader.download.assert_called_once()
+
+    def test_permanent_failure_is_recorded(self):
+        """Testa que falhas permanentes são gravadas com o prazo da categoria."""
+        # Arrange
+        mock_downloader = Mock()
+        mock_downloader.download.side_effect = DownloadFailedException(
+            self.URL, "Video unavailable"
+        )
+        failure_repo = Mock()
+        failure_repo.find.return_value = None
+        usecase = self._usecase(
+            mock_downloader,
+            failure_repo,
+            failure_ttls={FailureCategory.UNAVAILABLE: timedelta(hours=2)},
+        )
+
+        # Act
+        with pytest.raises(DownloadFailedException):
+            usecase.execute(self.URL)
+
+        # Assert
+        failure = failure_repo.record.call_args[0][0]
+        assert failure.category is FailureCategory.UNAVAILABLE
+        assert failure.expires_at - failure.failed_at == timedelta(hours=2)
+
+    def test_transient_failure_is_not_recorded(self):
+        """Testa que falhas transitórias não entram no cache negativo."""
+        # Arrange
+        mock_downloader = Mock()
+        mock_downloader.download.side_effect = DownloadFailedException(
+            self.URL, "HTTP Error 503: Service Unavailable"
+        )
+        failure_repo = Mock()
+        failure_repo.find.return_value = None
+        usecase = self._usecase(mock_downloader, failure_repo)
+
+        # Act
+        with pytest.raises(DownloadFailedException):
+            usecase.execute(self.URL)
+
+        # Assert
+        failure_repo.record.assert_not_called()
+
+
+class TestDownloadVideoMetrics:
+    """Testes para as métricas gravadas pelo DownloadVideo."""
+
+    URL = "https://youtube.com/watch?v=test"
+
+    def _usecase(self, downloader, existing=None):
+        mock_repo = Mock()
+        mock_repo.find_by_url.return_value = existing
+        metrics_repo = Mock()
+        usecase = DownloadVideo(downloader, mock_repo, metrics_repo=metrics_repo)
+        return usecase, metrics_repo
+
+    def test_records_successful_download(self):
+        """Testa que um download concluído grava métricas de cada fase."""
+        # Arrange
+        mock_downloader = Mock()
+
+        def download(url, stats):
+            stats.transfer_s = 2.0
+            stats.bytes_downloaded = 4096
+            return "Test Video", "downloads/test.mp4"
+
+        mock_downloader.download.side_effect = download
+        usecase, metrics_repo = self._usecase(mock_downloader)
+
+        # Act
+        usecase.execute(self.URL)
+
+        # Assert
+        stats = metrics_repo.record.call_args[0][0]
+        assert stats.url == self.URL
+        assert stats.outcome is DownloadOutcome.DOWNLOADED
+        assert stats.bytes_downloaded == 4096
+        assert stats.speed == 2048.0
+        assert stats.total_s >= stats.validation_s + stats.lookup_s + stats.save_s
+        assert stats.total_s > 0
+
+    def test_records_existing_video(self, sample_video):
+        """Testa que vídeos já baixados são registrados como existing."""
+        # Arrange
+        usecase, metrics_repo = self._usecase(Mock(), existing=sample_video)
+
+        # Act
+        usecase.execute(sample_video.url)
+
+        # Assert
+        stats = metrics_repo.record.call_args[0][0]
+        assert stats.outcome is DownloadOutcome.EXISTING
+
+    def test_records_failure(self):
+        """Testa que falhas também geram métricas, com o erro."""
+        # Arrange
+        mock_downloader = Mock()
+        mock_downloader.download.side_effect = DownloadFailedException(
+            self.URL, "HTTP Error 503"
+        )
+        usecase, metrics_repo = self._usecase(mock_downloader)
+
+        # Act
+        with pytest.raises(DownloadFailedException):
+            usecase.execute(self.URL)
+
+        # Assert
+        stats = metrics_repo.record.call_args[0][0]
+        assert stats.outcome is DownloadOutcome.FAILED
+        assert "HTTP Error 503" in stats.error
+
+    def test_updates_recorder(self):
+        """Testa contadores de resultado e de falhas por motivo."""
+        # Arrange
+        mock_downloader = Mock()
+        mock_downloader.download.side_effect = DownloadFailedException(
+            self.URL, "ERROR: Private video"
+        )
+        mock_repo = Mock()
+        mock_repo.find_by_url.return_value = None
+        metrics = Mock()
+        usecase = DownloadVideo(mock_downloader, mock_repo, metrics=metrics)
+
+        # Act
+        with pytest.raises(DownloadFailedException):
+            usecase.execute(self.URL)
+
+        # Assert
+        metrics.inc.assert_any_call("ytdl_downloads_total", outcome="failed")
+        metrics.inc.assert_any_call("ytdl_download_failures_total", reason="private")
+        metrics.observe.assert_not_called()
+
+
+class TestDownloadVideoContentStore:
+    """Testes para a deduplicação por conteúdo no DownloadVideo."""
+
+    URL = "https://youtube.com/watch?v=test"
+
+    def test_saves_content_hash(self):
+        """Testa que o arquivo é guardado no ContentStore e o hash salvo."""
+        # Arrange
+        mock_downloader = Mock()
+        mock_downloader.download.return_value = ("Test Video", "downloads/a.mp4")
+        mock_repo = Mock()
+        mock_repo.find_by_url.return_value = None
+        mock_repo.find_by_content_hash.return_value = None
+        content_store = Mock()
+        content_store.store.return_value = "abc123"
+        usecase = DownloadVideo(mock_downloader, mock_repo, content_store=content_store)
+
+        # Act
+        video = usecase.execute(self.URL)
+
+        # Assert
+        content_store.store.assert_called_once_with("downloads/a.mp4")
+        mock_repo.find_by_content_hash.assert_called_once_with("abc123")
+        assert video.content_hash == "abc123"
+        assert mock_repo.save.call_args[0][0].content_hash == "abc123"
+
+    def test_without_content_store(self):
+        """Testa que sem ContentStore nenhum hash é calculado."""
+        # Arrange
+        mock_downloader = Mock()
+        mock_downloader.download.return_value = ("Test Video", "downloads/a.mp4")
+        mock_repo = Mock()
+        mock_repo.find_by_url.return_value = None
+        usecase = DownloadVideo(mock_downloader, mock_repo)
+
+        # Act
+        video = usecase.execute(self.URL)
+
+        # Assert
+        assert video.content_hash is None
+        mock_repo.find_by_content_hash.assert_not_called()
+
+
+class TestDownloadVideoProfile:
+    """Testes para os perfis de formato no DownloadVideo."""
+
+    URL = "https://youtube.com/watch?v=test"
+
+    def _usecase(self, profile=None):
+        mock_downloader = Mock()
+        mock_downloader.download.return_value = ("Test Video", "downloads/a.m4a")
+        mock_repo = Mock()
+        mock_repo.find_by_url.return_value = None
+        usecase = DownloadVideo(mock_downloader, mock_repo, profile=profile)
+        return usecase, mock_downloader
+
+    def test_profile_per_call(self):
+        """Testa que o perfil de execute() chega ao downloader e ao vídeo."""
+        # Arrange
+        usecase, mock_downloader = self._usecase()
+
+        # Act
+        video = usecase.execute(self.URL, profile=FormatProfile.AUDIO)
+
+        # Assert
+        mock_downloader.download.assert_called_once_with(
+            self.URL, profile=FormatProfile.AUDIO
+        )
+        assert video.format_profile is FormatProfile.AUDIO
+
+    def test_default_profile(self):
+        """Testa o perfil padrão do caso de uso e a sobrescrita por chamada."""
+        # Arrange
+        usecase, mock_downloader = self._usecase(profile=FormatProfile.SD)
+
+        # Act
+        default = usecase.execute(self.URL)
+        override = usecase.execute(self.URL, profile=FormatProfile.ARCHIVAL)
+
+        # Assert
+        assert default.format_profile is FormatProfile.SD
+        assert override.format_profile is FormatProfile.ARCHIVAL
+
+
+class TestDownloadVideoPostprocess:
+    """Testes para o envio ao pós-processamento no DownloadVideo."""
+
+    def _usecase(self, postprocess=None):
+        mock_downloader = Mock()
+        mock_downloader.download.return_value = ("Test Video", "downloads/a.mp4")
+        mock_repo = Mock()
+        mock_repo.find_by_url.return_value = None
+        usecase = DownloadVideo(mock_downloader, mock_repo, postprocess=postprocess)
+        return usecase, mock_repo
+
+    def test_video_saved_pending_then_submitted(self):
+        """Testa que o vídeo é gravado como pendente antes de ser enviado."""
+        # Arrange
+        postprocess = Mock()
+        usecase, mock_repo = self._usecase(postprocess)
+        postprocess.submit.side_effect = lambda video: mock_repo.save.assert_called()
+
+        # Act
+        video = usecase.execute("https://youtube.com/watch?v=test")
+
+        # Assert
+        assert video.postprocess_status is PostprocessStatus.PENDING
+        mock_repo.save.assert_called_once_with(video)
+        postprocess.submit.assert_called_once_with(video)
+
+    def test_without_postprocess(self):
+        """Testa que, sem pós-processamento, o estado fica vazio."""
+        usecase, _ = self._usecase()
+
+        video = usecase.execute("https://youtube.com/watch?v=test")
+
+        assert video.postprocess_status is None
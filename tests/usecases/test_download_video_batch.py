@@ -0,0 +1,469 @@
+"""
+Testes unitários para o caso de uso DownloadVideoBatch.
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+
+from src.domain.entities import (
+    DownloadOutcome,
+    FailedDownload,
+    FormatProfile,
+    PostprocessStatus,
+)
+from src.domain.exceptions import (
+    DownloadFailedException,
+    InvalidURLException,
+    VideoNotSavedException,
+)
+from src.domain.failures import FailureCategory
+from src.usecases.download_video_batch import BatchItemResult, DownloadVideoBatch
+
+
+def make_repo(existing=None):
+    """Cria um repositório mock que conhece apenas os vídeos informados."""
+    existing = existing or {}
+    mock_repo = Mock()
+    mock_repo.find_by_urls.side_effect = lambda urls: {
+        url: existing[url] for url in urls if url in existing
+    }
+    return mock_repo
+
+
+class TestDownloadVideoBatch:
+    """Testes para o caso de uso DownloadVideoBatch."""
+
+    def test_run_returns_results_in_input_order(self):
+        """Testa que os resultados saem na ordem das URLs de entrada."""
+        # Arrange
+        urls = [f"https://youtube.com/watch?v={i}" for i in range(6)]
+
+        def slow_first(url):
+            # A primeira URL termina por último
+            if url.endswith("=0"):
+                time.sleep(0.05)
+            return f"Video {url[-1]}", f"downloads/{url[-1]}.mp4"
+
+        mock_downloader = Mock()
+        mock_downloader.download.side_effect = slow_first
+        mock_repo = make_repo()
+
+        usecase = DownloadVideoBatch(mock_downloader, mock_repo, max_workers=3)
+
+        # Act
+        results = list(usecase.run(urls))
+
+        # Assert
+        assert [r.url for r in results] == urls
+        assert [r.index for r in results] == list(range(6))
+        assert all(r.ok for r in results)
+        assert results[0].video.title == "Video 0"
+        saved = [v for c in mock_repo.save_many.call_args_list for v in c.args[0]]
+        assert len(saved) == 6
+        mock_repo.find_by_url.assert_not_called()
+
+    def test_run_reports_failures_without_stopping(self):
+        """Testa que uma falha não interrompe o restante do lote."""
+
+        # Arrange
+        def download(url):
+            if url.endswith("bad"):
+                raise DownloadFailedException(url, "Vídeo não encontrado")
+            return "Ok", "downloads/ok.mp4"
+
+        mock_downloader = Mock()
+        mock_downloader.download.side_effect = download
+        mock_repo = make_repo()
+
+        usecase = DownloadVideoBatch(mock_downloader, mock_repo)
+
+        # Act
+        results = list(
+            usecase.run(
+                [
+                    "https://youtube.com/watch?v=bad",
+                    "not-a-url",
+                    "https://youtube.com/watch?v=good",
+                ]
+            )
+        )
+
+        # Assert
+        assert isinstance(results[0].error, DownloadFailedException)
+        assert isinstance(results[1].error, InvalidURLException)
+        assert results[2].ok
+        assert mock_downloader.download.call_count == 2
+
+    def test_run_skips_already_downloaded(self, sample_video):
+        """Testa que vídeos já baixados não são baixados novamente."""
+        # Arrange
+        mock_downloader = Mock()
+        mock_repo = make_repo({sample_video.url: sample_video})
+
+        usecase = DownloadVideoBatch(mock_downloader, mock_repo)
+
+        # Act
+        results = list(usecase.run([sample_video.url]))
+
+        # Assert
+        assert results == [
+            BatchItemResult(index=0, url=sample_video.url, video=sample_video)
+        ]
+        mock_downloader.download.assert_not_called()
+        mock_repo.save_many.assert_not_called()
+
+    def test_run_respects_per_host_limit(self):
+        """Testa que o limite de downloads simultâneos por host é respeitado."""
+        # Arrange
+        lock = threading.Lock()
+        active = {"youtube.com": 0, "vimeo.com": 0}
+        peak = {"youtube.com": 0, "vimeo.com": 0}
+
+        def download(url):
+            host = "youtube.com" if "youtube" in url else "vimeo.com"
+            with lock:
+                active[host] += 1
+                peak[host] = max(peak[host], active[host])
+            time.sleep(0.01)
+            with lock:
+                active[host] -= 1
+            return "Video", "downloads/video.mp4"
+
+        mock_downloader = Mock()
+        mock_downloader.download.side_effect = download
+        mock_repo = make_repo()
+
+        urls = [f"https://youtube.com/watch?v={i}" for i in range(8)] + [
+            f"https://vimeo.com/{i}" for i in range(8)
+        ]
+        usecase = DownloadVideoBatch(
+            mock_downloader, mock_repo, max_workers=6, per_host_limit=2
+        )
+
+        # Act
+        results = list(usecase.run(urls))
+
+        # Assert
+        assert len(results) == 16
+        assert peak["youtube.com"] <= 2
+        assert peak["vimeo.com"] <= 2
+
+    def test_run_consumes_input_lazily(self):
+        """Testa que as URLs são lidas sob demanda, e não todas de uma vez."""
+        # Arrange
+        consumed = []
+
+        def url_source():
+            for i in range(1000):
+                consumed.append(i)
+                yield f"https://youtube.com/watch?v={i}"
+
+        mock_downloader = Mock()
+        mock_downloader.download.return_value = ("Video", "downloads/video.mp4")
+        mock_repo = make_repo()
+
+        usecase = DownloadVideoBatch(mock_downloader, mock_repo, max_workers=2)
+
+        # Act
+        results = usecase.run(url_source())
+        first = next(results)
+
+        # Assert
+        assert first.index == 0
+        assert len(consumed) <= usecase.window + 1
+        results.close()
+
+    def test_run_looks_up_duplicates_in_chunks(self, sample_video):
+        """Testa que a deduplicação consulta o repositório em blocos."""
+        # Arrange
+        urls = [f"https://youtube.com/watch?v={i}" for i in range(50)]
+        mock_downloader = Mock()
+        mock_downloader.download.return_value = ("Video", "downloads/video.mp4")
+        mock_repo = make_repo({urls[10]: sample_video})
+
+        usecase = DownloadVideoBatch(mock_downloader, mock_repo, window=25)
+
+        # Act
+        results = list(usecase.run(urls))
+
+        # Assert
+        assert mock_repo.find_by_urls.call_count <= 4
+        assert results[10].video == sample_video
+        assert mock_downloader.download.call_count == 49
+
+    def test_run_downloads_each_video_once_per_chunk(self):
+        """Testa que URLs repetidas ou variantes do mesmo vídeo baixam uma vez."""
+        # Arrange
+        urls = [
+            "https://youtube.com/watch?v=dQw4w9WgXcQ",
+            "https://youtu.be/dQw4w9WgXcQ",
+            "https://youtube.com/watch?v=other",
+            "https://youtube.com/watch?v=dQw4w9WgXcQ",
+        ]
+        mock_downloader = Mock()
+        mock_downloader.download.return_value = ("Video", "downloads/video.mp4")
+        mock_repo = make_repo()
+
+        usecase = DownloadVideoBatch(mock_downloader, mock_repo)
+
+        # Act
+        results = list(usecase.run(urls))
+
+        # Assert
+        assert [r.url for r in results] == urls
+        assert all(r.ok for r in results)
+        assert results[1].video is results[0].video
+        assert mock_downloader.download.call_count == 2
+        saved = [v for c in mock_repo.save_many.call_args_list for v in c.args[0]]
+        assert sorted(v.url for v in saved) == sorted([urls[0], urls[2]])
+
+    def test_duplicates_share_download_failure(self):
+        """Testa que as variantes recebem o erro do download do vídeo."""
+        # Arrange
+        mock_downloader = Mock()
+        mock_downloader.download.side_effect = DownloadFailedException("x", "503")
+
+        usecase = DownloadVideoBatch(mock_downloader, make_repo())
+
+        # Act
+        results = list(
+            usecase.run(
+                ["https://youtu.be/dQw4w9WgXcQ", "https://youtu.be/dQw4w9WgXcQ?t=1"]
+            )
+        )
+
+        # Assert
+        assert [r.ok for r in results] == [False, False]
+        assert results[1].error is results[0].error
+        mock_downloader.download.assert_called_once()
+
+    def test_duplicates_across_chunks_download_once(self):
+        """Testa que um vídeo repetido em outro bloco não é baixado de novo."""
+        # Arrange
+        mock_downloader = Mock()
+        mock_downloader.download.return_value = ("Video", "downloads/Video.mp4")
+        usecase = DownloadVideoBatch(
+            mock_downloader, make_repo(), max_workers=1, window=4
+        )
+        urls = [f"https://example.com/{i}" for i in range(3)] + [
+            "https://youtu.be/dQw4w9WgXcQ",
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+        ]
+
+        # Act
+        results = list(usecase.run(urls))
+
+        # Assert
+        assert [r.ok for r in results] == [True] * 5
+        assert results[4].video is results[3].video
+        assert mock_downloader.download.call_count == 4
+
+    def test_run_reports_save_failure(self):
+        """Testa que falha ao salvar o lote é reportada nos resultados."""
+        # Arrange
+        mock_downloader = Mock()
+        mock_downloader.download.return_value = ("Video", "downloads/video.mp4")
+        mock_repo = make_repo()
+        mock_repo.save_many.side_effect = VideoNotSavedException("disk full")
+
+        usecase = DownloadVideoBatch(mock_downloader, mock_repo)
+
+        # Act
+        results = list(usecase.run(["https://youtube.com/watch?v=1"]))
+
+        # Assert
+        assert isinstance(results[0].error, VideoNotSavedException)
+        assert results[0].video is None
+
+    def test_run_with_profile(self):
+        """Testa que o perfil do lote chega a cada download e vídeo."""
+        # Arrange
+        mock_downloader = Mock()
+        mock_downloader.download.return_value = ("Video", "downloads/a.m4a")
+        usecase = DownloadVideoBatch(mock_downloader, make_repo(), max_workers=2)
+
+        # Act
+        results = list(
+            usecase.run(["https://youtube.com/watch?v=1"], profile=FormatProfile.AUDIO)
+        )
+
+        # Assert
+        mock_downloader.download.assert_called_once_with(
+            "https://youtube.com/watch?v=1", profile=FormatProfile.AUDIO
+        )
+        assert results[0].video.format_profile is FormatProfile.AUDIO
+
+    def test_saved_videos_submitted_to_postprocess(self):
+        """Testa que os vídeos gravados seguem para o pós-processamento."""
+        # Arrange
+        mock_downloader = Mock()
+        mock_downloader.download.return_value = ("Video", "downloads/a.mp4")
+        postprocess = Mock()
+        usecase = DownloadVideoBatch(
+            mock_downloader, make_repo(), max_workers=2, postprocess=postprocess
+        )
+
+        # Act
+        results = list(usecase.run(["https://youtube.com/watch?v=1"]))
+
+        # Assert
+        video = results[0].video
+        assert video.postprocess_status is PostprocessStatus.PENDING
+        postprocess.submit.assert_called_once_with(video)
+
+    def test_postprocess_skipped_when_save_fails(self):
+        """Testa que vídeos não gravados não são pós-processados."""
+        # Arrange
+        mock_downloader = Mock()
+        mock_downloader.download.return_value = ("Video", "downloads/a.mp4")
+        mock_repo = make_repo()
+        mock_repo.save_many.side_effect = VideoNotSavedException("disco cheio")
+        postprocess = Mock()
+        usecase = DownloadVideoBatch(
+            mock_downloader, mock_repo, max_workers=2, postprocess=postprocess
+        )
+
+        # Act
+        list(usecase.run(["https://youtube.com/watch?v=1"]))
+
+        # Assert
+        postprocess.submit.assert_not_called()
+
+    def test_invalid_configuration(self):
+        """Testa que configurações inválidas levantam exceção."""
+        with pytest.raises(ValueError):
+            DownloadVideoBatch(Mock(), Mock(), max_workers=0)
+        with pytest.raises(ValueError):
+            DownloadVideoBatch(Mock(), Mock(), per_host_limit=0)
+
+
+class TestDownloadVideoBatchFailureCache:
+    """Testes para o cache negativo de falhas no modo lote."""
+
+    def _failure_repo(self, failed_urls):
+        now = datetime.now()
+        failure_repo = Mock()
+        failure_repo.find_many.side_effect = lambda urls: {
+            url: FailedDownload(
+                url=url,
+                reason="Video unavailable",
+                category=FailureCategory.UNAVAILABLE,
+                failed_at=now,
+                expires_at=now + timedelta(days=1),
+            )
+            for url in urls
+            if url in failed_urls
+        }
+        return failure_repo
+
+    def test_known_failures_are_skipped(self):
+        """Testa que URLs com falha recente não são baixadas."""
+        # Arrange
+        mock_downloader = Mock()
+        mock_downloader.download.return_value = ("Video", "downloads/Video.mp4")
+        dead = "https://example.com/dead"
+        usecase = DownloadVideoBatch(
+            mock_downloader,
+            make_repo(),
+            failure_repo=self._failure_repo({dead}),
+        )
+
+        # Act
+        results = list(usecase.run([dead, "https://example.com/ok"]))
+
+        # Assert
+        assert [r.ok for r in results] == [False, True]
+        assert isinstance(results[0].error, DownloadFailedException)
+        mock_downloader.download.assert_called_once_with("https://example.com/ok")
+
+    def test_retry_failed_downloads_everything(self):
+        """Testa que retry_failed ignora o cache negativo."""
+        # Arrange
+        mock_downloader = Mock()
+        mock_downloader.download.return_value = ("Video", "downloads/Video.mp4")
+        failure_repo = self._failure_repo({"https://example.com/dead"})
+        usecase = DownloadVideoBatch(
+            mock_downloader, make_repo(), failure_repo=failure_repo, retry_failed=True
+        )
+
+        # Act
+        results = list(usecase.run(["https://example.com/dead"]))
+
+        # Assert
+        assert results[0].ok
+        failure_repo.find_many.assert_not_called()
+
+    def test_success_clears_known_failures(self):
+        """Testa que um download bem-sucedido remove a falha do cache negativo."""
+        # Arrange
+        mock_downloader = Mock()
+        mock_downloader.download.return_value = ("Video", "downloads/Video.mp4")
+        failure_repo = self._failure_repo({"https://example.com/dead"})
+        usecase = DownloadVideoBatch(
+            mock_downloader, make_repo(), failure_repo=failure_repo, retry_failed=True
+        )
+
+        # Act
+        list(usecase.run(["https://example.com/dead"]))
+
+        # Assert
+        failure_repo.delete_many.assert_called_once_with(["https://example.com/dead"])
+
+    def test_permanent_failures_are_recorded(self):
+        """Testa que falhas permanentes do lote são gravadas."""
+        # Arrange
+        mock_downloader = Mock()
+        mock_downloader.download.side_effect = DownloadFailedException(
+            "https://example.com/x", "Private video"
+        )
+        failure_repo = self._failure_repo(set())
+        usecase = DownloadVideoBatch(
+            mock_downloader, make_repo(), failure_repo=failure_repo
+        )
+
+        # Act
+        list(usecase.run(["https://example.com/x"]))
+
+        # Assert
+        failure = failure_repo.record.call_args[0][0]
+        assert failure.url == "https://example.com/x"
+        assert failure.category is FailureCategory.PRIVATE
+
+
+class TestDownloadVideoBatchMetrics:
+    """Testes para as métricas gravadas pelo DownloadVideoBatch."""
+
+    def test_records_stats_per_download(self):
+        """Testa que cada download gera métricas, gravadas em lote."""
+
+        # Arrange
+        def download(url, stats):
+            if url.endswith("bad"):
+                raise DownloadFailedException(url, "HTTP Error 503")
+            stats.transfer_s = 1.0
+            stats.bytes_downloaded = 100
+            return "Ok", "downloads/ok.mp4"
+
+        mock_downloader = Mock()
+        mock_downloader.download.side_effect = download
+        metrics_repo = Mock()
+        usecase = DownloadVideoBatch(
+            mock_downloader, make_repo(), max_workers=1, metrics_repo=metrics_repo
+        )
+
+        # Act
+        list(usecase.run(["https://a.com/ok", "https://a.com/bad"]))
+
+        # Assert
+        recorded = {
+            s.url: s for c in metrics_repo.record_many.call_args_list for s in c.args[0]
+        }
+        assert recorded["https://a.com/ok"].outcome is DownloadOutcome.DOWNLOADED
+        assert recorded["https://a.com/ok"].bytes_downloaded == 100
+        assert recorded["https://a.com/ok"].total_s >= 0
+        assert recorded["https://a.com/bad"].outcome is DownloadOutcome.FAILED
+        assert "503" in recorded["https://a.com/bad"].error
@@ -0,0 +1,167 @@
+"""
+Testes unitários para o caso de uso ExpandPlaylist.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from src.domain.entities import PlaylistEntry
+from src.domain.exceptions import DownloadFailedException
+from src.usecases.expand_playlist import ExpandPlaylist
+
+PLAYLIST = "https://www.youtube.com/playlist?list=PL123"
+
+
+def video_url(n):
+    """URL de vídeo do YouTube com id de 11 caracteres."""
+    return f"https://www.youtube.com/watch?v=video{n:06d}"
+
+
+def make_downloader(count, consumed=None):
+    """Downloader falso cuja playlist tem ``count`` vídeos, gerados sob demanda."""
+
+    def iter_playlist(url):
+        for n in range(count):
+            if consumed is not None:
+                consumed.append(n)
+            yield PlaylistEntry(url=video_url(n), video_id=f"video{n:06d}")
+
+    mock_downloader = Mock()
+    mock_downloader.iter_playlist.side_effect = iter_playlist
+    return mock_downloader
+
+
+def make_repo(known=()):
+    """Repositório mock que conhece apenas as URLs informadas."""
+    known = set(known)
+    mock_repo = Mock()
+    mock_repo.find_by_urls.side_effect = lambda urls: {
+        url: Mock() for url in urls if url in known
+    }
+    return mock_repo
+
+
+class TestExpandPlaylist:
+    """Testes para a expansão de playlists e canais."""
+
+    def test_skips_known_videos(self):
+        """Testa que apenas vídeos ainda não baixados são devolvidos."""
+        # Arrange
+        usecase = ExpandPlaylist(
+            make_downloader(5), make_repo({video_url(1), video_url(3)})
+        )
+
+        # Act
+        urls = list(usecase.iter_new_urls(PLAYLIST))
+
+        # Assert
+        assert urls == [video_url(0), video_url(2), video_url(4)]
+
+    def test_checks_repository_in_chunks(self):
+        """Testa que o repositório é consultado uma vez por bloco."""
+        # Arrange
+        mock_repo = make_repo()
+        usecase = ExpandPlaylist(make_downloader(250), mock_repo, chunk_size=100)
+
+        # Act
+        urls = list(usecase.iter_new_urls(PLAYLIST))
+
+        # Assert
+        assert len(urls) == 250
+        assert mock_repo.find_by_urls.call_count == 3
+
+    def test_enumeration_is_lazy(self):
+        """Testa que a coleção só é lida conforme as URLs são consumidas."""
+        # Arrange
+        consumed = []
+        usecase = ExpandPlaylist(
+            make_downloader(10_000, consumed), make_repo(), chunk_size=50
+        )
+
+        # Act
+        urls = usecase.iter_new_urls(PLAYLIST)
+        first = [next(urls) for _ in range(3)]
+
+        # Assert
+        assert first == [video_url(0), video_url(1), video_url(2)]
+        assert len(consumed) == 50
+
+    def test_duplicates_in_collection_are_skipped(self):
+        """Testa que um vídeo repetido na coleção é devolvido uma vez."""
+        # Arrange
+        mock_downloader = Mock()
+        mock_downloader.iter_playlist.return_value = iter(
+            [
+                PlaylistEntry(url="https://www.youtube.com/watch?v=dQw4w9WgXcQ"),
+                PlaylistEntry(url="https://youtu.be/dQw4w9WgXcQ"),
+            ]
+        )
+        usecase = ExpandPlaylist(mock_downloader, make_repo())
+
+        # Act
+        urls = list(usecase.iter_new_urls(PLAYLIST))
+
+        # Assert
+        assert urls == ["https://www.youtube.com/watch?v=dQw4w9WgXcQ"]
+
+    def test_expand_passes_single_videos_through(self):
+        """Testa que URLs de vídeo não são expandidas."""
+        # Arrange
+        mock_downloader = make_downloader(2)
+        usecase = ExpandPlaylist(mock_downloader, make_repo())
+
+        # Act
+        urls = list(usecase.expand(["https://vimeo.com/1", PLAYLIST]))
+
+        # Assert
+        assert urls == ["https://vimeo.com/1", video_url(0), video_url(1)]
+        mock_downloader.iter_playlist.assert_called_once_with(PLAYLIST)
+
+    def test_expand_reports_errors(self):
+        """Testa que erros ao listar uma coleção vão para on_error."""
+        # Arrange
+        mock_downloader = Mock()
+        mock_downloader.iter_playlist.side_effect = DownloadFailedException(
+            PLAYLIST, "This playlist does not exist"
+        )
+        usecase = ExpandPlaylist(mock_downloader, make_repo())
+        errors = []
+
+        # Act
+        urls = list(
+            usecase.expand(
+                [PLAYLIST, "https://vimeo.com/1"],
+                on_error=lambda url, e: errors.append(url),
+            )
+        )
+
+        # Assert
+        assert urls == ["https://vimeo.com/1"]
+        assert errors == [PLAYLIST]
+
+    def test_expand_raises_without_handler(self):
+        """Testa que, sem on_error, o erro é propagado."""
+        # Arrange
+        mock_downloader = Mock()
+        mock_downloader.iter_playlist.side_effect = DownloadFailedException(
+            PLAYLIST, "erro"
+        )
+        usecase = ExpandPlaylist(mock_downloader, make_repo())
+
+        # Act & Assert
+        with pytest.raises(DownloadFailedException):
+            list(usecase.expand([PLAYLIST]))
+
+    def test_enqueue_respects_limit(self):
+        """Testa que enqueue envia à fila no máximo ``limit`` vídeos."""
+        # Arrange
+        mock_queue = Mock()
+        mock_queue.enqueue.side_effect = lambda urls: len(list(urls))
+        usecase = ExpandPlaylist(make_downloader(10), make_repo())
+
+        # Act
+        count = usecase.enqueue(PLAYLIST, mock_queue, limit=4)
+
+        # Assert
+        assert count == 4
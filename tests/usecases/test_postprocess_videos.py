@@ -0,0 +1,208 @@
+"""
+Testes unitários para o caso de uso PostprocessVideos.
+"""
+
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.domain.entities import FormatProfile, PostprocessStatus, Video
+from src.domain.exceptions import PostprocessFailedException
+from src.domain.services import PostProcessor
+from src.usecases.postprocess_videos import PostprocessVideos
+
+
+class _RenamingProcessor(PostProcessor):
+    """Processador serializável que troca a extensão do arquivo."""
+
+    def process(self, path, profile=None):
+        target = os.path.splitext(path)[0] + ".m4a"
+        os.replace(path, target)
+        return target
+
+
+class _LoggingProcessor(PostProcessor):
+    """Processador serializável que só registra um aviso."""
+
+    def process(self, path, profile=None):
+        logging.getLogger("tests.postprocess").warning("Processando %s", path)
+        return None
+
+
+def make_video(path="downloads/a.mp4", profile=None):
+    return Video(
+        url="https://youtube.com/watch?v=1",
+        title="Video",
+        file_path=path,
+        downloaded_at=datetime(2024, 1, 1),
+        format_profile=profile,
+        postprocess_status=PostprocessStatus.PENDING,
+    )
+
+
+def thread_pool(usecase):
+    """Troca o pool de processos por threads (para usar Mocks)."""
+    return patch.object(
+        usecase, "_create_executor", return_value=ThreadPoolExecutor(max_workers=1)
+    )
+
+
+class TestPostprocessVideos:
+    """Testes para o pós-processamento fora dos workers de download."""
+
+    def test_done_with_new_path(self):
+        """Testa que o novo caminho e o estado done vão para o repositório."""
+        # Arrange
+        processor = Mock()
+        processor.process.return_value = "downloads/a.m4a"
+        repo = Mock()
+        usecase = PostprocessVideos(processor, repo)
+
+        # Act
+        with thread_pool(usecase):
+            usecase.submit(make_video(profile=FormatProfile.AUDIO))
+            usecase.close()
+
+        # Assert
+        processor.process.assert_called_once_with(
+            "downloads/a.mp4", FormatProfile.AUDIO
+        )
+        repo.update_postprocess.assert_called_once_with(
+            "https://youtube.com/watch?v=1",
+            PostprocessStatus.DONE,
+            file_path="downloads/a.m4a",
+            content_hash=None,
+        )
+        assert usecase.pending == 0
+
+    def test_changed_file_is_rehashed(self):
+        """Testa que o arquivo alterado é guardado de novo no ContentStore."""
+        # Arrange
+        processor = Mock()
+        processor.process.return_value = "downloads/a.m4a"
+        content_store = Mock()
+        content_store.store.return_value = "hash-novo"
+        repo = Mock()
+        usecase = PostprocessVideos(processor, repo, content_store=content_store)
+
+        # Act
+        with thread_pool(usecase):
+            usecase.submit(make_video())
+            usecase.close()
+
+        # Assert
+        content_store.store.assert_called_once_with("downloads/a.m4a")
+        assert repo.update_postprocess.call_args.kwargs["content_hash"] == "hash-novo"
+
+    def test_unchanged_file_keeps_hash(self):
+        """Testa que arquivos não alterados não são lidos de novo."""
+        # Arrange
+        processor = Mock()
+        processor.process.return_value = None
+        content_store = Mock()
+        repo = Mock()
+        usecase = PostprocessVideos(processor, repo, content_store=content_store)
+
+        # Act
+        with thread_pool(usecase):
+            usecase.submit(make_video())
+            usecase.close()
+
+        # Assert
+        content_store.store.assert_not_called()
+        repo.update_postprocess.assert_called_once_with(
+            "https://youtube.com/watch?v=1",
+            PostprocessStatus.DONE,
+            file_path=None,
+            content_hash=None,
+        )
+
+    def test_failure_is_recorded(self):
+        """Testa que falhas do processador marcam o vídeo como failed."""
+        # Arrange
+        processor = Mock()
+        processor.process.side_effect = PostprocessFailedException(
+            "downloads/a.mp4", "Invalid data found"
+        )
+        repo = Mock()
+        usecase = PostprocessVideos(processor, repo)
+
+        # Act
+        with thread_pool(usecase):
+            usecase.submit(make_video())
+            usecase.close()
+
+        # Assert
+        repo.update_postprocess.assert_called_once_with(
+            "https://youtube.com/watch?v=1", PostprocessStatus.FAILED
+        )
+
+    def test_resume_submits_pending(self):
+        """Testa que resume() reenvia os vídeos ainda pendentes."""
+        # Arrange
+        processor = Mock()
+        processor.process.return_value = None
+        repo = Mock()
+        repo.find_by_postprocess_status.return_value = [
+            make_video("downloads/a.mp4"),
+            make_video("downloads/b.mp4"),
+        ]
+        usecase = PostprocessVideos(processor, repo)
+
+        # Act
+        with thread_pool(usecase):
+            count = usecase.resume()
+            usecase.close()
+
+        # Assert
+        assert count == 2
+        repo.find_by_postprocess_status.assert_called_once_with(
+            PostprocessStatus.PENDING
+        )
+        assert processor.process.call_count == 2
+
+    def test_runs_in_process_pool(self, tmp_path):
+        """Testa o processamento em um pool de processos de verdade."""
+        # Arrange
+        path = tmp_path / "a.mp4"
+        path.write_bytes(b"video")
+        repo = Mock()
+
+        # Act
+        with PostprocessVideos(_RenamingProcessor(), repo, max_workers=1) as usecase:
+            future = usecase.submit(make_video(str(path)))
+
+        # Assert
+        target = str(tmp_path / "a.m4a")
+        assert future.result() == (target, None)
+        assert os.path.exists(target)
+        repo.update_postprocess.assert_called_once_with(
+            "https://youtube.com/watch?v=1",
+            PostprocessStatus.DONE,
+            file_path=target,
+            content_hash=None,
+        )
+
+    def test_worker_logs_reach_parent(self, caplog):
+        """Testa que os logs dos processos do pool chegam ao processo pai."""
+        # Act
+        with caplog.at_level(logging.WARNING, logger="tests.postprocess"):
+            with PostprocessVideos(
+                _LoggingProcessor(), Mock(), max_workers=1
+            ) as usecase:
+                usecase.submit(make_video("downloads/log.mp4")).result()
+
+        # Assert
+        assert "Processando downloads/log.mp4" in caplog.messages
+
+    def test_default_workers_match_cores(self):
+        """Testa que o pool tem, por padrão, um processo por núcleo."""
+        usecase = PostprocessVideos(Mock(), Mock())
+
+        assert usecase.max_workers == (os.cpu_count() or 1)
+        with pytest.raises(ValueError):
+            PostprocessVideos(Mock(), Mock(), max_workers=0)
@@ -0,0 +1,471 @@
+"""
+Testes unitários para o caso de uso ProcessDownloadQueue.
+"""
+
+import sqlite3
+import threading
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from src.domain.entities import Job, JobStatus
+from src.domain.exceptions import DownloadFailedException, InvalidURLException
+from src.infrastructure.sqlite_failure_repo import SQLiteFailureRepository
+from src.infrastructure.sqlite_job_repo import SQLiteJobRepository
+from src.infrastructure.sqlite_repo import SQLiteVideoRepository
+from src.usecases.download_video import DownloadVideo
+from src.usecases.download_video_batch import DownloadVideoBatch
+from src.usecases.process_download_queue import ProcessDownloadQueue
+from src.usecases.retry_policy import HostErrorTracker, RetryPolicy
+
+
+def make_job(job_id=1, url="https://youtube.com/watch?v=1", attempts=1):
+    """Cria um job em execução para os testes."""
+    return Job(
+        id=job_id,
+        url=url,
+        status=JobStatus.RUNNING,
+        attempts=attempts,
+        created_at=datetime(2024, 1, 1),
+        updated_at=datetime(2024, 1, 1),
+    )
+
+
+class TestProcessDownloadQueue:
+    """Testes para o processamento da fila de downloads."""
+
+    def test_enqueue_skips_invalid_urls(self):
+        """Testa que URLs inválidas não são enfileiradas."""
+        # Arrange
+        mock_jobs = Mock()
+        mock_jobs.enqueue_many.side_effect = lambda urls: len(list(urls))
+        mock_jobs.find_by_urls.return_value = {}
+        usecase = ProcessDownloadQueue(DownloadVideo(Mock(), Mock()), mock_jobs)
+
+        # Act
+        count = usecase.enqueue(
+            ["https://youtube.com/watch?v=1", "not-a-url", " https://a.com/x \n"]
+        )
+
+        # Assert
+        assert count == 2
+
+    def test_run_once_completes_job(self):
+        """Testa que um job bem-sucedido é marcado como concluído."""
+        # Arrange
+        mock_download = Mock()
+        mock_jobs = Mock()
+        mock_jobs.claim.return_value = make_job()
+        usecase = ProcessDownloadQueue(mock_download, mock_jobs)
+
+        # Act
+        job = usecase.run_once()
+
+        # Assert
+        assert job.id == 1
+        mock_download.execute.assert_called_once_with("https://youtube.com/watch?v=1")
+        mock_jobs.complete.assert_called_once_with(1)
+
+    def test_run_once_empty_queue(self):
+        """Testa que run_once retorna None com a fila vazia."""
+        # Arrange
+        mock_jobs = Mock()
+        mock_jobs.claim.return_value = None
+        usecase = ProcessDownloadQueue(Mock(), mock_jobs)
+
+        # Act & Assert
+        assert usecase.run_once() is None
+
+    def test_run_once_retries_until_max_attempts(self):
+        """Testa que falhas de download são retentadas até o limite."""
+        # Arrange
+        mock_download = Mock()
+        mock_download.execute.side_effect = DownloadFailedException("url", "503")
+        mock_jobs = Mock()
+        usecase = ProcessDownloadQueue(mock_download, mock_jobs, max_attempts=2)
+
+        # Act
+        mock_jobs.claim.return_value = make_job(attempts=1)
+        usecase.run_once()
+        mock_jobs.claim.return_value = make_job(attempts=2)
+        usecase.run_once()
+
+        # Assert
+        retries = [c.kwargs["retry"] for c in mock_jobs.fail.call_args_list]
+        assert retries == [True, False]
+
+    def test_run_once_invalid_url_is_permanent(self):
+        """Testa que URL inválida falha sem nova tentativa."""
+        # Arrange
+        mock_download = Mock()
+        mock_download.execute.side_effect = InvalidURLException("x")
+        mock_jobs = Mock()
+        mock_jobs.claim.return_value = make_job()
+        usecase = ProcessDownloadQueue(mock_download, mock_jobs)
+
+        # Act
+        usecase.run_once()
+
+        # Assert
+        assert mock_jobs.fail.call_args.kwargs["retry"] is False
+
+    def test_run_once_permanent_failure_is_not_retried(self):
+        """Testa que vídeo privado/removido falha sem nova tentativa."""
+        # Arrange
+        mock_download = Mock()
+        mock_download.execute.side_effect = DownloadFailedException(
+            "url", "Private video"
+        )
+        mock_jobs = Mock()
+        mock_jobs.claim.return_value = make_job(attempts=1)
+        usecase = ProcessDownloadQueue(mock_download, mock_jobs, max_attempts=5)
+
+        # Act
+        usecase.run_once()
+
+        # Assert
+        assert mock_jobs.fail.call_args.kwargs["retry"] is False
+
+    def test_run_once_schedules_retry_with_backoff(self):
+        """Testa que falhas transitórias voltam à fila com backoff."""
+        # Arrange
+        mock_download = Mock()
+        mock_download.execute.side_effect = DownloadFailedException(
+            "url", "HTTP Error 429: Too Many Requests"
+        )
+        mock_jobs = Mock()
+        mock_jobs.claim.return_value = make_job(attempts=2)
+        policy = RetryPolicy(base_delay=10, max_delay=100, rng=lambda lo, hi: hi)
+        usecase = ProcessDownloadQueue(
+            mock_download, mock_jobs, retry_policy=policy, host_penalty=0
+        )
+
+        # Act
+        before = datetime.now()
+        usecase.run_once()
+
+        # Assert
+        kwargs = mock_jobs.fail.call_args.kwargs
+        assert kwargs["retry"] is True
+        delay = (kwargs["retry_at"] - before).total_seconds()
+        assert 20 <= delay < 21
+
+    def test_host_error_rate_stretches_backoff(self):
+        """Testa que hosts com muitos erros recebem backoff mais longo."""
+        # Arrange
+        mock_download = Mock()
+        mock_download.execute.side_effect = DownloadFailedException("url", "503")
+        mock_jobs = Mock()
+        mock_jobs.claim.return_value = make_job(attempts=1)
+        tracker = HostErrorTracker()
+        policy = RetryPolicy(base_delay=10, max_delay=1000, rng=lambda lo, hi: hi)
+        usecase = ProcessDownloadQueue(
+            mock_download,
+            mock_jobs,
+            retry_policy=policy,
+            host_errors=tracker,
+            host_penalty=3,
+        )
+
+        # Act
+        before = datetime.now()
+        usecase.run_once()
+
+        # Assert: a falha registrada deixa o host com 100% de erro
+        delay = (mock_jobs.fail.call_args.kwargs["retry_at"] - before).total_seconds()
+        assert 40 <= delay < 41
+        assert tracker.error_rate("https://youtube.com/watch?v=1") == 1.0
+
+    def test_run_once_releases_job_on_keyboard_interrupt(self):
+        """Testa que Ctrl+C devolve o job à fila."""
+        # Arrange
+        mock_download = Mock()
+        mock_download.execute.side_effect = KeyboardInterrupt()
+        mock_jobs = Mock()
+        mock_jobs.claim.return_value = make_job()
+        usecase = ProcessDownloadQueue(mock_download, mock_jobs)
+
+        # Act & Assert
+        with pytest.raises(KeyboardInterrupt):
+            usecase.run_once()
+        mock_jobs.release.assert_called_once_with(1)
+        mock_jobs.complete.assert_not_called()
+
+    def test_unexpected_error_counts_as_attempt(self, temp_db_path):
+        """Testa que um job que sempre levanta erro inesperado termina failed."""
+        # Arrange
+        mock_download = Mock()
+        mock_download.execute.side_effect = RuntimeError("boom")
+        jobs = SQLiteJobRepository(temp_db_path)
+        job = jobs.enqueue("https://youtube.com/watch?v=1")
+        usecase = ProcessDownloadQueue(
+            mock_download,
+            jobs,
+            max_attempts=3,
+            retry_policy=RetryPolicy(base_delay=0.0, max_delay=0.0),
+        )
+
+        # Act
+        processed = usecase.run()
+
+        # Assert
+        failed = jobs.get(job.id)
+        assert processed == 3
+        assert failed.status is JobStatus.FAILED
+        assert failed.attempts == 3
+        assert failed.last_error == "boom"
+
+    def test_run_until_empty(self):
+        """Testa que run processa jobs até a fila esvaziar."""
+        # Arrange
+        mock_jobs = Mock()
+        mock_jobs.claim.side_effect = [make_job(1), make_job(2), None]
+        mock_jobs.next_available_at.return_value = None
+        usecase = ProcessDownloadQueue(Mock(), mock_jobs)
+
+        # Act
+        processed = usecase.run()
+
+        # Assert
+        assert processed == 2
+        assert mock_jobs.complete.call_count == 2
+
+    def test_run_waits_for_backoff(self, temp_db_path):
+        """Testa que run espera o backoff em vez de parar com jobs pendentes."""
+        # Arrange
+        mock_download = Mock()
+        mock_download.execute.side_effect = [
+            DownloadFailedException("https://youtube.com/watch?v=1", "HTTP Error 503"),
+            None,
+        ]
+        jobs = SQLiteJobRepository(temp_db_path)
+        jobs.enqueue("https://youtube.com/watch?v=1")
+        usecase = ProcessDownloadQueue(
+            mock_download,
+            jobs,
+            retry_policy=RetryPolicy(
+                base_delay=0.05, max_delay=0.05, rng=lambda low, high: high
+            ),
+        )
+
+        # Act
+        processed = usecase.run()
+
+        # Assert
+        assert processed == 2
+        assert jobs.count_by_status()["done"] == 1
+        assert jobs.next_available_at() is None
+
+    def test_run_respects_max_jobs(self):
+        """Testa o limite de jobs processados por execução."""
+        # Arrange
+        mock_jobs = Mock()
+        mock_jobs.claim.return_value = make_job()
+        usecase = ProcessDownloadQueue(Mock(), mock_jobs)
+
+        # Act & Assert
+        assert usecase.run(max_jobs=3) == 3
+
+
+class TestProcessDownloadQueueBatch:
+    """Testes para o modo batch sobre a fila persistente."""
+
+    URLS = [f"https://youtube.com/watch?v={i}" for i in range(3)]
+
+    @staticmethod
+    def _batch(downloader, db_path, **options):
+        return DownloadVideoBatch(
+            downloader, SQLiteVideoRepository(db_path), max_workers=1, **options
+        )
+
+    def test_run_batch_completes_jobs(self, temp_db_path):
+        """Testa que o lote passa pela fila e não repete jobs concluídos."""
+        # Arrange
+        downloader = Mock()
+        downloader.download.return_value = ("Video", "downloads/a.mp4")
+        jobs = SQLiteJobRepository(temp_db_path)
+        usecase = ProcessDownloadQueue(self._batch(downloader, temp_db_path), jobs)
+
+        # Act
+        results = list(usecase.run_batch(usecase.usecase, self.URLS + ["not-a-url"]))
+        again = list(usecase.run_batch(usecase.usecase, self.URLS))
+
+        # Assert
+        assert [r.url for r in results if r.ok] == self.URLS
+        assert [r.url for r in results if not r.ok] == ["not-a-url"]
+        assert jobs.count_by_status()["done"] == 3
+        assert [r.url for r in again if r.ok] == self.URLS
+        assert downloader.download.call_count == 3
+
+    def test_run_batch_redownloads_missing_video(self, temp_db_path):
+        """Testa que um job concluído cujo vídeo sumiu do repositório é refeito."""
+        # Arrange
+        downloader = Mock()
+        downloader.download.return_value = ("Video", "downloads/a.mp4")
+        jobs = SQLiteJobRepository(temp_db_path)
+        usecase = ProcessDownloadQueue(self._batch(downloader, temp_db_path), jobs)
+        list(usecase.run_batch(usecase.usecase, self.URLS[:1]))
+        with sqlite3.connect(temp_db_path) as conn:
+            conn.execute("DELETE FROM videos")
+
+        # Act
+        again = list(usecase.run_batch(usecase.usecase, self.URLS[:1]))
+
+        # Assert
+        assert [r.url for r in again if r.ok] == self.URLS[:1]
+        assert downloader.download.call_count == 2
+
+    def test_run_batch_retries_failed_jobs(self, temp_db_path):
+        """Testa que jobs que falharam só são refeitos com retry_failed."""
+        # Arrange
+        url = self.URLS[0]
+        downloader = Mock()
+        downloader.download.side_effect = DownloadFailedException(url, "Private video")
+        jobs = SQLiteJobRepository(temp_db_path)
+        failures = SQLiteFailureRepository(temp_db_path)
+        batch = self._batch(downloader, temp_db_path, failure_repo=failures)
+        usecase = ProcessDownloadQueue(batch, jobs)
+
+        # Act
+        first = list(usecase.run_batch(batch, [url]))
+        skipped = list(usecase.run_batch(batch, [url]))
+        downloader.download.side_effect = None
+        downloader.download.return_value = ("Video", "downloads/a.mp4")
+        batch.retry_failed = True
+        retried = list(usecase.run_batch(batch, [url]))
+
+        # Assert
+        assert [r.ok for r in first + skipped + retried] == [False, False, True]
+        assert "Falha conhecida" in skipped[0].error.reason
+        assert downloader.download.call_count == 2
+        assert jobs.count_by_status()["done"] == 1
+
+    def test_run_batch_resumes_after_interrupt(self, temp_db_path):
+        """Testa que, após um Ctrl+C, a próxima execução retoma o lote."""
+        # Arrange
+        downloader = Mock()
+        downloader.download.side_effect = [
+            ("Video", "downloads/0.mp4"),
+            KeyboardInterrupt(),
+        ]
+        jobs = SQLiteJobRepository(temp_db_path)
+        usecase = ProcessDownloadQueue(self._batch(downloader, temp_db_path), jobs)
+
+        # Act
+        with pytest.raises(KeyboardInterrupt):
+            list(usecase.run_batch(usecase.usecase, self.URLS))
+        downloader.download.side_effect = None
+        downloader.download.return_value = ("Video", "downloads/b.mp4")
+        resumed = list(usecase.run_batch(usecase.usecase, []))
+
+        # Assert
+        assert [r.url for r in resumed] == self.URLS[1:]
+        assert jobs.count_by_status() == {
+            "pending": 0,
+            "running": 0,
+            "done": 3,
+            "failed": 0,
+        }
+
+
+class TestProcessDownloadQueueServe:
+    """Testes para o modo servidor (submit e serve)."""
+
+    def test_submit_validates_and_enqueues(self):
+        """Testa que submit() valida a URL e retorna o job."""
+        # Arrange
+        mock_jobs = Mock()
+        mock_jobs.enqueue.return_value = make_job()
+        usecase = ProcessDownloadQueue(DownloadVideo(Mock(), Mock()), mock_jobs)
+
+        # Act
+        job = usecase.submit(" https://youtube.com/watch?v=1 ")
+
+        # Assert
+        assert job.id == 1
+        mock_jobs.enqueue.assert_called_once_with("https://youtube.com/watch?v=1")
+        with pytest.raises(InvalidURLException):
+            usecase.submit("not-a-url")
+        assert mock_jobs.enqueue.call_count == 1
+
+    def test_submit_reopens_finished_jobs(self, temp_db_path, sample_video):
+        """Testa que submit() só reabre jobs finalizados que precisam disso."""
+        # Arrange
+        jobs = SQLiteJobRepository(temp_db_path)
+        for url in (sample_video.url, "https://youtube.com/watch?v=2"):
+            jobs.enqueue(url)
+        done, failed = jobs.claim("w1", 60), jobs.claim("w1", 60)
+        jobs.complete(done.id)
+        jobs.fail(failed.id, "Private video", retry=False)
+        video_repo = Mock()
+        video_repo.find_by_urls.return_value = {sample_video.url: sample_video}
+        usecase = ProcessDownloadQueue(
+            DownloadVideo(Mock(), video_repo, retry_failed=True), jobs
+        )
+
+        # Act
+        kept = usecase.submit(sample_video.url)
+        reopened = usecase.submit("https://youtube.com/watch?v=2")
+
+        # Assert
+        assert kept.status is JobStatus.DONE
+        assert reopened.status is JobStatus.PENDING
+        assert reopened.attempts == 0
+        assert reopened.last_error is None
+
+    def test_serve_wakes_up_on_submit(self):
+        """Testa que um worker ocioso processa o job logo após o submit()."""
+        # Arrange
+        pending = []
+        done = threading.Event()
+        mock_jobs = Mock()
+        mock_jobs.claim.side_effect = lambda *args: pending.pop() if pending else None
+        mock_jobs.enqueue.side_effect = (
+            lambda url: pending.append(make_job(url=url)) or pending[-1]
+        )
+        mock_jobs.complete.side_effect = lambda job_id: done.set()
+        usecase = ProcessDownloadQueue(DownloadVideo(Mock(), Mock()), mock_jobs)
+        usecase.usecase = Mock(wraps=usecase.usecase)
+        stop = threading.Event()
+        worker = threading.Thread(target=usecase.serve, args=(stop, 60.0))
+        worker.start()
+
+        # Act
+        usecase.submit("https://youtube.com/watch?v=1")
+
+        # Assert - sem o aviso, o worker só consultaria a fila após 60 s
+        try:
+            assert done.wait(5)
+            usecase.usecase.execute.assert_called_once_with(
+                "https://youtube.com/watch?v=1"
+            )
+        finally:
+            stop.set()
+            usecase.wake()
+            worker.join(5)
+        assert not worker.is_alive()
+
+    def test_serve_survives_unexpected_errors(self):
+        """Testa que um erro inesperado não derruba o worker."""
+        # Arrange
+        stop = threading.Event()
+        mock_jobs = Mock()
+        calls = []
+
+        def claim(*args):
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError("banco indisponível")
+            stop.set()
+            return None
+
+        mock_jobs.claim.side_effect = claim
+        usecase = ProcessDownloadQueue(Mock(), mock_jobs)
+
+        # Act
+        processed = usecase.serve(stop, poll_interval=0.01)
+
+        # Assert
+        assert processed == 0
+        assert len(calls) == 2
@@ -0,0 +1,105 @@
+"""
+Testes unitários para RetryPolicy e HostErrorTracker.
+"""
+
+import pytest
+
+from src.usecases.retry_policy import HostErrorTracker, RetryPolicy
+
+
+def upper_bound(low, high):
+    """Substitui o sorteio pelo teto, para testes determinísticos."""
+    return high
+
+
+class TestRetryPolicy:
+    """Testes para o backoff exponencial com jitter."""
+
+    def test_ceiling_grows_exponentially(self):
+        """Testa que o teto dobra a cada tentativa."""
+        # Arrange
+        policy = RetryPolicy(base_delay=1, max_delay=100)
+
+        # Act
+        ceilings = [policy.ceiling(attempt) for attempt in range(1, 6)]
+
+        # Assert
+        assert ceilings == [1, 2, 4, 8, 16]
+
+    def test_ceiling_is_capped(self):
+        """Testa que o teto respeita max_delay, mesmo com muitas tentativas."""
+        # Arrange
+        policy = RetryPolicy(base_delay=1, max_delay=60)
+
+        # Act & Assert
+        assert policy.ceiling(10) == 60
+        assert policy.ceiling(10_000) == 60
+
+    def test_delay_is_jittered_within_ceiling(self):
+        """Testa que a espera sorteada fica entre 0 e o teto."""
+        # Arrange
+        policy = RetryPolicy(base_delay=1, max_delay=100)
+
+        # Act
+        delays = [policy.delay(4) for _ in range(200)]
+
+        # Assert
+        assert all(0 <= delay <= 8 for delay in delays)
+        assert len(set(delays)) > 1
+
+    def test_penalty_stretches_ceiling(self):
+        """Testa que a penalidade multiplica o teto, limitada a max_delay."""
+        # Arrange
+        policy = RetryPolicy(base_delay=10, max_delay=100, rng=upper_bound)
+
+        # Act & Assert
+        assert policy.delay(1, penalty=3) == 30
+        assert policy.delay(4, penalty=3) == 100
+
+    def test_invalid_bounds(self):
+        """Testa que limites inconsistentes são rejeitados."""
+        with pytest.raises(ValueError):
+            RetryPolicy(base_delay=10, max_delay=1)
+
+
+class TestHostErrorTracker:
+    """Testes para a taxa de erro por host."""
+
+    def test_error_rate_per_host(self):
+        """Testa que cada host tem sua própria taxa de erro."""
+        # Arrange
+        tracker = HostErrorTracker()
+
+        # Act
+        tracker.record("https://www.youtube.com/watch?v=1", success=False)
+        tracker.record("https://youtube.com/watch?v=2", success=True)
+        tracker.record("https://vimeo.com/1", success=True)
+
+        # Assert
+        assert tracker.error_rate("https://youtube.com/watch?v=3") == 0.5
+        assert tracker.error_rate("https://vimeo.com/2") == 0.0
+        assert tracker.error_rate("https://example.com/x") == 0.0
+
+    def test_window_forgets_old_results(self):
+        """Testa que apenas os últimos resultados são considerados."""
+        # Arrange
+        tracker = HostErrorTracker(window=3)
+        url = "https://example.com/video"
+
+        # Act
+        for _ in range(3):
+            tracker.record(url, success=False)
+        for _ in range(3):
+            tracker.record(url, success=True)
+
+        # Assert
+        assert tracker.error_rate(url) == 0.0
+
+    def test_snapshot(self):
+        """Testa o resumo das taxas de erro de todos os hosts."""
+        # Arrange
+        tracker = HostErrorTracker()
+        tracker.record("https://example.com/a", success=False)
+
+        # Act & Assert
+        assert tracker.snapshot() == {"example.com": 1.0}
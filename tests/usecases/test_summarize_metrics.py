@@ -0,0 +1,84 @@
+"""
+Testes unitários para o caso de uso SummarizeMetrics.
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+
+from src.domain.entities import DownloadOutcome, DownloadStats
+from src.usecases.summarize_metrics import SummarizeMetrics, percentile
+
+NOW = datetime(2024, 1, 2, 12, 0, 0)
+
+
+def make_stats(total_s, outcome=DownloadOutcome.DOWNLOADED, transfer_s=1.0):
+    return DownloadStats(
+        url="https://example.com/v",
+        started_at=NOW - timedelta(hours=1),
+        outcome=outcome,
+        transfer_s=transfer_s,
+        total_s=total_s,
+        bytes_downloaded=1000 if outcome is DownloadOutcome.DOWNLOADED else 0,
+    )
+
+
+class TestPercentile:
+    """Testes para o cálculo de percentis."""
+
+    def test_interpolates_between_samples(self):
+        """Testa a interpolação linear entre as amostras vizinhas."""
+        # Arrange
+        values = [1.0, 2.0, 3.0, 4.0]
+
+        # Act / Assert
+        assert percentile(values, 50) == pytest.approx(2.5)
+        assert percentile(values, 100) == 4.0
+        assert percentile(values, 0) == 1.0
+
+    def test_empty_sequence(self):
+        """Testa que uma sequência vazia resulta em zero."""
+        assert percentile([], 95) == 0.0
+
+
+class TestSummarizeMetrics:
+    """Testes para o resumo das métricas de download."""
+
+    def test_summary(self):
+        """Testa contagem por resultado, percentis e vazão."""
+        # Arrange
+        stats = [make_stats(float(i)) for i in range(1, 101)]
+        stats.append(make_stats(50.0, outcome=DownloadOutcome.FAILED))
+        repo = Mock()
+        repo.find_since.return_value = stats
+        usecase = SummarizeMetrics(repo, clock=lambda: NOW)
+
+        # Act
+        summary = usecase.execute(timedelta(hours=2))
+
+        # Assert
+        repo.find_since.assert_called_once_with(NOW - timedelta(hours=2), NOW)
+        assert summary.count == 101
+        assert summary.outcomes == {"downloaded": 100, "failed": 1}
+        assert summary.latencies["total"]["p50"] == pytest.approx(50.5)
+        assert summary.latencies["total"]["p99"] == pytest.approx(99.01)
+        assert summary.bytes_downloaded == 100_000
+        assert summary.avg_speed == pytest.approx(1000.0)
+        assert summary.downloads_per_hour == pytest.approx(50.0)
+
+    def test_empty_window(self):
+        """Testa o resumo de uma janela sem downloads."""
+        # Arrange
+        repo = Mock()
+        repo.find_since.return_value = []
+        usecase = SummarizeMetrics(repo, clock=lambda: NOW)
+
+        # Act
+        summary = usecase.execute(timedelta(hours=1))
+
+        # Assert
+        assert summary.count == 0
+        assert summary.latencies == {}
+        assert summary.avg_speed == 0.0
+        assert summary.to_dict()["since"] == "2024-01-02T11:00:00"
@@ -0,0 +1,186 @@
+"""
+Testes unitários para o caso de uso SyncChannel.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from src.domain.entities import PlaylistEntry, Subscription
+from src.domain.exceptions import InvalidURLException
+from src.usecases.sync_channel import SyncChannel
+
+CHANNEL = "https://www.youtube.com/@canal"
+
+
+def video_id(n):
+    return f"video{n:06d}"
+
+
+def video_url(n):
+    return f"https://www.youtube.com/watch?v={video_id(n)}"
+
+
+def make_downloader(newest, oldest=0, consumed=None, upload_dates=False):
+    """Canal falso com vídeos do mais novo (``newest``) ao mais antigo."""
+
+    def iter_playlist(url):
+        for n in range(newest, oldest - 1, -1):
+            if consumed is not None:
+                consumed.append(n)
+            yield PlaylistEntry(
+                url=video_url(n),
+                video_id=video_id(n),
+                upload_date=f"2024{n:04d}" if upload_dates else None,
+            )
+
+    mock_downloader = Mock()
+    mock_downloader.iter_playlist.side_effect = iter_playlist
+    return mock_downloader
+
+
+def make_repo(known=()):
+    known = set(known)
+    mock_repo = Mock()
+    mock_repo.find_by_urls.side_effect = lambda urls: {
+        url: Mock() for url in urls if url in known
+    }
+    return mock_repo
+
+
+def make_subscriptions(subscription=None):
+    mock_subscriptions = Mock()
+    mock_subscriptions.find.return_value = subscription
+    return mock_subscriptions
+
+
+class TestSyncChannel:
+    """Testes para a sincronização incremental de canais."""
+
+    def test_first_sync_reads_whole_channel(self):
+        """Testa que sem referência o canal inteiro é lido."""
+        # Arrange
+        subscriptions = make_subscriptions()
+        usecase = SyncChannel(
+            make_downloader(newest=49), make_repo({video_url(0)}), subscriptions
+        )
+
+        # Act
+        result = usecase.execute(CHANNEL)
+
+        # Assert
+        assert result.scanned == 50
+        assert len(result.new_urls) == 49
+        assert result.new_urls[0] == video_url(49)
+        saved = subscriptions.save.call_args[0][0]
+        assert saved.last_video_id == video_id(49)
+        assert saved.last_synced_at is not None
+
+    def test_stops_at_high_water_mark(self):
+        """Testa que a enumeração para no vídeo mais novo já visto."""
+        # Arrange
+        consumed = []
+        subscriptions = make_subscriptions(
+            Subscription(url=CHANNEL, last_video_id=video_id(9_997))
+        )
+        usecase = SyncChannel(
+            make_downloader(newest=10_000, consumed=consumed),
+            make_repo(),
+            subscriptions,
+        )
+
+        # Act
+        result = usecase.execute(CHANNEL)
+
+        # Assert
+        assert result.new_urls == [
+            video_url(10_000),
+            video_url(9_999),
+            video_url(9_998),
+        ]
+        assert result.reached_known is True
+        assert len(consumed) == 4
+        assert subscriptions.save.call_args[0][0].last_video_id == video_id(10_000)
+
+    def test_stops_at_older_upload_date(self):
+        """Testa que um vídeo mais antigo que a referência encerra a leitura."""
+        # Arrange
+        consumed = []
+        subscriptions = make_subscriptions(
+            Subscription(
+                url=CHANNEL, last_video_id="removido", last_upload_date="20240095"
+            )
+        )
+        usecase = SyncChannel(
+            make_downloader(newest=100, consumed=consumed, upload_dates=True),
+            make_repo(),
+            subscriptions,
+        )
+
+        # Act
+        result = usecase.execute(CHANNEL)
+
+        # Assert
+        assert len(result.new_urls) == 6
+        assert len(consumed) == 7
+
+    def test_stops_after_streak_of_known_videos(self):
+        """Testa que uma sequência de vídeos já baixados encerra a leitura."""
+        # Arrange
+        consumed = []
+        known = {video_url(n) for n in range(0, 995)}
+        subscriptions = make_subscriptions(
+            Subscription(url=CHANNEL, last_video_id="removido")
+        )
+        usecase = SyncChannel(
+            make_downloader(newest=999, consumed=consumed),
+            make_repo(known),
+            subscriptions,
+            chunk_size=10,
+            known_streak=10,
+        )
+
+        # Act
+        result = usecase.execute(CHANNEL)
+
+        # Assert
+        assert result.new_urls == [video_url(n) for n in range(999, 994, -1)]
+        assert result.reached_known is True
+        assert len(consumed) <= 30
+
+    def test_new_videos_are_enqueued(self):
+        """Testa que os vídeos novos são enviados à fila."""
+        # Arrange
+        queue = Mock()
+        subscriptions = make_subscriptions(
+            Subscription(url=CHANNEL, last_video_id=video_id(1))
+        )
+        usecase = SyncChannel(make_downloader(newest=3), make_repo(), subscriptions)
+
+        # Act
+        usecase.execute(CHANNEL, queue)
+
+        # Assert
+        queue.enqueue.assert_called_once_with([video_url(3), video_url(2)])
+
+    def test_mark_is_kept_when_enqueue_fails(self):
+        """Testa que a referência não avança se a fila falhar."""
+        # Arrange
+        queue = Mock()
+        queue.enqueue.side_effect = RuntimeError("fila indisponível")
+        subscriptions = make_subscriptions()
+        usecase = SyncChannel(make_downloader(newest=3), make_repo(), subscriptions)
+
+        # Act & Assert
+        with pytest.raises(RuntimeError):
+            usecase.execute(CHANNEL, queue)
+        subscriptions.save.assert_not_called()
+
+    def test_rejects_playlists(self):
+        """Testa que playlists (ordem não cronológica) não são sincronizadas."""
+        # Arrange
+        usecase = SyncChannel(make_downloader(newest=3), make_repo(), Mock())
+
+        # Act & Assert
+        with pytest.raises(InvalidURLException):
+            usecase.execute("https://www.youtube.com/playlist?list=PL123")